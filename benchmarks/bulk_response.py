@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Compares the time and memory it takes to turn a GetBulkStateResponse with many items
+# into a BulkStatesResponse, by copying every field into a BulkStateItem up front as the
+# client used to, and by wrapping the items when they are read:
+#
+#     python benchmarks/bulk_response.py --items 100000 --iterations 5
+
+import argparse
+import timeit
+import tracemalloc
+
+from dapr.clients.grpc._response import BulkStateItem, BulkStatesResponse
+from dapr.proto import api_v1
+
+
+def _eager(response: api_v1.GetBulkStateResponse) -> BulkStatesResponse:
+    items = [
+        BulkStateItem(key=item.key, data=item.data, etag=item.etag, error=item.error)
+        for item in response.items
+    ]
+    return BulkStatesResponse(items=items)
+
+
+def _lazy(response: api_v1.GetBulkStateResponse) -> BulkStatesResponse:
+    return BulkStatesResponse(items=response.items)
+
+
+def _peak_memory_mb(build, response: api_v1.GetBulkStateResponse) -> float:
+    tracemalloc.start()
+    resp = build(response)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resp
+    return peak / (1024 * 1024)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--items', type=int, default=100000)
+    arg_parser.add_argument('--iterations', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    response = api_v1.GetBulkStateResponse(
+        items=[
+            api_v1.BulkStateItem(key=f'order-{i}', data=b'{"total": %d}' % i, etag=str(i))
+            for i in range(args.items)
+        ]
+    )
+
+    def read_one(build):
+        return lambda: build(response).items[args.items // 2].data
+
+    def read_all(build):
+        return lambda: [item.data for item in build(response).items]
+
+    print(f'{args.items} items, {args.iterations} iterations')
+    for name, bench in (('read one item', read_one), ('read every item', read_all)):
+        eager_time = timeit.timeit(bench(_eager), number=args.iterations) / args.iterations
+        lazy_time = timeit.timeit(bench(_lazy), number=args.iterations) / args.iterations
+        print(
+            f'{name:16} eager: {eager_time * 1000:8.1f} ms   lazy: {lazy_time * 1000:8.1f} ms '
+            f'({eager_time / lazy_time:.1f}x)'
+        )
+    eager_memory = _peak_memory_mb(_eager, response)
+    lazy_memory = _peak_memory_mb(_lazy, response)
+    print(f'{"peak memory":16} eager: {eager_memory:8.1f} MB   lazy: {lazy_memory:8.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
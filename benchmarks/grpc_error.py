@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Measures the error path of a failed call: wrapping the gRPC error in DaprGrpcError and
+# checking its status code, with and without parsing the rich error details:
+#
+#     python benchmarks/grpc_error.py --iterations 20000
+
+import argparse
+import timeit
+
+from google.protobuf.any_pb2 import Any
+from google.protobuf.duration_pb2 import Duration
+from google.rpc import code_pb2, error_details_pb2, status_pb2
+from grpc import RpcError, StatusCode
+
+from dapr.clients.exceptions import DaprGrpcError
+
+
+class _ThrottledError(RpcError):
+    """A RESOURCE_EXHAUSTED error with the details a throttled state store returns."""
+
+    def __init__(self):
+        details = []
+        for message in (
+            error_details_pb2.ErrorInfo(
+                reason='DAPR_STATE_QUERY_FAILED',
+                domain='dapr.io',
+                metadata={'storeName': 'statestore', 'key': 'order-42'},
+            ),
+            error_details_pb2.RetryInfo(retry_delay=Duration(seconds=1, nanos=500000000)),
+            error_details_pb2.ResourceInfo(resource_type='state', resource_name='statestore'),
+            error_details_pb2.DebugInfo(stack_entries=['store.go:42', 'state.go:7']),
+        ):
+            detail = Any()
+            detail.Pack(message)
+            details.append(detail)
+        status = status_pb2.Status(
+            code=code_pb2.RESOURCE_EXHAUSTED, message='too many requests', details=details
+        )
+        self._trailing_metadata = (('grpc-status-details-bin', status.SerializeToString()),)
+
+    def code(self):
+        return StatusCode.RESOURCE_EXHAUSTED
+
+    def details(self):
+        return 'too many requests'
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--iterations', type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    err = _ThrottledError()
+
+    def handle_code_only() -> None:
+        try:
+            raise DaprGrpcError(err) from err
+        except DaprGrpcError as e:
+            e.code()
+
+    def handle_with_details() -> None:
+        try:
+            raise DaprGrpcError(err) from err
+        except DaprGrpcError as e:
+            e.code()
+            e.status_details()
+
+    print(f'{args.iterations} iterations')
+    details_time = timeit.timeit(handle_with_details, number=args.iterations)
+    print(f'with status_details(): {args.iterations / details_time:10.0f} errors/s')
+    code_time = timeit.timeit(handle_code_only, number=args.iterations)
+    print(
+        f'code() only:           {args.iterations / code_time:10.0f} errors/s '
+        f'({details_time / code_time:.1f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Compares a new aiohttp session per request with the pooled DaprHttpClient session,
+# against a local aiohttp server standing in for the sidecar:
+#
+#     python benchmarks/http_client_session.py --requests 2000 --concurrency 16
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+from dapr.clients.http.client import DaprHttpClient
+from dapr.conf import settings
+from dapr.serializers import DefaultJSONSerializer
+
+
+async def _handle(request: web.Request) -> web.Response:
+    await request.read()
+    return web.Response(body=b'{"value": 1}', content_type='application/json')
+
+
+async def _start_server() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    return runner
+
+
+async def _per_request_session(url: str) -> None:
+    # Behavior of DaprHttpClient.send_bytes before sessions were pooled.
+    async with aiohttp.ClientSession() as session:
+        async with session.request('GET', url) as r:
+            await r.read()
+
+
+async def _run(send, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await send()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(total)])
+    return time.perf_counter() - start
+
+
+def _report(name: str, elapsed: float, total: int) -> None:
+    print(f'{name:<22} {total / elapsed:>10.0f} req/s {elapsed * 1e6 / total:>10.1f} us/req')
+
+
+async def main(total: int, concurrency: int) -> None:
+    runner = await _start_server()
+    port = runner.addresses[0][1]
+    settings.DAPR_HTTP_ENDPOINT = f'http://127.0.0.1:{port}'
+    url = f'{settings.DAPR_HTTP_ENDPOINT}/v1.0/actors/Bench/1/state/key'
+
+    # The constructor blocks on the sidecar health check, which this loop serves.
+    client = await asyncio.get_running_loop().run_in_executor(
+        None, DaprHttpClient, DefaultJSONSerializer()
+    )
+
+    async def pooled():
+        await client.send_bytes('GET', url, None, headers={})
+
+    async def per_request():
+        await _per_request_session(url)
+
+    print(f'{total} requests, concurrency {concurrency}')
+    _report('per-request session', await _run(per_request, total, concurrency), total)
+    _report('pooled session', await _run(pooled, total, concurrency), total)
+
+    await client.close()
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Compares DefaultJSONSerializer.deserialize through the pure-Python DaprJSONDecoder with
+# the fast decode path, using the C scanner of json and orjson (when installed):
+#
+#     python benchmarks/json_decode.py --iterations 20000
+
+import argparse
+import datetime
+import timeit
+
+from unittest import mock
+
+from dapr.serializers import DefaultJSONSerializer
+
+# An actor state value with a few dates and durations among plain values.
+_STATE = {
+    'orderId': 'f5c4a8d2-3b1e-4f6a-9c7d-2e8b1a0f4d3c',
+    'customer': {'name': 'Contoso', 'tier': 'gold', 'tags': ['a', 'b', 'c']},
+    'createdAt': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    'retryAfter': datetime.timedelta(minutes=5),
+    'items': [
+        {'sku': f'SKU-{i:05d}', 'quantity': i, 'price': i * 1.25, 'note': 'gift wrap'}
+        for i in range(20)
+    ],
+}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--iterations', type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    payload = DefaultJSONSerializer().serialize(_STATE)
+    decoder = DefaultJSONSerializer(fast_decode=False)
+    fast = DefaultJSONSerializer()
+    assert decoder.deserialize(payload) == fast.deserialize(payload)
+
+    print(f'payload: {len(payload)} bytes, {args.iterations} iterations')
+    slow_time = timeit.timeit(lambda: decoder.deserialize(payload), number=args.iterations)
+    print(f'DaprJSONDecoder:        {args.iterations / slow_time:10.0f} docs/s')
+
+    with mock.patch('dapr.serializers.json.orjson', None):
+        c_time = timeit.timeit(lambda: fast.deserialize(payload), number=args.iterations)
+    print(
+        f'fast (json C scanner):  {args.iterations / c_time:10.0f} docs/s '
+        f'({slow_time / c_time:.1f}x)'
+    )
+
+    from dapr.serializers import json as dapr_json
+
+    if dapr_json.orjson is not None:
+        orjson_time = timeit.timeit(lambda: fast.deserialize(payload), number=args.iterations)
+        print(
+            f'fast (orjson):          {args.iterations / orjson_time:10.0f} docs/s '
+            f'({slow_time / orjson_time:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Measures the peak memory the client needs to send a large payload with publish_event,
+# save_state and invoke_method, passed as bytes, bytearray and memoryview. Every call
+# runs in a new process against a stand-in sidecar in this one, and reports how much its
+# peak RSS grew beyond the payload itself:
+#
+#     python benchmarks/payload_memory.py --size-mb 50
+
+import argparse
+import resource
+import subprocess
+import sys
+
+from concurrent import futures
+from unittest import mock
+
+import grpc
+
+from google.protobuf.empty_pb2 import Empty
+
+from dapr.proto import api_service_v1, common_v1
+
+_OPERATIONS = ('publish_event', 'save_state', 'invoke_method')
+_KINDS = ('bytes', 'bytearray', 'memoryview')
+
+
+class _Sidecar(api_service_v1.DaprServicer):
+    """Accepts the calls without doing anything with the payload."""
+
+    def PublishEvent(self, request, context):
+        return Empty()
+
+    def SaveState(self, request, context):
+        return Empty()
+
+    def InvokeService(self, request, context):
+        return common_v1.InvokeResponse()
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(port: int, operation: str, kind: str, size_mb: int) -> None:
+    from dapr.clients.grpc.client import DaprGrpcClient
+
+    max_length = (size_mb + 1) * 1024 * 1024
+    # the stand-in sidecar has no HTTP health endpoint
+    with mock.patch('dapr.clients.health.DaprHealth.wait_until_ready'):
+        client = DaprGrpcClient(f'localhost:{port}', max_grpc_message_length=max_length)
+    send = {
+        'publish_event': lambda data: client.publish_event('pubsub', 'topic', data),
+        'save_state': lambda data: client.save_state('statestore', 'key', data),
+        'invoke_method': lambda data: client.invoke_method('app', 'method', data),
+    }[operation]
+    send(b'warm up')
+
+    # filled, so that its pages are resident before the baseline is taken
+    payload = b'x' * (size_mb * 1024 * 1024)
+    if kind == 'bytearray':
+        payload = bytearray(payload)
+    elif kind == 'memoryview':
+        payload = memoryview(payload)
+    baseline = _peak_rss_mb()
+    send(payload)
+    print(f'{_peak_rss_mb() - baseline:.0f}')
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--size-mb', type=int, default=50)
+    arg_parser.add_argument('--measure', nargs=3, metavar=('PORT', 'OPERATION', 'KIND'))
+    args = arg_parser.parse_args()
+
+    if args.measure:
+        port, operation, kind = args.measure
+        _measure(int(port), operation, kind, args.size_mb)
+        return
+
+    max_length = (args.size_mb + 1) * 1024 * 1024
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[('grpc.max_receive_message_length', max_length)],
+    )
+    api_service_v1.add_DaprServicer_to_server(_Sidecar(), server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+
+    def measure(operation: str, kind: str) -> str:
+        command = [sys.executable, __file__, '--size-mb', str(args.size_mb)]
+        command += ['--measure', str(port), operation, kind]
+        return subprocess.run(command, capture_output=True, text=True, check=True).stdout.strip()
+
+    try:
+        # the first large message a new server receives costs the client more buffers
+        measure(_OPERATIONS[0], _KINDS[0])
+        print(f'{args.size_mb} MB payload, peak RSS growth of the client in MB')
+        print(f'{"":15}' + ''.join(f'{kind:>12}' for kind in _KINDS))
+        for operation in _OPERATIONS:
+            row = [measure(operation, kind) for kind in _KINDS]
+            print(f'{operation:15}' + ''.join(f'{value:>12}' for value in row))
+    finally:
+        server.stop(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Compares payload size and serialize/deserialize throughput of DefaultJSONSerializer
+# and MessagePackSerializer (requires msgpack):
+#
+#     python benchmarks/serializers.py --iterations 20000
+
+import argparse
+import datetime
+import timeit
+
+from dapr.serializers import DefaultJSONSerializer, MessagePackSerializer
+
+_PAYLOADS = {
+    'small message': {'orderId': 42, 'status': 'shipped', 'express': True},
+    'state document': {
+        'customer': 'Contoso',
+        'createdAt': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        'retryAfter': datetime.timedelta(minutes=5),
+        'items': [{'sku': f'SKU-{i:05d}', 'quantity': i, 'price': i * 1.25} for i in range(20)],
+    },
+    '4 KiB binary blob': {'name': 'thumbnail.png', 'content': bytes(range(256)) * 16},
+}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--iterations', type=int, default=20000)
+    args = arg_parser.parse_args()
+    n = args.iterations
+
+    serializers = {'json': DefaultJSONSerializer(), 'msgpack': MessagePackSerializer()}
+    print(f'{"payload":<18} {"format":<8} {"bytes":>7} {"ser/s":>10} {"deser/s":>10}')
+    for name, payload in _PAYLOADS.items():
+        for fmt, serializer in serializers.items():
+            data = serializer.serialize(payload)
+            ser = n / timeit.timeit(lambda: serializer.serialize(payload), number=n)
+            deser = n / timeit.timeit(lambda: serializer.deserialize(data), number=n)
+            print(f'{name:<18} {fmt:<8} {len(data):>7} {ser:>10.0f} {deser:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -18,8 +18,9 @@ from typing import Any, Callable, Dict, Optional, Type
 
 from dapr.actor.actor_interface import ActorInterface
 from dapr.actor.id import ActorId
+from dapr.actor.runtime._client_factory import create_actor_client
 from dapr.actor.runtime._type_utils import get_dispatchable_attrs_from_interface
-from dapr.clients import DaprActorClientBase, DaprActorHttpClient
+from dapr.clients import DaprActorClientBase, DaprActorHttpClient  # noqa: F401
 from dapr.serializers import Serializer, DefaultJSONSerializer
 from dapr.conf import settings
 
@@ -43,18 +44,43 @@ class ActorProxyFactory(ActorFactoryBase):
     actor objects.
 
     DefaultActorProxyFactory creates :class:`ActorProxy` with
-    :class:`DaprActorHttpClient` connecting to Dapr runtime.
+    :class:`DaprActorHttpClient` connecting to Dapr runtime. Pass
+    ``actor_client_protocol='grpc'`` (or set DAPR_ACTOR_CLIENT_PROTOCOL) to call the
+    actors over gRPC with :class:`DaprActorGrpcClient` instead.
     """
 
     def __init__(
         self,
         message_serializer=DefaultJSONSerializer(),
         http_timeout_seconds: int = settings.DAPR_HTTP_TIMEOUT_SECONDS,
+        http_max_connections: Optional[int] = None,
+        http_max_connections_per_host: Optional[int] = None,
+        http_keepalive_timeout: Optional[float] = None,
+        http_dns_cache_ttl: Optional[int] = None,
+        actor_client_protocol: Optional[str] = None,
     ):
         # TODO: support serializer for state store later
-        self._dapr_client = DaprActorHttpClient(message_serializer, timeout=http_timeout_seconds)
+        self._dapr_client = create_actor_client(
+            message_serializer,
+            protocol=actor_client_protocol,
+            timeout=http_timeout_seconds,
+            max_connections=http_max_connections,
+            max_connections_per_host=http_max_connections_per_host,
+            keepalive_timeout=http_keepalive_timeout,
+            dns_cache_ttl=http_dns_cache_ttl,
+        )
         self._message_serializer = message_serializer
 
+    async def close(self) -> None:
+        """Releases the pooled connections used by the proxies of this factory."""
+        await self._dapr_client.close()
+
+    async def __aenter__(self) -> 'ActorProxyFactory':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
     def create(
         self,
         actor_type: str,
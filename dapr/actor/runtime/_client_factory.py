@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2023 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Optional
+
+from dapr.clients.base import DaprActorClientBase
+from dapr.clients.exceptions import DaprInternalError
+from dapr.conf import settings
+from dapr.serializers import Serializer
+
+
+def create_actor_client(
+    message_serializer: Serializer,
+    protocol: Optional[str] = None,
+    timeout: int = settings.DAPR_HTTP_TIMEOUT_SECONDS,
+    max_connections: Optional[int] = None,
+    max_connections_per_host: Optional[int] = None,
+    keepalive_timeout: Optional[float] = None,
+    dns_cache_ttl: Optional[int] = None,
+) -> DaprActorClientBase:
+    """Creates the actor client for the given protocol.
+
+    Args:
+        message_serializer (Serializer): Dapr serializer.
+        protocol (str, optional): 'http', 'grpc' (synchronous channel shared by all event
+            loops) or 'grpc-aio' (grpc.aio channel per event loop), defaults to
+            settings.DAPR_ACTOR_CLIENT_PROTOCOL.
+        timeout (int, optional): Timeout in seconds.
+        max_connections (int, optional): Maximum number of pooled HTTP connections.
+        max_connections_per_host (int, optional): Maximum number of pooled HTTP connections
+            to the same endpoint.
+        keepalive_timeout (float, optional): Seconds an idle HTTP connection is kept alive.
+        dns_cache_ttl (int, optional): Seconds resolved addresses are cached.
+
+    Returns:
+        :class:`DaprActorClientBase`: the actor client.
+    """
+    protocol = (protocol or settings.DAPR_ACTOR_CLIENT_PROTOCOL).lower()
+
+    if protocol == 'http':
+        from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
+
+        return DaprActorHttpClient(
+            message_serializer,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+        )
+    if protocol == 'grpc':
+        from dapr.clients.grpc.dapr_actor_grpc_client import DaprActorGrpcClient
+
+        return DaprActorGrpcClient(timeout=timeout)
+    if protocol == 'grpc-aio':
+        from dapr.aio.clients.grpc.dapr_actor_grpc_client import DaprActorGrpcClientAsync
+
+        return DaprActorGrpcClientAsync(timeout=timeout)
+
+    raise DaprInternalError(f'Unknown value for DAPR_ACTOR_CLIENT_PROTOCOL: {protocol}')
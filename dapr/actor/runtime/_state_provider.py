@@ -13,12 +13,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import base64
 import io
+import json
 
-from typing import Any, List, Type, Tuple
+from typing import Any, Dict, List, Optional, Type, Tuple
 from dapr.actor.runtime.state_change import StateChangeKind, ActorStateChange
 from dapr.clients.base import DaprActorClientBase
 from dapr.serializers import Serializer, DefaultJSONSerializer
+from dapr.serializers.typed import TypeDecoder, compile_decoder
 
 
 # Mapping StateChangeKind to Dapr State Operation
@@ -42,15 +45,41 @@ class StateProvider:
     ):
         self._state_client = actor_client
         self._state_serializer = state_serializer
+        self._state_decoders: Dict[Any, TypeDecoder] = {}
 
     async def try_load_state(
         self, actor_type: str, actor_id: str, state_name: str, state_type: Type[Any] = object
     ) -> Tuple[bool, Any]:
+        raw_state_value = await self.load_state_bytes(actor_type, actor_id, state_name)
+        if raw_state_value is None:
+            return (False, None)
+        return (True, self.deserialize_state(raw_state_value, state_type))
+
+    async def load_state_bytes(
+        self, actor_type: str, actor_id: str, state_name: str
+    ) -> Optional[bytes]:
+        """Gets the serialized value of a state, or None if the state does not exist."""
         raw_state_value = await self._state_client.get_state(actor_type, actor_id, state_name)
         if (not raw_state_value) or len(raw_state_value) == 0:
-            return (False, None)
-        result = self._state_serializer.deserialize(raw_state_value, state_type)
-        return (True, result)
+            return None
+        return raw_state_value
+
+    def deserialize_state(self, raw_state_value: bytes, state_type: Type[Any] = object) -> Any:
+        """Deserializes a value returned by :meth:`load_state_bytes`."""
+        if getattr(self._state_serializer, 'binary', False):
+            # Binary values are stored as a base64 JSON string, see save_state.
+            raw_state_value = base64.b64decode(json.loads(raw_state_value))
+        if state_type is not object and getattr(self._state_serializer, 'typed_decode', False):
+            state_type = self._get_state_decoder(state_type)
+        return self._state_serializer.deserialize(raw_state_value, state_type)
+
+    def serialize_state(self, value: Any) -> bytes:
+        """Serializes a state value into the form :meth:`save_state` stores, which
+        :meth:`load_state_bytes` returns."""
+        serialized = self._state_serializer.serialize(value)
+        if getattr(self._state_serializer, 'binary', False):
+            return b'"' + base64.b64encode(serialized) + b'"'
+        return serialized
 
     async def contains_state(self, actor_type: str, actor_id: str, state_name: str) -> bool:
         raw_state_value = await self._state_client.get_state(actor_type, actor_id, state_name)
@@ -93,14 +122,15 @@ class StateProvider:
             json_output.write(b'","request":{"key":"')
             json_output.write(state.state_name.encode('utf-8'))
             json_output.write(b'"')
-            if state.value is not None:
-                serialized = self._state_serializer.serialize(state.value)
+            serialized = state.serialized_value
+            if serialized is None and state.value is not None:
+                serialized = self.serialize_state(state.value)
+            if serialized is not None:
                 json_output.write(b',"value":')
                 json_output.write(serialized)
             if state.ttl_in_seconds is not None and state.ttl_in_seconds >= 0:
-                serialized = self._state_serializer.serialize(state.ttl_in_seconds)
                 json_output.write(b',"metadata":{"ttlInSeconds":"')
-                json_output.write(serialized)
+                json_output.write(str(state.ttl_in_seconds).encode('utf-8'))
                 json_output.write(b'"}')
             json_output.write(b'}}')
             first_state = False
@@ -108,3 +138,13 @@ class StateProvider:
         data = json_output.getvalue()
         json_output.close()
         await self._state_client.save_state_transactionally(actor_type, actor_id, data)
+
+    def _get_state_decoder(self, state_type: Type[Any]) -> Any:
+        # Compiled once per state type.
+        try:
+            return self._state_decoders[state_type]
+        except KeyError:
+            decoder = self._state_decoders[state_type] = compile_decoder(state_type)
+            return decoder
+        except TypeError:  # unhashable type hint
+            return state_type
@@ -16,7 +16,7 @@ limitations under the License.
 import uuid
 
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence, Type, Union
 
 from dapr.actor.id import ActorId
 from dapr.actor.runtime._method_context import ActorMethodContext
@@ -52,8 +52,18 @@ class Actor:
     Attributes:
         runtime_ctx: the :class:`ActorRuntimeContext` object served for
             the actor implementation.
+        prefetch_states: the states the actor uses, which are loaded concurrently when
+            it is activated so that the first method call reads them from memory. Either
+            state names, or a mapping of state names to the types their values are
+            deserialized to, e.g. ``{'order': Order, 'total': int}``.
+        detect_state_mutations: whether the state values that were changed in place,
+            without calling ``set_state``, are saved too. Finding them serializes every
+            state the actor read when the states are saved, so it is off by default.
     """
 
+    prefetch_states: ClassVar[Union[Sequence[str], Mapping[str, Type[Any]]]] = ()
+    detect_state_mutations: ClassVar[bool] = False
+
     def __init__(self, ctx: ActorRuntimeContext, actor_id: ActorId):
         self.id = actor_id
         self._runtime_ctx = ctx
@@ -92,7 +102,7 @@ class Actor:
         name = name or self.__get_new_timer_name()
         timer = ActorTimerData(name, callback, state, due_time, period, ttl)
 
-        req_body = self._runtime_ctx.message_serializer.serialize(timer.as_dict())
+        req_body = self._runtime_ctx.api_serializer.serialize(timer.as_dict())
         await self._runtime_ctx.dapr_client.register_timer(
             self._runtime_ctx.actor_type_info.type_name, self.id.id, name, req_body
         )
@@ -135,7 +145,7 @@ class Actor:
             ttl (datetime.timedelta): the time interval before the reminder stops firing
         """
         reminder = ActorReminderData(name, state, due_time, period, ttl)
-        req_body = self._runtime_ctx.message_serializer.serialize(reminder.as_dict())
+        req_body = self._runtime_ctx.api_serializer.serialize(reminder.as_dict())
         await self._runtime_ctx.dapr_client.register_reminder(
             self._runtime_ctx.actor_type_info.type_name, self.id.id, name, req_body
         )
@@ -151,12 +161,14 @@ class Actor:
         )
 
     async def _on_activate_internal(self) -> None:
-        """Clears all state cache, calls the overridden :meth:`_on_activate`,
-        and then save the states.
+        """Clears all state cache, loads the states declared in :attr:`prefetch_states`,
+        calls the overridden :meth:`_on_activate`, and then save the states.
 
         This internal callback is called when actor is activated.
         """
         await self._reset_state_internal()
+        if self.prefetch_states:
+            await self._state_manager.prefetch_states(self._get_prefetch_state_types())
         await self._on_activate()
         await self._save_state_internal()
 
@@ -195,6 +207,12 @@ class Actor:
         """
         await self._state_manager.clear_cache()
 
+    def _get_prefetch_state_types(self) -> Dict[str, Type[Any]]:
+        """Maps the names in :attr:`prefetch_states` to the types of their values."""
+        if isinstance(self.prefetch_states, Mapping):
+            return dict(self.prefetch_states)
+        return {state_name: object for state_name in self.prefetch_states}
+
     async def _save_state_internal(self):
         """Saves all the state changes (add/update/remove) that were made since last call
         to the actor state provider associated with the actor.
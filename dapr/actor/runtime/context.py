@@ -16,7 +16,7 @@ limitations under the License.
 from dapr.actor.id import ActorId
 from dapr.actor.runtime._state_provider import StateProvider
 from dapr.clients.base import DaprActorClientBase
-from dapr.serializers import Serializer
+from dapr.serializers import Serializer, DefaultJSONSerializer
 
 from typing import Callable, Optional, TYPE_CHECKING
 
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
     from dapr.actor.runtime.actor import Actor
     from dapr.actor.runtime._type_information import ActorTypeInformation
 
+_JSON_SERIALIZER = DefaultJSONSerializer()
+
 
 class ActorRuntimeContext:
     """A context of ActorRuntime.
@@ -81,6 +83,16 @@ class ActorRuntimeContext:
         """Return message serializer which is used for Actor invocation."""
         return self._message_serializer
 
+    @property
+    def api_serializer(self) -> Serializer:
+        """Return the serializer for the timer and reminder bodies exchanged with Dapr.
+
+        This is the message serializer, unless it is binary; Dapr expects JSON there.
+        """
+        if getattr(self._message_serializer, 'binary', False):
+            return _JSON_SERIALIZER
+        return self._message_serializer
+
     @property
     def state_serializer(self) -> Serializer:
         """Return state serializer which is used for State value."""
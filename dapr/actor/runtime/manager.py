@@ -45,6 +45,10 @@ class ActorManager:
         self._timer_method_context = ActorMethodContext.create_for_timer(TIMER_METHOD_NAME)
         self._reminder_method_context = ActorMethodContext.create_for_reminder(REMINDER_METHOD_NAME)
 
+    async def close(self) -> None:
+        """Releases the connections held by the actor client of this actor type."""
+        await self._runtime_ctx.dapr_client.close()
+
     async def activate_actor(self, actor_id: ActorId):
         """Activates actor."""
         actor = self._runtime_ctx.create_actor(actor_id)
@@ -67,7 +71,7 @@ class ActorManager:
             raise ValueError(
                 f'{self._runtime_ctx.actor_type_info.type_name} does not implment Remindable.'
             )
-        request_obj = self._message_serializer.deserialize(request_body, object)
+        request_obj = self._runtime_ctx.api_serializer.deserialize(request_body, object)
         if isinstance(request_obj, dict):
             reminder_data = ActorReminderData.from_dict(reminder_name, request_obj)
         # ignore if request_obj is not dict
@@ -87,7 +91,7 @@ class ActorManager:
         await self._dispatch_internal(actor_id, self._reminder_method_context, invoke_reminder)
 
     async def fire_timer(self, actor_id: ActorId, timer_name: str, request_body: bytes) -> None:
-        timer = self._message_serializer.deserialize(request_body, object)
+        timer = self._runtime_ctx.api_serializer.deserialize(request_body, object)
 
         async def invoke_timer(actor: Actor) -> Optional[bytes]:
             await actor._fire_timer_internal(timer['callback'], timer['data'])
@@ -107,7 +111,10 @@ class ActorManager:
                 # * Support only one argument
                 # * If you use the default DaprJSONSerializer, it support only object type
                 # as a argument
-                input_obj = self._message_serializer.deserialize(request_body, arg_types[0])
+                arg_type = arg_types[0]
+                if getattr(self._message_serializer, 'typed_decode', False):
+                    arg_type = self._dispatcher.get_arg_decoder(actor_method_name)
+                input_obj = self._message_serializer.deserialize(request_body, arg_type)
                 rtnval = await self._dispatcher.dispatch(actor, actor_method_name, input_obj)
             else:
                 rtnval = await self._dispatcher.dispatch(actor, actor_method_name)
@@ -13,15 +13,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from dapr.actor.runtime.actor import Actor
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.actor.runtime._type_utils import get_dispatchable_attrs
+from dapr.serializers.typed import TypeDecoder, compile_decoder
 
 
 class ActorMethodDispatcher:
     def __init__(self, type_info: ActorTypeInformation):
         self._dispatch_mapping = get_dispatchable_attrs(type_info.implementation_type)
+        self._arg_decoders: Dict[str, Optional[TypeDecoder]] = {}
 
     async def dispatch(self, actor: Actor, name: str, *args, **kwargs) -> Any:
         self._check_name_exist(name)
@@ -35,6 +37,16 @@ class ActorMethodDispatcher:
         self._check_name_exist(name)
         return self._dispatch_mapping[name]['arg_types']
 
+    def get_arg_decoder(self, name: str) -> Optional[TypeDecoder]:
+        """Gets the decoder of the first argument, compiled once per actor method."""
+        try:
+            return self._arg_decoders[name]
+        except KeyError:
+            arg_types = self.get_arg_types(name)
+            decoder = compile_decoder(arg_types[0]) if arg_types else None
+            self._arg_decoders[name] = decoder
+            return decoder
+
     def get_return_type(self, name: str) -> Dict[str, Any]:
         self._check_name_exist(name)
         return self._dispatch_mapping[name]['return_types']
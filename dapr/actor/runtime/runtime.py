@@ -23,7 +23,7 @@ from dapr.actor.runtime.config import ActorRuntimeConfig
 from dapr.actor.runtime.context import ActorRuntimeContext
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.actor.runtime.manager import ActorManager
-from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
+from dapr.actor.runtime._client_factory import create_actor_client
 from dapr.serializers import Serializer, DefaultJSONSerializer
 from dapr.conf import settings
 
@@ -47,6 +47,11 @@ class ActorRuntime:
         message_serializer: Serializer = DefaultJSONSerializer(),
         state_serializer: Serializer = DefaultJSONSerializer(),
         http_timeout_seconds: int = settings.DAPR_HTTP_TIMEOUT_SECONDS,
+        http_max_connections: Optional[int] = None,
+        http_max_connections_per_host: Optional[int] = None,
+        http_keepalive_timeout: Optional[float] = None,
+        http_dns_cache_ttl: Optional[int] = None,
+        actor_client_protocol: Optional[str] = None,
     ) -> None:
         """Registers an :class:`Actor` object with the runtime.
 
@@ -56,17 +61,47 @@ class ActorRuntime:
                 between actors.
             state_serializer (:class:`Serializer`): Serializer that serializes state values.
             http_timeout_seconds (:int:): a configurable timeout value
+            http_max_connections (int, optional): Maximum number of pooled HTTP connections.
+            http_max_connections_per_host (int, optional): Maximum number of pooled HTTP
+                connections to the same endpoint.
+            http_keepalive_timeout (float, optional): Seconds an idle HTTP connection is
+                kept alive.
+            http_dns_cache_ttl (int, optional): Seconds resolved addresses are cached.
+            actor_client_protocol (str, optional): Protocol used to call the Dapr actor API,
+                'http', 'grpc' or 'grpc-aio'. Defaults to settings.DAPR_ACTOR_CLIENT_PROTOCOL.
         """
         type_info = ActorTypeInformation.create(actor)
-        # TODO: We will allow to use gRPC client later.
-        actor_client = DaprActorHttpClient(message_serializer, timeout=http_timeout_seconds)
+        actor_client = create_actor_client(
+            message_serializer,
+            protocol=actor_client_protocol,
+            timeout=http_timeout_seconds,
+            max_connections=http_max_connections,
+            max_connections_per_host=http_max_connections_per_host,
+            keepalive_timeout=http_keepalive_timeout,
+            dns_cache_ttl=http_dns_cache_ttl,
+        )
         ctx = ActorRuntimeContext(type_info, message_serializer, state_serializer, actor_client)
 
         # Create an ActorManager, override existing entry if registered again.
         async with cls._actor_managers_lock:
+            previous = cls._actor_managers.get(type_info.type_name)
             cls._actor_managers[type_info.type_name] = ActorManager(ctx)
             cls._actor_config.update_entities(ActorRuntime.get_registered_actor_types())
 
+        if previous is not None:
+            await previous.close()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Releases the connections held by the actor clients of all registered actor types.
+
+        Registered actor types remain registered; their clients reconnect on next use.
+        """
+        async with cls._actor_managers_lock:
+            managers = list(cls._actor_managers.values())
+        for manager in managers:
+            await manager.close()
+
     @classmethod
     def get_registered_actor_types(cls) -> List[str]:
         """Gets registered actor types."""
@@ -41,11 +41,13 @@ class ActorStateChange(Generic[T]):
         value: T,
         change_kind: StateChangeKind,
         ttl_in_seconds: Optional[int] = None,
+        serialized_value: Optional[bytes] = None,
     ):
         self._state_name = state_name
         self._value = value
         self._change_kind = change_kind
         self._ttl_in_seconds = ttl_in_seconds
+        self._serialized_value = serialized_value
 
     @property
     def state_name(self) -> str:
@@ -62,3 +64,8 @@ class ActorStateChange(Generic[T]):
     @property
     def ttl_in_seconds(self) -> Optional[int]:
         return self._ttl_in_seconds
+
+    @property
+    def serialized_value(self) -> Optional[bytes]:
+        """The value as it is stored, if it was already serialized."""
+        return self._serialized_value
@@ -14,12 +14,27 @@ limitations under the License.
 """
 
 import asyncio
+import hashlib
+
 from contextvars import ContextVar
 
 from dapr.actor.runtime.state_change import StateChangeKind, ActorStateChange
 from dapr.actor.runtime.reentrancy_context import reentrancy_ctx
 
-from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+    TypeVar,
+    Optional,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from dapr.actor.runtime.actor import Actor
@@ -27,22 +42,84 @@ if TYPE_CHECKING:
 T = TypeVar('T')
 CONTEXT: ContextVar[Optional[Dict[str, Any]]] = ContextVar('state_tracker_context')
 
+# The number of states the bulk operations load from Dapr at the same time by default
+DEFAULT_MAX_CONCURRENT_LOADS = 10
+
+
+def _fingerprint(serialized_value: bytes) -> bytes:
+    return hashlib.blake2b(serialized_value, digest_size=16).digest()
+
 
 class StateMetadata(Generic[T]):
     def __init__(
-        self, value: T, change_kind: StateChangeKind, ttl_in_seconds: Optional[int] = None
+        self,
+        value: T,
+        change_kind: StateChangeKind,
+        ttl_in_seconds: Optional[int] = None,
+        fingerprint: Optional[bytes] = None,
     ):
         self._value = value
         self._change_kind = change_kind
         self._ttl_in_seconds = ttl_in_seconds
+        self._fingerprint = fingerprint
+        # the stored form of a value that was not deserialized yet
+        self._serialized_value: Optional[bytes] = None
+        self._deserializer: Optional[Callable[[bytes, Type[Any]], T]] = None
+        self._state_type: Type[Any] = object
+
+    @classmethod
+    def from_serialized(
+        cls,
+        serialized_value: bytes,
+        deserializer: Callable[[bytes, Type[Any]], T],
+        state_type: Type[Any] = object,
+    ) -> 'StateMetadata[T]':
+        """Tracks a stored state, whose value is deserialized when it is first read.
+
+        Args:
+            serialized_value (bytes): the value as it is stored.
+            deserializer (Callable): deserializes the stored value to the given type.
+            state_type (Type, optional): the type the value is deserialized to.
+        """
+        state_metadata: StateMetadata[T] = cls(
+            None,  # type: ignore
+            StateChangeKind.none,
+            fingerprint=_fingerprint(serialized_value),
+        )
+        state_metadata._serialized_value = serialized_value
+        state_metadata._deserializer = deserializer
+        state_metadata._state_type = state_type
+        return state_metadata
 
     @property
     def value(self) -> T:
-        return self._value
+        return self.read()
 
     @value.setter
     def value(self, new_value: T) -> None:
         self._value = new_value
+        self._serialized_value = None
+        self._deserializer = None
+
+    @property
+    def serialized_value(self) -> Optional[bytes]:
+        """The value as it is stored while it has not been read, or None."""
+        return self._serialized_value
+
+    def read(self, state_type: Type[Any] = object) -> T:
+        """Returns the value, deserializing it if it was not read yet.
+
+        Args:
+            state_type (Type, optional): the type the value is deserialized to, instead
+                of the one it was loaded with.
+        """
+        if self._deserializer is not None:
+            if state_type is object:
+                state_type = self._state_type
+            self._value = self._deserializer(self._serialized_value, state_type)  # type: ignore
+            self._serialized_value = None
+            self._deserializer = None
+        return self._value
 
     @property
     def change_kind(self) -> StateChangeKind:
@@ -60,6 +137,15 @@ class StateMetadata(Generic[T]):
     def ttl_in_seconds(self, new_ttl_in_seconds: int) -> None:
         self._ttl_in_seconds = new_ttl_in_seconds
 
+    @property
+    def fingerprint(self) -> Optional[bytes]:
+        """A digest of the value as it is stored, or None if it is not known."""
+        return self._fingerprint
+
+    @fingerprint.setter
+    def fingerprint(self, new_fingerprint: Optional[bytes]) -> None:
+        self._fingerprint = new_fingerprint
+
 
 class ActorStateManager(Generic[T]):
     def __init__(self, actor: 'Actor'):
@@ -69,6 +155,15 @@ class ActorStateManager(Generic[T]):
         self._type_name = actor.runtime_ctx.actor_type_info.type_name
 
         self._default_state_change_tracker: Dict[str, StateMetadata] = {}
+        # the stored values of states that are not tracked, None for states that do not exist
+        self._default_loaded_states: Dict[str, Optional[bytes]] = {}
+        self._detect_mutations = actor.detect_state_mutations
+
+        # the writes save_state skipped because the stored value was the same
+        self.elided_writes = 0
+        self.elided_bytes = 0
+        # the states save_state wrote because their value was changed in place
+        self.detected_mutations = 0
 
     async def add_state(self, state_name: str, value: T) -> None:
         if not await self.try_add_state(state_name, value):
@@ -83,35 +178,100 @@ class ActorStateManager(Generic[T]):
                 return True
             return False
 
-        existed = await self._actor.runtime_ctx.state_provider.contains_state(
-            self._type_name, self._actor.id.id, state_name
-        )
+        existed = await self._load_state_bytes(state_name) is not None
         if not existed:
             return False
 
         state_change_tracker[state_name] = StateMetadata(value, StateChangeKind.add)
         return True
 
-    async def get_state(self, state_name: str) -> Optional[T]:
-        has_value, val = await self.try_get_state(state_name)
+    async def get_state(self, state_name: str, state_type: Type[Any] = object) -> Optional[T]:
+        has_value, val = await self.try_get_state(state_name, state_type)
         if has_value:
             return val
         else:
             raise KeyError(f'Actor State with name {state_name} was not found.')
 
-    async def try_get_state(self, state_name: str) -> Tuple[bool, Optional[T]]:
+    async def try_get_state(
+        self, state_name: str, state_type: Type[Any] = object
+    ) -> Tuple[bool, Optional[T]]:
         state_change_tracker = self._get_contextual_state_tracker()
         if state_name in state_change_tracker:
             state_metadata = state_change_tracker[state_name]
             if state_metadata.change_kind == StateChangeKind.remove:
                 return False, None
-            return True, state_metadata.value
-        has_value, val = await self._actor.runtime_ctx.state_provider.try_load_state(
-            self._type_name, self._actor.id.id, state_name
-        )
-        if has_value:
-            state_change_tracker[state_name] = StateMetadata(val, StateChangeKind.none)
-        return has_value, val
+            return True, state_metadata.read(state_type)
+        state_metadata = await self._load_state(state_name, state_type)
+        if state_metadata is None:
+            return False, None
+        state_change_tracker[state_name] = state_metadata
+        return True, state_metadata.read(state_type)
+
+    async def get_states(
+        self,
+        state_names: Iterable[str],
+        state_type: Type[Any] = object,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    ) -> Dict[str, T]:
+        """Gets the values of several states.
+
+        The states that are tracked are read from memory, and the others are loaded
+        from Dapr concurrently.
+
+        Args:
+            state_names (Iterable[str]): the names of the states.
+            state_type (Type, optional): the type the values are deserialized to.
+            max_concurrency (int, optional): the most states loaded at the same time.
+
+        Returns:
+            Dict[str, T]: the values, keyed by the state names.
+
+        Raises:
+            KeyError: if one of the states does not exist.
+        """
+        state_types = dict.fromkeys(state_names, state_type)
+        states = await self._try_get_states(state_types, max_concurrency)
+        for state_name in state_types:
+            if state_name not in states:
+                raise KeyError(f'Actor State with name {state_name} was not found.')
+        return states
+
+    async def try_get_states(
+        self,
+        state_names: Iterable[str],
+        state_type: Type[Any] = object,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    ) -> Dict[str, T]:
+        """Gets the values of the states that exist among several states.
+
+        The states that are tracked are read from memory, and the others are loaded
+        from Dapr concurrently.
+
+        Args:
+            state_names (Iterable[str]): the names of the states.
+            state_type (Type, optional): the type the values are deserialized to.
+            max_concurrency (int, optional): the most states loaded at the same time.
+
+        Returns:
+            Dict[str, T]: the values of the states that exist, keyed by the state names.
+        """
+        return await self._try_get_states(dict.fromkeys(state_names, state_type), max_concurrency)
+
+    async def prefetch_states(self, state_types: Mapping[str, Type[Any]]) -> None:
+        """Loads the states that are not tracked yet concurrently, so that reading them
+        later does not call Dapr. The values are deserialized when they are read.
+
+        Args:
+            state_types (Mapping[str, Type]): the names of the states to load, mapped to
+                the types their values are deserialized to.
+        """
+        state_change_tracker = self._get_contextual_state_tracker()
+        state_names = [name for name in state_types if name not in state_change_tracker]
+        await self._load_states_bytes(state_names, DEFAULT_MAX_CONCURRENT_LOADS)
+        for state_name in state_names:
+            state_metadata = await self._load_state(state_name, state_types[state_name])
+            if state_metadata is not None:
+                state_change_tracker[state_name] = state_metadata
 
     async def set_state(self, state_name: str, value: T) -> None:
         await self.set_state_ttl(state_name, value, None)
@@ -134,18 +294,42 @@ class ActorStateManager(Generic[T]):
             state_change_tracker[state_name] = state_metadata
             return
 
-        existed = await self._actor.runtime_ctx.state_provider.contains_state(
-            self._type_name, self._actor.id.id, state_name
-        )
-        if existed:
+        raw_state_value = await self._load_state_bytes(state_name)
+        if raw_state_value is not None:
             state_change_tracker[state_name] = StateMetadata(
-                value, StateChangeKind.update, ttl_in_seconds
+                value, StateChangeKind.update, ttl_in_seconds, _fingerprint(raw_state_value)
             )
         else:
             state_change_tracker[state_name] = StateMetadata(
                 value, StateChangeKind.add, ttl_in_seconds
             )
 
+    async def set_states(
+        self,
+        states: Mapping[str, T],
+        ttl_in_seconds: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    ) -> None:
+        """Sets the values of several states.
+
+        Whether the states that are not tracked exist is checked concurrently.
+
+        Args:
+            states (Mapping[str, T]): the new values, keyed by the state names.
+            ttl_in_seconds (int, optional): the time to live of the states.
+            max_concurrency (int, optional): the most states loaded at the same time.
+        """
+        if ttl_in_seconds is not None and ttl_in_seconds < 0:
+            return
+
+        state_change_tracker = self._get_contextual_state_tracker()
+        await self._load_states_bytes(
+            [state_name for state_name in states if state_name not in state_change_tracker],
+            max_concurrency,
+        )
+        for state_name, value in states.items():
+            await self.set_state_ttl(state_name, value, ttl_in_seconds)
+
     async def remove_state(self, state_name: str) -> None:
         if not await self.try_remove_state(state_name):
             raise KeyError(f'Actor State with name {state_name} was not found.')
@@ -162,9 +346,7 @@ class ActorStateManager(Generic[T]):
             state_metadata.change_kind = StateChangeKind.remove
             return True
 
-        existed = await self._actor.runtime_ctx.state_provider.contains_state(
-            self._type_name, self._actor.id.id, state_name
-        )
+        existed = await self._load_state_bytes(state_name) is not None
         if existed:
             state_change_tracker[state_name] = StateMetadata(None, StateChangeKind.remove)
             return True
@@ -175,9 +357,7 @@ class ActorStateManager(Generic[T]):
         if state_name in state_change_tracker:
             state_metadata = state_change_tracker[state_name]
             return state_metadata.change_kind != StateChangeKind.remove
-        return await self._actor.runtime_ctx.state_provider.contains_state(
-            self._type_name, self._actor.id.id, state_name
-        )
+        return await self._load_state_bytes(state_name) is not None
 
     async def get_or_add_state(self, state_name: str, value: T) -> Optional[T]:
         state_change_tracker = self._get_contextual_state_tracker()
@@ -211,13 +391,13 @@ class ActorStateManager(Generic[T]):
             state_change_tracker[state_name] = state_metadata
             return new_value
 
-        has_value, val = await self._actor.runtime_ctx.state_provider.try_load_state(
-            self._type_name, self._actor.id.id, state_name
-        )
+        state_metadata = await self._load_state(state_name)
 
-        if has_value:
-            new_value = update_value_factory(state_name, val)
-            state_change_tracker[state_name] = StateMetadata(new_value, StateChangeKind.update)
+        if state_metadata is not None:
+            new_value = update_value_factory(state_name, state_metadata.value)
+            state_metadata.value = new_value
+            state_metadata.change_kind = StateChangeKind.update
+            state_change_tracker[state_name] = state_metadata
             return new_value
         state_change_tracker[state_name] = StateMetadata(value, StateChangeKind.add)
         return value
@@ -239,37 +419,96 @@ class ActorStateManager(Generic[T]):
 
     async def clear_cache(self) -> None:
         state_change_tracker = self._get_contextual_state_tracker()
+        self._get_contextual_loaded_states().clear()
         default_loop = asyncio.get_running_loop()
         await default_loop.run_in_executor(None, state_change_tracker.clear)
 
     async def save_state(self) -> None:
+        """Saves the changes of the tracked states in one transaction.
+
+        A state set to the value it is stored with is not written, so it keeps the
+        time to live it was stored with unless a new one is set. When the actor
+        detects state mutations, the states whose value was changed in place are
+        written too.
+        """
         state_change_tracker = self._get_contextual_state_tracker()
         if len(state_change_tracker) == 0:
             return
 
+        state_provider = self._actor.runtime_ctx.state_provider
         state_changes = []
         states_to_remove = []
+        # the states written, with the fingerprint of what is stored from now on
+        written: List[Tuple[StateMetadata, Optional[bytes]]] = []
         for state_name, state_metadata in state_change_tracker.items():
-            if state_metadata.change_kind == StateChangeKind.none:
+            change_kind = state_metadata.change_kind
+            value = None
+            serialized_value = None
+            if change_kind == StateChangeKind.remove:
+                if state_metadata.serialized_value is None:
+                    value = state_metadata.value
+            elif state_metadata.serialized_value is not None or state_metadata.value is not None:
+                if change_kind == StateChangeKind.none and (
+                    not self._detect_mutations
+                    or state_metadata.fingerprint is None
+                    or state_metadata.serialized_value is not None
+                ):
+                    continue
+                if state_metadata.serialized_value is not None:
+                    # the value was not read, so it is written back as it is stored
+                    serialized_value = state_metadata.serialized_value
+                    fingerprint = state_metadata.fingerprint
+                else:
+                    value = state_metadata.value
+                    serialized_value = state_provider.serialize_state(value)
+                    fingerprint = _fingerprint(serialized_value)
+                unchanged = fingerprint == state_metadata.fingerprint
+                if change_kind == StateChangeKind.none:
+                    if unchanged:
+                        continue
+                    self.detected_mutations += 1
+                    change_kind = StateChangeKind.update
+                elif unchanged and state_metadata.ttl_in_seconds is None:
+                    self.elided_writes += 1
+                    self.elided_bytes += len(serialized_value)
+                    state_metadata.change_kind = StateChangeKind.none
+                    continue
+                written.append((state_metadata, fingerprint))
+            elif change_kind == StateChangeKind.none:
                 continue
+            else:
+                written.append((state_metadata, None))
             state_changes.append(
                 ActorStateChange(
                     state_name,
-                    state_metadata.value,
-                    state_metadata.change_kind,
+                    value,
+                    change_kind,
                     state_metadata.ttl_in_seconds,
+                    serialized_value,
                 )
             )
-            if state_metadata.change_kind == StateChangeKind.remove:
+            if change_kind == StateChangeKind.remove:
                 states_to_remove.append(state_name)
             # Mark the states as unmodified so that tracking for next invocation is done correctly.
             state_metadata.change_kind = StateChangeKind.none
         if len(state_changes) > 0:
-            await self._actor.runtime_ctx.state_provider.save_state(
-                self._type_name, self._actor.id.id, state_changes
-            )
+            await state_provider.save_state(self._type_name, self._actor.id.id, state_changes)
+        for state_metadata, fingerprint in written:
+            state_metadata.fingerprint = fingerprint
+        loaded_states = self._get_contextual_loaded_states()
+        for state_change in state_changes:
+            loaded_states.pop(state_change.state_name, None)
         for state_name in states_to_remove:
             state_change_tracker.pop(state_name, None)
+            loaded_states[state_name] = None
+
+    def counters(self) -> Dict[str, int]:
+        """Returns a snapshot of the write elision counters."""
+        return {
+            'elided_writes': self.elided_writes,
+            'elided_bytes': self.elided_bytes,
+            'detected_mutations': self.detected_mutations,
+        }
 
     def is_state_marked_for_remove(self, state_name: str) -> bool:
         state_change_tracker = self._get_contextual_state_tracker()
@@ -278,6 +517,67 @@ class ActorStateManager(Generic[T]):
             and state_change_tracker[state_name].change_kind == StateChangeKind.remove
         )
 
+    async def _load_state_bytes(self, state_name: str) -> Optional[bytes]:
+        """Gets the serialized value of a state that is not tracked, or None if it does
+        not exist.
+
+        What is learned is remembered until the state is saved or the cache is cleared,
+        so checking that a state exists and then reading it fetches it only once, and a
+        state that does not exist is not fetched again.
+        """
+        loaded_states = self._get_contextual_loaded_states()
+        if state_name in loaded_states:
+            return loaded_states[state_name]
+        raw_state_value = await self._actor.runtime_ctx.state_provider.load_state_bytes(
+            self._type_name, self._actor.id.id, state_name
+        )
+        loaded_states[state_name] = raw_state_value
+        return raw_state_value
+
+    async def _load_states_bytes(self, state_names: List[str], max_concurrency: int) -> None:
+        """Loads the serialized values of states that are not tracked concurrently, for
+        :meth:`_load_state_bytes` to return them without calling Dapr."""
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if not state_names:
+            return
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load(state_name: str) -> None:
+            async with semaphore:
+                await self._load_state_bytes(state_name)
+
+        await asyncio.gather(*(load(state_name) for state_name in state_names))
+
+    async def _try_get_states(
+        self, state_types: Mapping[str, Type[Any]], max_concurrency: int
+    ) -> Dict[str, T]:
+        state_change_tracker = self._get_contextual_state_tracker()
+        await self._load_states_bytes(
+            [state_name for state_name in state_types if state_name not in state_change_tracker],
+            max_concurrency,
+        )
+        states: Dict[str, T] = {}
+        for state_name, state_type in state_types.items():
+            has_value, val = await self.try_get_state(state_name, state_type)
+            if has_value:
+                states[state_name] = val
+        return states
+
+    async def _load_state(
+        self, state_name: str, state_type: Type[Any] = object
+    ) -> Optional[StateMetadata]:
+        """Loads a state that is not tracked, which the caller tracks, or returns None
+        if it does not exist. The value is deserialized when it is first read."""
+        raw_state_value = await self._load_state_bytes(state_name)
+        if raw_state_value is None:
+            return None
+        # the tracker holds the value from now on
+        self._get_contextual_loaded_states().pop(state_name, None)
+        return StateMetadata.from_serialized(
+            raw_state_value, self._actor.runtime_ctx.state_provider.deserialize_state, state_type
+        )
+
     def _get_contextual_state_tracker(self) -> Dict[str, StateMetadata]:
         context = CONTEXT.get(None)
         if context is not None and reentrancy_ctx.get(None) is not None:
@@ -285,9 +585,16 @@ class ActorStateManager(Generic[T]):
         else:
             return self._default_state_change_tracker
 
+    def _get_contextual_loaded_states(self) -> Dict[str, Optional[bytes]]:
+        context = CONTEXT.get(None)
+        if context is not None and reentrancy_ctx.get(None) is not None:
+            return context['loaded']
+        else:
+            return self._default_loaded_states
+
     def set_state_context(self, contextID: Optional[str]):
         if contextID is not None:
-            CONTEXT.set({'id': contextID, 'tracker': {}})
+            CONTEXT.set({'id': contextID, 'tracker': {}, 'loaded': {}})
         else:
             CONTEXT.set(None)
         return
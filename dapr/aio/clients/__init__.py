@@ -18,16 +18,31 @@ from typing import Callable, Dict, List, Optional, Union
 from dapr.clients.base import DaprActorClientBase
 from dapr.clients.exceptions import DaprInternalError, ERROR_CODE_UNKNOWN
 from dapr.aio.clients.grpc.client import DaprGrpcClientAsync, MetadataTuple, InvokeMethodResponse
+from dapr.aio.clients.grpc.dapr_actor_grpc_client import DaprActorGrpcClientAsync
+from dapr.aio.clients.grpc._publisher import Publisher
+from dapr.clients.grpc._state_batching import StateWriteBatching
+from dapr.clients.grpc._call_options import CallOptions, CompressionType
+from dapr.clients.grpc._helpers import BytesLike
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._retry import RetryPolicy
+from dapr.clients.grpc._state_cache import StateCache
 from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
 from dapr.clients.http.dapr_invocation_http_client import DaprInvocationHttpClient
 from dapr.conf import settings
 from google.protobuf.message import Message as GrpcMessage
 
 __all__ = [
+    'CallOptions',
     'DaprClient',
     'DaprActorClientBase',
     'DaprActorHttpClient',
+    'DaprActorGrpcClientAsync',
     'DaprInternalError',
+    'HedgingPolicy',
+    'Publisher',
+    'RetryPolicy',
+    'StateCache',
+    'StateWriteBatching',
     'ERROR_CODE_UNKNOWN',
 ]
 
@@ -61,6 +76,11 @@ class DaprClient(DaprGrpcClientAsync):
         ] = None,
         http_timeout_seconds: Optional[int] = None,
         max_grpc_message_length: Optional[int] = None,
+        state_cache: Optional[StateCache] = None,
+        state_write_batching: Optional[StateWriteBatching] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        call_options: Optional[CallOptions] = None,
     ):
         """Connects to Dapr Runtime and via gRPC and HTTP.
 
@@ -74,8 +94,27 @@ class DaprClient(DaprGrpcClientAsync):
             http_timeout_seconds (int): specify a timeout for http connections
             max_grpc_messsage_length (int, optional): The maximum grpc send and receive
                 message length in bytes.
+            state_cache (StateCache, optional): caches the values read by get_state and
+                get_bulk_state. Disabled by default.
+            state_write_batching (StateWriteBatching, optional): coalesces concurrent
+                save_state calls into batched requests. Disabled by default.
+            retry_policy (RetryPolicy, optional): retries calls that fail with a transient
+                error. Disabled by default.
+            hedging_policy (HedgingPolicy, optional): sends slow reads a second time
+                and uses the first response. Disabled by default.
+            call_options (CallOptions, optional): the default deadline of the gRPC calls,
+                and the compression of the channel.
         """
-        super().__init__(address, interceptors, max_grpc_message_length)
+        super().__init__(
+            address,
+            interceptors,
+            max_grpc_message_length,
+            state_cache,
+            state_write_batching,
+            retry_policy,
+            hedging_policy,
+            call_options,
+        )
         self.invocation_client = None
 
         invocation_protocol = settings.DAPR_API_METHOD_INVOCATION_PROTOCOL.upper()
@@ -97,24 +136,27 @@ class DaprClient(DaprGrpcClientAsync):
         self,
         app_id: str,
         method_name: str,
-        data: Union[bytes, str, GrpcMessage],
+        data: Union[BytesLike, str, GrpcMessage],
         content_type: Optional[str] = None,
         metadata: Optional[MetadataTuple] = None,
         http_verb: Optional[str] = None,
         http_querystring: Optional[MetadataTuple] = None,
         timeout: Optional[int] = None,
+        compression: Optional[CompressionType] = None,
     ) -> InvokeMethodResponse:
         """Invoke a service method over gRPC or HTTP.
 
         Args:
             app_id (str): Application Id.
             method_name (str): Method to be invoked.
-            data (bytes or str or GrpcMessage, optional): Data for requet's body.
+            data (bytes-like or str or GrpcMessage, optional): Data for requet's body.
             content_type (str, optional): Content type of the data.
             metadata (MetadataTuple, optional): Additional metadata or headers.
             http_verb (str, optional): HTTP verb for the request.
             http_querystring (MetadataTuple, optional): Query parameters.
             timeout (int, optional): Request timeout in seconds.
+            compression (grpc.Compression or str, optional): the compression of the
+                request over gRPC, e.g. 'gzip'.
 
         Returns:
             InvokeMethodResponse: the method invocation response.
@@ -140,4 +182,5 @@ class DaprClient(DaprGrpcClientAsync):
                 http_verb=http_verb,
                 http_querystring=http_querystring,
                 timeout=timeout,
+                compression=compression,
             )
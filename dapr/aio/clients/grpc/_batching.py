@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from dapr.clients.grpc._batching import Batch
+
+
+class BatcherAsync:
+    """Collects items into batches per key and sends them as tasks on the event loop.
+
+    A batch is handed to ``send`` once it is ``linger_seconds`` old, holds ``max_items``
+    items, or the next item would take it over ``max_bytes``. ``send`` must resolve the
+    future of every item in the batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Batch], Awaitable[None]],
+        linger_seconds: float,
+        max_items: int,
+        max_bytes: int,
+    ):
+        self._send = send
+        self._linger_seconds = linger_seconds
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._pending: Dict[Hashable, Batch] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._sends: Set[asyncio.Future] = set()
+
+    def submit(
+        self, key: Hashable, item: Any, item_id: Optional[Hashable] = None, size: int = 0
+    ) -> asyncio.Future:
+        """Queues an item and returns the future its batch resolves."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is not None and not batch.fits(item_id, size, self._max_bytes):
+            self._dispatch(key)
+            batch = None
+        if batch is None:
+            batch = Batch(key, loop.time() + self._linger_seconds)
+            self._pending[key] = batch
+            self._timers[key] = loop.call_later(self._linger_seconds, self._dispatch, key)
+        batch.add(item, item_id, size, future)
+        if len(batch.items) >= self._max_items:
+            self._dispatch(key)
+        return future
+
+    async def flush(self) -> None:
+        """Sends all queued items and waits until every sent batch completes."""
+        for key in list(self._pending):
+            self._dispatch(key)
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Sends all queued items and waits for them to complete."""
+        await self.flush()
+
+    def _dispatch(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch is not None:
+            send = asyncio.ensure_future(self._send(batch))
+            self._sends.add(send)
+            send.add_done_callback(self._sends.discard)
+
+
+def set_result(waiter: Any, result: Any) -> None:
+    """Resolves a future unless its caller stopped waiting for it."""
+    if not waiter.done():
+        waiter.set_result(result)
+
+
+def set_exception(waiter: Any, err: BaseException) -> None:
+    """Fails a future unless its caller stopped waiting for it."""
+    if not waiter.done():
+        waiter.set_exception(err)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import time
+
+from typing import Any, Dict, Optional, Tuple
+
+from grpc.aio import AioRpcError  # type: ignore
+
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._helpers import MetadataTuple
+
+
+async def hedged_call_async(
+    policy: HedgingPolicy,
+    method: str,
+    multicallable: Any,
+    request: Any,
+    metadata: Optional[MetadataTuple] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """Sends a unary call, and a hedge of it if it is slow.
+
+    Args:
+        policy (HedgingPolicy): decides when the call is hedged.
+        method (str): the Dapr API method, e.g. ``GetState``.
+        multicallable (grpc.aio.UnaryUnaryMultiCallable): the stub method to call.
+        request: the request message.
+        metadata (tuple, optional): gRPC custom metadata.
+        timeout (float, optional): the deadline of the call in seconds, which the
+            hedge shares.
+
+    Returns:
+        The finished call to await for the response. It raises the error of the last
+        copy if every copy failed.
+    """
+    policy.on_call()
+    sent: Dict[asyncio.Future, Tuple[Any, float]] = {}
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def send() -> asyncio.Future:
+        start = time.monotonic()
+        remaining = None if deadline is None else max(deadline - start, 0.0)
+        call = multicallable(request, metadata=metadata, timeout=remaining)
+        task = asyncio.ensure_future(_settle(call))
+        sent[task] = (call, start)
+        return task
+
+    winner: Optional[asyncio.Future] = None
+    try:
+        done, pending = await asyncio.wait({send()}, timeout=policy.delay(method))
+        if not done and policy.try_hedge():
+            pending.add(send())
+        while True:
+            if not done:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = done.pop()
+            # a copy that failed leaves the other one to win
+            if winner.result() or not (done or pending):
+                break
+    finally:
+        # the copy that lost, or every copy when the caller was cancelled
+        for task, (call, _) in sent.items():
+            if task is not winner:
+                call.cancel()
+                task.cancel()
+
+    call, start = sent[winner]
+    if winner.result():
+        first_task = next(iter(sent))
+        policy.on_success(method, time.monotonic() - start, winner is not first_task)
+    return call
+
+
+async def _settle(call: Any) -> bool:
+    try:
+        await call
+    except AioRpcError:
+        return False
+    return True
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from typing import Dict, Optional, Union, TYPE_CHECKING
+
+from dapr.aio.clients.grpc._batching import BatcherAsync, set_exception, set_result
+from dapr.clients.exceptions import DaprInternalError
+from dapr.clients.grpc._batching import DEFAULT_MAX_MESSAGE_LENGTH, Batch
+from dapr.clients.grpc._publisher import entry_size
+from dapr.clients.grpc._request import BulkPublishEntry
+
+if TYPE_CHECKING:
+    from dapr.aio.clients.grpc.client import DaprGrpcClientAsync
+
+
+class Publisher:
+    """Buffers events per pub/sub topic and publishes them in bulk.
+
+    Events given to :meth:`publish` are collected for up to ``linger_seconds`` and sent
+    with :meth:`DaprGrpcClientAsync.publish_events`. A buffer is sent early once it holds
+    ``max_entries`` events or would exceed ``max_bytes``. Events the pub/sub component
+    rejects are retried ``max_retries`` times, and the future of each event reports
+    whether it was published.
+
+    Examples:
+
+        >>> from dapr.aio.clients import DaprClient, Publisher
+        >>> async with DaprClient() as d, Publisher(d) as publisher:
+        ...     futures = [publisher.publish('pubsub', 'orders', f'{i}') for i in range(1000)]
+        ...     await asyncio.gather(*futures)
+    """
+
+    def __init__(
+        self,
+        client: DaprGrpcClientAsync,
+        max_entries: int = 100,
+        max_bytes: Optional[int] = None,
+        linger_seconds: float = 0.01,
+        publish_metadata: Optional[Dict[str, str]] = None,
+        max_retries: int = 0,
+        retry_backoff_seconds: float = 0.1,
+    ):
+        """Creates a publisher.
+
+        Args:
+            client (DaprGrpcClientAsync): the client the events are published with.
+            max_entries (int): the maximum number of events in one request.
+            max_bytes (int, optional): the maximum request size, 4 MiB by default.
+            linger_seconds (float): the longest an event waits for other events.
+            publish_metadata (Dict[str, str], optional): Dapr metadata of every request.
+            max_retries (int): how often events the pub/sub rejects are published again.
+            retry_backoff_seconds (float): the wait before the first retry, doubled after
+                each retry.
+
+        Raises:
+            ValueError: max_entries is not positive, or linger_seconds is negative.
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be a positive number')
+        if linger_seconds < 0:
+            raise ValueError('linger_seconds cannot be negative')
+        self._client = client
+        self._publish_metadata = publish_metadata or {}
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._batcher = BatcherAsync(
+            self._send, linger_seconds, max_entries, max_bytes or DEFAULT_MAX_MESSAGE_LENGTH
+        )
+
+    def publish(
+        self,
+        pubsub_name: str,
+        topic_name: str,
+        data: Union[bytes, str],
+        entry_id: Optional[str] = None,
+        data_content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> asyncio.Future:
+        """Queues an event.
+
+        Args:
+            pubsub_name (str): the name of the pubsub component
+            topic_name (str): the topic name to publish to
+            data (bytes or str): bytes or str for data
+            entry_id (str, optional): identifies the event, a random UUID by default.
+            data_content_type (str, optional): content type of the data payload
+            metadata (Dict[str, str], optional): Dapr metadata of the event
+
+        Returns:
+            :class:`asyncio.Future` resolving to the entry id once the event is published.
+            It raises :class:`DaprInternalError` if the pub/sub rejects the event, or the
+            error of the publish request.
+        """
+        entry = BulkPublishEntry(data, entry_id or str(uuid.uuid4()), data_content_type, metadata)
+        return self._batcher.submit(
+            (pubsub_name, topic_name), entry, entry.entry_id, entry_size(entry)
+        )
+
+    async def flush(self) -> None:
+        """Publishes all buffered events and waits for the requests to complete."""
+        await self._batcher.flush()
+
+    async def close(self) -> None:
+        """Publishes all buffered events and waits for the requests to complete."""
+        await self._batcher.close()
+
+    async def __aenter__(self) -> Publisher:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _send(self, batch: Batch) -> None:
+        pubsub_name, topic_name = batch.key
+        try:
+            response = await self._client.publish_events(
+                pubsub_name,
+                topic_name,
+                batch.items,
+                publish_metadata=self._publish_metadata,
+                max_retries=self._max_retries,
+                retry_backoff_seconds=self._retry_backoff_seconds,
+            )
+        except Exception as err:
+            for waiter in batch.waiters:
+                set_exception(waiter, err)
+            return
+
+        errors = {failed.entry_id: failed.error for failed in response.failed_entries}
+        for entry, waiter in zip(batch.items, batch.waiters):
+            if entry.entry_id in errors:
+                set_exception(
+                    waiter,
+                    DaprInternalError(
+                        f'failed to publish event {entry.entry_id}: {errors[entry.entry_id]}'
+                    ),
+                )
+            else:
+                set_result(waiter, entry.entry_id)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from dapr.clients.grpc._query import (
+    QueryDecoder,
+    QueryPage,
+    decode_items,
+    next_page_token,
+    page_query,
+    split,
+)
+from dapr.clients.grpc._response import QueryResponse
+
+
+async def iter_query_async(
+    fetch: Callable[[str], Awaitable[QueryResponse]],
+    query: Dict[str, Any],
+    prefetch: bool = True,
+    decode: Optional[QueryDecoder] = None,
+    decode_workers: int = 1,
+) -> AsyncIterator[Any]:
+    """Yields the items of a paged query.
+
+    While the items of a page are consumed, the next page is fetched as a task and
+    decoded on a thread pool, so at most two pages are held in memory at a time.
+
+    Args:
+        fetch (callable): sends the query for one page.
+        query (Dict[str, Any]): the query from :func:`parse_paged_query`.
+        prefetch (bool): whether the next page is fetched ahead of time.
+        decode (callable, optional): applied to every item off the event loop, its
+            results are yielded instead of the items.
+        decode_workers (int): the number of threads decoding a page.
+    """
+    loop = asyncio.get_running_loop()
+    decode_pool: Optional[ThreadPoolExecutor] = None
+    if decode is not None:
+        decode_pool = ThreadPoolExecutor(
+            max(decode_workers, 1), thread_name_prefix='dapr-query-decode'
+        )
+
+    async def load(token: Optional[str]) -> QueryPage:
+        response = await fetch(page_query(query, token))
+        results: List[Any] = list(response.results)
+        if decode is not None:
+            slices = await asyncio.gather(
+                *(
+                    loop.run_in_executor(decode_pool, decode_items, decode, part)
+                    for part in split(results, decode_workers)
+                )
+            )
+            results = [item for decoded in slices for item in decoded]
+        return results, next_page_token(token, response)
+
+    next_page: Optional[asyncio.Future] = None
+    try:
+        results, token = await load(None)
+        while True:
+            if prefetch and token is not None:
+                next_page = asyncio.ensure_future(load(token))
+            for item in results:
+                yield item
+            if token is None:
+                return
+            if next_page is not None:
+                results, token = await next_page
+                next_page = None
+            else:
+                results, token = await load(token)
+    finally:
+        # an iteration stopped early leaves a prefetched page nobody waits for
+        if next_page is not None:
+            next_page.cancel()
+        if decode_pool is not None:
+            decode_pool.shutdown(wait=False)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import time
+
+from grpc.aio import AioRpcError, UnaryUnaryClientInterceptor  # type: ignore
+
+from dapr.aio.clients.grpc._asynchelpers import _ClientCallDetailsAsync
+from dapr.clients.grpc._retry import RetryPolicy
+
+
+class RetryInterceptorAsync(UnaryUnaryClientInterceptor):
+    """Sends unary calls again as the :class:`RetryPolicy` allows."""
+
+    def __init__(self, policy: RetryPolicy):
+        self._policy = policy
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.monotonic()
+        timeout = client_call_details.timeout
+        call_details = client_call_details
+        attempt = 1
+        while True:
+            call = await continuation(call_details, request)
+            try:
+                await call
+            except AioRpcError as err:
+                remaining = None if timeout is None else timeout - (time.monotonic() - start)
+                delay = self._policy.on_failure(client_call_details.method, err, attempt, remaining)
+                if delay is None:
+                    return call
+            else:
+                self._policy.on_success()
+                return call
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            if timeout is not None:
+                # the retries share the deadline of the call
+                call_details = _ClientCallDetailsAsync(
+                    client_call_details.method,
+                    timeout - (time.monotonic() - start),
+                    client_call_details.metadata,
+                    client_call_details.credentials,
+                    client_call_details.wait_for_ready,
+                )
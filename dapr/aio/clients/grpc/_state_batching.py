@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+from typing import Awaitable, Callable, List, Optional
+
+from dapr.aio.clients.grpc._batching import BatcherAsync, set_exception, set_result
+from dapr.clients.grpc._batching import Batch
+from dapr.clients.grpc._response import DaprResponse
+from dapr.clients.grpc._state_batching import StateWriteBatching
+from dapr.proto import common_v1
+
+
+class SaveStateBatcherAsync:
+    """Coalesces state writes of a :class:`DaprGrpcClientAsync` on the event loop."""
+
+    def __init__(
+        self,
+        send: Callable[[str, List[common_v1.StateItem]], Awaitable[DaprResponse]],
+        batching: StateWriteBatching,
+        max_grpc_message_length: Optional[int] = None,
+    ):
+        """Creates the batcher.
+
+        Args:
+            send (callable): sends a SaveState request for a store and its states.
+            batching (StateWriteBatching): the batching options.
+            max_grpc_message_length (int, optional): the message size limit of the client.
+        """
+        self._send = send
+        self._batcher = BatcherAsync(
+            self._flush,
+            batching.linger_seconds,
+            batching.max_items,
+            batching.get_max_bytes(max_grpc_message_length),
+        )
+
+    def submit(self, store_name: str, state: common_v1.StateItem) -> asyncio.Future:
+        """Queues a state write and returns the future of its response."""
+        return self._batcher.submit(store_name, state, state.key, state.ByteSize())
+
+    async def close(self) -> None:
+        """Sends all queued writes and waits for them to complete."""
+        await self._batcher.close()
+
+    async def _flush(self, batch: Batch) -> None:
+        try:
+            response = await self._send(batch.key, batch.items)
+        except Exception as err:
+            if len(batch.items) == 1:
+                set_exception(batch.waiters[0], err)
+                return
+            # A failed request does not tell which state caused it, so each state is
+            # sent again on its own to give every caller its own result.
+            for state, waiter in zip(batch.items, batch.waiters):
+                try:
+                    set_result(waiter, await self._send(batch.key, [state]))
+                except Exception as state_err:
+                    set_exception(waiter, state_err)
+            return
+
+        for waiter in batch.waiters:
+            set_result(waiter, response)
@@ -14,8 +14,6 @@ limitations under the License.
 """
 
 import asyncio
-import time
-import socket
 import json
 import uuid
 
@@ -24,7 +22,7 @@ from urllib.parse import urlencode
 
 from warnings import warn
 
-from typing import Callable, Dict, Optional, Text, Union, Sequence, List, Any
+from typing import AsyncIterator, Callable, Dict, Optional, Text, Tuple, Union, Sequence, List, Any
 from typing_extensions import Self
 
 from google.protobuf.message import Message as GrpcMessage
@@ -41,8 +39,25 @@ from grpc.aio import (  # type: ignore
 
 from dapr.clients.exceptions import DaprInternalError, DaprGrpcError
 from dapr.clients.grpc._state import StateOptions, StateItem
+from dapr.clients.grpc._state_batching import StateWriteBatching
+from dapr.clients.grpc._batching import DEFAULT_MAX_MESSAGE_LENGTH, chunk_by_size
+from dapr.clients.grpc._publisher import (
+    build_bulk_publish_request,
+    get_failed_entries,
+    to_bulk_publish_entries,
+)
+from dapr.clients.grpc._channels import channel_registry
+from dapr.clients.grpc._call_options import CallOptions, CompressionType, to_compression
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._retry import RetryPolicy
+from dapr.clients.grpc._query import parse_paged_query
+from dapr.clients.grpc._state_cache import StateCache, merge_bulk_state
+from dapr.aio.clients.grpc._hedging import hedged_call_async
+from dapr.aio.clients.grpc._query import iter_query_async
+from dapr.aio.clients.grpc._retry import RetryInterceptorAsync
+from dapr.aio.clients.grpc._state_batching import SaveStateBatcherAsync
 from dapr.clients.grpc._helpers import getWorkflowRuntimeStatus
-from dapr.clients.health import DaprHealth
+from dapr.clients.health import DaprHealth, wait_for_socket_async
 from dapr.conf.helpers import GrpcEndpoint
 from dapr.conf import settings
 from dapr.proto import api_v1, api_service_v1, common_v1
@@ -51,6 +66,7 @@ from dapr.version import __version__
 
 from dapr.aio.clients.grpc._asynchelpers import DaprClientInterceptorAsync
 from dapr.clients.grpc._helpers import (
+    BytesLike,
     MetadataTuple,
     to_bytes,
     validateNotNone,
@@ -60,6 +76,7 @@ from dapr.clients.grpc._request import (
     InvokeMethodRequest,
     BindingRequest,
     TransactionalStateOperation,
+    BulkPublishEntry,
 )
 from dapr.clients.grpc._response import (
     BindingResponse,
@@ -72,6 +89,9 @@ from dapr.clients.grpc._response import (
     StateResponse,
     BulkStatesResponse,
     BulkStateItem,
+    LazyItems,
+    BulkPublishResponse,
+    DeleteBulkStateResponse,
     ConfigurationResponse,
     QueryResponse,
     QueryResponseItem,
@@ -118,6 +138,11 @@ class DaprGrpcClientAsync:
             ]
         ] = None,
         max_grpc_message_length: Optional[int] = None,
+        state_cache: Optional[StateCache] = None,
+        state_write_batching: Optional[StateWriteBatching] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        call_options: Optional[CallOptions] = None,
     ):
         """Connects to Dapr Runtime and initialize gRPC client stub.
 
@@ -129,8 +154,38 @@ class DaprGrpcClientAsync:
                 StreamStreamClientInterceptor, optional): gRPC interceptors.
             max_grpc_messsage_length (int, optional): The maximum grpc send and receive
                 message length in bytes.
+            state_cache (StateCache, optional): caches the values read by get_state and
+                get_bulk_state. Disabled by default.
+            state_write_batching (StateWriteBatching, optional): coalesces concurrent
+                save_state calls into batched requests. Disabled by default.
+            retry_policy (RetryPolicy, optional): retries calls that fail with a transient
+                error. Disabled by default.
+            hedging_policy (HedgingPolicy, optional): sends slow reads a second time
+                and uses the first response. Disabled by default.
+            call_options (CallOptions, optional): the default deadline of the calls, and
+                the compression of the channel.
         """
-        DaprHealth.wait_until_ready()
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # Inside an event loop the sidecar is checked by a task, so the loop is not
+        # blocked. `async with` and wait() wait for it.
+        self._health_check: Optional[asyncio.Task] = None
+        if loop is None:
+            DaprHealth.wait_until_ready()
+        elif not DaprHealth.is_ready():
+            self._health_check = loop.create_task(DaprHealth.wait_until_ready_async())
+            self._health_check.add_done_callback(_retrieve_exception)
+        self._call_options = call_options or CallOptions()
+        self._hedging_policy = hedging_policy
+        self._state_cache = state_cache
+        self._max_grpc_message_length = max_grpc_message_length
+        self._save_state_batcher = None
+        if state_write_batching is not None:
+            self._save_state_batcher = SaveStateBatcherAsync(
+                self._send_save_state, state_write_batching, max_grpc_message_length
+            )
 
         useragent = f'dapr-sdk-python/{__version__}'
         if not max_grpc_message_length:
@@ -154,38 +209,99 @@ class DaprGrpcClientAsync:
         except ValueError as error:
             raise DaprInternalError(f'{error}') from error
 
-        if self._uri.tls:
-            self._channel = grpc.aio.secure_channel(
-                self._uri.endpoint, credentials=self.get_credentials(), options=options
+        # the retry interceptor comes first, so the others run again for every retry
+        retry_interceptors = []
+        if retry_policy is not None:
+            retry_interceptors.append(RetryInterceptorAsync(retry_policy))
+
+        compression = self._call_options.compression
+
+        def create_channel() -> grpc.aio.Channel:
+            if interceptors:
+                return grpc.aio.insecure_channel(  # type: ignore
+                    address, options=options, *interceptors
+                )
+            if settings.DAPR_API_TOKEN:
+                api_token_interceptor = DaprClientInterceptorAsync(
+                    [
+                        ('dapr-api-token', settings.DAPR_API_TOKEN),
+                    ]
+                )
+                return grpc.aio.insecure_channel(  # type: ignore
+                    address,
+                    options=options,
+                    compression=compression,
+                    interceptors=(*retry_interceptors, api_token_interceptor),
+                )
+            if self._uri.tls:
+                return grpc.aio.secure_channel(
+                    self._uri.endpoint,
+                    credentials=self.get_credentials(),
+                    options=options,
+                    compression=compression,
+                    interceptors=retry_interceptors,
+                )  # type: ignore
+            return grpc.aio.insecure_channel(
+                self._uri.endpoint, options, compression, interceptors=retry_interceptors
             )  # type: ignore
-        else:
-            self._channel = grpc.aio.insecure_channel(self._uri.endpoint, options)  # type: ignore
 
-        if settings.DAPR_API_TOKEN:
-            api_token_interceptor = DaprClientInterceptorAsync(
-                [
-                    ('dapr-api-token', settings.DAPR_API_TOKEN),
-                ]
-            )
-            self._channel = grpc.aio.insecure_channel(  # type: ignore
-                address, options=options, interceptors=(api_token_interceptor,)
-            )
-        if interceptors:
-            self._channel = grpc.aio.insecure_channel(  # type: ignore
-                address, options=options, *interceptors
-            )
+        # Clients with the same endpoint and options share one channel, and with it
+        # the connection to the sidecar. An aio channel belongs to the event loop it
+        # was created on, so each loop gets its own.
+        channel_key = (
+            address,
+            self._uri.tls,
+            type(self).get_credentials if self._uri.tls else None,
+            tuple(options),
+            settings.DAPR_API_TOKEN,
+            tuple(interceptors or ()),
+            retry_policy,
+            compression,
+            loop,
+        )
+        self._channel_lease = channel_registry.acquire(channel_key, create_channel)
+        self._channel = self._channel_lease.channel
 
         self._stub = api_service_v1.DaprStub(self._channel)
 
     def get_credentials(self):
         return grpc.ssl_channel_credentials()
 
+    async def _read(
+        self,
+        method: str,
+        request: GrpcMessage,
+        metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+    ) -> grpc.aio.UnaryUnaryCall:
+        """Sends a read of the Dapr API, hedged if the hedging policy covers it.
+
+        Returns:
+            The call, to await for the response and headers.
+        """
+        multicallable = getattr(self._stub, method)
+        timeout = self._call_options.deadline(timeout)
+        policy = self._hedging_policy
+        if policy is None or not policy.applies_to(method):
+            return multicallable(request, metadata=metadata, timeout=timeout)
+        return await hedged_call_async(policy, method, multicallable, request, metadata, timeout)
+
     async def close(self):
-        """Closes Dapr runtime gRPC channel."""
-        if hasattr(self, '_channel') and self._channel:
-            await self._channel.close()
+        """Closes Dapr runtime gRPC channel.
+
+        The channel is shared with other clients of the same address, options and
+        event loop, and only closed once none of them uses it anymore.
+        """
+        if getattr(self, '_save_state_batcher', None) is not None:
+            await self._save_state_batcher.close()
+        if getattr(self, '_channel_lease', None) is not None:
+            channel = self._channel_lease.release()
+            if channel is not None:
+                await channel.close()
 
     async def __aenter__(self) -> Self:  # type: ignore
+        if self._health_check is not None:
+            await self._health_check
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
@@ -204,12 +320,13 @@ class DaprGrpcClientAsync:
         self,
         app_id: str,
         method_name: str,
-        data: Union[bytes, str, GrpcMessage] = '',
+        data: Union[BytesLike, str, GrpcMessage] = '',
         content_type: Optional[str] = None,
         metadata: Optional[MetadataTuple] = None,
         http_verb: Optional[str] = None,
         http_querystring: Optional[MetadataTuple] = None,
-        timeout: Optional[int] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> InvokeMethodResponse:
         """Invokes the target service to call method.
 
@@ -274,12 +391,15 @@ class DaprGrpcClientAsync:
         Args:
             app_id (str): the callee app id
             method (str): the method name which is called
-            data (bytes or :obj:`google.protobuf.message.Message`, optional): bytes
-                or Message for data which will be sent to app id
+            data (bytes-like, str or :obj:`google.protobuf.message.Message`, optional):
+                bytes-like, str or Message for data which will be sent to app id
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
             http_verb (str, optional): http method verb to call HTTP callee application
             http_querystring (tuple, optional): the tuple to represent query string
-            timeout (int, optional): request timeout in seconds
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`InvokeMethodResponse` object returned from callee
@@ -305,17 +425,23 @@ class DaprGrpcClientAsync:
         content_type = ''
         if req_data.content_type:
             content_type = req_data.content_type
-        req = api_v1.InvokeServiceRequest(
-            id=app_id,
-            message=common_v1.InvokeRequest(
-                method=method_name,
-                data=req_data.proto,
-                content_type=content_type,
-                http_extension=http_ext,
-            ),
-        )
+        # build the request in place, since every message passed to a constructor is copied
+        req = api_v1.InvokeServiceRequest(id=app_id)
+        req.message.method = method_name
+        req.message.content_type = content_type
+        if http_ext is not None:
+            req.message.http_extension.CopyFrom(http_ext)
+        if req_data.is_proto():
+            req.message.data.CopyFrom(req_data.proto)
+        else:
+            req.message.data.value = req_data.data
 
-        call = self._stub.InvokeService(req, metadata=metadata, timeout=timeout)
+        call = self._stub.InvokeService(
+            req,
+            metadata=metadata,
+            timeout=self._call_options.deadline(timeout),
+            compression=to_compression(compression),
+        )
         response = await call
 
         resp_data = InvokeMethodResponse(response.data, response.content_type)
@@ -326,9 +452,11 @@ class DaprGrpcClientAsync:
         self,
         binding_name: str,
         operation: str,
-        data: Union[bytes, str] = '',
+        data: Union[BytesLike, str] = '',
         binding_metadata: Dict[str, str] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> BindingResponse:
         """Invokes the output binding with the specified operation.
 
@@ -353,9 +481,13 @@ class DaprGrpcClientAsync:
         Args:
             binding_name (str): the name of the binding as defined in the components
             operation (str): the operation to perform on the binding
-            data (bytes or str, optional): bytes or str for data which will sent to the binding
+            data (bytes-like or str, optional): the data which will sent to the binding
             binding_metadata (dict, optional): Dapr metadata for output binding
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`InvokeBindingResponse` object returned from binding
@@ -377,7 +509,12 @@ class DaprGrpcClientAsync:
             operation=operation,
         )
 
-        call = self._stub.InvokeBinding(req, metadata=metadata)
+        call = self._stub.InvokeBinding(
+            req,
+            metadata=metadata,
+            timeout=self._call_options.deadline(timeout),
+            compression=to_compression(compression),
+        )
         response = await call
         return BindingResponse(
             response.data, dict(response.metadata), await call.initial_metadata()
@@ -387,10 +524,12 @@ class DaprGrpcClientAsync:
         self,
         pubsub_name: str,
         topic_name: str,
-        data: Union[bytes, str],
+        data: Union[BytesLike, str],
         publish_metadata: Dict[str, str] = {},
         metadata: Optional[MetadataTuple] = None,
         data_content_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Publish to a given topic.
         This publishes an event with bytes array or str data to a specified topic and
@@ -413,10 +552,14 @@ class DaprGrpcClientAsync:
         Args:
             pubsub_name (str): the name of the pubsub component
             topic_name (str): the topic name to publish to
-            data (bytes or str): bytes or str for data
+            data (bytes-like or str): the data of the event
             publish_metadata (Dict[str, str], optional): Dapr metadata per Pub/Sub message
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
             data_content_type: (str, optional): content type of the data payload
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -429,15 +572,10 @@ class DaprGrpcClientAsync:
                 stacklevel=2,
             )
 
-        if not isinstance(data, bytes) and not isinstance(data, str):
+        if not isinstance(data, (bytes, bytearray, memoryview, str)):
             raise ValueError(f'invalid type for data {type(data)}')
 
-        req_data: bytes
-        if isinstance(data, bytes):
-            req_data = data
-        else:
-            if isinstance(data, str):
-                req_data = data.encode('utf-8')
+        req_data = to_bytes(data)
 
         content_type = ''
         if data_content_type:
@@ -451,7 +589,12 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            call = self._stub.PublishEvent(req, metadata=metadata)
+            call = self._stub.PublishEvent(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             # response is google.protobuf.Empty
             await call
         except AioRpcError as err:
@@ -459,12 +602,92 @@ class DaprGrpcClientAsync:
 
         return DaprResponse(await call.initial_metadata())
 
+    async def publish_events(
+        self,
+        pubsub_name: str,
+        topic_name: str,
+        data: Sequence[Union[bytes, str, BulkPublishEntry]],
+        publish_metadata: Dict[str, str] = {},
+        data_content_type: Optional[str] = None,
+        max_retries: int = 0,
+        retry_backoff_seconds: float = 0.1,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
+    ) -> BulkPublishResponse:
+        """Publishes several events to a given topic in one request.
+
+        The pub/sub component may publish some of the events and reject others. Rejected
+        events are published again up to max_retries times, and those still rejected are
+        returned in the response.
+
+        The example publishes three events to a topic:
+
+            from dapr.aio.clients import DaprClient
+            async with DaprClient() as d:
+                resp = await d.publish_events(
+                    pubsub_name='pubsub_1',
+                    topic_name='TOPIC_A',
+                    data=['message 1', 'message 2', b'message 3'],
+                )
+                # resp.failed_entries lists the events that were not published.
+
+        Args:
+            pubsub_name (str): the name of the pubsub component
+            topic_name (str): the topic name to publish to
+            data (Sequence[Union[bytes, str, BulkPublishEntry]]): the events
+            publish_metadata (Dict[str, str], optional): Dapr metadata of the request
+            data_content_type (str, optional): content type of events that do not set one
+            max_retries (int): how often rejected events are published again
+            retry_backoff_seconds (float): the wait before the first retry, doubled after
+                each retry
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
+
+        Returns:
+            :class:`BulkPublishResponse` gRPC metadata returned from callee and the
+            events that were not published
+
+        Raises:
+            ValueError: data is empty or the entry ids of the events are not unique
+        """
+        warn(
+            'The Bulk Publish API is an Alpha version and is subject to change.',
+            UserWarning,
+            stacklevel=2,
+        )
+
+        entries = to_bulk_publish_entries(data)
+        attempt = 0
+        while True:
+            req = build_bulk_publish_request(
+                pubsub_name, topic_name, entries, publish_metadata, data_content_type
+            )
+            try:
+                call = self._stub.BulkPublishEventAlpha1(
+                    req,
+                    timeout=self._call_options.deadline(timeout),
+                    compression=to_compression(compression),
+                )
+                response = await call
+            except AioRpcError as err:
+                raise DaprGrpcError(err) from err
+
+            failed_entries = get_failed_entries(entries, response)
+            if not failed_entries or attempt >= max_retries:
+                return BulkPublishResponse(failed_entries, await call.initial_metadata())
+            await asyncio.sleep(retry_backoff_seconds * 2**attempt)
+            attempt += 1
+            entries = [failed.entry for failed in failed_entries]
+
     async def get_state(
         self,
         store_name: str,
         key: str,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> StateResponse:
         """Gets value from a statestore with a key
 
@@ -483,6 +706,8 @@ class DaprGrpcClientAsync:
             key (str): the key of the key-value pair to be gotten
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`StateResponse` gRPC metadata returned from callee
@@ -499,14 +724,31 @@ class DaprGrpcClientAsync:
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
 
+        cache = self._state_cache
+        if cache is not None:
+            cached = cache.get(store_name, key, state_metadata)
+            if cached is not None:
+                return StateResponse(data=cached[0], etag=cached[1])
+            generation = cache.generation
+
         req = api_v1.GetStateRequest(store_name=store_name, key=key, metadata=state_metadata)
 
         try:
-            call = self._stub.GetState(req, metadata=metadata)
+            call = await self._read('GetState', req, metadata, timeout)
             response = await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
 
+        if cache is not None:
+            cache.put(
+                store_name,
+                key,
+                state_metadata,
+                response.data,
+                response.etag,
+                generation,
+                response.metadata,
+            )
         return StateResponse(
             data=response.data, etag=response.etag, headers=await call.initial_metadata()
         )
@@ -518,9 +760,16 @@ class DaprGrpcClientAsync:
         parallelism: int = 1,
         states_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        max_concurrency: int = 1,
+        max_keys_per_request: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> BulkStatesResponse:
         """Gets values from a statestore with keys
 
+        The keys are split into requests that each stay below the gRPC message limit,
+        and at most max_keys_per_request long. Up to max_concurrency of these requests
+        run at the same time, and the items of all of them are returned in key order.
+
         The example gets value from a statestore:
             from dapr.aio.clients import DaprClient
             async with DaprClient() as d:
@@ -534,13 +783,21 @@ class DaprGrpcClientAsync:
         Args:
             store_name (str): the state store name to get from
             key (Sequence[str]): the keys to be retrieved
-            parallelism (int): number of items to be retrieved in parallel
+            parallelism (int): number of items each request retrieves in parallel
             states_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            max_concurrency (int): the maximum number of requests in flight
+            max_keys_per_request (int, optional): the maximum number of keys in a request
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
 
         Returns:
-            :class:`BulkStatesResponse` gRPC metadata returned from callee
+            :class:`BulkStatesResponse` gRPC metadata returned from the first request
             and value obtained from the state store
+
+        Raises:
+            ValueError: store_name is empty, or max_concurrency or max_keys_per_request
+                is not positive
         """
         if metadata is not None:
             warn(
@@ -552,25 +809,185 @@ class DaprGrpcClientAsync:
 
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
-        req = api_v1.GetBulkStateRequest(
-            store_name=store_name, keys=keys, parallelism=parallelism, metadata=states_metadata
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+        if max_keys_per_request is not None and max_keys_per_request < 1:
+            raise ValueError('max_keys_per_request must be a positive number')
+
+        parts: List[Sequence[Any]] = []
+        headers: Optional[MetadataTuple] = None
+        async for chunk_items, chunk_headers in self._get_bulk_state_chunks(
+            store_name,
+            keys,
+            parallelism,
+            states_metadata,
+            metadata,
+            max_concurrency,
+            max_keys_per_request,
+            ordered=True,
+            timeout=timeout,
+        ):
+            parts.append(chunk_items)
+            if headers is None and chunk_headers is not None:
+                headers = chunk_headers
+        # a single response is not copied into a list
+        items = parts[0] if len(parts) == 1 else [item for part in parts for item in part]
+        return BulkStatesResponse(items=items, headers=headers or ())
+
+    def iter_bulk_state(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        parallelism: int = 1,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        max_concurrency: int = 4,
+        max_keys_per_request: Optional[int] = None,
+        ordered: bool = False,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[BulkStateItem]:
+        """Gets values from a statestore with keys, yielding the items as they arrive
+
+        The keys are split into requests like in :meth:`get_bulk_state`, and up to
+        max_concurrency of them run as tasks at the same time. The items of a request
+        are yielded once it completes, so a large key list can be processed before all
+        of it has been read.
+
+        The example reads many keys with 8 concurrent requests:
+            from dapr.aio.clients import DaprClient
+            async with DaprClient() as d:
+                async for item in d.iter_bulk_state('state_store', keys, max_concurrency=8):
+                    print(item.key, item.data)
+
+        Args:
+            store_name (str): the state store name to get from
+            keys (Sequence[str]): the keys to be retrieved
+            parallelism (int): number of items each request retrieves in parallel
+            states_metadata (Dict[str, str], optional): Dapr metadata for state request
+            max_concurrency (int): the maximum number of requests in flight
+            max_keys_per_request (int, optional): the maximum number of keys in a request
+            ordered (bool): whether the items are yielded in key order, instead of in the
+                order the requests complete
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
+
+        Returns:
+            An async iterator of :class:`BulkStateItem`
+
+        Raises:
+            ValueError: store_name is empty, or max_concurrency or max_keys_per_request
+                is not positive
+        """
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+        if max_keys_per_request is not None and max_keys_per_request < 1:
+            raise ValueError('max_keys_per_request must be a positive number')
+
+        chunks = self._get_bulk_state_chunks(
+            store_name,
+            keys,
+            parallelism,
+            states_metadata,
+            None,
+            max_concurrency,
+            max_keys_per_request,
+            ordered,
+            timeout,
         )
+        return (item async for items, _ in chunks for item in LazyItems(items, BulkStateItem))
 
-        try:
-            call = self._stub.GetBulkState(req, metadata=metadata)
-            response = await call
-        except AioRpcError as err:
-            raise DaprGrpcError(err) from err
+    async def _get_bulk_state_chunks(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        parallelism: int,
+        states_metadata: Optional[Dict[str, str]],
+        metadata: Optional[MetadataTuple],
+        max_concurrency: int,
+        max_keys_per_request: Optional[int],
+        ordered: bool,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[Sequence[Any], Optional[MetadataTuple]]]:
+        """Yields the items and headers of each request of a bulk read.
+
+        The items are the :obj:`runtime_v1.BulkStateItem` messages of a response, and
+        :class:`BulkStateItem` for the keys found in the state cache, which are not
+        requested. A chunk of cached keys yields None for its headers.
+        """
+        cache = self._state_cache
+        cached: Dict[str, Any] = {}
+        generation = 0
+        if cache is not None:
+            generation = cache.generation
+            cached = cache.get_many(store_name, keys, states_metadata)
+        chunks = chunk_by_size(
+            keys,
+            [len(key.encode('utf-8')) for key in keys],
+            self._max_grpc_message_length or DEFAULT_MAX_MESSAGE_LENGTH,
+            max_keys_per_request,
+        )
 
-        items = []
-        for item in response.items:
-            items.append(
-                BulkStateItem(key=item.key, data=item.data, etag=item.etag, error=item.error)
+        async def get_chunk(
+            chunk: List[str],
+        ) -> Tuple[Sequence[Any], Optional[MetadataTuple]]:
+            missing_keys = [key for key in chunk if key not in cached]
+            if not missing_keys:
+                return merge_bulk_state(chunk, cached, []), None
+
+            req = api_v1.GetBulkStateRequest(
+                store_name=store_name,
+                keys=missing_keys,
+                parallelism=parallelism,
+                metadata=states_metadata,
             )
-        return BulkStatesResponse(items=items, headers=await call.initial_metadata())
+            async with semaphore:
+                try:
+                    call = await self._read('GetBulkState', req, metadata, timeout)
+                    response = await call
+                except AioRpcError as err:
+                    raise DaprGrpcError(err) from err
+
+            # the messages are wrapped in BulkStateItem only when they are read
+            items: Sequence[Any] = response.items
+            if cache is not None:
+                for item in items:
+                    if not item.error:
+                        cache.put(
+                            store_name,
+                            item.key,
+                            states_metadata,
+                            item.data,
+                            item.etag,
+                            generation,
+                            item.metadata,
+                        )
+            if cached:
+                items = merge_bulk_state(chunk, cached, items)
+            return items, await call.initial_metadata()
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if len(chunks) < 2:
+            for chunk in chunks:
+                yield await get_chunk(chunk)
+            return
+
+        tasks = [asyncio.ensure_future(get_chunk(chunk)) for chunk in chunks]
+        try:
+            for task in tasks if ordered else asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                # a failure after the first one is never awaited, so it is retrieved here
+                if not task.cancel() and not task.cancelled():
+                    task.exception()
 
     async def query_state(
-        self, store_name: str, query: str, states_metadata: Optional[Dict[str, str]] = dict()
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        timeout: Optional[float] = None,
     ) -> QueryResponse:
         """Queries a statestore with a query
 
@@ -604,6 +1021,8 @@ class DaprGrpcClientAsync:
             store_name (str): the state store name to query
             query (str): the query to be executed
             states_metadata (Dict[str, str], optional): custom metadata for state request
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`QueryStateResponse` gRPC metadata returned from callee,
@@ -617,36 +1036,105 @@ class DaprGrpcClientAsync:
 
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
+        return await self._query_state(store_name, query, states_metadata, timeout)
+
+    async def _query_state(
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]],
+        timeout: Optional[float] = None,
+    ) -> QueryResponse:
         req = api_v1.QueryStateRequest(store_name=store_name, query=query, metadata=states_metadata)
 
         try:
-            call = self._stub.QueryStateAlpha1(req)
+            call = self._stub.QueryStateAlpha1(req, timeout=self._call_options.deadline(timeout))
             response = await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
 
-        results = []
-        for item in response.results:
-            results.append(
-                QueryResponseItem(key=item.key, value=item.data, etag=item.etag, error=item.error)
-            )
-
         return QueryResponse(
             token=response.token,
-            results=results,
+            results=response.results,
             metadata=response.metadata,
             headers=await call.initial_metadata(),
         )
 
+    def iter_query_state(
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        decode: Optional[Callable[[QueryResponseItem], Any]] = None,
+        decode_workers: int = 1,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Queries a statestore and iterates over the items of all result pages
+
+        The query is sent once per page, each time with the pagination token of the page
+        before. While the items of a page are consumed the next page is already fetched,
+        so at most two pages are held in memory however large the result.
+
+        This example iterates over all items of a query:
+            from dapr.aio.clients import DaprClient
+
+            query = '{"filter": {"EQ": {"state": "CA"}}}'
+
+            async with DaprClient() as d:
+                async for item in d.iter_query_state('state_store', query, page_size=500):
+                    print(item.key, item.json())
+
+        Args:
+            store_name (str): the state store name to query
+            query (str): the query to be executed, without a page token
+            states_metadata (Dict[str, str], optional): custom metadata for state request
+            page_size (int, optional): the number of items per page, overriding the
+                page limit of the query. Queries without a page limit get pages of
+                1000 items.
+            prefetch (bool): whether the next page is fetched while a page is consumed.
+            decode (callable, optional): converts each item, e.g. ``QueryResponseItem.json``;
+                the converted values are yielded instead of the items.
+            decode_workers (int): the number of threads decoding the items of a page.
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
+
+        Returns:
+            An async iterator of :class:`QueryResponseItem`, or of the values ``decode`` returns
+
+        Raises:
+            ValueError: the store name is empty, the query is not a JSON object or
+                page_size is not positive.
+        """
+        warn(
+            'The State Store Query API is an Alpha version and is subject to change.',
+            UserWarning,
+            stacklevel=2,
+        )
+
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        paged_query = parse_paged_query(query, page_size)
+        return iter_query_async(
+            lambda page: self._query_state(store_name, page, states_metadata, timeout),
+            paged_query,
+            prefetch=prefetch,
+            decode=decode,
+            decode_workers=decode_workers,
+        )
+
     async def save_state(
         self,
         store_name: str,
         key: str,
-        value: Union[bytes, str],
+        value: Union[BytesLike, str],
         etag: Optional[str] = None,
         options: Optional[StateOptions] = None,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves key-value pairs to a statestore
 
@@ -668,18 +1156,22 @@ class DaprGrpcClientAsync:
         Args:
             store_name (str): the state store name to save to
             key (str): the key to be saved
-            value (bytes or str): the value to be saved
+            value (bytes-like or str): the value to be saved
             etag (str, optional): the etag to save with
             options (StateOptions, optional): custom options
                 for concurrency and consistency
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
 
         Raises:
-            ValueError: value is not bytes or str
+            ValueError: value is not bytes-like or str
             ValueError: store_name is empty
         """
         if metadata is not None:
@@ -690,11 +1182,9 @@ class DaprGrpcClientAsync:
                 stacklevel=2,
             )
 
-        if not isinstance(value, (bytes, str)):
+        if not isinstance(value, (bytes, bytearray, memoryview, str)):
             raise ValueError(f'invalid type for data {type(value)}')
 
-        req_value = value
-
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
 
@@ -703,24 +1193,58 @@ class DaprGrpcClientAsync:
         else:
             state_options = options.get_proto()
 
-        state = common_v1.StateItem(
+        state = dict(
             key=key,
-            value=to_bytes(req_value),
+            value=to_bytes(value),
             etag=common_v1.Etag(value=etag) if etag is not None else None,
             options=state_options,
             metadata=state_metadata,
         )
 
-        req = api_v1.SaveStateRequest(store_name=store_name, states=[state])
         try:
-            call = self._stub.SaveState(req, metadata=metadata)
+            if (
+                self._save_state_batcher is not None
+                and etag is None
+                and metadata is None
+                and timeout is None
+                and compression is None
+            ):
+                return await self._save_state_batcher.submit(
+                    store_name, common_v1.StateItem(**state)
+                )
+
+            # added in place, a StateItem passed to the request would be copied with its value
+            req = api_v1.SaveStateRequest(store_name=store_name)
+            req.states.add(**state)
+            call = self._stub.SaveState(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             await call
             return DaprResponse(headers=await call.initial_metadata())
         except AioRpcError as e:
             raise DaprInternalError(e.details()) from e
+        finally:
+            if self._state_cache is not None:
+                self._state_cache.invalidate(store_name, key, state_metadata)
+
+    async def _send_save_state(
+        self, store_name: str, states: List[common_v1.StateItem]
+    ) -> DaprResponse:
+        req = api_v1.SaveStateRequest(store_name=store_name, states=states)
+        call = self._stub.SaveState(req, timeout=self._call_options.timeout)
+        await call
+        return DaprResponse(headers=await call.initial_metadata())
 
     async def save_bulk_state(
-        self, store_name: str, states: List[StateItem], metadata: Optional[MetadataTuple] = None
+        self,
+        store_name: str,
+        states: List[StateItem],
+        metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves state items to a statestore
 
@@ -739,6 +1263,10 @@ class DaprGrpcClientAsync:
             store_name (str): the state store name to save to
             states (List[StateItem]): list of states to save
             metadata (tuple, optional): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -775,10 +1303,19 @@ class DaprGrpcClientAsync:
         req = api_v1.SaveStateRequest(store_name=store_name, states=req_states)
 
         try:
-            call = self._stub.SaveState(req, metadata=metadata)
+            call = self._stub.SaveState(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                for state in states:
+                    self._state_cache.invalidate(store_name, state.key, state.metadata)
 
         return DaprResponse(headers=await call.initial_metadata())
 
@@ -788,6 +1325,8 @@ class DaprGrpcClientAsync:
         operations: Sequence[TransactionalStateOperation],
         transactional_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves or deletes key-value pairs to a statestore as a transaction
 
@@ -815,6 +1354,10 @@ class DaprGrpcClientAsync:
             operations (Sequence[TransactionalStateOperation]): the transaction operations
             transactional_metadata (Dict[str, str], optional): Dapr metadata for transaction
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -846,10 +1389,19 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            call = self._stub.ExecuteStateTransaction(req, metadata=metadata)
+            call = self._stub.ExecuteStateTransaction(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                for o in operations:
+                    self._state_cache.invalidate(store_name, o.key, transactional_metadata)
 
         return DaprResponse(headers=await call.initial_metadata())
 
@@ -861,6 +1413,7 @@ class DaprGrpcClientAsync:
         options: Optional[StateOptions] = None,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> DaprResponse:
         """Deletes key-value pairs from a statestore
 
@@ -886,6 +1439,8 @@ class DaprGrpcClientAsync:
                 for concurrency and consistency
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -916,19 +1471,113 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            call = self._stub.DeleteState(req, metadata=metadata)
+            call = self._stub.DeleteState(
+                req, metadata=metadata, timeout=self._call_options.deadline(timeout)
+            )
             await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                self._state_cache.invalidate(store_name, key)
 
         return DaprResponse(headers=await call.initial_metadata())
 
+    async def delete_bulk_state(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        etags: Optional[Dict[str, str]] = None,
+        options: Optional[StateOptions] = None,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+    ) -> DeleteBulkStateResponse:
+        """Deletes keys from a statestore
+
+        The keys are split into DeleteBulkState requests that fit in the maximum gRPC
+        message length, and up to max_concurrency requests run at the same time. A failed
+        request does not stop the others: the keys it held are returned in the response
+        together with its error.
+
+        The example deletes states from a statestore:
+            from dapr.aio.clients import DaprClient
+            async with DaprClient() as d:
+                resp = await d.delete_bulk_state(
+                    store_name='state_store',
+                    keys=['key1', 'key2'],
+                    etags={'key2': 'etag'},
+                )
+                # resp.failed_keys maps the keys that were not deleted to their errors.
+
+        Args:
+            store_name (str): the state store name to delete from
+            keys (Sequence[str]): the keys to delete
+            etags (Dict[str, str], optional): the etags to delete keys with, by key
+            options (StateOptions, optional): custom options
+                for concurrency and consistency
+            states_metadata (Dict[str, str], optional): Dapr metadata for state request
+            max_concurrency (int): the maximum number of requests in flight
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
+
+        Returns:
+            :class:`DeleteBulkStateResponse` the keys that could not be deleted
+
+        Raises:
+            ValueError: store_name is empty
+            ValueError: max_concurrency is not positive
+        """
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+
+        state_options = None if options is None else options.get_proto()
+        states = [
+            common_v1.StateItem(
+                key=key,
+                etag=common_v1.Etag(value=etags[key]) if etags and key in etags else None,
+                options=state_options,
+                metadata=states_metadata,
+            )
+            for key in keys
+        ]
+        chunks = chunk_by_size(
+            states,
+            [state.ByteSize() for state in states],
+            self._max_grpc_message_length or DEFAULT_MAX_MESSAGE_LENGTH,
+        )
+        failed_keys: Dict[str, str] = {}
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def delete_chunk(chunk: List[common_v1.StateItem]) -> None:
+            req = api_v1.DeleteBulkStateRequest(store_name=store_name, states=chunk)
+            async with semaphore:
+                try:
+                    await self._stub.DeleteBulkState(
+                        req, timeout=self._call_options.deadline(timeout)
+                    )
+                except AioRpcError as err:
+                    for state in chunk:
+                        failed_keys[state.key] = err.details()
+
+        try:
+            await asyncio.gather(*[delete_chunk(chunk) for chunk in chunks])
+        finally:
+            if self._state_cache is not None:
+                for key in keys:
+                    self._state_cache.invalidate(store_name, key)
+        return DeleteBulkStateResponse(failed_keys)
+
     async def get_secret(
         self,
         store_name: str,
         key: str,
         secret_metadata: Optional[Dict[str, str]] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> GetSecretResponse:
         """Get secret with a given key.
 
@@ -956,6 +1605,8 @@ class DaprGrpcClientAsync:
             key (str): str for key
             secret_metadata (Dict[str, str], Optional): Dapr metadata for secrets request
             metadata (MetadataTuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetSecretResponse` object with the secret and metadata returned from callee
@@ -970,7 +1621,7 @@ class DaprGrpcClientAsync:
 
         req = api_v1.GetSecretRequest(store_name=store_name, key=key, metadata=secret_metadata)
 
-        call = self._stub.GetSecret(req, metadata=metadata)
+        call = await self._read('GetSecret', req, metadata, timeout)
         response = await call
 
         return GetSecretResponse(secret=response.data, headers=await call.initial_metadata())
@@ -980,6 +1631,7 @@ class DaprGrpcClientAsync:
         store_name: str,
         secret_metadata: Optional[Dict[str, str]] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> GetBulkSecretResponse:
         """Get all granted secrets.
 
@@ -1004,6 +1656,8 @@ class DaprGrpcClientAsync:
             store_name (str): store name to get secret from
             secret_metadata (Dict[str, Dict[str, str]], Optional): Dapr metadata of secrets request
             metadata (MetadataTuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetBulkSecretResponse` object with secrets and metadata returned from callee
@@ -1018,7 +1672,9 @@ class DaprGrpcClientAsync:
 
         req = api_v1.GetBulkSecretRequest(store_name=store_name, metadata=secret_metadata)
 
-        call = self._stub.GetBulkSecret(req, metadata=metadata)
+        call = self._stub.GetBulkSecret(
+            req, metadata=metadata, timeout=self._call_options.deadline(timeout)
+        )
         response = await call
 
         secrets_map = {}
@@ -1032,7 +1688,11 @@ class DaprGrpcClientAsync:
         return GetBulkSecretResponse(secrets=secrets_map, headers=await call.initial_metadata())
 
     async def get_configuration(
-        self, store_name: str, keys: List[str], config_metadata: Optional[Dict[str, str]] = dict()
+        self,
+        store_name: str,
+        keys: List[str],
+        config_metadata: Optional[Dict[str, str]] = dict(),
+        timeout: Optional[float] = None,
     ) -> ConfigurationResponse:
         """Gets values from a config store with keys
 
@@ -1049,6 +1709,8 @@ class DaprGrpcClientAsync:
             store_name (str): the state store name to get from
             keys (List[str]): the keys of the key-value pairs to be gotten
             config_metadata (Dict[str, str], optional): Dapr metadata for configuration
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`ConfigurationResponse` gRPC metadata returned from callee
@@ -1060,7 +1722,7 @@ class DaprGrpcClientAsync:
         req = api_v1.GetConfigurationRequest(
             store_name=store_name, keys=keys, metadata=config_metadata
         )
-        call = self._stub.GetConfiguration(req)
+        call = await self._read('GetConfiguration', req, timeout=timeout)
         response = await call
         return ConfigurationResponse(items=response.items, headers=await call.initial_metadata())
 
@@ -1101,22 +1763,33 @@ class DaprGrpcClientAsync:
         )
         return id
 
-    async def unsubscribe_configuration(self, store_name: str, id: str) -> bool:
+    async def unsubscribe_configuration(
+        self, store_name: str, id: str, timeout: Optional[float] = None
+    ) -> bool:
         """Unsubscribes from configuration changes.
 
         Args:
             store_name (str): the state store name to unsubscribe from
             id (str): the subscription id to unsubscribe
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             bool: True if unsubscribed successfully, False otherwise
         """
         req = api_v1.UnsubscribeConfigurationRequest(store_name=store_name, id=id)
-        response: UnsubscribeConfigurationResponse = await self._stub.UnsubscribeConfiguration(req)
+        response: UnsubscribeConfigurationResponse = await self._stub.UnsubscribeConfiguration(
+            req, timeout=self._call_options.deadline(timeout)
+        )
         return response.ok
 
     async def try_lock(
-        self, store_name: str, resource_id: str, lock_owner: str, expiry_in_seconds: int
+        self,
+        store_name: str,
+        resource_id: str,
+        lock_owner: str,
+        expiry_in_seconds: int,
+        timeout: Optional[float] = None,
     ) -> TryLockResponse:
         """Tries to get a lock with an expiry.
 
@@ -1146,6 +1819,8 @@ class DaprGrpcClientAsync:
             lock_owner (str):  indicates the identifier of lock owner.
             expiry_in_seconds (int): The length of time (in seconds) for which this lock
                 will be held and after which it expires.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`TryLockResponse`: With the result of the try-lock operation.
@@ -1168,7 +1843,7 @@ class DaprGrpcClientAsync:
             lock_owner=lock_owner,
             expiry_in_seconds=expiry_in_seconds,
         )
-        call = self._stub.TryLockAlpha1(req)
+        call = self._stub.TryLockAlpha1(req, timeout=self._call_options.deadline(timeout))
         response = await call
         return TryLockResponse(
             success=response.success,
@@ -1179,7 +1854,9 @@ class DaprGrpcClientAsync:
             headers=await call.initial_metadata(),
         )
 
-    async def unlock(self, store_name: str, resource_id: str, lock_owner: str) -> UnlockResponse:
+    async def unlock(
+        self, store_name: str, resource_id: str, lock_owner: str, timeout: Optional[float] = None
+    ) -> UnlockResponse:
         """Unlocks a lock.
 
         Args:
@@ -1188,6 +1865,8 @@ class DaprGrpcClientAsync:
                                 It stands for "which resource I want to protect".
             lock_owner (str):  indicates the identifier of lock owner.
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`UnlockResponseStatus`: Status of the request,
@@ -1207,7 +1886,7 @@ class DaprGrpcClientAsync:
         req = api_v1.UnlockRequest(
             store_name=store_name, resource_id=resource_id, lock_owner=lock_owner
         )
-        call = self._stub.UnlockAlpha1(req)
+        call = self._stub.UnlockAlpha1(req, timeout=self._call_options.deadline(timeout))
         response = await call
 
         return UnlockResponse(
@@ -1222,6 +1901,7 @@ class DaprGrpcClientAsync:
         instance_id: Optional[str] = None,
         workflow_options: Optional[Dict[str, str]] = dict(),
         send_raw_bytes: bool = False,
+        timeout: Optional[float] = None,
     ) -> StartWorkflowResponse:
         """Starts a workflow.
 
@@ -1239,6 +1919,8 @@ class DaprGrpcClientAsync:
                                 that the workflow will receive.
             send_raw_bytes (bool) if true, no serialization will be performed on the input
                                 bytes
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`StartWorkflowResponse`: Instance ID associated with the started workflow
@@ -1278,12 +1960,16 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            response = self._stub.StartWorkflowBeta1(req)
+            response = self._stub.StartWorkflowBeta1(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return StartWorkflowResponse(instance_id=response.instance_id)
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
 
-    async def get_workflow(self, instance_id: str, workflow_component: str) -> GetWorkflowResponse:
+    async def get_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> GetWorkflowResponse:
         """Gets information on a workflow.
 
         Args:
@@ -1291,6 +1977,8 @@ class DaprGrpcClientAsync:
                                 e.g. `order_processing_workflow-103784`.
             workflow_component (str): the name of the workflow component
                                 that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetWorkflowResponse`: Instance ID associated with the started workflow
@@ -1308,7 +1996,7 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            resp = self._stub.GetWorkflowBeta1(req)
+            resp = self._stub.GetWorkflowBeta1(req, timeout=self._call_options.deadline(timeout))
             if resp.created_at is None:
                 resp.created_at = datetime.now
             if resp.last_updated_at is None:
@@ -1324,7 +2012,9 @@ class DaprGrpcClientAsync:
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
 
-    async def terminate_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    async def terminate_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Terminates a workflow.
 
         Args:
@@ -1334,6 +2024,8 @@ class DaprGrpcClientAsync:
                                 that will run the workflow. e.g. `dapr`.
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         """
         # Warnings and input validation
@@ -1349,7 +2041,9 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            _, call = self._stub.TerminateWorkflowBeta1.with_call(req)
+            _, call = self._stub.TerminateWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return DaprResponse(headers=call.initial_metadata())
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
@@ -1361,6 +2055,7 @@ class DaprGrpcClientAsync:
         event_name: str,
         event_data: Optional[Union[Any, bytes]] = None,
         send_raw_bytes: bool = False,
+        timeout: Optional[float] = None,
     ) -> DaprResponse:
         """Raises an event on a workflow.
 
@@ -1377,6 +2072,8 @@ class DaprGrpcClientAsync:
                                              to send unencoded binary input.
             send_raw_bytes (bool) if true, no serialization will be performed on the input
                                 bytes
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1419,12 +2116,16 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            _, call = self._stub.RaiseEventWorkflowBeta1.with_call(req)
+            _, call = self._stub.RaiseEventWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return DaprResponse(headers=call.initial_metadata())
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
 
-    async def pause_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    async def pause_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Pause a workflow.
 
             Args:
@@ -1432,6 +2133,8 @@ class DaprGrpcClientAsync:
                                     e.g. `order_processing_workflow-103784`.
                 workflow_component (str): the name of the workflow component
                                     that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1450,13 +2153,17 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            _, call = self._stub.PauseWorkflowBeta1.with_call(req)
+            _, call = self._stub.PauseWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
 
-    async def resume_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    async def resume_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Resumes a workflow.
 
         Args:
@@ -1464,6 +2171,8 @@ class DaprGrpcClientAsync:
                                 e.g. `order_processing_workflow-103784`.
             workflow_component (str): the name of the workflow component
                                 that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1481,13 +2190,17 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            _, call = self._stub.ResumeWorkflowBeta1.with_call(req)
+            _, call = self._stub.ResumeWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
         except grpc.aio.AioRpcError as err:
             raise DaprInternalError(err.details())
 
-    async def purge_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    async def purge_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Purges a workflow.
 
             Args:
@@ -1495,6 +2208,8 @@ class DaprGrpcClientAsync:
                                     e.g. `order_processing_workflow-103784`.
                 workflow_component (str): the name of the workflow component
                                     that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1512,7 +2227,9 @@ class DaprGrpcClientAsync:
         )
 
         try:
-            _, call = self._stub.PurgeWorkflowBeta1.with_call(req)
+            _, call = self._stub.PurgeWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
 
@@ -1542,20 +2259,11 @@ class DaprGrpcClientAsync:
             stacklevel=2,
         )
 
-        start = time.time()
-        while True:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout_s)
-                try:
-                    s.connect((self._uri.hostname, self._uri.port_as_int))
-                    return
-                except Exception as e:
-                    remaining = (start + timeout_s) - time.time()
-                    if remaining < 0:
-                        raise e
-                    asyncio.sleep(min(1, remaining))
-
-    async def get_metadata(self) -> GetMetadataResponse:
+        if self._health_check is not None:
+            await self._health_check
+        await wait_for_socket_async(self._uri.hostname, self._uri.port_as_int, timeout_s)
+
+    async def get_metadata(self, timeout: Optional[float] = None) -> GetMetadataResponse:
         """Returns information about the sidecar allowing for runtime
         discoverability.
 
@@ -1566,10 +2274,14 @@ class DaprGrpcClientAsync:
         Each loaded component provides its name, type and version and also
         information about supported features in the form of component
         capabilities.
+
+        Args:
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
         """
 
         try:
-            call = self._stub.GetMetadata(GrpcEmpty())
+            call = self._stub.GetMetadata(GrpcEmpty(), timeout=self._call_options.deadline(timeout))
             _resp = await call
         except AioRpcError as err:
             raise DaprGrpcError(err) from err
@@ -1595,7 +2307,9 @@ class DaprGrpcClientAsync:
             headers=await call.initial_metadata(),
         )
 
-    async def set_metadata(self, attributeName: str, attributeValue: str) -> DaprResponse:
+    async def set_metadata(
+        self, attributeName: str, attributeValue: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Adds a custom (extended) metadata attribute to the Dapr sidecar
         information stored by the Metadata endpoint.
 
@@ -1609,6 +2323,8 @@ class DaprGrpcClientAsync:
             attributeName (str): Custom attribute name. This is they key name
                                  in the key-value pair.
             attributeValue (str): Custom attribute value we want to store.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
         """
         # input validation
         validateNotBlankString(attributeName=attributeName)
@@ -1616,12 +2332,12 @@ class DaprGrpcClientAsync:
         validateNotNone(attributeValue=attributeValue)
         # Actual invocation
         req = api_v1.SetMetadataRequest(key=attributeName, value=attributeValue)
-        call = self._stub.SetMetadata(req)
+        call = self._stub.SetMetadata(req, timeout=self._call_options.deadline(timeout))
         await call
 
         return DaprResponse(await call.initial_metadata())
 
-    async def shutdown(self) -> DaprResponse:
+    async def shutdown(self, timeout: Optional[float] = None) -> DaprResponse:
         """Shutdown the sidecar.
 
         This will ask the sidecar to gracefully shutdown.
@@ -1633,11 +2349,21 @@ class DaprGrpcClientAsync:
             async with DaprClient() as d:
                 resp = await d.shutdown()
 
+        Args:
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
         """
 
-        call = self._stub.Shutdown(GrpcEmpty())
+        call = self._stub.Shutdown(GrpcEmpty(), timeout=self._call_options.deadline(timeout))
         await call
 
         return DaprResponse(await call.initial_metadata())
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # a failed check nobody awaits must not be reported as never retrieved
+    if not task.cancelled():
+        task.exception()
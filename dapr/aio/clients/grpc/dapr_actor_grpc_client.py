@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2023 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+from typing import Any, Dict, Optional, Tuple
+
+import grpc  # type: ignore
+from grpc.aio import AioRpcError  # type: ignore
+
+from dapr.aio.clients.grpc._asynchelpers import DaprClientInterceptorAsync
+from dapr.clients.base import DaprActorClientBase
+from dapr.clients.exceptions import DaprInternalError, DaprGrpcError
+from dapr.clients.grpc._actor import (
+    build_invoke_actor_request,
+    build_register_reminder_request,
+    build_register_timer_request,
+    build_state_transaction_request,
+)
+from dapr.clients.health import DaprHealth
+from dapr.conf import settings
+from dapr.conf.helpers import GrpcEndpoint
+from dapr.proto import api_service_v1, api_v1
+from dapr.version import __version__
+
+
+class DaprActorGrpcClientAsync(DaprActorClientBase):
+    """A Dapr Actor grpc.aio client implementing :class:`DaprActorClientBase`.
+
+    grpc.aio channels are bound to the event loop they are created on, so the client
+    opens its channel lazily on the first call and keeps one channel per event loop.
+    """
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        timeout: int = 60,
+        max_grpc_message_length: Optional[int] = None,
+    ):
+        """Prepares the connection to the Dapr runtime gRPC endpoint.
+
+        Args:
+            address (str, optional): Dapr Runtime gRPC endpoint address.
+            timeout (int, optional): Timeout in seconds, defaults to 60.
+            max_grpc_message_length (int, optional): The maximum grpc send and receive
+                message length in bytes.
+        """
+        DaprHealth.wait_until_ready()
+
+        self._timeout = timeout
+        useragent = f'dapr-sdk-python/{__version__}'
+        self._options = [('grpc.primary_user_agent', useragent)]
+        if max_grpc_message_length:
+            self._options += [
+                ('grpc.max_send_message_length', max_grpc_message_length),
+                ('grpc.max_receive_message_length', max_grpc_message_length),
+            ]
+
+        if not address:
+            address = settings.DAPR_GRPC_ENDPOINT or (
+                f'{settings.DAPR_RUNTIME_HOST}:' f'{settings.DAPR_GRPC_PORT}'
+            )
+
+        try:
+            self._uri = GrpcEndpoint(address)
+        except ValueError as error:
+            raise DaprInternalError(f'{error}') from error
+
+        self._channels: Dict[asyncio.AbstractEventLoop, Tuple[Any, Any]] = {}
+
+    def get_credentials(self):
+        return grpc.ssl_channel_credentials()
+
+    async def close(self) -> None:
+        """Closes the gRPC channel opened on the running event loop.
+
+        Channels of other event loops are dropped; they are closed together with their loop.
+        """
+        loop = asyncio.get_running_loop()
+        channels, self._channels = self._channels, {}
+        for channel_loop, (channel, _) in channels.items():
+            if channel_loop is loop:
+                await channel.close()
+
+    async def __aenter__(self) -> 'DaprActorGrpcClientAsync':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def invoke_method(
+        self, actor_type: str, actor_id: str, method: str, data: Optional[bytes] = None
+    ) -> bytes:
+        """Invoke method defined in :class:`Actor` remotely.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            method (str): Method name defined in :class:`Actor`.
+            bytes data (bytes): data which will be passed to the target actor.
+
+        Returns:
+            bytes: the response from the actor.
+        """
+        req = build_invoke_actor_request(actor_type, actor_id, method, data)
+        response = await self._call('InvokeActor', req)
+        return response.data
+
+    async def save_state_transactionally(self, actor_type: str, actor_id: str, data: bytes) -> None:
+        """Save state transactionally.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            data (bytes): Json-serialized the transactional state operations.
+        """
+        req = build_state_transaction_request(actor_type, actor_id, data)
+        await self._call('ExecuteActorStateTransaction', req)
+
+    async def get_state(self, actor_type: str, actor_id: str, name: str) -> bytes:
+        """Get state value for name key.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of state.
+
+        Returns:
+            bytes: the value of the state.
+        """
+        req = api_v1.GetActorStateRequest(actor_type=actor_type, actor_id=actor_id, key=name)
+        response = await self._call('GetActorState', req)
+        return response.data
+
+    async def register_reminder(
+        self, actor_type: str, actor_id: str, name: str, data: bytes
+    ) -> None:
+        """Register actor reminder.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of reminder
+            data (bytes): Reminder request json body.
+        """
+        req = build_register_reminder_request(actor_type, actor_id, name, data)
+        await self._call('RegisterActorReminder', req)
+
+    async def unregister_reminder(self, actor_type: str, actor_id: str, name: str) -> None:
+        """Unregister actor reminder.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str):  the name of reminder.
+        """
+        req = api_v1.UnregisterActorReminderRequest(
+            actor_type=actor_type, actor_id=actor_id, name=name
+        )
+        await self._call('UnregisterActorReminder', req)
+
+    async def register_timer(self, actor_type: str, actor_id: str, name: str, data: bytes) -> None:
+        """Register actor timer.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of reminder.
+            data (bytes): Timer request json body.
+        """
+        req = build_register_timer_request(actor_type, actor_id, name, data)
+        await self._call('RegisterActorTimer', req)
+
+    async def unregister_timer(self, actor_type: str, actor_id: str, name: str) -> None:
+        """Unregister actor timer.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of timer
+        """
+        req = api_v1.UnregisterActorTimerRequest(
+            actor_type=actor_type, actor_id=actor_id, name=name
+        )
+        await self._call('UnregisterActorTimer', req)
+
+    async def _call(self, method_name: str, request: Any) -> Any:
+        stub = self._get_stub()
+        try:
+            return await getattr(stub, method_name)(request, timeout=self._timeout)
+        except AioRpcError as err:
+            raise DaprGrpcError(err) from err
+
+    def _get_stub(self) -> Any:
+        loop = asyncio.get_running_loop()
+        entry = self._channels.get(loop)
+        if entry is None:
+            for stale_loop in [lp for lp in self._channels if lp.is_closed()]:
+                del self._channels[stale_loop]
+            channel = self._create_channel()
+            entry = (channel, api_service_v1.DaprStub(channel))
+            self._channels[loop] = entry
+        return entry[1]
+
+    def _create_channel(self) -> Any:
+        interceptors = None
+        if settings.DAPR_API_TOKEN:
+            interceptors = [
+                DaprClientInterceptorAsync([('dapr-api-token', settings.DAPR_API_TOKEN)])
+            ]
+        if self._uri.tls:
+            return grpc.aio.secure_channel(  # type: ignore
+                self._uri.endpoint,
+                self.get_credentials(),
+                options=self._options,
+                interceptors=interceptors,
+            )
+        return grpc.aio.insecure_channel(  # type: ignore
+            self._uri.endpoint, options=self._options, interceptors=interceptors
+        )
@@ -19,6 +19,14 @@ from warnings import warn
 from dapr.clients.base import DaprActorClientBase
 from dapr.clients.exceptions import DaprInternalError, ERROR_CODE_UNKNOWN
 from dapr.clients.grpc.client import DaprGrpcClient, MetadataTuple, InvokeMethodResponse
+from dapr.clients.grpc.dapr_actor_grpc_client import DaprActorGrpcClient
+from dapr.clients.grpc._publisher import Publisher
+from dapr.clients.grpc._state_batching import StateWriteBatching
+from dapr.clients.grpc._call_options import CallOptions, CompressionType
+from dapr.clients.grpc._helpers import BytesLike
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._retry import RetryPolicy
+from dapr.clients.grpc._state_cache import StateCache
 from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
 from dapr.clients.http.dapr_invocation_http_client import DaprInvocationHttpClient
 from dapr.conf import settings
@@ -26,10 +34,17 @@ from google.protobuf.message import Message as GrpcMessage
 
 
 __all__ = [
+    'CallOptions',
     'DaprClient',
     'DaprActorClientBase',
     'DaprActorHttpClient',
+    'DaprActorGrpcClient',
     'DaprInternalError',
+    'HedgingPolicy',
+    'Publisher',
+    'RetryPolicy',
+    'StateCache',
+    'StateWriteBatching',
     'ERROR_CODE_UNKNOWN',
 ]
 
@@ -64,6 +79,15 @@ class DaprClient(DaprGrpcClient):
         ] = None,
         http_timeout_seconds: Optional[int] = None,
         max_grpc_message_length: Optional[int] = None,
+        http_max_connections: Optional[int] = None,
+        http_max_connections_per_host: Optional[int] = None,
+        http_keepalive_timeout: Optional[float] = None,
+        http_dns_cache_ttl: Optional[int] = None,
+        state_cache: Optional[StateCache] = None,
+        state_write_batching: Optional[StateWriteBatching] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        call_options: Optional[CallOptions] = None,
     ):
         """Connects to Dapr Runtime via gRPC and HTTP.
 
@@ -77,8 +101,34 @@ class DaprClient(DaprGrpcClient):
             http_timeout_seconds (int): specify a timeout for http connections
             max_grpc_message_length (int, optional): The maximum grpc send and receive
                 message length in bytes.
+            http_max_connections (int, optional): Maximum number of pooled HTTP connections
+                used for service invocation.
+            http_max_connections_per_host (int, optional): Maximum number of pooled HTTP
+                connections to the same endpoint.
+            http_keepalive_timeout (float, optional): Seconds an idle HTTP connection is
+                kept alive.
+            http_dns_cache_ttl (int, optional): Seconds resolved addresses are cached.
+            state_cache (StateCache, optional): caches the values read by get_state and
+                get_bulk_state. Disabled by default.
+            state_write_batching (StateWriteBatching, optional): coalesces concurrent
+                save_state calls into batched requests. Disabled by default.
+            retry_policy (RetryPolicy, optional): retries calls that fail with a transient
+                error. Disabled by default.
+            hedging_policy (HedgingPolicy, optional): sends slow reads a second time
+                and uses the first response. Disabled by default.
+            call_options (CallOptions, optional): the default deadline of the gRPC calls,
+                and the compression of the channel.
         """
-        super().__init__(address, interceptors, max_grpc_message_length)
+        super().__init__(
+            address,
+            interceptors,
+            max_grpc_message_length,
+            state_cache,
+            state_write_batching,
+            retry_policy,
+            hedging_policy,
+            call_options,
+        )
         self.invocation_client = None
 
         invocation_protocol = settings.DAPR_API_METHOD_INVOCATION_PROTOCOL.upper()
@@ -87,7 +137,12 @@ class DaprClient(DaprGrpcClient):
             if http_timeout_seconds is None:
                 http_timeout_seconds = settings.DAPR_HTTP_TIMEOUT_SECONDS
             self.invocation_client = DaprInvocationHttpClient(
-                headers_callback=headers_callback, timeout=http_timeout_seconds
+                headers_callback=headers_callback,
+                timeout=http_timeout_seconds,
+                max_connections=http_max_connections,
+                max_connections_per_host=http_max_connections_per_host,
+                keepalive_timeout=http_keepalive_timeout,
+                dns_cache_ttl=http_dns_cache_ttl,
             )
         elif invocation_protocol == 'GRPC':
             pass
@@ -96,28 +151,38 @@ class DaprClient(DaprGrpcClient):
                 f'Unknown value for DAPR_API_METHOD_INVOCATION_PROTOCOL: {invocation_protocol}'
             )
 
+    def close(self):
+        """Closes Dapr runtime gRPC channel and the HTTP invocation connections."""
+        super().close()
+        invocation_client = getattr(self, 'invocation_client', None)
+        if invocation_client is not None:
+            invocation_client.shutdown()
+
     def invoke_method(
         self,
         app_id: str,
         method_name: str,
-        data: Union[bytes, str, GrpcMessage] = '',
+        data: Union[BytesLike, str, GrpcMessage] = '',
         content_type: Optional[str] = None,
         metadata: Optional[MetadataTuple] = None,
         http_verb: Optional[str] = None,
         http_querystring: Optional[MetadataTuple] = None,
         timeout: Optional[int] = None,
+        compression: Optional[CompressionType] = None,
     ) -> InvokeMethodResponse:
         """Invoke a service method over gRPC or HTTP.
 
         Args:
             app_id (str): Application ID.
             method_name (str): Method to be invoked.
-            data (bytes or str or GrpcMessage, optional): Data for request's body.
+            data (bytes-like or str or GrpcMessage, optional): Data for request's body.
             content_type (str, optional): Content type of the data.
             metadata (MetadataTuple, optional): Additional metadata or headers.
             http_verb (str, optional): HTTP verb for the request.
             http_querystring (MetadataTuple, optional): Query parameters.
             timeout (int, optional): request timeout in seconds.
+            compression (grpc.Compression or str, optional): the compression of the
+                request over gRPC, e.g. 'gzip'.
 
         Returns:
             InvokeMethodResponse: the response from the method invocation.
@@ -143,13 +208,14 @@ class DaprClient(DaprGrpcClient):
                 http_verb=http_verb,
                 http_querystring=http_querystring,
                 timeout=timeout,
+                compression=compression,
             )
 
     async def invoke_method_async(
         self,
         app_id: str,
         method_name: str,
-        data: Union[bytes, str, GrpcMessage],
+        data: Union[BytesLike, str, GrpcMessage],
         content_type: Optional[str] = None,
         metadata: Optional[MetadataTuple] = None,
         http_verb: Optional[str] = None,
@@ -161,7 +227,7 @@ class DaprClient(DaprGrpcClient):
         Args:
             app_id (str): Application ID.
             method_name (str): Method to be invoked.
-            data (bytes or str or GrpcMessage, optional): Data for request's body.
+            data (bytes-like or str or GrpcMessage, optional): Data for request's body.
             content_type (str, optional): Content type of the data.
             metadata (MetadataTuple, optional): Additional metadata or headers.
             http_verb (str, optional): HTTP verb for the request.
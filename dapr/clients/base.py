@@ -55,3 +55,7 @@ class DaprActorClientBase(ABC):
     @abstractmethod
     async def unregister_timer(self, actor_type: str, actor_id: str, name: str) -> None:
         ...
+
+    async def close(self) -> None:
+        """Releases the resources held by the client, such as pooled connections."""
+        pass
@@ -62,40 +62,50 @@ class StatusDetails:
         return {attr: getattr(self, attr) for attr in self.__dict__}
 
 
+# the StatusDetails attribute of each rich error detail type
+_DETAIL_ATTRIBUTES = {
+    error_details_pb2.ErrorInfo.DESCRIPTOR.full_name: 'error_info',
+    error_details_pb2.RetryInfo.DESCRIPTOR.full_name: 'retry_info',
+    error_details_pb2.DebugInfo.DESCRIPTOR.full_name: 'debug_info',
+    error_details_pb2.QuotaFailure.DESCRIPTOR.full_name: 'quota_failure',
+    error_details_pb2.PreconditionFailure.DESCRIPTOR.full_name: 'precondition_failure',
+    error_details_pb2.BadRequest.DESCRIPTOR.full_name: 'bad_request',
+    error_details_pb2.RequestInfo.DESCRIPTOR.full_name: 'request_info',
+    error_details_pb2.ResourceInfo.DESCRIPTOR.full_name: 'resource_info',
+    error_details_pb2.Help.DESCRIPTOR.full_name: 'help',
+    error_details_pb2.LocalizedMessage.DESCRIPTOR.full_name: 'localized_message',
+}
+
+# marks the gRPC status as not parsed yet, since None means there is none
+_NOT_PARSED = object()
+
+
 class DaprGrpcError(RpcError):
+    """An error returned by a Dapr API call.
+
+    The rich error details of the sidecar are only parsed when they are first asked
+    for, by status_details(), error_code(), json() or get_grpc_status(), so raising
+    and handling errors stays cheap when the details are not needed.
+    """
+
     def __init__(self, err: RpcError):
         self._status_code = err.code()
         self._err_message = err.details()
-        self._details = StatusDetails()
-
-        self._grpc_status = rpc_status.from_call(err)
-        self._parse_details()
-
-    def _parse_details(self):
-        if self._grpc_status is None:
-            return
-
-        for detail in self._grpc_status.details:
-            if detail.Is(error_details_pb2.ErrorInfo.DESCRIPTOR):
-                self._details.error_info = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.RetryInfo.DESCRIPTOR):
-                self._details.retry_info = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.DebugInfo.DESCRIPTOR):
-                self._details.debug_info = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.QuotaFailure.DESCRIPTOR):
-                self._details.quota_failure = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.PreconditionFailure.DESCRIPTOR):
-                self._details.precondition_failure = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.BadRequest.DESCRIPTOR):
-                self._details.bad_request = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.RequestInfo.DESCRIPTOR):
-                self._details.request_info = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.ResourceInfo.DESCRIPTOR):
-                self._details.resource_info = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.Help.DESCRIPTOR):
-                self._details.help = serialize_status_detail(detail)
-            elif detail.Is(error_details_pb2.LocalizedMessage.DESCRIPTOR):
-                self._details.localized_message = serialize_status_detail(detail)
+        self._err = err
+        self._grpc_status = _NOT_PARSED
+        self._details: Optional[StatusDetails] = None
+
+    def _parse_details(self) -> StatusDetails:
+        details = StatusDetails()
+        grpc_status = self.get_grpc_status()
+        if grpc_status is None:
+            return details
+
+        for detail in grpc_status.details:
+            attribute = _DETAIL_ATTRIBUTES.get(detail.TypeName())
+            if attribute is not None:
+                setattr(details, attribute, serialize_status_detail(detail))
+        return details
 
     def code(self):
         return self._status_code
@@ -113,9 +123,13 @@ class DaprGrpcError(RpcError):
         return self.status_details().error_info.get('reason', ERROR_CODE_UNKNOWN)
 
     def status_details(self):
+        if self._details is None:
+            self._details = self._parse_details()
         return self._details
 
     def get_grpc_status(self):
+        if self._grpc_status is _NOT_PARSED:
+            self._grpc_status = rpc_status.from_call(self._err)
         return self._grpc_status
 
     def json(self):
@@ -123,7 +137,7 @@ class DaprGrpcError(RpcError):
             'status_code': self.code().name,
             'message': self.details(),
             'error_code': self.error_code(),
-            'details': self._details.as_dict(),
+            'details': self.status_details().as_dict(),
         }
         return json.dumps(error_details)
 
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2023 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+import json
+
+from typing import List, Optional
+
+from google.protobuf.any_pb2 import Any as GrpcAny
+
+from dapr.proto import api_v1
+
+DAPR_REENTRANCY_ID_METADATA = 'Dapr-Reentrancy-Id'
+
+
+def build_invoke_actor_request(
+    actor_type: str, actor_id: str, method: str, data: Optional[bytes] = None
+) -> api_v1.InvokeActorRequest:
+    """Builds the InvokeActor request, propagating the reentrancy id as metadata."""
+    # import to avoid circular dependency
+    from dapr.actor.runtime.reentrancy_context import reentrancy_ctx
+
+    reentrancy_id = reentrancy_ctx.get()
+    metadata = {DAPR_REENTRANCY_ID_METADATA: reentrancy_id} if reentrancy_id else None
+    return api_v1.InvokeActorRequest(
+        actor_type=actor_type,
+        actor_id=actor_id,
+        method=method,
+        data=data or b'',
+        metadata=metadata,
+    )
+
+
+def build_state_transaction_request(
+    actor_type: str, actor_id: str, data: bytes
+) -> api_v1.ExecuteActorStateTransactionRequest:
+    """Converts the JSON transaction body built by the state provider into protobuf operations.
+
+    The value of each upsert is sent as the compact JSON encoding of the value, so it is
+    read back by the same state serializer as with the HTTP API.
+    """
+    operations: List[api_v1.TransactionalActorStateOperation] = []
+    for op in json.loads(data):
+        request = op['request']
+        value = None
+        if 'value' in request:
+            value = GrpcAny(
+                value=json.dumps(request['value'], separators=(',', ':')).encode('utf-8')
+            )
+        operations.append(
+            api_v1.TransactionalActorStateOperation(
+                operationType=op['operation'],
+                key=request['key'],
+                value=value,
+                metadata=request.get('metadata'),
+            )
+        )
+    return api_v1.ExecuteActorStateTransactionRequest(
+        actor_type=actor_type, actor_id=actor_id, operations=operations
+    )
+
+
+def build_register_reminder_request(
+    actor_type: str, actor_id: str, name: str, data: bytes
+) -> api_v1.RegisterActorReminderRequest:
+    """Converts the JSON reminder body into a RegisterActorReminder request.
+
+    The reminder state is base64 encoded in the JSON body; gRPC carries the raw bytes.
+    """
+    reminder = json.loads(data)
+    state = reminder.get('data')
+    return api_v1.RegisterActorReminderRequest(
+        actor_type=actor_type,
+        actor_id=actor_id,
+        name=name,
+        due_time=reminder.get('dueTime') or '',
+        period=reminder.get('period') or '',
+        ttl=reminder.get('ttl') or '',
+        data=base64.b64decode(state) if state else b'',
+    )
+
+
+def build_register_timer_request(
+    actor_type: str, actor_id: str, name: str, data: bytes
+) -> api_v1.RegisterActorTimerRequest:
+    """Converts the JSON timer body into a RegisterActorTimer request.
+
+    The timer state is sent as its JSON encoding. Note that the sidecar hands state
+    registered over gRPC back to the timer callback base64 encoded.
+    """
+    timer = json.loads(data)
+    state = timer.get('data')
+    return api_v1.RegisterActorTimerRequest(
+        actor_type=actor_type,
+        actor_id=actor_id,
+        name=name,
+        due_time=timer.get('dueTime') or '',
+        period=timer.get('period') or '',
+        ttl=timer.get('ttl') or '',
+        callback=timer.get('callback') or '',
+        data=json.dumps(state).encode('utf-8') if state is not None else b'',
+    )
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
+
+# gRPC rejects messages larger than this unless max_grpc_message_length is raised
+DEFAULT_MAX_MESSAGE_LENGTH = 4 * 1024 * 1024
+
+# room left for the names in a request and the framing of each item
+REQUEST_OVERHEAD = 1024
+ITEM_OVERHEAD = 8
+
+T = TypeVar('T')
+
+
+def chunk_by_size(
+    items: Sequence[T], sizes: Sequence[int], max_bytes: int, max_items: Optional[int] = None
+) -> List[List[T]]:
+    """Splits items into chunks that each fit in one request of at most ``max_bytes``.
+
+    An item larger than ``max_bytes`` gets a chunk of its own.
+    """
+    chunks: List[List[T]] = []
+    chunk: List[T] = []
+    chunk_size = REQUEST_OVERHEAD
+    for item, size in zip(items, sizes):
+        size += ITEM_OVERHEAD
+        if chunk and (
+            chunk_size + size > max_bytes or (max_items is not None and len(chunk) >= max_items)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            chunk_size = REQUEST_OVERHEAD
+        chunk.append(item)
+        chunk_size += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class Batch:
+    """Items for one request, each with the future of its caller."""
+
+    __slots__ = ('key', 'items', 'waiters', 'ids', 'size', 'deadline')
+
+    def __init__(self, key: Hashable, deadline: float):
+        self.key = key
+        self.items: List[Any] = []
+        self.waiters: List[Any] = []
+        self.ids: set = set()
+        self.size = REQUEST_OVERHEAD
+        self.deadline = deadline
+
+    def fits(self, item_id: Optional[Hashable], size: int, max_bytes: int) -> bool:
+        # an id already in the batch starts a new one, so the items keep their order
+        if item_id is not None and item_id in self.ids:
+            return False
+        return not self.items or self.size + size + ITEM_OVERHEAD <= max_bytes
+
+    def add(self, item: Any, item_id: Optional[Hashable], size: int, waiter: Any) -> None:
+        self.items.append(item)
+        self.waiters.append(waiter)
+        if item_id is not None:
+            self.ids.add(item_id)
+        self.size += size + ITEM_OVERHEAD
+
+
+class Batcher:
+    """Collects items into batches per key and sends them from a background thread.
+
+    A batch is handed to ``send`` once it is ``linger_seconds`` old, holds ``max_items``
+    items, or the next item would take it over ``max_bytes``. ``send`` must resolve the
+    future of every item in the batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Batch], None],
+        linger_seconds: float,
+        max_items: int,
+        max_bytes: int,
+        name: str = 'dapr-batcher',
+    ):
+        self._send = send
+        self._linger_seconds = linger_seconds
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._name = name
+        self._pending: Dict[Hashable, Batch] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(
+        self, key: Hashable, item: Any, item_id: Optional[Hashable] = None, size: int = 0
+    ) -> Future:
+        """Queues an item and returns the future its batch resolves.
+
+        Full batches are sent from the calling thread.
+        """
+        future: Future = Future()
+        ready = []
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('the batcher is closed')
+            batch = self._pending.get(key)
+            if batch is not None and not batch.fits(item_id, size, self._max_bytes):
+                ready.append(self._pending.pop(key))
+                batch = None
+            if batch is None:
+                batch = Batch(key, time.monotonic() + self._linger_seconds)
+                self._pending[key] = batch
+                self._start()
+                self._condition.notify()
+            batch.add(item, item_id, size, future)
+            if len(batch.items) >= self._max_items:
+                ready.append(self._pending.pop(key))
+
+        for batch in ready:
+            self._send(batch)
+        return future
+
+    def flush(self) -> None:
+        """Sends all queued items from the calling thread."""
+        with self._condition:
+            ready = list(self._pending.values())
+            self._pending.clear()
+        for batch in ready:
+            self._send(batch)
+
+    def close(self) -> None:
+        """Sends all queued items and stops the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    due = [
+                        key
+                        for key, batch in self._pending.items()
+                        if self._closed or batch.deadline <= now
+                    ]
+                    if due:
+                        ready = [self._pending.pop(key) for key in due]
+                        break
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._pending:
+                        timeout = min(b.deadline for b in self._pending.values()) - now
+                    self._condition.wait(timeout)
+
+            for batch in ready:
+                self._send(batch)
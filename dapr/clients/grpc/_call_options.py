@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Optional, Union
+
+from grpc import Compression  # type: ignore
+
+# a compression algorithm, either as grpc.Compression or by name, e.g. 'gzip'
+CompressionType = Union[Compression, str]
+
+_COMPRESSIONS = {
+    'none': Compression.NoCompression,
+    'gzip': Compression.Gzip,
+    'deflate': Compression.Deflate,
+}
+
+
+def to_compression(compression: Optional[CompressionType]) -> Optional[Compression]:
+    """Converts a compression name, e.g. 'gzip', to grpc.Compression.
+
+    Raises:
+        ValueError: the name is not 'none', 'gzip' or 'deflate'.
+    """
+    if compression is None or isinstance(compression, Compression):
+        return compression
+    try:
+        return _COMPRESSIONS[compression.lower()]
+    except KeyError:
+        raise ValueError(
+            f'Unsupported compression {compression!r}, use one of {", ".join(_COMPRESSIONS)}'
+        ) from None
+
+
+class CallOptions:
+    """Defaults for the deadline and compression of the calls a client makes.
+
+    ``timeout`` is the deadline of every unary call that does not pass its own
+    ``timeout``, so a sidecar that stops responding cannot block the caller forever.
+    Streaming subscriptions are not limited by it.
+
+    ``compression`` is set on the channel, so every request is compressed with it,
+    unless a call passes its own ``compression``. Compressing pays off for large state
+    values and events, and costs CPU for small ones.
+
+    Examples:
+
+        >>> from dapr.clients import CallOptions, DaprClient
+        >>> with DaprClient(call_options=CallOptions(timeout=5, compression='gzip')) as d:
+        ...     d.save_state('statestore', 'key', large_value)
+        ...     d.get_state('statestore', 'key', timeout=0.5)
+    """
+
+    def __init__(
+        self, timeout: Optional[float] = None, compression: Optional[CompressionType] = None
+    ):
+        """Creates the call options of a client.
+
+        Args:
+            timeout (float, optional): the default deadline of a call in seconds. Calls
+                wait indefinitely by default.
+            compression (grpc.Compression or str, optional): the compression of the
+                channel, 'gzip', 'deflate' or 'none'. Not compressed by default.
+
+        Raises:
+            ValueError: timeout is not positive, or the compression is not supported.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError('timeout must be a positive number of seconds')
+        self.timeout = timeout
+        self.compression = to_compression(compression)
+
+    def deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """Returns the deadline of a call, the default unless ``timeout`` is set."""
+        return self.timeout if timeout is None else timeout
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class ChannelLease:
+    """A reference to a shared channel, held by one client."""
+
+    __slots__ = ('_registry', 'key', 'channel', '_released')
+
+    def __init__(self, registry: 'ChannelRegistry', key: Hashable, channel: Any):
+        self._registry = registry
+        self.key = key
+        self.channel = channel
+        self._released = False
+
+    def release(self) -> Optional[Any]:
+        """Gives up the reference.
+
+        Returns:
+            The channel if this was its last user, the caller must close it. None
+            otherwise, also when the lease was already released.
+        """
+        if self._released:
+            return None
+        self._released = True
+        return self._registry._release(self.key)
+
+
+class ChannelRegistry:
+    """Shares gRPC channels between the clients that connect with the same settings.
+
+    Channels are keyed by everything that goes into creating them, e.g. the endpoint,
+    TLS and channel options. A channel is created by the first client that asks for
+    it, and handed back for closing when the last of its clients releases it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: Dict[Hashable, Any] = {}
+        self._refcounts: Dict[Hashable, int] = {}
+
+    def acquire(self, key: Hashable, create: Callable[[], Any]) -> ChannelLease:
+        """Returns a lease on the channel for ``key``, creating it if needed."""
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = create()
+                self._channels[key] = channel
+                self._refcounts[key] = 0
+            self._refcounts[key] += 1
+        return ChannelLease(self, key, channel)
+
+    def refcount(self, key: Hashable) -> int:
+        """Returns the number of clients that use the channel for ``key``."""
+        with self._lock:
+            return self._refcounts.get(key, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._channels)
+
+    def _release(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            self._refcounts[key] -= 1
+            if self._refcounts[key] > 0:
+                return None
+            del self._refcounts[key]
+            return self._channels.pop(key)
+
+
+# the registry of all Dapr clients in the process
+channel_registry = ChannelRegistry()
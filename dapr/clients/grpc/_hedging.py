@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+import queue
+import threading
+import time
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from dapr.clients.grpc._helpers import MetadataTuple
+
+# Dapr API reads that are hedged by default
+HEDGED_METHODS = frozenset({'GetState', 'GetBulkState', 'GetSecret', 'GetConfiguration'})
+
+# the adaptive delay is recomputed after this many new latencies
+_RECOMPUTE_INTERVAL = 16
+
+
+class HedgingPolicy:
+    """Sends a second copy of a slow read, and uses whichever response comes first.
+
+    A call that has not finished after the hedging delay is sent once more, and the
+    copy that is still running when the other one succeeds is cancelled. The delay is
+    either fixed with ``delay_seconds``, or adapts to the ``percentile`` of the recent
+    latencies of the method, so only the slowest calls are hedged. Until
+    ``min_samples`` latencies are known, ``max_delay_seconds`` is used.
+
+    Hedges are capped by a budget: every call adds ``max_hedge_ratio`` of a token and
+    every hedge takes one, so in the long run at most that fraction of the calls is
+    sent twice, with bursts of up to ``budget_max_tokens`` hedges.
+
+    Only reads are hedged, ``GetState``, ``GetBulkState``, ``GetSecret`` and
+    ``GetConfiguration`` by default. The counters ``calls``, ``hedges``,
+    ``hedge_wins`` and ``throttled`` tell how many calls were made, how many were sent
+    twice, how often the second copy won, and how many hedges the budget prevented.
+
+    With a :class:`RetryPolicy`, the sync client only sends a call after its retries
+    are over, so a call that is being retried is not hedged. The aio client hedges it.
+
+    Examples:
+
+        >>> from dapr.clients import DaprClient, HedgingPolicy
+        >>> policy = HedgingPolicy(percentile=0.95)
+        >>> with DaprClient(hedging_policy=policy) as d:
+        ...     d.get_state('statestore', 'key')
+        >>> policy.hedges
+    """
+
+    def __init__(
+        self,
+        delay_seconds: Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay_seconds: float = 0.005,
+        max_delay_seconds: float = 1.0,
+        min_samples: int = 20,
+        window_size: int = 1000,
+        max_hedge_ratio: float = 0.1,
+        budget_max_tokens: float = 10.0,
+        methods: Iterable[str] = HEDGED_METHODS,
+    ):
+        """Creates a hedging policy.
+
+        Args:
+            delay_seconds (float, optional): a fixed hedging delay. Adaptive by default.
+            percentile (float): the latency percentile used as the adaptive delay.
+            min_delay_seconds (float): the shortest adaptive delay.
+            max_delay_seconds (float): the longest adaptive delay.
+            min_samples (int): the number of latencies needed for the adaptive delay.
+            window_size (int): the number of recent latencies kept per method.
+            max_hedge_ratio (float): the fraction of calls that may be hedged.
+            budget_max_tokens (float): the most hedges that can be sent in a burst.
+            methods (Iterable[str]): the names of the Dapr API methods to hedge.
+
+        Raises:
+            ValueError: delay_seconds is negative, percentile is not between 0 and 1,
+                or max_hedge_ratio is negative.
+        """
+        if delay_seconds is not None and delay_seconds < 0:
+            raise ValueError('delay_seconds must not be negative')
+        if not 0 < percentile <= 1:
+            raise ValueError('percentile must be between 0 and 1')
+        if max_hedge_ratio < 0:
+            raise ValueError('max_hedge_ratio must not be negative')
+        self._delay_seconds = delay_seconds
+        self._percentile = percentile
+        self._min_delay_seconds = min_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._min_samples = max(min_samples, 1)
+        self._window_size = window_size
+        self._max_hedge_ratio = max_hedge_ratio
+        self._budget_max_tokens = budget_max_tokens
+        self._methods = frozenset(methods)
+
+        self._lock = threading.Lock()
+        self._tokens = budget_max_tokens
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._delays: Dict[str, float] = {}
+        self._new_samples: Dict[str, int] = {}
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.throttled = 0
+
+    def counters(self) -> Dict[str, int]:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'throttled': self.throttled,
+            }
+
+    def applies_to(self, method: str) -> bool:
+        """Returns whether calls of a Dapr API method, e.g. ``GetState``, are hedged."""
+        return method in self._methods
+
+    def delay(self, method: str) -> float:
+        """Returns the seconds to wait for a call before it is hedged."""
+        if self._delay_seconds is not None:
+            return self._delay_seconds
+        with self._lock:
+            return self._delays.get(method, self._max_delay_seconds)
+
+    def on_call(self) -> None:
+        """Records a call, which adds to the hedging budget."""
+        with self._lock:
+            self.calls += 1
+            self._tokens = min(self._budget_max_tokens, self._tokens + self._max_hedge_ratio)
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget.
+
+        Returns:
+            Whether the call may be sent again.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self.throttled += 1
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def on_success(self, method: str, latency: float, hedged: bool) -> None:
+        """Records the latency of the copy of a call that succeeded first.
+
+        Args:
+            method (str): the Dapr API method of the call.
+            latency (float): the seconds the copy took, from when it was sent.
+            hedged (bool): whether the copy was the hedge.
+        """
+        with self._lock:
+            if hedged:
+                self.hedge_wins += 1
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = deque(maxlen=self._window_size)
+            latencies.append(latency)
+            # sorting the window for every call would cost more than it saves
+            self._new_samples[method] = self._new_samples.get(method, 0) + 1
+            if len(latencies) < self._min_samples or (
+                method in self._delays and self._new_samples[method] < _RECOMPUTE_INTERVAL
+            ):
+                return
+            self._new_samples[method] = 0
+            ordered = sorted(latencies)
+            value = ordered[max(math.ceil(self._percentile * len(ordered)) - 1, 0)]
+            self._delays[method] = min(self._max_delay_seconds, max(self._min_delay_seconds, value))
+
+
+def hedged_call(
+    policy: HedgingPolicy,
+    method: str,
+    multicallable: Any,
+    request: Any,
+    metadata: Optional[MetadataTuple] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Any, Any]:
+    """Sends a unary call, and a hedge of it if it is slow.
+
+    Args:
+        policy (HedgingPolicy): decides when the call is hedged.
+        method (str): the Dapr API method, e.g. ``GetState``.
+        multicallable (grpc.UnaryUnaryMultiCallable): the stub method to call.
+        request: the request message.
+        metadata (tuple, optional): gRPC custom metadata.
+        timeout (float, optional): the deadline of the call in seconds, which the
+            hedge shares.
+
+    Returns:
+        The response and the call that returned it, like ``with_call``.
+
+    Raises:
+        RpcError: every copy of the call failed.
+    """
+    policy.on_call()
+    finished: 'queue.Queue[Any]' = queue.Queue()
+    sent: List[Tuple[Any, float]] = []
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def send() -> None:
+        start = time.monotonic()
+        remaining = None if deadline is None else max(deadline - start, 0.0)
+        future = multicallable.future(request, metadata=metadata, timeout=remaining)
+        sent.append((future, start))
+        future.add_done_callback(finished.put)
+
+    send()
+    try:
+        winner = finished.get(timeout=policy.delay(method))
+    except queue.Empty:
+        if policy.try_hedge():
+            send()
+        winner = finished.get()
+    # a copy that failed leaves the other one to win
+    pending = len(sent) - 1
+    while pending and winner.exception() is not None:
+        winner = finished.get()
+        pending -= 1
+    finished_at = time.monotonic()
+
+    for future, start in sent:
+        if future is not winner:
+            future.cancel()
+        elif winner.exception() is None:
+            policy.on_success(method, finished_at - start, future is not sent[0][0])
+    return winner.result(), winner
@@ -21,6 +21,8 @@ from grpc import UnaryUnaryClientInterceptor, ClientCallDetails  # type: ignore
 
 MetadataDict = Dict[str, List[Union[bytes, str]]]
 MetadataTuple = Tuple[Tuple[str, Union[bytes, str]], ...]
+# binary data that is sent without encoding it first
+BytesLike = Union[bytes, bytearray, memoryview]
 
 
 def tuple_to_dict(tupledata: MetadataTuple) -> MetadataDict:
@@ -58,24 +60,41 @@ def unpack(data: GrpcAny, message: GrpcMessage) -> None:
     data.Unpack(message)
 
 
-def to_bytes(data: Union[str, bytes]) -> bytes:
-    """Convert str data to bytes."""
+def to_bytes(data: Union[str, BytesLike]) -> bytes:
+    """Convert str or bytes-like data to bytes.
+
+    A memoryview of a whole bytes object returns that object, and bytearray and other
+    memoryviews are copied once, since protocol buffer bytes fields only take bytes.
+
+    Raises:
+        ValueError: data is neither str nor bytes-like.
+    """
     if isinstance(data, bytes):
         return data
     elif isinstance(data, str):
         return data.encode('utf-8')
+    elif isinstance(data, memoryview):
+        if isinstance(data.obj, bytes) and data.nbytes == len(data.obj):
+            return data.obj
+        return data.tobytes()
+    elif isinstance(data, bytearray):
+        return bytes(data)
     else:
-        raise f'invalid data type {type(data)}'
+        raise ValueError(f'invalid data type {type(data)}')
 
 
-def to_str(data: Union[str, bytes]) -> str:
-    """Convert bytes data to str."""
+def to_str(data: Union[str, BytesLike]) -> str:
+    """Convert bytes-like data to str.
+
+    Raises:
+        ValueError: data is neither str nor bytes-like.
+    """
     if isinstance(data, str):
         return data
-    elif isinstance(data, bytes):
-        return data.decode('utf-8')
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        return str(data, 'utf-8')
     else:
-        raise f'invalid data type {type(data)}'
+        raise ValueError(f'invalid data type {type(data)}')
 
 
 class _ClientCallDetails(
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Union, TYPE_CHECKING
+
+from dapr.clients.exceptions import DaprInternalError
+from dapr.clients.grpc._batching import DEFAULT_MAX_MESSAGE_LENGTH, Batch, Batcher
+from dapr.clients.grpc._helpers import to_bytes
+from dapr.clients.grpc._request import BulkPublishEntry
+from dapr.clients.grpc._response import BulkPublishResponseFailedEntry
+from dapr.proto import api_v1
+
+if TYPE_CHECKING:
+    from dapr.clients.grpc.client import DaprGrpcClient
+
+PublishData = Union[bytes, str, BulkPublishEntry]
+
+
+def to_bulk_publish_entries(data: Sequence[PublishData]) -> List[BulkPublishEntry]:
+    """Wraps the events of a publish_events call, numbering those without an entry id.
+
+    Raises:
+        ValueError: the events are empty or their entry ids are not unique.
+    """
+    if not data:
+        raise ValueError('Events to be published cannot be empty')
+
+    entries = []
+    for i, event in enumerate(data):
+        if not isinstance(event, BulkPublishEntry):
+            event = BulkPublishEntry(event, entry_id=str(i))
+        elif event.entry_id is None:
+            event = BulkPublishEntry(event.data, str(i), event.content_type, event.metadata)
+        entries.append(event)
+
+    if len({entry.entry_id for entry in entries}) != len(entries):
+        raise ValueError('Entry ids of published events must be unique')
+    return entries
+
+
+def build_bulk_publish_request(
+    pubsub_name: str,
+    topic_name: str,
+    entries: Sequence[BulkPublishEntry],
+    publish_metadata: Dict[str, str],
+    data_content_type: Optional[str],
+) -> api_v1.BulkPublishRequest:
+    return api_v1.BulkPublishRequest(
+        pubsub_name=pubsub_name,
+        topic=topic_name,
+        metadata=publish_metadata,
+        entries=[
+            api_v1.BulkPublishRequestEntry(
+                entry_id=entry.entry_id,
+                event=to_bytes(entry.data),
+                content_type=entry.content_type
+                or data_content_type
+                or ('text/plain' if isinstance(entry.data, str) else 'application/octet-stream'),
+                metadata=entry.metadata,
+            )
+            for entry in entries
+        ],
+    )
+
+
+def get_failed_entries(
+    entries: Sequence[BulkPublishEntry], response: api_v1.BulkPublishResponse
+) -> List[BulkPublishResponseFailedEntry]:
+    by_id = {entry.entry_id: entry for entry in entries}
+    return [
+        BulkPublishResponseFailedEntry(by_id[failed.entry_id], failed.error)
+        for failed in response.failedEntries
+    ]
+
+
+def entry_size(entry: BulkPublishEntry) -> int:
+    """Estimates the size of an event in a bulk publish request."""
+    size = len(entry.data) + len(entry.entry_id or '') + len(entry.content_type or '')
+    for key, value in entry.metadata.items():
+        size += len(key) + len(value)
+    return size
+
+
+class Publisher:
+    """Buffers events per pub/sub topic and publishes them in bulk.
+
+    Events given to :meth:`publish` are collected for up to ``linger_seconds`` and sent
+    with :meth:`DaprGrpcClient.publish_events`. A buffer is sent early once it holds
+    ``max_entries`` events or would exceed ``max_bytes``. Events the pub/sub component
+    rejects are retried ``max_retries`` times, and the future of each event reports
+    whether it was published.
+
+    Examples:
+
+        >>> from dapr.clients import DaprClient, Publisher
+        >>> with DaprClient() as d, Publisher(d) as publisher:
+        ...     futures = [publisher.publish('pubsub', 'orders', f'{i}') for i in range(1000)]
+        >>> futures[0].result()
+    """
+
+    def __init__(
+        self,
+        client: DaprGrpcClient,
+        max_entries: int = 100,
+        max_bytes: Optional[int] = None,
+        linger_seconds: float = 0.01,
+        publish_metadata: Optional[Dict[str, str]] = None,
+        max_retries: int = 0,
+        retry_backoff_seconds: float = 0.1,
+    ):
+        """Creates a publisher.
+
+        Args:
+            client (DaprGrpcClient): the client the events are published with.
+            max_entries (int): the maximum number of events in one request.
+            max_bytes (int, optional): the maximum request size, 4 MiB by default.
+            linger_seconds (float): the longest an event waits for other events.
+            publish_metadata (Dict[str, str], optional): Dapr metadata of every request.
+            max_retries (int): how often events the pub/sub rejects are published again.
+            retry_backoff_seconds (float): the wait before the first retry, doubled after
+                each retry.
+
+        Raises:
+            ValueError: max_entries is not positive, or linger_seconds is negative.
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be a positive number')
+        if linger_seconds < 0:
+            raise ValueError('linger_seconds cannot be negative')
+        self._client = client
+        self._publish_metadata = publish_metadata or {}
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._batcher = Batcher(
+            self._send,
+            linger_seconds,
+            max_entries,
+            max_bytes or DEFAULT_MAX_MESSAGE_LENGTH,
+            name='dapr-publisher',
+        )
+
+    def publish(
+        self,
+        pubsub_name: str,
+        topic_name: str,
+        data: Union[bytes, str],
+        entry_id: Optional[str] = None,
+        data_content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Future:
+        """Queues an event.
+
+        Args:
+            pubsub_name (str): the name of the pubsub component
+            topic_name (str): the topic name to publish to
+            data (bytes or str): bytes or str for data
+            entry_id (str, optional): identifies the event, a random UUID by default.
+            data_content_type (str, optional): content type of the data payload
+            metadata (Dict[str, str], optional): Dapr metadata of the event
+
+        Returns:
+            :class:`Future` resolving to the entry id once the event is published. It
+            raises :class:`DaprInternalError` if the pub/sub rejects the event, or the
+            error of the publish request.
+        """
+        entry = BulkPublishEntry(data, entry_id or str(uuid.uuid4()), data_content_type, metadata)
+        return self._batcher.submit(
+            (pubsub_name, topic_name), entry, entry.entry_id, entry_size(entry)
+        )
+
+    def flush(self) -> None:
+        """Publishes all buffered events from the calling thread."""
+        self._batcher.flush()
+
+    def close(self) -> None:
+        """Publishes all buffered events and stops the publisher."""
+        self._batcher.close()
+
+    def __enter__(self) -> Publisher:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _send(self, batch: Batch) -> None:
+        pubsub_name, topic_name = batch.key
+        try:
+            response = self._client.publish_events(
+                pubsub_name,
+                topic_name,
+                batch.items,
+                publish_metadata=self._publish_metadata,
+                max_retries=self._max_retries,
+                retry_backoff_seconds=self._retry_backoff_seconds,
+            )
+        except Exception as err:
+            for waiter in batch.waiters:
+                waiter.set_exception(err)
+            return
+
+        errors = {failed.entry_id: failed.error for failed in response.failed_entries}
+        for entry, waiter in zip(batch.items, batch.waiters):
+            if entry.entry_id in errors:
+                waiter.set_exception(
+                    DaprInternalError(
+                        f'failed to publish event {entry.entry_id}: {errors[entry.entry_id]}'
+                    )
+                )
+            else:
+                waiter.set_result(entry.entry_id)
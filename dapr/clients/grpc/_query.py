@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from dapr.clients.grpc._response import QueryResponse, QueryResponseItem
+
+# page size of queries that do not set page.limit, so a page always fits in memory
+DEFAULT_QUERY_PAGE_SIZE = 1000
+
+QueryDecoder = Callable[[QueryResponseItem], Any]
+QueryPage = Tuple[List[Any], Optional[str]]
+
+
+def parse_paged_query(query: str, page_size: Optional[int] = None) -> Dict[str, Any]:
+    """Parses a state query and sets the number of items of each page.
+
+    Raises:
+        ValueError: the query is not a JSON object, or page_size is not positive.
+    """
+    if page_size is not None and page_size < 1:
+        raise ValueError('page_size must be a positive number')
+    parsed = json.loads(query)
+    if not isinstance(parsed, dict):
+        raise ValueError('query must be a JSON object')
+
+    page = dict(parsed.get('page') or {})
+    if page_size is not None:
+        page['limit'] = page_size
+    elif 'limit' not in page:
+        page['limit'] = DEFAULT_QUERY_PAGE_SIZE
+    parsed['page'] = page
+    return parsed
+
+
+def page_query(query: Dict[str, Any], token: Optional[str]) -> str:
+    """Serializes the query for the page that starts at ``token``."""
+    if token is None:
+        return json.dumps(query)
+    return json.dumps({**query, 'page': {**query['page'], 'token': token}})
+
+
+def next_page_token(token: Optional[str], response: QueryResponse) -> Optional[str]:
+    """Returns the token of the page after ``response``, or None after the last page."""
+    # An empty page ends the query as well, and a token that does not move would make
+    # the iteration loop forever.
+    if not response.token or not response.results or response.token == token:
+        return None
+    return response.token
+
+
+def split(items: Sequence[Any], parts: int) -> List[Sequence[Any]]:
+    """Splits items into at most ``parts`` slices of about the same length."""
+    size = -(-len(items) // max(parts, 1))
+    return [items[i : i + size] for i in range(0, len(items), size)] if items else []
+
+
+def decode_items(decode: QueryDecoder, items: Sequence[QueryResponseItem]) -> List[Any]:
+    return [decode(item) for item in items]
+
+
+def iter_query(
+    fetch: Callable[[str], QueryResponse],
+    query: Dict[str, Any],
+    prefetch: bool = True,
+    decode: Optional[QueryDecoder] = None,
+    decode_workers: int = 1,
+) -> Iterator[Any]:
+    """Yields the items of a paged query.
+
+    While the items of a page are consumed, the next page is fetched and decoded on a
+    background thread, so at most two pages are held in memory at a time.
+
+    Args:
+        fetch (callable): sends the query for one page.
+        query (Dict[str, Any]): the query from :func:`parse_paged_query`.
+        prefetch (bool): whether the next page is fetched ahead of time.
+        decode (callable, optional): applied to every item, its results are yielded
+            instead of the items.
+        decode_workers (int): the number of threads decoding a page.
+    """
+    decode_pool: Optional[Executor] = None
+    if decode is not None and decode_workers > 1:
+        decode_pool = ThreadPoolExecutor(decode_workers, thread_name_prefix='dapr-query-decode')
+    fetch_pool: Optional[Executor] = None
+    if prefetch:
+        fetch_pool = ThreadPoolExecutor(1, thread_name_prefix='dapr-query-prefetch')
+
+    def load(token: Optional[str]) -> QueryPage:
+        response = fetch(page_query(query, token))
+        results: List[Any] = list(response.results)
+        if decode is not None:
+            if decode_pool is None:
+                results = decode_items(decode, results)
+            else:
+                slices = decode_pool.map(
+                    decode_items, [decode] * decode_workers, split(results, decode_workers)
+                )
+                results = [item for decoded in slices for item in decoded]
+        return results, next_page_token(token, response)
+
+    next_page: Optional[Future] = None
+    try:
+        results, token = load(None)
+        while True:
+            if fetch_pool is not None and token is not None:
+                next_page = fetch_pool.submit(load, token)
+            yield from results
+            if token is None:
+                return
+            if next_page is not None:
+                results, token = next_page.result()
+                next_page = None
+            else:
+                results, token = load(token)
+    finally:
+        # an iteration stopped early leaves a prefetched page nobody waits for
+        if next_page is not None:
+            next_page.cancel()
+        if fetch_pool is not None:
+            fetch_pool.shutdown(wait=False)
+        if decode_pool is not None:
+            decode_pool.shutdown(wait=False)
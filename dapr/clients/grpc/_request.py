@@ -21,6 +21,7 @@ from google.protobuf.message import Message as GrpcMessage
 
 from dapr.clients.base import DEFAULT_JSON_CONTENT_TYPE
 from dapr.clients.grpc._helpers import (
+    BytesLike,
     MetadataDict,
     MetadataTuple,
     tuple_to_dict,
@@ -78,7 +79,7 @@ class InvokeMethodRequest(DaprRequest):
 
     Attributes:
         metadata(dict): A dict to include the headers from Dapr Request.
-        data (str, bytes, GrpcAny, GrpcMessage, optional): the serialized data
+        data (str, bytes-like, GrpcAny, GrpcMessage, optional): the serialized data
             for invoke_method request.
         content_type (str, optional): the content type of data which is valid
             only for bytes array data.
@@ -88,13 +89,13 @@ class InvokeMethodRequest(DaprRequest):
 
     def __init__(
         self,
-        data: Union[str, bytes, GrpcAny, GrpcMessage, None] = None,
+        data: Union[str, BytesLike, GrpcAny, GrpcMessage, None] = None,
         content_type: Optional[str] = None,
     ):
         """Inits InvokeMethodRequestData with data and content_type.
 
         Args:
-            data (bytes, str, GrpcAny, GrpcMessage, optional): the data
+            data (bytes-like, str, GrpcAny, GrpcMessage, optional): the data
                 which is used for invoke_method request.
             content_type (str): the content_type of data when the data is bytes.
                 The default content type is application/json.
@@ -139,11 +140,13 @@ class InvokeMethodRequest(DaprRequest):
     @property
     def proto(self) -> GrpcAny:
         """Gets raw data as proto any type."""
+        if self._data is None:
+            self._data = GrpcAny(value=self._value)
         return self._data
 
     def is_proto(self) -> bool:
         """Returns true if data is protocol-buffer serialized."""
-        return hasattr(self, '_data') and self._data.type_url != ''
+        return getattr(self, '_data', None) is not None and self._data.type_url != ''
 
     def pack(self, val: Union[GrpcAny, GrpcMessage]) -> None:
         """Serializes protocol buffer message.
@@ -154,6 +157,7 @@ class InvokeMethodRequest(DaprRequest):
         Raises:
             ValueError: message is neither GrpcAny nor GrpcMessage.
         """
+        self._value = None
         if isinstance(val, GrpcAny):
             self._data = val
         elif isinstance(val, GrpcMessage):
@@ -180,19 +184,27 @@ class InvokeMethodRequest(DaprRequest):
         """Gets request data as bytes."""
         if self.is_proto():
             raise ValueError('data is protocol buffer message object.')
-        return self._data.value
+        if self._value is None:
+            self._value = self._data.value
+        return self._value
 
     @data.setter
-    def data(self, val: Union[str, bytes]) -> None:
-        """Sets str or bytes type data to request data."""
+    def data(self, val: Union[str, BytesLike]) -> None:
+        """Sets str or bytes-like data to request data."""
         self.set_data(to_bytes(val))
 
-    def set_data(self, val: Union[str, bytes, GrpcAny, GrpcMessage, None]) -> None:
-        """Sets data to request data."""
+    def set_data(self, val: Union[str, BytesLike, GrpcAny, GrpcMessage, None]) -> None:
+        """Sets data to request data.
+
+        bytes-like data is kept as is, and wrapped in :obj:`GrpcAny` only when
+        :attr:`proto` is read, so the client can send it without copying it again.
+        """
         if val is None:
             self._data = GrpcAny()
-        elif isinstance(val, (bytes, str)):
-            self._data = GrpcAny(value=to_bytes(val))
+            self._value = None
+        elif isinstance(val, (bytes, bytearray, memoryview, str)):
+            self._data = None
+            self._value = to_bytes(val)
         elif isinstance(val, (GrpcAny, GrpcMessage)):
             self.pack(val)
         else:
@@ -224,15 +236,15 @@ class BindingRequest(DaprRequest):
         metadata (Dict[str, str]): the metadata sent to the binding.
     """
 
-    def __init__(self, data: Union[str, bytes], binding_metadata: Dict[str, str] = {}):
+    def __init__(self, data: Union[str, BytesLike], binding_metadata: Dict[str, str] = {}):
         """Inits BindingRequest with data and metadata if given.
 
         Args:
-            data (bytes, str): the data which is used for invoke_binding request.
+            data (bytes-like, str): the data which is used for invoke_binding request.
             binding_metadata (tuple, optional): the metadata to be sent to the binding.
 
         Raises:
-            ValueError: data is not bytes or str.
+            ValueError: data is not bytes-like or str.
         """
         super(BindingRequest, self).__init__(())
         self.data = data  # type: ignore
@@ -244,8 +256,8 @@ class BindingRequest(DaprRequest):
         return self._data
 
     @data.setter
-    def data(self, val: Union[str, bytes]) -> None:
-        """Sets str or bytes type data to request data."""
+    def data(self, val: Union[str, BytesLike]) -> None:
+        """Sets str or bytes-like data to request data."""
         self._data = to_bytes(val)
 
     def text(self) -> str:
@@ -321,3 +333,62 @@ class TransactionalStateOperation:
     def operation_type(self) -> TransactionOperationType:
         """Gets etag."""
         return self._operation_type
+
+
+class BulkPublishEntry:
+    """An event published with the bulk publish API.
+
+    Attributes:
+        entry_id (str): identifies the event in the bulk publish response.
+        data (Union[bytes, str]): event's data.
+        content_type (str): content type of the data.
+        metadata (Dict[str, str]): Dapr metadata of the event.
+    """
+
+    def __init__(
+        self,
+        data: Union[bytes, str],
+        entry_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ):
+        """Initializes BulkPublishEntry.
+
+        Args:
+            data (Union[bytes, str]): event's data.
+            entry_id (str, optional): identifies the event in the bulk publish response.
+                Defaults to the position of the event in the request.
+            content_type (str, optional): content type of the data. Defaults to
+                ``text/plain`` for str and ``application/octet-stream`` for bytes.
+            metadata (Dict[str, str], optional): Dapr metadata of the event.
+
+        Raises:
+            ValueError: data is not bytes or str.
+        """
+        if not isinstance(data, (bytes, str)):
+            raise ValueError(f'invalid type for data {type(data)}')
+
+        self._data = data
+        self._entry_id = entry_id
+        self._content_type = content_type
+        self._metadata = metadata or {}
+
+    @property
+    def entry_id(self) -> Optional[str]:
+        """Gets entry id."""
+        return self._entry_id
+
+    @property
+    def data(self) -> Union[bytes, str]:
+        """Gets raw data."""
+        return self._data
+
+    @property
+    def content_type(self) -> Optional[str]:
+        """Gets content type."""
+        return self._content_type
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Gets metadata."""
+        return self._metadata
@@ -20,8 +20,10 @@ import threading
 from datetime import datetime
 from enum import Enum
 from typing import (
+    Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Text,
@@ -37,6 +39,7 @@ from google.protobuf.message import Message as GrpcMessage
 
 from dapr.clients.base import DEFAULT_JSON_CONTENT_TYPE
 from dapr.clients.grpc._helpers import (
+    BytesLike,
     MetadataDict,
     MetadataTuple,
     to_bytes,
@@ -56,6 +59,58 @@ from dapr.proto import api_service_v1
 # for type checking
 if TYPE_CHECKING:
     from dapr.clients.grpc.client import DaprGrpcClient
+    from dapr.clients.grpc._request import BulkPublishEntry
+
+# marks a value that has not been decoded yet
+_NOT_DECODED: Any = object()
+
+
+class LazyItems(Sequence):
+    """A read-only sequence of response items, created from their messages on access.
+
+    A bulk response holds the messages it received, and wraps each of them in its item
+    type only when the item is read, so the items of a large response that are never
+    looked at cost no Python objects. An item is created once and then reused.
+    """
+
+    __slots__ = ('_messages', '_item_type', '_items')
+
+    def __init__(self, messages: Sequence[Any], item_type: Any):
+        """Creates the items of a response.
+
+        Args:
+            messages (Sequence): the protocol buffer messages of the items, or the items
+                themselves.
+            item_type (type): the item class, whose ``from_proto`` wraps a message.
+        """
+        self._messages = messages
+        self._item_type = item_type
+        self._items: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._items is None:
+            self._items = [None] * len(self._messages)
+        item = self._items[index]
+        if item is None:
+            message = self._messages[index]
+            if isinstance(message, self._item_type):
+                item = message
+            else:
+                item = self._item_type.from_proto(message)
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._messages)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
 
 
 class DaprResponse:
@@ -67,6 +122,8 @@ class DaprResponse:
         headers(dict): A dict to include the headers from Dapr gRPC Response.
     """
 
+    __slots__ = ('_headers', '_headers_dict')
+
     def __init__(self, headers: MetadataTuple = ()):
         """Inits DapResponse with headers and trailers.
 
@@ -84,6 +141,7 @@ class DaprResponse:
     def headers(self, val: MetadataTuple) -> None:
         """Sets response headers."""
         self._headers = val
+        self._headers_dict = None
 
     def get_headers(self, as_dict: bool = False) -> Union[MetadataDict, MetadataTuple]:
         """Gets headers from the response.
@@ -96,7 +154,9 @@ class DaprResponse:
             dict or tuple: response headers.
         """
         if as_dict:
-            return tuple_to_dict(self._headers)
+            if self._headers_dict is None:
+                self._headers_dict = tuple_to_dict(self._headers)
+            return self._headers_dict
         return self._headers
 
 
@@ -108,7 +168,7 @@ class InvokeMethodResponse(DaprResponse):
 
     Attributes:
         headers (tuple, optional): the tuple for the headers from response.
-        data (str, bytes, GrpcAny, GrpcMessage, optional): the serialized protocol
+        data (str, bytes-like, GrpcAny, GrpcMessage, optional): the serialized protocol
             buffer raw message
         content (bytes, optional): bytes data if response data is not serialized
             protocol buffer message
@@ -118,7 +178,7 @@ class InvokeMethodResponse(DaprResponse):
 
     def __init__(
         self,
-        data: Union[str, bytes, GrpcAny, GrpcMessage, None] = None,
+        data: Union[str, BytesLike, GrpcAny, GrpcMessage, None] = None,
         content_type: Optional[str] = None,
         headers: MetadataTuple = (),
         status_code: Optional[int] = None,
@@ -126,7 +186,7 @@ class InvokeMethodResponse(DaprResponse):
         """Initializes InvokeMethodReponse from :obj:`common_v1.InvokeResponse`.
 
         Args:
-            data (str, bytes, GrpcAny, GrpcMessage, optional): the response data
+            data (str, bytes-like, GrpcAny, GrpcMessage, optional): the response data
                 from Dapr response
             content_type (str, optional): the content type of the bytes data
             headers (tuple, optional): the headers from Dapr gRPC response
@@ -149,11 +209,13 @@ class InvokeMethodResponse(DaprResponse):
         Raises:
             ValueError: data is not protocol buffer message object
         """
+        if self._data is None:
+            self._data = GrpcAny(value=self._value)
         return self._data
 
     def is_proto(self) -> bool:
         """Returns True if the response data is the serialized protocol buffer message."""
-        return hasattr(self, '_data') and self._data.type_url != ''
+        return getattr(self, '_data', None) is not None and self._data.type_url != ''
 
     @property
     def data(self) -> bytes:
@@ -165,19 +227,39 @@ class InvokeMethodResponse(DaprResponse):
         """
         if self.is_proto():
             raise ValueError('data is protocol buffer message object.')
-        return self._data.value
+        if self._value is None:
+            self._value = self._data.value
+        return self._value
+
+    @property
+    def data_view(self) -> memoryview:
+        """Gets the response data as a read-only memoryview.
+
+        The data is copied out of the response message once, and slicing the view
+        does not copy it again.
+
+        Raises:
+            ValueError: the response data is the serialized protocol buffer message
+        """
+        return memoryview(self.data)
 
     @data.setter
-    def data(self, val: Union[str, bytes]) -> None:
-        """Sets str or bytes type data to request data."""
+    def data(self, val: Union[str, BytesLike]) -> None:
+        """Sets str or bytes-like data to request data."""
         self.set_data(val)
 
-    def set_data(self, val: Union[str, bytes, GrpcAny, GrpcMessage, None]) -> None:
-        """Sets data to request data."""
+    def set_data(self, val: Union[str, BytesLike, GrpcAny, GrpcMessage, None]) -> None:
+        """Sets data to request data.
+
+        bytes-like data is kept as is, and wrapped in :obj:`GrpcAny` only when
+        :attr:`proto` is read, so it is copied only once, when the response is sent.
+        """
         if val is None:
             self._data = GrpcAny()
-        elif isinstance(val, (bytes, str)):
-            self._data = GrpcAny(value=to_bytes(val))
+            self._value = None
+        elif isinstance(val, (bytes, bytearray, memoryview, str)):
+            self._data = None
+            self._value = to_bytes(val)
         elif isinstance(val, (GrpcAny, GrpcMessage)):
             self.pack(val)
         else:
@@ -220,6 +302,7 @@ class InvokeMethodResponse(DaprResponse):
         Raises:
             ValueError: message is neither GrpcAny nor GrpcMessage.
         """
+        self._value = None
         if isinstance(val, GrpcAny):
             self._data = val
         elif isinstance(val, GrpcMessage):
@@ -369,16 +452,18 @@ class StateResponse(DaprResponse):
 
     Attributes:
         data (bytes): the data in response from the get_state call
-        etag (str): state's etag.
+        etag (str): state's etag.
         headers (Tuple, optional): the headers from Dapr gRPC response
     """
 
+    __slots__ = ('_data', '_etag', '_json')
+
     def __init__(self, data: Union[bytes, str], etag: str = '', headers: MetadataTuple = ()):
         """Initializes StateResponse from :obj:`runtime_v1.GetStateResponse`.
 
         Args:
             data (bytes): the data in response from the get_state call
-            etag (str): state's etag.
+            etag (str): state's etag.
             headers (Tuple, optional): the headers from Dapr gRPC response
 
         Raises:
@@ -394,8 +479,13 @@ class StateResponse(DaprResponse):
         return to_str(self._data)
 
     def json(self) -> Dict[str, object]:
-        """Gets content as deserialized JSON dictionary."""
-        return json.loads(to_str(self._data))
+        """Gets content as deserialized JSON dictionary.
+
+        The content is decoded once, and later calls return the same object.
+        """
+        if self._json is _NOT_DECODED:
+            self._json = json.loads(to_str(self._data))
+        return self._json
 
     @property
     def etag(self) -> str:
@@ -411,58 +501,88 @@ class StateResponse(DaprResponse):
     def data(self, val: Union[bytes, str]) -> None:
         """Sets str or bytes type data to request data."""
         self._data = to_bytes(val)
+        self._json = _NOT_DECODED
 
 
 class BulkStateItem:
     """A state item from bulk_get_state API.
 
+    An item created with :meth:`from_proto` decodes the fields of its message when
+    they are first read.
+
     Attributes:
         key (str): state's key.
         data (Union[bytes, str]): state's data.
-        etag (str): state's etag.
+        etag (str): state's etag.
         error (str): error when state was retrieved
     """
 
+    __slots__ = ('_message', '_key', '_data', '_etag', '_error', '_json')
+
     def __init__(self, key: str, data: Union[bytes, str], etag: str = '', error: str = ''):
         """Initializes BulkStateItem item from :obj:`runtime_v1.BulkStateItem`.
 
         Args:
             key (str): state's key.
             data (Union[bytes, str]): state's data.
-            etag (str): state's etag.
+            etag (str): state's etag.
             error (str): error when state was retrieved
         """
+        self._message = None
         self._key = key
         self._data = data  # type: ignore
         self._etag = etag
         self._error = error
+        self._json = _NOT_DECODED
+
+    @classmethod
+    def from_proto(cls, message: api_v1.BulkStateItem) -> BulkStateItem:
+        """Wraps a :obj:`runtime_v1.BulkStateItem` without decoding its fields."""
+        item = cls.__new__(cls)
+        item._message = message
+        item._key = item._data = item._etag = item._error = _NOT_DECODED
+        item._json = _NOT_DECODED
+        return item
 
     def text(self) -> str:
         """Gets content as str."""
-        return to_str(self._data)
+        return to_str(self.data)
 
     def json(self) -> Dict[str, object]:
-        """Gets content as deserialized JSON dictionary."""
-        return json.loads(to_str(self._data))
+        """Gets content as deserialized JSON dictionary.
+
+        The content is decoded once, and later calls return the same object.
+        """
+        if self._json is _NOT_DECODED:
+            self._json = json.loads(to_str(self.data))
+        return self._json
 
     @property
     def key(self) -> str:
         """Gets key."""
+        if self._key is _NOT_DECODED:
+            self._key = self._message.key
         return self._key
 
     @property
     def data(self) -> Union[bytes, str]:
         """Gets raw data."""
+        if self._data is _NOT_DECODED:
+            self._data = self._message.data
         return self._data
 
     @property
     def etag(self) -> str:
         """Gets etag."""
+        if self._etag is _NOT_DECODED:
+            self._etag = self._message.etag
         return self._etag
 
     @property
     def error(self) -> str:
         """Gets error."""
+        if self._error is _NOT_DECODED:
+            self._error = self._message.error
         return self._error
 
 
@@ -472,18 +592,25 @@ class BulkStatesResponse(DaprResponse):
     This inherits from DaprResponse
 
     Attributes:
-        data (Union[bytes, str]): state's data.
+        items (Sequence[BulkStateItem]): the items retrieved, created on access.
     """
 
-    def __init__(self, items: Sequence[BulkStateItem], headers: MetadataTuple = ()):
+    __slots__ = ('_items',)
+
+    def __init__(
+        self,
+        items: Sequence[Union[BulkStateItem, api_v1.BulkStateItem]],
+        headers: MetadataTuple = (),
+    ):
         """Initializes BulkStatesResponse from :obj:`runtime_v1.GetBulkStateResponse`.
 
         Args:
-            items (Sequence[BulkStatesItem]): the items retrieved.
+            items (Sequence[BulkStatesItem]): the items retrieved, or their
+                :obj:`runtime_v1.BulkStateItem` messages.
             headers (Tuple, optional): the headers from Dapr gRPC response.
         """
         super(BulkStatesResponse, self).__init__(headers)
-        self._items = items
+        self._items = LazyItems(items, BulkStateItem)
 
     @property
     def items(self) -> Sequence[BulkStateItem]:
@@ -491,9 +618,39 @@ class BulkStatesResponse(DaprResponse):
         return self._items
 
 
+class DeleteBulkStateResponse(DaprResponse):
+    """The response of delete_bulk_state API.
+
+    This inherits from DaprResponse
+
+    Attributes:
+        failed_keys (Dict[str, str]): the keys that could not be deleted, with the error
+            of the request that held them. Empty when all keys were deleted.
+    """
+
+    def __init__(self, failed_keys: Optional[Dict[str, str]] = None, headers: MetadataTuple = ()):
+        """Initializes DeleteBulkStateResponse.
+
+        Args:
+            failed_keys (Dict[str, str], optional): the keys that could not be deleted,
+                with their errors.
+            headers (Tuple, optional): the headers from Dapr gRPC response.
+        """
+        super(DeleteBulkStateResponse, self).__init__(headers)
+        self._failed_keys = failed_keys or {}
+
+    @property
+    def failed_keys(self) -> Dict[str, str]:
+        """Gets the keys that could not be deleted, with their errors."""
+        return self._failed_keys
+
+
 class QueryResponseItem:
     """A query response item from state store query API.
 
+    An item created with :meth:`from_proto` decodes the fields of its message when
+    they are first read.
+
     Attributes:
         key (str): query reponse item's key.
         value (bytes): query reponse item's data.
@@ -501,6 +658,8 @@ class QueryResponseItem:
         error (str): error when state was retrieved
     """
 
+    __slots__ = ('_message', '_key', '_value', '_etag', '_error', '_json')
+
     def __init__(self, key: str, value: bytes, etag: str = '', error: str = ''):
         """Initializes QueryResponseItem item from :obj:`runtime_v1.QueryStateItem`.
 
@@ -510,37 +669,61 @@ class QueryResponseItem:
             etag (str): query response item's etag.
             error (str): error when state was retrieved
         """
+        self._message = None
         self._key = key
         self._value = value
         self._etag = etag
         self._error = error
+        self._json = _NOT_DECODED
+
+    @classmethod
+    def from_proto(cls, message: api_v1.QueryStateItem) -> QueryResponseItem:
+        """Wraps a :obj:`runtime_v1.QueryStateItem` without decoding its fields."""
+        item = cls.__new__(cls)
+        item._message = message
+        item._key = item._value = item._etag = item._error = _NOT_DECODED
+        item._json = _NOT_DECODED
+        return item
 
     def text(self) -> str:
         """Gets value as str."""
-        return to_str(self._value)
+        return to_str(self.value)
 
     def json(self) -> Dict[str, object]:
-        """Gets value as deserialized JSON dictionary."""
-        return json.loads(to_str(self._value))
+        """Gets value as deserialized JSON dictionary.
+
+        The value is decoded once, and later calls return the same object.
+        """
+        if self._json is _NOT_DECODED:
+            self._json = json.loads(to_str(self.value))
+        return self._json
 
     @property
     def key(self) -> str:
         """Gets key."""
+        if self._key is _NOT_DECODED:
+            self._key = self._message.key
         return self._key
 
     @property
     def value(self) -> bytes:
         """Gets raw value."""
+        if self._value is _NOT_DECODED:
+            self._value = self._message.data
         return self._value
 
     @property
     def etag(self) -> str:
         """Gets etag."""
+        if self._etag is _NOT_DECODED:
+            self._etag = self._message.etag
         return self._etag
 
     @property
     def error(self) -> str:
         """Gets error."""
+        if self._error is _NOT_DECODED:
+            self._error = self._message.error
         return self._error
 
 
@@ -550,14 +733,16 @@ class QueryResponse(DaprResponse):
     This inherits from DaprResponse
 
     Attributes:
-        results (Sequence[QueryResponseItem]): the query results.
+        results (Sequence[QueryResponseItem]): the query results, created on access.
         token (str): query response token for pagination.
         metadata (Dict[str, str]): query response metadata.
     """
 
+    __slots__ = ('_results', '_token', '_metadata')
+
     def __init__(
         self,
-        results: Sequence[QueryResponseItem],
+        results: Sequence[Union[QueryResponseItem, api_v1.QueryStateItem]],
         token: str = '',
         metadata: Dict[str, str] = dict(),
         headers: MetadataTuple = (),
@@ -565,14 +750,15 @@ class QueryResponse(DaprResponse):
         """Initializes QueryResponse from :obj:`runtime_v1.QueryStateResponse`.
 
         Args:
-            results (Sequence[QueryResponseItem]): the query results.
+            results (Sequence[QueryResponseItem]): the query results, or their
+                :obj:`runtime_v1.QueryStateItem` messages.
             token (str): query response token for pagination.
             metadata (Dict[str, str]): query response metadata.
             headers (Tuple, optional): the headers from Dapr gRPC response.
         """
         super(QueryResponse, self).__init__(headers)
         self._metadata = metadata
-        self._results = results
+        self._results = LazyItems(results, QueryResponseItem)
         self._token = token
 
     @property
@@ -596,29 +782,37 @@ class ConfigurationItem:
 
     Attributes:
         value (Union[bytes, str]): config's value.
-        version (str): config's version.
+        version (str): config's version.
         metadata (str): metadata
     """
 
+    __slots__ = ('_value', '_version', '_metadata', '_json')
+
     def __init__(self, value: str, version: str, metadata: Optional[Dict[str, str]] = dict()):
         """Initializes ConfigurationItem item from :obj:`runtime_v1.ConfigurationItem`.
 
         Args:
             value (str): config's value.
-            version (str): config's version.
+            version (str): config's version.
             metadata (Optional[Dict[str, str]] = dict()): metadata
         """
         self._value = value
         self._version = version
         self._metadata = metadata
+        self._json = _NOT_DECODED
 
     def text(self) -> str:
         """Gets content as str."""
         return to_str(self._value)
 
     def json(self) -> Dict[str, object]:
-        """Gets content as deserialized JSON dictionary."""
-        return json.loads(to_str(self._value))
+        """Gets content as deserialized JSON dictionary.
+
+        The content is decoded once, and later calls return the same object.
+        """
+        if self._json is _NOT_DECODED:
+            self._json = json.loads(to_str(self._value))
+        return self._json
 
     @property
     def value(self) -> str:
@@ -645,6 +839,8 @@ class ConfigurationResponse(DaprResponse):
         - items (Mapping[Text, ConfigurationItem]): state's data.
     """
 
+    __slots__ = ('_items',)
+
     def __init__(self, items: Mapping[Text, ConfigurationItem], headers: MetadataTuple = ()):
         """Initializes ConfigurationResponse from :obj:`runtime_v1.GetConfigurationResponse`.
 
@@ -755,6 +951,71 @@ class TopicEventResponse(DaprResponse):
         return self._status
 
 
+class BulkPublishResponseFailedEntry:
+    """An event the bulk publish API could not publish.
+
+    Attributes:
+        entry (BulkPublishEntry): the event.
+        error (str): why the event was not published.
+    """
+
+    def __init__(self, entry: BulkPublishEntry, error: str):
+        """Initializes BulkPublishResponseFailedEntry.
+
+        Args:
+            entry (BulkPublishEntry): the event.
+            error (str): why the event was not published.
+        """
+        self._entry = entry
+        self._error = error
+
+    @property
+    def entry(self) -> BulkPublishEntry:
+        """Gets the event."""
+        return self._entry
+
+    @property
+    def entry_id(self) -> str:
+        """Gets the entry id of the event."""
+        return self._entry.entry_id  # type: ignore
+
+    @property
+    def error(self) -> str:
+        """Gets error."""
+        return self._error
+
+
+class BulkPublishResponse(DaprResponse):
+    """The response of publish_events API.
+
+    This inherits from DaprResponse
+
+    Attributes:
+        failed_entries (Sequence[BulkPublishResponseFailedEntry]): the events that could
+            not be published. Empty when all events were published.
+    """
+
+    def __init__(
+        self,
+        failed_entries: Sequence[BulkPublishResponseFailedEntry] = (),
+        headers: MetadataTuple = (),
+    ):
+        """Initializes BulkPublishResponse from :obj:`runtime_v1.BulkPublishResponse`.
+
+        Args:
+            failed_entries (Sequence[BulkPublishResponseFailedEntry]): the events that
+                could not be published.
+            headers (Tuple, optional): the headers from Dapr gRPC response.
+        """
+        super(BulkPublishResponse, self).__init__(headers)
+        self._failed_entries = failed_entries
+
+    @property
+    def failed_entries(self) -> Sequence[BulkPublishResponseFailedEntry]:
+        """Gets the events that could not be published."""
+        return self._failed_entries
+
+
 class UnlockResponseStatus(Enum):
     success = api_v1.UnlockResponse.Status.SUCCESS
     """The Unlock operation for the referred lock was successful."""
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import threading
+import time
+
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from grpc import RpcError, StatusCode, UnaryUnaryClientInterceptor  # type: ignore
+
+from dapr.clients.exceptions import DaprGrpcError
+from dapr.clients.grpc._helpers import _ClientCallDetails
+
+# Dapr API methods that can be sent again without changing the outcome
+IDEMPOTENT_METHODS = frozenset(
+    {
+        'GetState',
+        'GetBulkState',
+        'QueryStateAlpha1',
+        'SaveState',
+        'DeleteState',
+        'DeleteBulkState',
+        'GetSecret',
+        'GetBulkSecret',
+        'GetConfiguration',
+        'GetConfigurationAlpha1',
+        'UnsubscribeConfiguration',
+        'UnsubscribeConfigurationAlpha1',
+        'GetMetadata',
+        'SetMetadata',
+        'GetWorkflowBeta1',
+        'GetWorkflowAlpha1',
+        'GetActorState',
+    }
+)
+
+RETRYABLE_STATUS_CODES = frozenset({StatusCode.UNAVAILABLE, StatusCode.RESOURCE_EXHAUSTED})
+
+
+class RetryPolicy:
+    """Retries Dapr API calls that fail with a transient error.
+
+    A failed call is sent again if its status code is retryable and the method is
+    idempotent, up to ``max_attempts`` calls in total. The wait before a retry grows
+    exponentially from ``initial_backoff_seconds`` with random jitter, unless the
+    error carries a ``RetryInfo`` delay from the sidecar, which is used instead.
+
+    Retries are throttled by a budget: every failure takes a token and every success
+    gives back ``budget_token_ratio`` of one, and no retries are sent while less than
+    half of ``budget_max_tokens`` is left. This keeps retries from piling load on a
+    sidecar that is already failing.
+
+    The counters ``attempts``, ``retries``, ``exhausted`` and ``throttled`` tell how
+    often calls were sent, retried, failed after the last attempt, and not retried
+    because the budget was used up.
+
+    Examples:
+
+        >>> from dapr.clients import DaprClient, RetryPolicy
+        >>> policy = RetryPolicy(max_attempts=5)
+        >>> with DaprClient(retry_policy=policy) as d:
+        ...     d.get_state('statestore', 'key')
+        >>> policy.retries
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff_seconds: float = 0.1,
+        max_backoff_seconds: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        jitter: float = 0.2,
+        retryable_status_codes: Iterable[StatusCode] = RETRYABLE_STATUS_CODES,
+        idempotent_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_non_idempotent: bool = False,
+        budget_max_tokens: float = 10.0,
+        budget_token_ratio: float = 0.1,
+        random_uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        """Creates a retry policy.
+
+        Args:
+            max_attempts (int): the maximum number of calls, including the first one.
+            initial_backoff_seconds (float): the wait before the first retry.
+            max_backoff_seconds (float): the longest wait between two calls.
+            backoff_multiplier (float): the growth of the wait after each retry.
+            jitter (float): the fraction by which a wait is randomly shortened or
+                lengthened.
+            retryable_status_codes (Iterable[StatusCode]): the status codes of transient
+                errors, UNAVAILABLE and RESOURCE_EXHAUSTED by default.
+            idempotent_methods (Iterable[str]): the names of the Dapr API methods that
+                are safe to retry, e.g. ``GetState``.
+            retry_non_idempotent (bool): whether all methods are retried.
+            budget_max_tokens (float): the size of the retry budget.
+            budget_token_ratio (float): the part of a token a successful call returns
+                to the budget.
+
+        Raises:
+            ValueError: max_attempts is not positive, or jitter is not between 0 and 1.
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be a positive number')
+        if not 0 <= jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1')
+        self._max_attempts = max_attempts
+        self._initial_backoff_seconds = initial_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._backoff_multiplier = backoff_multiplier
+        self._jitter = jitter
+        self._retryable_status_codes = frozenset(retryable_status_codes)
+        self._idempotent_methods = frozenset(idempotent_methods)
+        self._retry_non_idempotent = retry_non_idempotent
+        self._budget_max_tokens = budget_max_tokens
+        self._budget_token_ratio = budget_token_ratio
+        self._random_uniform = random_uniform
+
+        self._lock = threading.Lock()
+        self._tokens = budget_max_tokens
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.throttled = 0
+
+    def counters(self) -> Dict[str, int]:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'attempts': self.attempts,
+                'retries': self.retries,
+                'exhausted': self.exhausted,
+                'throttled': self.throttled,
+            }
+
+    def is_idempotent(self, method: Union[str, bytes]) -> bool:
+        """Returns whether a gRPC method, e.g. ``/dapr.proto.runtime.v1.Dapr/GetState``,
+        may be retried."""
+        if isinstance(method, bytes):
+            method = method.decode('utf-8')
+        return self._retry_non_idempotent or method.rsplit('/', 1)[-1] in self._idempotent_methods
+
+    def on_success(self) -> None:
+        """Records a call that succeeded."""
+        with self._lock:
+            self.attempts += 1
+            self._tokens = min(self._budget_max_tokens, self._tokens + self._budget_token_ratio)
+
+    def on_failure(
+        self,
+        method: Union[str, bytes],
+        err: RpcError,
+        attempt: int,
+        remaining: Optional[float] = None,
+    ) -> Optional[float]:
+        """Records a failed call and decides whether to send it again.
+
+        Args:
+            method (str or bytes): the gRPC method of the call.
+            err (RpcError): the error of the call.
+            attempt (int): the number of calls sent so far, starting at 1.
+            remaining (float, optional): the seconds left until the deadline of the call.
+
+        Returns:
+            The seconds to wait before the next call, or None if the error is final.
+        """
+        with self._lock:
+            self.attempts += 1
+            if err.code() not in self._retryable_status_codes or not self.is_idempotent(method):
+                return None
+            self._tokens = max(0.0, self._tokens - 1)
+            if attempt >= self._max_attempts:
+                self.exhausted += 1
+                return None
+            if self._tokens <= self._budget_max_tokens / 2:
+                self.throttled += 1
+                return None
+
+        delay = self._get_server_delay(err)
+        if delay is None:
+            delay = min(
+                self._max_backoff_seconds,
+                self._initial_backoff_seconds * self._backoff_multiplier ** (attempt - 1),
+            )
+            delay = self._random_uniform(delay * (1 - self._jitter), delay * (1 + self._jitter))
+        if remaining is not None and delay >= remaining:
+            return None
+        with self._lock:
+            self.retries += 1
+        return delay
+
+    @staticmethod
+    def _get_server_delay(err: RpcError) -> Optional[float]:
+        if not isinstance(err, DaprGrpcError):
+            try:
+                err = DaprGrpcError(err)
+            except Exception:
+                return None
+        retry_info = err.status_details().retry_info
+        if not retry_info or 'retry_delay' not in retry_info:
+            return None
+        # a Duration in JSON form, e.g. '1.500s'
+        return float(retry_info['retry_delay'].rstrip('s'))
+
+
+class RetryInterceptor(UnaryUnaryClientInterceptor):
+    """Sends unary calls again as the :class:`RetryPolicy` allows."""
+
+    def __init__(self, policy: RetryPolicy):
+        self._policy = policy
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.monotonic()
+        timeout = client_call_details.timeout
+        call_details = client_call_details
+        attempt = 1
+        while True:
+            outcome = continuation(call_details, request)
+            err = outcome.exception()
+            if err is None:
+                self._policy.on_success()
+                return outcome
+
+            remaining = None if timeout is None else timeout - (time.monotonic() - start)
+            delay = self._policy.on_failure(client_call_details.method, err, attempt, remaining)
+            if delay is None:
+                return outcome
+            time.sleep(delay)
+            attempt += 1
+            if timeout is not None:
+                # the retries share the deadline of the call
+                call_details = _ClientCallDetails(
+                    client_call_details.method,
+                    timeout - (time.monotonic() - start),
+                    client_call_details.metadata,
+                    client_call_details.credentials,
+                    client_call_details.wait_for_ready,
+                    client_call_details.compression,
+                )
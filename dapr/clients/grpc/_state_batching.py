@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+from dapr.clients.grpc._batching import DEFAULT_MAX_MESSAGE_LENGTH, Batch, Batcher
+from dapr.clients.grpc._response import DaprResponse
+from dapr.proto import common_v1
+
+
+class StateWriteBatching:
+    """Options for coalescing ``save_state`` calls into batched SaveState requests.
+
+    Pass an instance as ``state_write_batching`` to a Dapr client to enable it. Calls to
+    ``save_state`` on the same store are then collected for up to ``linger_seconds`` and
+    sent as one SaveState request. A batch is sent early once it holds ``max_items``
+    states or would exceed ``max_bytes``. Each call still returns its own response, or
+    raises its own error.
+
+    Writes with an etag, and writes using the deprecated ``metadata`` argument, are never
+    batched.
+    """
+
+    def __init__(
+        self,
+        linger_seconds: float = 0.005,
+        max_items: int = 100,
+        max_bytes: Optional[int] = None,
+    ):
+        """Creates write batching options.
+
+        Args:
+            linger_seconds (float): the longest a write waits for other writes.
+            max_items (int): the maximum number of states in one request.
+            max_bytes (int, optional): the maximum request size. Defaults to the
+                ``max_grpc_message_length`` of the client, or 4 MiB.
+
+        Raises:
+            ValueError: max_items is not positive, or linger_seconds is negative.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be a positive number')
+        if linger_seconds < 0:
+            raise ValueError('linger_seconds cannot be negative')
+        self.linger_seconds = linger_seconds
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+
+    def get_max_bytes(self, max_grpc_message_length: Optional[int]) -> int:
+        return self.max_bytes or max_grpc_message_length or DEFAULT_MAX_MESSAGE_LENGTH
+
+
+class SaveStateBatcher:
+    """Coalesces state writes of a :class:`DaprGrpcClient` on a background thread."""
+
+    def __init__(
+        self,
+        send: Callable[[str, List[common_v1.StateItem]], DaprResponse],
+        batching: StateWriteBatching,
+        max_grpc_message_length: Optional[int] = None,
+    ):
+        """Creates the batcher.
+
+        Args:
+            send (callable): sends a SaveState request for a store and its states.
+            batching (StateWriteBatching): the batching options.
+            max_grpc_message_length (int, optional): the message size limit of the client.
+        """
+        self._send = send
+        self._batcher = Batcher(
+            self._flush,
+            batching.linger_seconds,
+            batching.max_items,
+            batching.get_max_bytes(max_grpc_message_length),
+            name='dapr-save-state-batcher',
+        )
+
+    def submit(self, store_name: str, state: common_v1.StateItem) -> 'Future[DaprResponse]':
+        """Queues a state write and returns the future of its response."""
+        return self._batcher.submit(store_name, state, state.key, state.ByteSize())
+
+    def close(self) -> None:
+        """Sends all queued writes and stops the background thread."""
+        self._batcher.close()
+
+    def _flush(self, batch: Batch) -> None:
+        try:
+            response = self._send(batch.key, batch.items)
+        except Exception as err:
+            if len(batch.items) == 1:
+                batch.waiters[0].set_exception(err)
+                return
+            # A failed request does not tell which state caused it, so each state is
+            # sent again on its own to give every caller its own result.
+            for state, waiter in zip(batch.items, batch.waiters):
+                try:
+                    waiter.set_result(self._send(batch.key, [state]))
+                except Exception as state_err:
+                    waiter.set_exception(state_err)
+            return
+
+        for waiter in batch.waiters:
+            waiter.set_result(response)
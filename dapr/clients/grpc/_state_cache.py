@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from dateutil import parser
+
+from dapr.clients.grpc._response import BulkStateItem
+
+# metadata key used by state stores for the time to live of a saved value
+TTL_IN_SECONDS = 'ttlInSeconds'
+# response metadata key with the expiry time of a value, returned by state stores with TTL
+TTL_EXPIRE_TIME = 'ttlExpireTime'
+
+CachedState = Tuple[bytes, str]
+
+_StateId = Tuple[str, str]
+_EntryKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class StateCache:
+    """In-process read-through cache for ``get_state`` and ``get_bulk_state``.
+
+    Pass an instance as ``state_cache`` to a Dapr client to enable it. Entries are evicted
+    least recently used first once ``max_entries`` is reached, and expire ``ttl_seconds``
+    after they were read. A key is invalidated whenever the client saves, deletes or
+    transacts it, so a client always reads its own writes. Writes made by other processes
+    are only seen once the entry expires.
+
+    The cache is thread safe and can be shared by several clients, including the
+    ``dapr.aio`` client.
+
+    Examples:
+
+        >>> from dapr.clients import DaprClient, StateCache
+        >>> cache = StateCache(max_entries=10000, ttl_seconds=5)
+        >>> with DaprClient(state_cache=cache) as d:
+        ...     resp = d.get_state('statestore', 'config')
+        >>> cache.hits, cache.misses
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 60.0,
+        honor_state_ttl: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Creates an empty cache.
+
+        Args:
+            max_entries (int): the maximum number of cached values.
+            ttl_seconds (float, optional): seconds a value is served from the cache, or
+                None to keep values until they are evicted or invalidated.
+            honor_state_ttl (bool): expire values no later than the state store does, using
+                the ``ttlInSeconds`` metadata of the client's own writes and the
+                ``ttlExpireTime`` metadata returned by the state store.
+            clock (callable): monotonic time source in seconds.
+
+        Raises:
+            ValueError: max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be a positive number')
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._honor_state_ttl = honor_state_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # entry key -> (data, etag, expires at)
+        self._entries: 'OrderedDict[_EntryKey, Tuple[bytes, str, Optional[float]]]' = OrderedDict()
+        # (store, key) -> entry keys cached for it, one per distinct request metadata
+        self._variants: Dict[_StateId, set] = {}
+        # (store, key) -> (generation of the last write, expiry set by that write)
+        self._writes: 'OrderedDict[_StateId, Tuple[int, Optional[float]]]' = OrderedDict()
+        # generation of the most recent write forgotten from self._writes
+        self._write_floor = 0
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Write generation to pass to :meth:`put` for a read started now."""
+        return self._generation
+
+    def get(
+        self, store_name: str, key: str, state_metadata: Optional[Mapping[str, str]] = None
+    ) -> Optional[CachedState]:
+        """Returns the cached ``(data, etag)`` of a key, or None on a miss."""
+        entry_key = _entry_key(store_name, key, state_metadata)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                data, etag, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(entry_key)
+                    self.hits += 1
+                    return data, etag
+                self._remove(entry_key)
+            self.misses += 1
+            return None
+
+    def get_many(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        state_metadata: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, CachedState]:
+        """Returns the cached ``(data, etag)`` of the keys that are in the cache."""
+        found = {}
+        for key in keys:
+            cached = self.get(store_name, key, state_metadata)
+            if cached is not None:
+                found[key] = cached
+        return found
+
+    def put(
+        self,
+        store_name: str,
+        key: str,
+        state_metadata: Optional[Mapping[str, str]],
+        data: bytes,
+        etag: str,
+        generation: int,
+        response_metadata: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Caches a value read from the state store.
+
+        The value is dropped if the client wrote the key after ``generation`` was taken, as
+        the read may have returned the value from before that write.
+        """
+        state_id = (store_name, key)
+        now = self._clock()
+        expires_at = None if self._ttl_seconds is None else now + self._ttl_seconds
+        if self._honor_state_ttl and response_metadata:
+            expires_at = _earliest(expires_at, _parse_expire_time(response_metadata, now))
+
+        with self._lock:
+            write_generation, write_expires_at = self._writes.get(
+                state_id, (self._write_floor, None)
+            )
+            if write_generation > generation:
+                return
+            expires_at = _earliest(expires_at, write_expires_at)
+            if expires_at is not None and expires_at <= now:
+                return
+
+            entry_key = _entry_key(store_name, key, state_metadata)
+            self._entries[entry_key] = (data, etag, expires_at)
+            self._entries.move_to_end(entry_key)
+            self._variants.setdefault(state_id, set()).add(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(
+        self, store_name: str, key: str, state_metadata: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """Drops a key after the client wrote or deleted it.
+
+        Args:
+            store_name (str): the state store name.
+            key (str): the key that was written.
+            state_metadata (Dict[str, str], optional): metadata of the write; its
+                ``ttlInSeconds`` bounds how long later reads of the key are cached.
+        """
+        state_id = (store_name, key)
+        write_expires_at = None
+        if self._honor_state_ttl and state_metadata and state_metadata.get(TTL_IN_SECONDS):
+            try:
+                write_expires_at = self._clock() + float(state_metadata[TTL_IN_SECONDS])
+            except ValueError:
+                pass
+
+        with self._lock:
+            for entry_key in self._variants.pop(state_id, ()):
+                del self._entries[entry_key]
+            self._generation += 1
+            self._writes[state_id] = (self._generation, write_expires_at)
+            self._writes.move_to_end(state_id)
+            if len(self._writes) > self._max_entries:
+                _, (forgotten, _) = self._writes.popitem(last=False)
+                self._write_floor = max(self._write_floor, forgotten)
+
+    def clear(self) -> None:
+        """Drops all cached values. The hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._variants.clear()
+            self._generation += 1
+            self._write_floor = self._generation
+
+    def _remove(self, entry_key: _EntryKey) -> None:
+        del self._entries[entry_key]
+        state_id = (entry_key[0], entry_key[1])
+        variants = self._variants.get(state_id)
+        if variants is not None:
+            variants.discard(entry_key)
+            if not variants:
+                del self._variants[state_id]
+
+
+def merge_bulk_state(
+    keys: Sequence[str], cached: Dict[str, CachedState], fetched: Sequence[Any]
+) -> List[Any]:
+    """Combines cached values and fetched items of a bulk read, in the order of the keys.
+
+    The fetched items may be :obj:`runtime_v1.BulkStateItem` messages, which are kept.
+    """
+    fetched_by_key = {item.key: item for item in fetched}
+    items = []
+    for key in keys:
+        if key in cached:
+            data, etag = cached[key]
+            items.append(BulkStateItem(key=key, data=data, etag=etag))
+        elif key in fetched_by_key:
+            items.append(fetched_by_key[key])
+    return items
+
+
+def _entry_key(store_name: str, key: str, state_metadata: Optional[Mapping[str, str]]) -> _EntryKey:
+    return store_name, key, tuple(sorted(state_metadata.items())) if state_metadata else ()
+
+
+def _earliest(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+def _parse_expire_time(metadata: Mapping[str, str], now: float) -> Optional[float]:
+    value = metadata.get(TTL_EXPIRE_TIME)
+    if not value:
+        return None
+    try:
+        expire_time = parser.isoparse(value)
+    except ValueError:
+        return None
+    if expire_time.tzinfo is None:
+        expire_time = expire_time.replace(tzinfo=timezone.utc)
+    return now + (expire_time - datetime.now(timezone.utc)).total_seconds()
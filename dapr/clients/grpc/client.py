@@ -14,15 +14,15 @@ limitations under the License.
 """
 
 import time
-import socket
 import json
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlencode
 
 from warnings import warn
 
-from typing import Callable, Dict, Optional, Text, Union, Sequence, List, Any
+from typing import Callable, Dict, Iterator, Optional, Text, Tuple, Union, Sequence, List, Any
 from typing_extensions import Self
 from datetime import datetime
 from google.protobuf.message import Message as GrpcMessage
@@ -39,14 +39,28 @@ from grpc import (  # type: ignore
 
 from dapr.clients.exceptions import DaprInternalError, DaprGrpcError
 from dapr.clients.grpc._state import StateOptions, StateItem
+from dapr.clients.grpc._state_batching import SaveStateBatcher, StateWriteBatching
+from dapr.clients.grpc._batching import DEFAULT_MAX_MESSAGE_LENGTH, chunk_by_size
+from dapr.clients.grpc._publisher import (
+    build_bulk_publish_request,
+    get_failed_entries,
+    to_bulk_publish_entries,
+)
+from dapr.clients.grpc._channels import channel_registry
+from dapr.clients.grpc._call_options import CallOptions, CompressionType, to_compression
+from dapr.clients.grpc._hedging import HedgingPolicy, hedged_call
+from dapr.clients.grpc._retry import RetryInterceptor, RetryPolicy
+from dapr.clients.grpc._query import iter_query, parse_paged_query
+from dapr.clients.grpc._state_cache import StateCache, merge_bulk_state
 from dapr.clients.grpc._helpers import getWorkflowRuntimeStatus
-from dapr.clients.health import DaprHealth
+from dapr.clients.health import DaprHealth, wait_for_socket
 from dapr.conf import settings
 from dapr.proto import api_v1, api_service_v1, common_v1
 from dapr.proto.runtime.v1.dapr_pb2 import UnsubscribeConfigurationResponse
 from dapr.version import __version__
 
 from dapr.clients.grpc._helpers import (
+    BytesLike,
     DaprClientInterceptor,
     MetadataTuple,
     to_bytes,
@@ -58,6 +72,7 @@ from dapr.clients.grpc._request import (
     InvokeMethodRequest,
     BindingRequest,
     TransactionalStateOperation,
+    BulkPublishEntry,
 )
 from dapr.clients.grpc._response import (
     BindingResponse,
@@ -70,6 +85,9 @@ from dapr.clients.grpc._response import (
     StateResponse,
     BulkStatesResponse,
     BulkStateItem,
+    LazyItems,
+    BulkPublishResponse,
+    DeleteBulkStateResponse,
     ConfigurationResponse,
     QueryResponse,
     QueryResponseItem,
@@ -116,6 +134,11 @@ class DaprGrpcClient:
             ]
         ] = None,
         max_grpc_message_length: Optional[int] = None,
+        state_cache: Optional[StateCache] = None,
+        state_write_batching: Optional[StateWriteBatching] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        call_options: Optional[CallOptions] = None,
     ):
         """Connects to Dapr Runtime and initialize gRPC client stub.
 
@@ -127,8 +150,27 @@ class DaprGrpcClient:
                 StreamStreamClientInterceptor, optional): gRPC interceptors.
             max_grpc_messsage_length (int, optional): The maximum grpc send and receive
                 message length in bytes.
+            state_cache (StateCache, optional): caches the values read by get_state and
+                get_bulk_state. Disabled by default.
+            state_write_batching (StateWriteBatching, optional): coalesces concurrent
+                save_state calls into batched requests. Disabled by default.
+            retry_policy (RetryPolicy, optional): retries calls that fail with a transient
+                error. Disabled by default.
+            hedging_policy (HedgingPolicy, optional): sends slow reads a second time
+                and uses the first response. Disabled by default.
+            call_options (CallOptions, optional): the default deadline of the calls, and
+                the compression of the channel.
         """
         DaprHealth.wait_until_ready()
+        self._call_options = call_options or CallOptions()
+        self._hedging_policy = hedging_policy
+        self._state_cache = state_cache
+        self._max_grpc_message_length = max_grpc_message_length
+        self._save_state_batcher = None
+        if state_write_batching is not None:
+            self._save_state_batcher = SaveStateBatcher(
+                self._send_save_state, state_write_batching, max_grpc_message_length
+            )
 
         useragent = f'dapr-sdk-python/{__version__}'
         if not max_grpc_message_length:
@@ -152,18 +194,32 @@ class DaprGrpcClient:
         except ValueError as error:
             raise DaprInternalError(f'{error}') from error
 
-        if self._uri.tls:
-            self._channel = grpc.secure_channel(  # type: ignore
-                self._uri.endpoint,
-                self.get_credentials(),
-                options=options,
-            )
-        else:
-            self._channel = grpc.insecure_channel(  # type: ignore
+        def create_channel() -> grpc.Channel:
+            if self._uri.tls:
+                return grpc.secure_channel(  # type: ignore
+                    self._uri.endpoint,
+                    self.get_credentials(),
+                    options=options,
+                    compression=self._call_options.compression,
+                )
+            return grpc.insecure_channel(  # type: ignore
                 self._uri.endpoint,
                 options=options,
+                compression=self._call_options.compression,
             )
 
+        # Clients with the same endpoint and options share one channel, and with it
+        # the connection to the sidecar.
+        channel_key = (
+            self._uri.endpoint,
+            self._uri.tls,
+            type(self).get_credentials if self._uri.tls else None,
+            tuple(options),
+            self._call_options.compression,
+        )
+        self._channel_lease = channel_registry.acquire(channel_key, create_channel)
+        self._channel = self._channel_lease.channel
+
         if settings.DAPR_API_TOKEN:
             api_token_interceptor = DaprClientInterceptor(
                 [
@@ -177,6 +233,11 @@ class DaprGrpcClient:
             self._channel = grpc.intercept_channel(  # type: ignore
                 self._channel, *interceptors
             )
+        if retry_policy is not None:
+            # added last so it runs first, and the other interceptors run for every retry
+            self._channel = grpc.intercept_channel(  # type: ignore
+                self._channel, RetryInterceptor(retry_policy)
+            )
 
         self._stub = api_service_v1.DaprStub(self._channel)
 
@@ -186,9 +247,17 @@ class DaprGrpcClient:
         return grpc.ssl_channel_credentials()  # type: ignore
 
     def close(self):
-        """Closes Dapr runtime gRPC channel."""
-        if hasattr(self, '_channel') and self._channel:
-            self._channel.close()
+        """Closes Dapr runtime gRPC channel.
+
+        The channel is shared with other clients of the same address and options, and
+        only closed once none of them uses it anymore.
+        """
+        if getattr(self, '_save_state_batcher', None) is not None:
+            self._save_state_batcher.close()
+        if getattr(self, '_channel_lease', None) is not None:
+            channel = self._channel_lease.release()
+            if channel is not None:
+                channel.close()
 
     def __del__(self):
         self.close()
@@ -199,6 +268,21 @@ class DaprGrpcClient:
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.close()
 
+    def _read_with_call(
+        self,
+        method: str,
+        request: GrpcMessage,
+        metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, grpc.Call]:
+        """Sends a read of the Dapr API, hedged if the hedging policy covers it."""
+        multicallable = getattr(self._stub, method)
+        timeout = self._call_options.deadline(timeout)
+        policy = self._hedging_policy
+        if policy is None or not policy.applies_to(method):
+            return multicallable.with_call(request, metadata=metadata, timeout=timeout)
+        return hedged_call(policy, method, multicallable, request, metadata, timeout)
+
     def _get_http_extension(
         self, http_verb: str, http_querystring: Optional[MetadataTuple] = None
     ) -> common_v1.HTTPExtension:  # type: ignore
@@ -212,12 +296,13 @@ class DaprGrpcClient:
         self,
         app_id: str,
         method_name: str,
-        data: Union[bytes, str, GrpcMessage] = '',
+        data: Union[BytesLike, str, GrpcMessage] = '',
         content_type: Optional[str] = None,
         metadata: Optional[MetadataTuple] = None,
         http_verb: Optional[str] = None,
         http_querystring: Optional[MetadataTuple] = None,
-        timeout: Optional[int] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> InvokeMethodResponse:
         """Invokes the target service to call method.
 
@@ -282,12 +367,15 @@ class DaprGrpcClient:
         Args:
             app_id (str): the callee app id
             method (str): the method name which is called
-            data (bytes or :obj:`google.protobuf.message.Message`, optional): bytes
-                or Message for data which will be sent to app id
+            data (bytes-like, str or :obj:`google.protobuf.message.Message`, optional):
+                bytes-like, str or Message for data which will be sent to app id
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
             http_verb (str, optional): http method verb to call HTTP callee application
             http_querystring (tuple, optional): the tuple to represent query string
-            timeout (int, optional): request timeout in seconds
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`InvokeMethodResponse` object returned from callee
@@ -313,17 +401,23 @@ class DaprGrpcClient:
         content_type = ''
         if req_data.content_type:
             content_type = req_data.content_type
-        req = api_v1.InvokeServiceRequest(
-            id=app_id,
-            message=common_v1.InvokeRequest(
-                method=method_name,
-                data=req_data.proto,
-                content_type=content_type,
-                http_extension=http_ext,
-            ),
-        )
+        # build the request in place, since every message passed to a constructor is copied
+        req = api_v1.InvokeServiceRequest(id=app_id)
+        req.message.method = method_name
+        req.message.content_type = content_type
+        if http_ext is not None:
+            req.message.http_extension.CopyFrom(http_ext)
+        if req_data.is_proto():
+            req.message.data.CopyFrom(req_data.proto)
+        else:
+            req.message.data.value = req_data.data
 
-        response, call = self._stub.InvokeService.with_call(req, metadata=metadata, timeout=timeout)
+        response, call = self._stub.InvokeService.with_call(
+            req,
+            metadata=metadata,
+            timeout=self._call_options.deadline(timeout),
+            compression=to_compression(compression),
+        )
 
         resp_data = InvokeMethodResponse(response.data, response.content_type)
         resp_data.headers = call.initial_metadata()  # type: ignore
@@ -333,9 +427,11 @@ class DaprGrpcClient:
         self,
         binding_name: str,
         operation: str,
-        data: Union[bytes, str] = '',
+        data: Union[BytesLike, str] = '',
         binding_metadata: Dict[str, str] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> BindingResponse:
         """Invokes the output binding with the specified operation.
 
@@ -360,9 +456,13 @@ class DaprGrpcClient:
         Args:
             binding_name (str): the name of the binding as defined in the components
             operation (str): the operation to perform on the binding
-            data (bytes or str, optional): bytes or str for data which will sent to the binding
+            data (bytes-like or str, optional): the data which will sent to the binding
             binding_metadata (dict, optional): Dapr metadata for output binding
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`InvokeBindingResponse` object returned from binding
@@ -384,17 +484,24 @@ class DaprGrpcClient:
             operation=operation,
         )
 
-        response, call = self._stub.InvokeBinding.with_call(req, metadata=metadata)
+        response, call = self._stub.InvokeBinding.with_call(
+            req,
+            metadata=metadata,
+            timeout=self._call_options.deadline(timeout),
+            compression=to_compression(compression),
+        )
         return BindingResponse(response.data, dict(response.metadata), call.initial_metadata())
 
     def publish_event(
         self,
         pubsub_name: str,
         topic_name: str,
-        data: Union[bytes, str],
+        data: Union[BytesLike, str],
         publish_metadata: Dict[str, str] = {},
         metadata: Optional[MetadataTuple] = None,
         data_content_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Publish to a given topic.
         This publishes an event with bytes array or str data to a specified topic and
@@ -417,10 +524,14 @@ class DaprGrpcClient:
         Args:
             pubsub_name (str): the name of the pubsub component
             topic_name (str): the topic name to publish to
-            data (bytes or str): bytes or str for data
+            data (bytes-like or str): the data of the event
             publish_metadata (Dict[str, str], optional): Dapr metadata per Pub/Sub message
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
             data_content_type: (str, optional): content type of the data payload
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -433,15 +544,10 @@ class DaprGrpcClient:
                 stacklevel=2,
             )
 
-        if not isinstance(data, bytes) and not isinstance(data, str):
+        if not isinstance(data, (bytes, bytearray, memoryview, str)):
             raise ValueError(f'invalid type for data {type(data)}')
 
-        req_data: bytes
-        if isinstance(data, bytes):
-            req_data = data
-        else:
-            if isinstance(data, str):
-                req_data = data.encode('utf-8')
+        req_data = to_bytes(data)
 
         content_type = ''
         if data_content_type:
@@ -456,18 +562,102 @@ class DaprGrpcClient:
 
         try:
             # response is google.protobuf.Empty
-            _, call = self._stub.PublishEvent.with_call(req, metadata=metadata)
+            _, call = self._stub.PublishEvent.with_call(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
         except RpcError as err:
             raise DaprGrpcError(err) from err
 
         return DaprResponse(call.initial_metadata())
 
+    def publish_events(
+        self,
+        pubsub_name: str,
+        topic_name: str,
+        data: Sequence[Union[bytes, str, BulkPublishEntry]],
+        publish_metadata: Dict[str, str] = {},
+        data_content_type: Optional[str] = None,
+        max_retries: int = 0,
+        retry_backoff_seconds: float = 0.1,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
+    ) -> BulkPublishResponse:
+        """Publishes several events to a given topic in one request.
+
+        The pub/sub component may publish some of the events and reject others. Rejected
+        events are published again up to max_retries times, and those still rejected are
+        returned in the response.
+
+        The example publishes three events to a topic:
+
+            from dapr.clients import DaprClient
+            with DaprClient() as d:
+                resp = d.publish_events(
+                    pubsub_name='pubsub_1',
+                    topic_name='TOPIC_A',
+                    data=['message 1', 'message 2', b'message 3'],
+                )
+                # resp.failed_entries lists the events that were not published.
+
+        Args:
+            pubsub_name (str): the name of the pubsub component
+            topic_name (str): the topic name to publish to
+            data (Sequence[Union[bytes, str, BulkPublishEntry]]): the events
+            publish_metadata (Dict[str, str], optional): Dapr metadata of the request
+            data_content_type (str, optional): content type of events that do not set one
+            max_retries (int): how often rejected events are published again
+            retry_backoff_seconds (float): the wait before the first retry, doubled after
+                each retry
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
+
+        Returns:
+            :class:`BulkPublishResponse` gRPC metadata returned from callee and the
+            events that were not published
+
+        Raises:
+            ValueError: data is empty or the entry ids of the events are not unique
+        """
+        warn(
+            'The Bulk Publish API is an Alpha version and is subject to change.',
+            UserWarning,
+            stacklevel=2,
+        )
+
+        entries = to_bulk_publish_entries(data)
+        attempt = 0
+        while True:
+            req = build_bulk_publish_request(
+                pubsub_name, topic_name, entries, publish_metadata, data_content_type
+            )
+            try:
+                response, call = self._stub.BulkPublishEventAlpha1.with_call(
+                    req,
+                    timeout=self._call_options.deadline(timeout),
+                    compression=to_compression(compression),
+                )
+            except RpcError as err:
+                raise DaprGrpcError(err) from err
+
+            failed_entries = get_failed_entries(entries, response)
+            if not failed_entries or attempt >= max_retries:
+                return BulkPublishResponse(failed_entries, call.initial_metadata())
+            time.sleep(retry_backoff_seconds * 2**attempt)
+            attempt += 1
+            entries = [failed.entry for failed in failed_entries]
+
     def get_state(
         self,
         store_name: str,
         key: str,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> StateResponse:
         """Gets value from a statestore with a key
 
@@ -486,6 +676,8 @@ class DaprGrpcClient:
             key (str): the key of the key-value pair to be gotten
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`StateResponse` gRPC metadata returned from callee
@@ -501,15 +693,34 @@ class DaprGrpcClient:
 
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
+
+        cache = self._state_cache
+        if cache is not None:
+            cached = cache.get(store_name, key, state_metadata)
+            if cached is not None:
+                return StateResponse(data=cached[0], etag=cached[1])
+            generation = cache.generation
+
         req = api_v1.GetStateRequest(store_name=store_name, key=key, metadata=state_metadata)
         try:
-            response, call = self._stub.GetState.with_call(req, metadata=metadata)
-            return StateResponse(
-                data=response.data, etag=response.etag, headers=call.initial_metadata()
-            )
+            response, call = self._read_with_call('GetState', req, metadata, timeout)
         except RpcError as err:
             raise DaprGrpcError(err) from err
 
+        if cache is not None:
+            cache.put(
+                store_name,
+                key,
+                state_metadata,
+                response.data,
+                response.etag,
+                generation,
+                response.metadata,
+            )
+        return StateResponse(
+            data=response.data, etag=response.etag, headers=call.initial_metadata()
+        )
+
     def get_bulk_state(
         self,
         store_name: str,
@@ -517,9 +728,16 @@ class DaprGrpcClient:
         parallelism: int = 1,
         states_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        max_concurrency: int = 1,
+        max_keys_per_request: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> BulkStatesResponse:
         """Gets values from a statestore with keys
 
+        The keys are split into requests that each stay below the gRPC message limit,
+        and at most max_keys_per_request long. Up to max_concurrency of these requests
+        run at the same time, and the items of all of them are returned in key order.
+
         The example gets value from a statestore:
             from dapr.clients import DaprClient
             with DaprClient() as d:
@@ -533,13 +751,21 @@ class DaprGrpcClient:
         Args:
             store_name (str): the state store name to get from
             key (Sequence[str]): the keys to be retrieved
-            parallelism (int): number of items to be retrieved in parallel
+            parallelism (int): number of items each request retrieves in parallel
             states_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            max_concurrency (int): the maximum number of requests in flight
+            max_keys_per_request (int, optional): the maximum number of keys in a request
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
 
         Returns:
-            :class:`BulkStatesResponse` gRPC metadata returned from callee
+            :class:`BulkStatesResponse` gRPC metadata returned from the first request
             and value obtained from the state store
+
+        Raises:
+            ValueError: store_name is empty, or max_concurrency or max_keys_per_request
+                is not positive
         """
         if metadata is not None:
             warn(
@@ -551,24 +777,183 @@ class DaprGrpcClient:
 
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
-        req = api_v1.GetBulkStateRequest(
-            store_name=store_name, keys=keys, parallelism=parallelism, metadata=states_metadata
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+        if max_keys_per_request is not None and max_keys_per_request < 1:
+            raise ValueError('max_keys_per_request must be a positive number')
+
+        parts: List[Sequence[Any]] = []
+        headers: Optional[MetadataTuple] = None
+        for chunk_items, chunk_headers in self._get_bulk_state_chunks(
+            store_name,
+            keys,
+            parallelism,
+            states_metadata,
+            metadata,
+            max_concurrency,
+            max_keys_per_request,
+            ordered=True,
+            timeout=timeout,
+        ):
+            parts.append(chunk_items)
+            if headers is None and chunk_headers is not None:
+                headers = chunk_headers
+        # a single response is not copied into a list
+        items = parts[0] if len(parts) == 1 else [item for part in parts for item in part]
+        return BulkStatesResponse(items=items, headers=headers or ())
+
+    def iter_bulk_state(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        parallelism: int = 1,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        max_concurrency: int = 4,
+        max_keys_per_request: Optional[int] = None,
+        ordered: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Iterator[BulkStateItem]:
+        """Gets values from a statestore with keys, yielding the items as they arrive
+
+        The keys are split into requests like in :meth:`get_bulk_state`, and up to
+        max_concurrency of them run on a thread pool at the same time. The items of a request
+        are yielded once it completes, so a large key list can be processed before all
+        of it has been read.
+
+        The example reads many keys with 8 concurrent requests:
+            from dapr.clients import DaprClient
+            with DaprClient() as d:
+                for item in d.iter_bulk_state('state_store', keys, max_concurrency=8):
+                    print(item.key, item.data)
+
+        Args:
+            store_name (str): the state store name to get from
+            keys (Sequence[str]): the keys to be retrieved
+            parallelism (int): number of items each request retrieves in parallel
+            states_metadata (Dict[str, str], optional): Dapr metadata for state request
+            max_concurrency (int): the maximum number of requests in flight
+            max_keys_per_request (int, optional): the maximum number of keys in a request
+            ordered (bool): whether the items are yielded in key order, instead of in the
+                order the requests complete
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
+
+        Returns:
+            An iterator of :class:`BulkStateItem`
+
+        Raises:
+            ValueError: store_name is empty, or max_concurrency or max_keys_per_request
+                is not positive
+        """
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+        if max_keys_per_request is not None and max_keys_per_request < 1:
+            raise ValueError('max_keys_per_request must be a positive number')
+
+        chunks = self._get_bulk_state_chunks(
+            store_name,
+            keys,
+            parallelism,
+            states_metadata,
+            None,
+            max_concurrency,
+            max_keys_per_request,
+            ordered,
+            timeout,
         )
+        return (item for items, _ in chunks for item in LazyItems(items, BulkStateItem))
 
-        try:
-            response, call = self._stub.GetBulkState.with_call(req, metadata=metadata)
-        except RpcError as err:
-            raise DaprGrpcError(err) from err
+    def _get_bulk_state_chunks(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        parallelism: int,
+        states_metadata: Optional[Dict[str, str]],
+        metadata: Optional[MetadataTuple],
+        max_concurrency: int,
+        max_keys_per_request: Optional[int],
+        ordered: bool,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[Sequence[Any], Optional[MetadataTuple]]]:
+        """Yields the items and headers of each request of a bulk read.
+
+        The items are the :obj:`runtime_v1.BulkStateItem` messages of a response, and
+        :class:`BulkStateItem` for the keys found in the state cache, which are not
+        requested. A chunk of cached keys yields None for its headers.
+        """
+        cache = self._state_cache
+        cached: Dict[str, Any] = {}
+        generation = 0
+        if cache is not None:
+            generation = cache.generation
+            cached = cache.get_many(store_name, keys, states_metadata)
+        chunks = chunk_by_size(
+            keys,
+            [len(key.encode('utf-8')) for key in keys],
+            self._max_grpc_message_length or DEFAULT_MAX_MESSAGE_LENGTH,
+            max_keys_per_request,
+        )
+
+        def get_chunk(chunk: List[str]) -> Tuple[Sequence[Any], Optional[MetadataTuple]]:
+            missing_keys = [key for key in chunk if key not in cached]
+            if not missing_keys:
+                return merge_bulk_state(chunk, cached, []), None
 
-        items = []
-        for item in response.items:
-            items.append(
-                BulkStateItem(key=item.key, data=item.data, etag=item.etag, error=item.error)
+            req = api_v1.GetBulkStateRequest(
+                store_name=store_name,
+                keys=missing_keys,
+                parallelism=parallelism,
+                metadata=states_metadata,
             )
-        return BulkStatesResponse(items=items, headers=call.initial_metadata())
+            try:
+                response, call = self._read_with_call('GetBulkState', req, metadata, timeout)
+            except RpcError as err:
+                raise DaprGrpcError(err) from err
+
+            # the messages are wrapped in BulkStateItem only when they are read
+            items: Sequence[Any] = response.items
+            if cache is not None:
+                for item in items:
+                    if not item.error:
+                        cache.put(
+                            store_name,
+                            item.key,
+                            states_metadata,
+                            item.data,
+                            item.etag,
+                            generation,
+                            item.metadata,
+                        )
+            if cached:
+                items = merge_bulk_state(chunk, cached, items)
+            return items, call.initial_metadata()
+
+        if len(chunks) < 2 or max_concurrency < 2:
+            for chunk in chunks:
+                yield get_chunk(chunk)
+            return
+
+        pool = ThreadPoolExecutor(
+            min(max_concurrency, len(chunks)), thread_name_prefix='dapr-get-bulk-state'
+        )
+        futures = [pool.submit(get_chunk, chunk) for chunk in chunks]
+        try:
+            for future in futures if ordered else as_completed(futures):
+                yield future.result()
+        finally:
+            # requests that have not started yet are dropped when the caller stops early
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
 
     def query_state(
-        self, store_name: str, query: str, states_metadata: Optional[Dict[str, str]] = dict()
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        timeout: Optional[float] = None,
     ) -> QueryResponse:
         """Queries a statestore with a query
 
@@ -602,6 +987,8 @@ class DaprGrpcClient:
             store_name (str): the state store name to query
             query (str): the query to be executed
             states_metadata (Dict[str, str], optional): custom metadata for state request
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`QueryStateResponse` gRPC metadata returned from callee,
@@ -615,35 +1002,106 @@ class DaprGrpcClient:
 
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
+        return self._query_state(store_name, query, states_metadata, timeout)
+
+    def _query_state(
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]],
+        timeout: Optional[float] = None,
+    ) -> QueryResponse:
         req = api_v1.QueryStateRequest(store_name=store_name, query=query, metadata=states_metadata)
 
         try:
-            response, call = self._stub.QueryStateAlpha1.with_call(req)
+            response, call = self._stub.QueryStateAlpha1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
         except RpcError as err:
             raise DaprGrpcError(err) from err
 
-        results = []
-        for item in response.results:
-            results.append(
-                QueryResponseItem(key=item.key, value=item.data, etag=item.etag, error=item.error)
-            )
-
         return QueryResponse(
             token=response.token,
-            results=results,
+            results=response.results,
             metadata=response.metadata,
             headers=call.initial_metadata(),
         )
 
+    def iter_query_state(
+        self,
+        store_name: str,
+        query: str,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        decode: Optional[Callable[[QueryResponseItem], Any]] = None,
+        decode_workers: int = 1,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """Queries a statestore and iterates over the items of all result pages
+
+        The query is sent once per page, each time with the pagination token of the page
+        before. While the items of a page are consumed the next page is already fetched,
+        so at most two pages are held in memory however large the result.
+
+        This example iterates over all items of a query:
+            from dapr.clients import DaprClient
+
+            query = '{"filter": {"EQ": {"state": "CA"}}}'
+
+            with DaprClient() as d:
+                for item in d.iter_query_state('state_store', query, page_size=500):
+                    print(item.key, item.json())
+
+        Args:
+            store_name (str): the state store name to query
+            query (str): the query to be executed, without a page token
+            states_metadata (Dict[str, str], optional): custom metadata for state request
+            page_size (int, optional): the number of items per page, overriding the
+                page limit of the query. Queries without a page limit get pages of
+                1000 items.
+            prefetch (bool): whether the next page is fetched while a page is consumed.
+            decode (callable, optional): converts each item, e.g. ``QueryResponseItem.json``;
+                the converted values are yielded instead of the items.
+            decode_workers (int): the number of threads decoding the items of a page.
+            timeout (float, optional): the deadline of each request in seconds, the
+                client's default if not set
+
+        Returns:
+            An iterator of :class:`QueryResponseItem`, or of the values ``decode`` returns
+
+        Raises:
+            ValueError: the store name is empty, the query is not a JSON object or
+                page_size is not positive.
+        """
+        warn(
+            'The State Store Query API is an Alpha version and is subject to change.',
+            UserWarning,
+            stacklevel=2,
+        )
+
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        paged_query = parse_paged_query(query, page_size)
+        return iter_query(
+            lambda page: self._query_state(store_name, page, states_metadata, timeout),
+            paged_query,
+            prefetch=prefetch,
+            decode=decode,
+            decode_workers=decode_workers,
+        )
+
     def save_state(
         self,
         store_name: str,
         key: str,
-        value: Union[bytes, str],
+        value: Union[BytesLike, str],
         etag: Optional[str] = None,
         options: Optional[StateOptions] = None,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves key-value pairs to a statestore
 
@@ -665,18 +1123,22 @@ class DaprGrpcClient:
         Args:
             store_name (str): the state store name to save to
             key (str): the key to be saved
-            value (bytes or str): the value to be saved
+            value (bytes-like or str): the value to be saved
             etag (str, optional): the etag to save with
             options (StateOptions, optional): custom options
                 for concurrency and consistency
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
 
         Raises:
-            ValueError: value is not bytes or str
+            ValueError: value is not bytes-like or str
             ValueError: store_name is empty
         """
         if metadata is not None:
@@ -687,11 +1149,9 @@ class DaprGrpcClient:
                 stacklevel=2,
             )
 
-        if not isinstance(value, (bytes, str)):
+        if not isinstance(value, (bytes, bytearray, memoryview, str)):
             raise ValueError(f'invalid type for data {type(value)}')
 
-        req_value = value
-
         if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
             raise ValueError('State store name cannot be empty')
 
@@ -700,23 +1160,54 @@ class DaprGrpcClient:
         else:
             state_options = options.get_proto()
 
-        state = common_v1.StateItem(
+        state = dict(
             key=key,
-            value=to_bytes(req_value),
+            value=to_bytes(value),
             etag=common_v1.Etag(value=etag) if etag is not None else None,
             options=state_options,
             metadata=state_metadata,
         )
 
-        req = api_v1.SaveStateRequest(store_name=store_name, states=[state])
         try:
-            _, call = self._stub.SaveState.with_call(req, metadata=metadata)
+            if (
+                self._save_state_batcher is not None
+                and etag is None
+                and metadata is None
+                and timeout is None
+                and compression is None
+            ):
+                return self._save_state_batcher.submit(
+                    store_name, common_v1.StateItem(**state)
+                ).result()
+
+            # added in place, a StateItem passed to the request would be copied with its value
+            req = api_v1.SaveStateRequest(store_name=store_name)
+            req.states.add(**state)
+            _, call = self._stub.SaveState.with_call(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                self._state_cache.invalidate(store_name, key, state_metadata)
+
+    def _send_save_state(self, store_name: str, states: List[common_v1.StateItem]) -> DaprResponse:
+        req = api_v1.SaveStateRequest(store_name=store_name, states=states)
+        _, call = self._stub.SaveState.with_call(req, timeout=self._call_options.timeout)
+        return DaprResponse(headers=call.initial_metadata())
 
     def save_bulk_state(
-        self, store_name: str, states: List[StateItem], metadata: Optional[MetadataTuple] = None
+        self,
+        store_name: str,
+        states: List[StateItem],
+        metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves state items to a statestore
 
@@ -735,6 +1226,10 @@ class DaprGrpcClient:
             store_name (str): the state store name to save to
             states (List[StateItem]): list of states to save
             metadata (tuple, optional): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -771,10 +1266,19 @@ class DaprGrpcClient:
         req = api_v1.SaveStateRequest(store_name=store_name, states=req_states)
 
         try:
-            _, call = self._stub.SaveState.with_call(req, metadata=metadata)
+            _, call = self._stub.SaveState.with_call(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                for state in states:
+                    self._state_cache.invalidate(store_name, state.key, state.metadata)
 
     def execute_state_transaction(
         self,
@@ -782,6 +1286,8 @@ class DaprGrpcClient:
         operations: Sequence[TransactionalStateOperation],
         transactional_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
+        compression: Optional[CompressionType] = None,
     ) -> DaprResponse:
         """Saves or deletes key-value pairs to a statestore as a transaction
 
@@ -809,6 +1315,10 @@ class DaprGrpcClient:
             operations (Sequence[TransactionalStateOperation]): the transaction operations
             transactional_metadata (Dict[str, str], optional): Dapr metadata for transaction
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+            compression (grpc.Compression or str, optional): the compression of the
+                request, e.g. 'gzip', the channel's compression if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -840,10 +1350,19 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.ExecuteStateTransaction.with_call(req, metadata=metadata)
+            _, call = self._stub.ExecuteStateTransaction.with_call(
+                req,
+                metadata=metadata,
+                timeout=self._call_options.deadline(timeout),
+                compression=to_compression(compression),
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                for o in operations:
+                    self._state_cache.invalidate(store_name, o.key, transactional_metadata)
 
     def delete_state(
         self,
@@ -853,6 +1372,7 @@ class DaprGrpcClient:
         options: Optional[StateOptions] = None,
         state_metadata: Optional[Dict[str, str]] = dict(),
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> DaprResponse:
         """Deletes key-value pairs from a statestore
 
@@ -878,6 +1398,8 @@ class DaprGrpcClient:
                 for concurrency and consistency
             state_metadata (Dict[str, str], optional): Dapr metadata for state request
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -908,10 +1430,103 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.DeleteState.with_call(req, metadata=metadata)
+            _, call = self._stub.DeleteState.with_call(
+                req, metadata=metadata, timeout=self._call_options.deadline(timeout)
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprGrpcError(err) from err
+        finally:
+            if self._state_cache is not None:
+                self._state_cache.invalidate(store_name, key)
+
+    def delete_bulk_state(
+        self,
+        store_name: str,
+        keys: Sequence[str],
+        etags: Optional[Dict[str, str]] = None,
+        options: Optional[StateOptions] = None,
+        states_metadata: Optional[Dict[str, str]] = dict(),
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+    ) -> DeleteBulkStateResponse:
+        """Deletes keys from a statestore
+
+        The keys are split into DeleteBulkState requests that fit in the maximum gRPC
+        message length, and up to max_concurrency requests run at the same time. A failed
+        request does not stop the others: the keys it held are returned in the response
+        together with its error.
+
+        The example deletes states from a statestore:
+            from dapr.clients import DaprClient
+            with DaprClient() as d:
+                resp = d.delete_bulk_state(
+                    store_name='state_store',
+                    keys=['key1', 'key2'],
+                    etags={'key2': 'etag'},
+                )
+                # resp.failed_keys maps the keys that were not deleted to their errors.
+
+        Args:
+            store_name (str): the state store name to delete from
+            keys (Sequence[str]): the keys to delete
+            etags (Dict[str, str], optional): the etags to delete keys with, by key
+            options (StateOptions, optional): custom options
+                for concurrency and consistency
+            states_metadata (Dict[str, str], optional): Dapr metadata for state request
+            max_concurrency (int): the maximum number of requests in flight
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+
+        Returns:
+            :class:`DeleteBulkStateResponse` the keys that could not be deleted
+
+        Raises:
+            ValueError: store_name is empty
+            ValueError: max_concurrency is not positive
+        """
+        if not store_name or len(store_name) == 0 or len(store_name.strip()) == 0:
+            raise ValueError('State store name cannot be empty')
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive number')
+
+        state_options = None if options is None else options.get_proto()
+        states = [
+            common_v1.StateItem(
+                key=key,
+                etag=common_v1.Etag(value=etags[key]) if etags and key in etags else None,
+                options=state_options,
+                metadata=states_metadata,
+            )
+            for key in keys
+        ]
+        chunks = chunk_by_size(
+            states,
+            [state.ByteSize() for state in states],
+            self._max_grpc_message_length or DEFAULT_MAX_MESSAGE_LENGTH,
+        )
+        failed_keys: Dict[str, str] = {}
+
+        def delete_chunk(chunk: List[common_v1.StateItem]) -> None:
+            req = api_v1.DeleteBulkStateRequest(store_name=store_name, states=chunk)
+            try:
+                self._stub.DeleteBulkState(req, timeout=self._call_options.deadline(timeout))
+            except RpcError as err:
+                for state in chunk:
+                    failed_keys[state.key] = err.details()
+
+        try:
+            if len(chunks) < 2:
+                for chunk in chunks:
+                    delete_chunk(chunk)
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as pool:
+                    list(pool.map(delete_chunk, chunks))
+        finally:
+            if self._state_cache is not None:
+                for key in keys:
+                    self._state_cache.invalidate(store_name, key)
+        return DeleteBulkStateResponse(failed_keys)
 
     def get_secret(
         self,
@@ -919,6 +1534,7 @@ class DaprGrpcClient:
         key: str,
         secret_metadata: Optional[Dict[str, str]] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> GetSecretResponse:
         """Get secret with a given key.
 
@@ -946,6 +1562,8 @@ class DaprGrpcClient:
             key (str): str for key
             secret_metadata (Dict[str, str], Optional): Dapr metadata for secrets request
             metadata (MetadataTuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetSecretResponse` object with the secret and metadata returned from callee
@@ -960,7 +1578,7 @@ class DaprGrpcClient:
 
         req = api_v1.GetSecretRequest(store_name=store_name, key=key, metadata=secret_metadata)
 
-        response, call = self._stub.GetSecret.with_call(req, metadata=metadata)
+        response, call = self._read_with_call('GetSecret', req, metadata, timeout)
 
         return GetSecretResponse(secret=response.data, headers=call.initial_metadata())
 
@@ -969,6 +1587,7 @@ class DaprGrpcClient:
         store_name: str,
         secret_metadata: Optional[Dict[str, str]] = {},
         metadata: Optional[MetadataTuple] = None,
+        timeout: Optional[float] = None,
     ) -> GetBulkSecretResponse:
         """Get all granted secrets.
 
@@ -993,6 +1612,8 @@ class DaprGrpcClient:
             store_name (str): store name to get secret from
             secret_metadata (Dict[str, Dict[str, str]], Optional): Dapr metadata of secrets request
             metadata (MetadataTuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetBulkSecretResponse` object with secrets and metadata returned from callee
@@ -1007,7 +1628,9 @@ class DaprGrpcClient:
 
         req = api_v1.GetBulkSecretRequest(store_name=store_name, metadata=secret_metadata)
 
-        response, call = self._stub.GetBulkSecret.with_call(req, metadata=metadata)
+        response, call = self._stub.GetBulkSecret.with_call(
+            req, metadata=metadata, timeout=self._call_options.deadline(timeout)
+        )
 
         secrets_map = {}
         for key in response.data.keys():
@@ -1020,7 +1643,11 @@ class DaprGrpcClient:
         return GetBulkSecretResponse(secrets=secrets_map, headers=call.initial_metadata())
 
     def get_configuration(
-        self, store_name: str, keys: List[str], config_metadata: Optional[Dict[str, str]] = dict()
+        self,
+        store_name: str,
+        keys: List[str],
+        config_metadata: Optional[Dict[str, str]] = dict(),
+        timeout: Optional[float] = None,
     ) -> ConfigurationResponse:
         """Gets value from a config store with a key
 
@@ -1037,6 +1664,8 @@ class DaprGrpcClient:
             store_name (str): the state store name to get from
             keys (List[str]): the keys of the key-value pairs to be gotten
             config_metadata (Dict[str, str], optional): Dapr metadata for configuration
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`ConfigurationResponse` gRPC metadata returned from callee
@@ -1047,7 +1676,7 @@ class DaprGrpcClient:
         req = api_v1.GetConfigurationRequest(
             store_name=store_name, keys=keys, metadata=config_metadata
         )
-        response, call = self._stub.GetConfiguration.with_call(req)
+        response, call = self._read_with_call('GetConfiguration', req, timeout=timeout)
         return ConfigurationResponse(items=response.items, headers=call.initial_metadata())
 
     def subscribe_configuration(
@@ -1088,22 +1717,33 @@ class DaprGrpcClient:
         )
         return id
 
-    def unsubscribe_configuration(self, store_name: str, id: str) -> bool:
+    def unsubscribe_configuration(
+        self, store_name: str, id: str, timeout: Optional[float] = None
+    ) -> bool:
         """Unsubscribes from configuration changes.
 
         Args:
             store_name (str): the state store name to unsubscribe from
             id (str): the subscription id to unsubscribe
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             bool: True if unsubscribed successfully, False otherwise
         """
         req = api_v1.UnsubscribeConfigurationRequest(store_name=store_name, id=id)
-        response: UnsubscribeConfigurationResponse = self._stub.UnsubscribeConfiguration(req)
+        response: UnsubscribeConfigurationResponse = self._stub.UnsubscribeConfiguration(
+            req, timeout=self._call_options.deadline(timeout)
+        )
         return response.ok
 
     def try_lock(
-        self, store_name: str, resource_id: str, lock_owner: str, expiry_in_seconds: int
+        self,
+        store_name: str,
+        resource_id: str,
+        lock_owner: str,
+        expiry_in_seconds: int,
+        timeout: Optional[float] = None,
     ) -> TryLockResponse:
         """Tries to get a lock with an expiry.
 
@@ -1133,6 +1773,8 @@ class DaprGrpcClient:
             lock_owner (str):  indicates the identifier of lock owner.
             expiry_in_seconds (int): The length of time (in seconds) for which this lock
                 will be held and after which it expires.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`TryLockResponse`: With the result of the try-lock operation.
@@ -1155,7 +1797,9 @@ class DaprGrpcClient:
             lock_owner=lock_owner,
             expiry_in_seconds=expiry_in_seconds,
         )
-        response, call = self._stub.TryLockAlpha1.with_call(req)
+        response, call = self._stub.TryLockAlpha1.with_call(
+            req, timeout=self._call_options.deadline(timeout)
+        )
         return TryLockResponse(
             success=response.success,
             client=self,
@@ -1165,7 +1809,9 @@ class DaprGrpcClient:
             headers=call.initial_metadata(),
         )
 
-    def unlock(self, store_name: str, resource_id: str, lock_owner: str) -> UnlockResponse:
+    def unlock(
+        self, store_name: str, resource_id: str, lock_owner: str, timeout: Optional[float] = None
+    ) -> UnlockResponse:
         """Unlocks a lock.
 
         Args:
@@ -1174,6 +1820,8 @@ class DaprGrpcClient:
                                 It stands for "which resource I want to protect".
             lock_owner (str):  indicates the identifier of lock owner.
             metadata (tuple, optional, DEPRECATED): gRPC custom metadata
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`UnlockResponseStatus`: Status of the request,
@@ -1193,7 +1841,9 @@ class DaprGrpcClient:
         req = api_v1.UnlockRequest(
             store_name=store_name, resource_id=resource_id, lock_owner=lock_owner
         )
-        response, call = self._stub.UnlockAlpha1.with_call(req)
+        response, call = self._stub.UnlockAlpha1.with_call(
+            req, timeout=self._call_options.deadline(timeout)
+        )
 
         return UnlockResponse(
             status=UnlockResponseStatus(response.status), headers=call.initial_metadata()
@@ -1207,6 +1857,7 @@ class DaprGrpcClient:
         instance_id: Optional[str] = None,
         workflow_options: Optional[Dict[str, str]] = dict(),
         send_raw_bytes: bool = False,
+        timeout: Optional[float] = None,
     ) -> StartWorkflowResponse:
         """Starts a workflow.
 
@@ -1224,6 +1875,8 @@ class DaprGrpcClient:
                                 that the workflow will receive.
             send_raw_bytes (bool) if true, no serialization will be performed on the input
                                 bytes
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`StartWorkflowResponse`: Instance ID associated with the started workflow
@@ -1259,12 +1912,16 @@ class DaprGrpcClient:
         )
 
         try:
-            response = self._stub.StartWorkflowBeta1(req)
+            response = self._stub.StartWorkflowBeta1(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return StartWorkflowResponse(instance_id=response.instance_id)
         except RpcError as err:
             raise DaprInternalError(err.details())
 
-    def get_workflow(self, instance_id: str, workflow_component: str) -> GetWorkflowResponse:
+    def get_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> GetWorkflowResponse:
         """Gets information on a workflow.
 
         Args:
@@ -1272,6 +1929,8 @@ class DaprGrpcClient:
                                 e.g. `order_processing_workflow-103784`.
             workflow_component (str): the name of the workflow component
                                 that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`GetWorkflowResponse`: Instance ID associated with the started workflow
@@ -1289,7 +1948,7 @@ class DaprGrpcClient:
         )
 
         try:
-            resp = self._stub.GetWorkflowBeta1(req)
+            resp = self._stub.GetWorkflowBeta1(req, timeout=self._call_options.deadline(timeout))
             if resp.created_at is None:
                 resp.created_at = datetime.now()
             if resp.last_updated_at is None:
@@ -1305,7 +1964,9 @@ class DaprGrpcClient:
         except RpcError as err:
             raise DaprInternalError(err.details())
 
-    def terminate_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    def terminate_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Terminates a workflow.
 
             Args:
@@ -1313,6 +1974,8 @@ class DaprGrpcClient:
                                     `order_processing_workflow-103784`.
                 workflow_component (str): the name of the workflow component
                                     that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1331,7 +1994,9 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.TerminateWorkflowBeta1.with_call(req)
+            _, call = self._stub.TerminateWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprInternalError(err.details())
@@ -1343,6 +2008,7 @@ class DaprGrpcClient:
         event_name: str,
         event_data: Optional[Union[Any, bytes]] = None,
         send_raw_bytes: bool = False,
+        timeout: Optional[float] = None,
     ) -> DaprResponse:
         """Raises an event on a workflow.
 
@@ -1358,6 +2024,8 @@ class DaprGrpcClient:
             event_data (Optional[Union[Any, bytes]]): the input to the event.
             send_raw_bytes (bool) if true, no serialization will be performed on the input
                                 bytes
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1402,12 +2070,16 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.RaiseEventWorkflowBeta1.with_call(req)
+            _, call = self._stub.RaiseEventWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprInternalError(err.details())
 
-    def pause_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    def pause_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Pause a workflow.
 
             Args:
@@ -1415,6 +2087,8 @@ class DaprGrpcClient:
                                     e.g. `order_processing_workflow-103784`.
                 workflow_component (str): the name of the workflow component
                                     that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1433,13 +2107,17 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.PauseWorkflowBeta1.with_call(req)
+            _, call = self._stub.PauseWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprInternalError(err.details())
 
-    def resume_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    def resume_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Resumes a workflow.
 
         Args:
@@ -1447,6 +2125,8 @@ class DaprGrpcClient:
                                 e.g. `order_processing_workflow-103784`.
             workflow_component (str): the name of the workflow component
                                 that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1464,13 +2144,17 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.ResumeWorkflowBeta1.with_call(req)
+            _, call = self._stub.ResumeWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
         except RpcError as err:
             raise DaprInternalError(err.details())
 
-    def purge_workflow(self, instance_id: str, workflow_component: str) -> DaprResponse:
+    def purge_workflow(
+        self, instance_id: str, workflow_component: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Purges a workflow.
 
             Args:
@@ -1478,6 +2162,8 @@ class DaprGrpcClient:
                                     e.g. `order_processing_workflow-103784`.
                 workflow_component (str): the name of the workflow component
                                     that will run the workflow. e.g. `dapr`.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
 
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
@@ -1495,7 +2181,9 @@ class DaprGrpcClient:
         )
 
         try:
-            _, call = self._stub.PurgeWorkflowBeta1.with_call(req)
+            _, call = self._stub.PurgeWorkflowBeta1.with_call(
+                req, timeout=self._call_options.deadline(timeout)
+            )
 
             return DaprResponse(headers=call.initial_metadata())
 
@@ -1524,21 +2212,10 @@ class DaprGrpcClient:
             DeprecationWarning,
             stacklevel=2,
         )
-        start = time.time()
-        while True:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout_s)
-                try:
-                    s.connect((self._uri.hostname, self._uri.port_as_int))
-                    return
-                except Exception as e:
-                    remaining = (start + timeout_s) - time.time()
-                    if remaining < 0:
-                        raise e
-                    time.sleep(min(1, remaining))
+        wait_for_socket(self._uri.hostname, self._uri.port_as_int, timeout_s)
 
     # ---
-    def get_metadata(self) -> GetMetadataResponse:
+    def get_metadata(self, timeout: Optional[float] = None) -> GetMetadataResponse:
         """Returns information about the sidecar allowing for runtime
         discoverability.
 
@@ -1549,9 +2226,15 @@ class DaprGrpcClient:
         Each loaded component provides its name, type and version and also
         information about supported features in the form of component
         capabilities.
+
+        Args:
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
         """
         try:
-            _resp, call = self._stub.GetMetadata.with_call(GrpcEmpty())
+            _resp, call = self._stub.GetMetadata.with_call(
+                GrpcEmpty(), timeout=self._call_options.deadline(timeout)
+            )
         except RpcError as err:
             raise DaprGrpcError(err) from err
 
@@ -1576,7 +2259,9 @@ class DaprGrpcClient:
             headers=call.initial_metadata(),
         )
 
-    def set_metadata(self, attributeName: str, attributeValue: str) -> DaprResponse:
+    def set_metadata(
+        self, attributeName: str, attributeValue: str, timeout: Optional[float] = None
+    ) -> DaprResponse:
         """Adds a custom (extended) metadata attribute to the Dapr sidecar
         information stored by the Metadata endpoint.
 
@@ -1590,6 +2275,8 @@ class DaprGrpcClient:
             attributeName (str): Custom attribute name. This is they key name
                                  in the key-value pair.
             attributeValue (str): Custom attribute value we want to store.
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
         """
         # input validation
         validateNotBlankString(attributeName=attributeName)
@@ -1597,11 +2284,13 @@ class DaprGrpcClient:
         validateNotNone(attributeValue=attributeValue)
         # Actual invocation
         req = api_v1.SetMetadataRequest(key=attributeName, value=attributeValue)
-        _, call = self._stub.SetMetadata.with_call(req)
+        _, call = self._stub.SetMetadata.with_call(
+            req, timeout=self._call_options.deadline(timeout)
+        )
 
         return DaprResponse(call.initial_metadata())
 
-    def shutdown(self) -> DaprResponse:
+    def shutdown(self, timeout: Optional[float] = None) -> DaprResponse:
         """Shutdown the sidecar.
 
         This will ask the sidecar to gracefully shutdown.
@@ -1613,10 +2302,16 @@ class DaprGrpcClient:
             with DaprClient() as d:
                 resp = d.shutdown()
 
+        Args:
+            timeout (float, optional): the deadline of the call in seconds, the
+                client's default if not set
+
         Returns:
             :class:`DaprResponse` gRPC metadata returned from callee
         """
 
-        _, call = self._stub.Shutdown.with_call(GrpcEmpty())
+        _, call = self._stub.Shutdown.with_call(
+            GrpcEmpty(), timeout=self._call_options.deadline(timeout)
+        )
 
         return DaprResponse(call.initial_metadata())
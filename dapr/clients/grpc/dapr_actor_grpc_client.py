@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2023 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+from typing import Any, Optional
+
+import grpc  # type: ignore
+from grpc import RpcError  # type: ignore
+
+from dapr.clients.base import DaprActorClientBase
+from dapr.clients.exceptions import DaprInternalError, DaprGrpcError
+from dapr.clients.grpc._actor import (
+    build_invoke_actor_request,
+    build_register_reminder_request,
+    build_register_timer_request,
+    build_state_transaction_request,
+)
+from dapr.clients.grpc._helpers import DaprClientInterceptor
+from dapr.clients.health import DaprHealth
+from dapr.conf import settings
+from dapr.conf.helpers import GrpcEndpoint
+from dapr.proto import api_service_v1, api_v1
+from dapr.version import __version__
+
+
+class DaprActorGrpcClient(DaprActorClientBase):
+    """A Dapr Actor gRPC client implementing :class:`DaprActorClientBase`.
+
+    All calls are multiplexed over a single synchronous gRPC channel. The calls are
+    started with the non-blocking future API, so the client can be shared by any
+    number of event loops and threads.
+    """
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        timeout: int = 60,
+        max_grpc_message_length: Optional[int] = None,
+    ):
+        """Connects to the Dapr runtime gRPC endpoint.
+
+        Args:
+            address (str, optional): Dapr Runtime gRPC endpoint address.
+            timeout (int, optional): Timeout in seconds, defaults to 60.
+            max_grpc_message_length (int, optional): The maximum grpc send and receive
+                message length in bytes.
+        """
+        DaprHealth.wait_until_ready()
+
+        self._timeout = timeout
+        useragent = f'dapr-sdk-python/{__version__}'
+        options = [('grpc.primary_user_agent', useragent)]
+        if max_grpc_message_length:
+            options += [
+                ('grpc.max_send_message_length', max_grpc_message_length),
+                ('grpc.max_receive_message_length', max_grpc_message_length),
+            ]
+
+        if not address:
+            address = settings.DAPR_GRPC_ENDPOINT or (
+                f'{settings.DAPR_RUNTIME_HOST}:' f'{settings.DAPR_GRPC_PORT}'
+            )
+
+        try:
+            self._uri = GrpcEndpoint(address)
+        except ValueError as error:
+            raise DaprInternalError(f'{error}') from error
+
+        if self._uri.tls:
+            self._channel = grpc.secure_channel(  # type: ignore
+                self._uri.endpoint,
+                self.get_credentials(),
+                options=options,
+            )
+        else:
+            self._channel = grpc.insecure_channel(  # type: ignore
+                self._uri.endpoint,
+                options=options,
+            )
+
+        if settings.DAPR_API_TOKEN:
+            api_token_interceptor = DaprClientInterceptor(
+                [
+                    ('dapr-api-token', settings.DAPR_API_TOKEN),
+                ]
+            )
+            self._channel = grpc.intercept_channel(  # type: ignore
+                self._channel, api_token_interceptor
+            )
+
+        self._stub = api_service_v1.DaprStub(self._channel)
+
+    def get_credentials(self):
+        # This method is used (overwritten) from tests
+        # to return credentials for self-signed certificates
+        return grpc.ssl_channel_credentials()  # type: ignore
+
+    async def close(self) -> None:
+        """Closes Dapr runtime gRPC channel."""
+        if hasattr(self, '_channel') and self._channel:
+            self._channel.close()
+
+    async def __aenter__(self) -> 'DaprActorGrpcClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def invoke_method(
+        self, actor_type: str, actor_id: str, method: str, data: Optional[bytes] = None
+    ) -> bytes:
+        """Invoke method defined in :class:`Actor` remotely.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            method (str): Method name defined in :class:`Actor`.
+            bytes data (bytes): data which will be passed to the target actor.
+
+        Returns:
+            bytes: the response from the actor.
+        """
+        req = build_invoke_actor_request(actor_type, actor_id, method, data)
+        response = await self._call(self._stub.InvokeActor, req)
+        return response.data
+
+    async def save_state_transactionally(self, actor_type: str, actor_id: str, data: bytes) -> None:
+        """Save state transactionally.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            data (bytes): Json-serialized the transactional state operations.
+        """
+        req = build_state_transaction_request(actor_type, actor_id, data)
+        await self._call(self._stub.ExecuteActorStateTransaction, req)
+
+    async def get_state(self, actor_type: str, actor_id: str, name: str) -> bytes:
+        """Get state value for name key.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of state.
+
+        Returns:
+            bytes: the value of the state.
+        """
+        req = api_v1.GetActorStateRequest(actor_type=actor_type, actor_id=actor_id, key=name)
+        response = await self._call(self._stub.GetActorState, req)
+        return response.data
+
+    async def register_reminder(
+        self, actor_type: str, actor_id: str, name: str, data: bytes
+    ) -> None:
+        """Register actor reminder.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of reminder
+            data (bytes): Reminder request json body.
+        """
+        req = build_register_reminder_request(actor_type, actor_id, name, data)
+        await self._call(self._stub.RegisterActorReminder, req)
+
+    async def unregister_reminder(self, actor_type: str, actor_id: str, name: str) -> None:
+        """Unregister actor reminder.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str):  the name of reminder.
+        """
+        req = api_v1.UnregisterActorReminderRequest(
+            actor_type=actor_type, actor_id=actor_id, name=name
+        )
+        await self._call(self._stub.UnregisterActorReminder, req)
+
+    async def register_timer(self, actor_type: str, actor_id: str, name: str, data: bytes) -> None:
+        """Register actor timer.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of reminder.
+            data (bytes): Timer request json body.
+        """
+        req = build_register_timer_request(actor_type, actor_id, name, data)
+        await self._call(self._stub.RegisterActorTimer, req)
+
+    async def unregister_timer(self, actor_type: str, actor_id: str, name: str) -> None:
+        """Unregister actor timer.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of timer
+        """
+        req = api_v1.UnregisterActorTimerRequest(
+            actor_type=actor_type, actor_id=actor_id, name=name
+        )
+        await self._call(self._stub.UnregisterActorTimer, req)
+
+    async def _call(self, method: Any, request: Any) -> Any:
+        """Starts a unary call without blocking and awaits its completion on the running loop."""
+        loop = asyncio.get_running_loop()
+        result: asyncio.Future = loop.create_future()
+        call = method.future(request, timeout=self._timeout)
+
+        def _set_result(call_future) -> None:
+            if result.done():
+                return
+            try:
+                result.set_result(call_future.result())
+            except RpcError as err:
+                error = DaprGrpcError(err)
+                error.__cause__ = err
+                result.set_exception(error)
+            except Exception as err:  # cancelled or failed before reaching the server
+                result.set_exception(err)
+
+        def _on_done(call_future) -> None:
+            try:
+                loop.call_soon_threadsafe(_set_result, call_future)
+            except RuntimeError:
+                # The awaiting loop has been closed in the meantime.
+                pass
+
+        call.add_done_callback(_on_done)
+        try:
+            return await result
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
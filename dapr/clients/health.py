@@ -12,43 +12,174 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import asyncio
+import logging
+import socket
+import threading
 import urllib.request
 import urllib.error
 import time
 
+from typing import Awaitable, Callable, Dict, Iterator, List, Set
+
 from dapr.clients.http.conf import DAPR_API_TOKEN_HEADER, USER_AGENT_HEADER, DAPR_USER_AGENT
 from dapr.clients.http.helpers import get_api_url
 from dapr.conf import settings
 
+logger = logging.getLogger(__name__)
+
+# delays between two checks, doubled after every failed check
+INITIAL_BACKOFF_SECONDS = 0.05
+MAX_BACKOFF_SECONDS = 1.0
+
+
+def backoff_delays() -> Iterator[float]:
+    """Yields exponentially growing delays, capped at MAX_BACKOFF_SECONDS."""
+    delay = INITIAL_BACKOFF_SECONDS
+    while True:
+        yield delay
+        delay = min(delay * 2, MAX_BACKOFF_SECONDS)
+
+
+def poll(check: Callable[[], bool], timeout: float) -> bool:
+    """Calls check with exponential backoff until it succeeds or timeout seconds pass.
+
+    Returns:
+        Whether the check succeeded.
+    """
+    deadline = time.monotonic() + timeout
+    for delay in backoff_delays():
+        if check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+    return False  # pragma: no cover
+
+
+async def poll_async(check: Callable[[], Awaitable[bool]], timeout: float) -> bool:
+    """Like :func:`poll`, but awaits the check and sleeps without blocking the event loop."""
+    deadline = time.monotonic() + timeout
+    for delay in backoff_delays():
+        if await check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+    return False  # pragma: no cover
+
+
+def wait_for_socket(host: str, port: int, timeout: float) -> None:
+    """Waits until a TCP connection to host and port succeeds.
+
+    Raises:
+        OSError: the last connection error, once timeout seconds passed.
+    """
+    errors: List[Exception] = []
+    if not poll(lambda: _connect(host, port, timeout, errors), timeout):
+        raise errors[-1]
+
+
+async def wait_for_socket_async(host: str, port: int, timeout: float) -> None:
+    """Like :func:`wait_for_socket`, without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    errors: List[Exception] = []
+
+    def check() -> Awaitable[bool]:
+        return loop.run_in_executor(None, _connect, host, port, timeout, errors)
+
+    if not await poll_async(check, timeout):
+        raise errors[-1]
+
+
+def _connect(host: str, port: int, timeout: float, errors: List[Exception]) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        try:
+            s.connect((host, port))
+            return True
+        except Exception as e:
+            errors.append(e)
+            return False
+
 
 class DaprHealth:
+    """Checks that the Dapr sidecar is ready.
+
+    Readiness is remembered per health endpoint for the whole process, so only the
+    first client waits for the sidecar and later clients start right away.
+    """
+
+    _ready: Set[str] = set()
+    _lock = threading.Lock()
+
     @staticmethod
     def wait_until_ready():
-        health_url = f'{get_api_url()}/healthz/outbound'
-        headers = {USER_AGENT_HEADER: DAPR_USER_AGENT}
-        if settings.DAPR_API_TOKEN is not None:
-            headers[DAPR_API_TOKEN_HEADER] = settings.DAPR_API_TOKEN
-        timeout = float(settings.DAPR_HEALTH_TIMEOUT)
+        health_url, headers = DaprHealth._get_request()
+        if health_url in DaprHealth._ready:
+            return
 
-        start = time.time()
-        while True:
-            try:
-                req = urllib.request.Request(health_url, headers=headers)
-                with urllib.request.urlopen(req, context=DaprHealth.get_ssl_context()) as response:
-                    if 200 <= response.status < 300:
-                        break
-            except urllib.error.URLError as e:
-                print(f'Health check on {health_url} failed: {e.reason}')
-            except Exception as e:
-                print(f'Unexpected error during health check: {e}')
-
-            remaining = (start + timeout) - time.time()
-            if remaining <= 0:
+        # Clients created at the same time wait for one check instead of all polling.
+        with DaprHealth._lock:
+            if health_url in DaprHealth._ready:
+                return
+            timeout = float(settings.DAPR_HEALTH_TIMEOUT)
+            if not poll(lambda: DaprHealth._check(health_url, headers), timeout):
                 raise TimeoutError(f'Dapr health check timed out, after {timeout}.')
-            time.sleep(min(1, remaining))
+            DaprHealth._ready.add(health_url)
+
+    @staticmethod
+    async def wait_until_ready_async():
+        """Waits for the sidecar like :meth:`wait_until_ready`, without blocking the event
+        loop."""
+        health_url, headers = DaprHealth._get_request()
+        if health_url in DaprHealth._ready:
+            return
+
+        loop = asyncio.get_running_loop()
+        timeout = float(settings.DAPR_HEALTH_TIMEOUT)
+
+        def check() -> Awaitable[bool]:
+            return loop.run_in_executor(None, DaprHealth._check, health_url, headers)
+
+        if not await poll_async(check, timeout):
+            raise TimeoutError(f'Dapr health check timed out, after {timeout}.')
+        DaprHealth._ready.add(health_url)
+
+    @staticmethod
+    def is_ready() -> bool:
+        """Returns whether the sidecar of the configured endpoint was found ready."""
+        return f'{get_api_url()}/healthz/outbound' in DaprHealth._ready
+
+    @staticmethod
+    def reset():
+        """Forgets which sidecars were found ready, so the next client checks again."""
+        DaprHealth._ready.clear()
 
     @staticmethod
     def get_ssl_context():
         # This method is used (overwritten) from tests
         # to return context for self-signed certificates
         return None
+
+    @staticmethod
+    def _get_request():
+        health_url = f'{get_api_url()}/healthz/outbound'
+        headers: Dict[str, str] = {USER_AGENT_HEADER: DAPR_USER_AGENT}
+        if settings.DAPR_API_TOKEN is not None:
+            headers[DAPR_API_TOKEN_HEADER] = settings.DAPR_API_TOKEN
+        return health_url, headers
+
+    @staticmethod
+    def _check(health_url: str, headers: Dict[str, str]) -> bool:
+        try:
+            req = urllib.request.Request(health_url, headers=headers)
+            with urllib.request.urlopen(req, context=DaprHealth.get_ssl_context()) as response:
+                return 200 <= response.status < 300
+        except urllib.error.URLError as e:
+            logger.debug('Health check on %s failed: %s', health_url, e.reason)
+        except Exception as e:
+            logger.warning('Unexpected error during health check: %s', e)
+        return False
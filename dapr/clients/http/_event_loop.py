@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import os
+import threading
+
+from typing import Awaitable, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class BackgroundEventLoop:
+    """An event loop running in a daemon thread, used to run coroutines from sync code.
+
+    The loop and its thread are started on first use and live until :meth:`stop` is called,
+    so state bound to the loop (such as pooled HTTP connections) is reused across calls.
+    Any number of threads may submit coroutines concurrently.
+    """
+
+    def __init__(self, name: str = 'dapr-event-loop'):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def run(self, coro: Coroutine[None, None, T]) -> T:
+        """Runs the coroutine on the background loop and blocks until it completes.
+
+        Args:
+            coro (Coroutine): the coroutine to run.
+
+        Returns:
+            the result of the coroutine.
+
+        Raises:
+            RuntimeError: when called from the background loop thread itself.
+        """
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('cannot block on the background event loop from its own thread')
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def stop(self, cleanup: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        """Stops the loop and joins its thread.
+
+        Args:
+            cleanup (Callable, optional): coroutine function awaited on the loop before it
+                stops, used to release resources bound to the loop.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        if cleanup is not None and threading.current_thread() is not thread:
+            asyncio.run_coroutine_threadsafe(cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if threading.current_thread() is not thread:
+            thread.join()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked child inherits the loop object but not its thread.
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_forever, args=(self._loop,), name=self._name, daemon=True
+                )
+                self._pid = os.getpid()
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
@@ -13,6 +13,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import socket
+
 import aiohttp
 
 from typing import Callable, Mapping, Dict, Optional, Union, Tuple, TYPE_CHECKING
@@ -34,13 +37,23 @@ from dapr.clients.exceptions import DaprInternalError, ERROR_CODE_DOES_NOT_EXIST
 
 
 class DaprHttpClient:
-    """A Dapr Http API client"""
+    """A Dapr Http API client
+
+    The client keeps one pooled :class:`aiohttp.ClientSession` per event loop and reuses it
+    for every request, so connections to the sidecar are kept alive across calls. Call
+    :meth:`close` (or use the client as an async context manager) to release the pooled
+    connections.
+    """
 
     def __init__(
         self,
         message_serializer: 'Serializer',
         timeout: Optional[int] = 60,
         headers_callback: Optional[Callable[[], Dict[str, str]]] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
     ):
         """Invokes Dapr over HTTP.
 
@@ -48,6 +61,15 @@ class DaprHttpClient:
             message_serializer (Serializer): Dapr serializer.
             timeout (int, optional): Timeout in seconds, defaults to 60.
             headers_callback (lambda: Dict[str, str]], optional): Generates header for each request.
+            max_connections (int, optional): Maximum number of pooled connections, defaults
+                to settings.DAPR_HTTP_MAX_CONNECTIONS. 0 means no limit.
+            max_connections_per_host (int, optional): Maximum number of pooled connections to
+                the same endpoint, defaults to settings.DAPR_HTTP_MAX_CONNECTIONS_PER_HOST.
+                0 means no limit.
+            keepalive_timeout (float, optional): Seconds an idle connection is kept alive,
+                defaults to settings.DAPR_HTTP_KEEPALIVE_TIMEOUT.
+            dns_cache_ttl (int, optional): Seconds resolved addresses are cached, defaults to
+                settings.DAPR_HTTP_DNS_CACHE_TTL.
         """
         DaprHealth.wait_until_ready()
 
@@ -55,6 +77,103 @@ class DaprHttpClient:
         self._serializer = message_serializer
         self._headers_callback = headers_callback
 
+        self._max_connections = int(
+            settings.DAPR_HTTP_MAX_CONNECTIONS if max_connections is None else max_connections
+        )
+        self._max_connections_per_host = int(
+            settings.DAPR_HTTP_MAX_CONNECTIONS_PER_HOST
+            if max_connections_per_host is None
+            else max_connections_per_host
+        )
+        self._keepalive_timeout = float(
+            settings.DAPR_HTTP_KEEPALIVE_TIMEOUT if keepalive_timeout is None else keepalive_timeout
+        )
+        self._dns_cache_ttl = int(
+            settings.DAPR_HTTP_DNS_CACHE_TTL if dns_cache_ttl is None else dns_cache_ttl
+        )
+
+        # aiohttp sessions are bound to the loop they were created on.
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    async def __aenter__(self) -> 'DaprHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the pooled sessions of every event loop this client was used on."""
+        running_loop = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop is running_loop:
+                await self._close_session(session)
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                self._release_session(session)
+
+    async def _close_running_loop_session(self) -> None:
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await self._close_session(session)
+
+    @staticmethod
+    async def _close_session(session: aiohttp.ClientSession) -> None:
+        await session.close()
+        # Give the transports one loop iteration to finish closing their sockets.
+        await asyncio.sleep(0)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        self._release_stale_sessions()
+
+        session = self._sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+
+        connector = aiohttp.TCPConnector(
+            limit=self._max_connections,
+            limit_per_host=self._max_connections_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=self._dns_cache_ttl,
+        )
+        session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        self._sessions[loop] = session
+        return session
+
+    def _release_stale_sessions(self) -> None:
+        # A session keeps a reference to its loop, so entries of closed loops are dropped
+        # here rather than relying on garbage collection of the loop.
+        for loop in [lp for lp in self._sessions if lp.is_closed()]:
+            self._release_session(self._sessions.pop(loop))
+
+    @staticmethod
+    def _release_session(session: aiohttp.ClientSession) -> None:
+        """Releases a session whose event loop cannot be used to await its close."""
+        connector = session.connector
+        if connector is not None:
+            sockets = []
+            for conns in connector._conns.values():
+                for proto, _ in conns:
+                    if proto.transport is not None:
+                        sockets.append(proto.transport.get_extra_info('socket'))
+            # Unregisters the transports from their loop while it is still open.
+            connector._close()
+            # The transports would only close their sockets on a later loop iteration,
+            # which may never come, so close them right away.
+            for sock in sockets:
+                if sock is None:
+                    continue
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                getattr(sock, '_sock', sock).close()
+        session.detach()
+
     async def send_bytes(
         self,
         method: str,
@@ -77,20 +196,19 @@ class DaprHttpClient:
 
         headers_map[USER_AGENT_HEADER] = DAPR_USER_AGENT
 
-        r = None
         client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else self._timeout
         sslcontext = self.get_ssl_context()
 
-        async with aiohttp.ClientSession(timeout=client_timeout) as session:
-            r = await session.request(
-                method=method,
-                url=url,
-                data=data,
-                headers=headers_map,
-                ssl=sslcontext,
-                params=query_params,
-            )
-
+        session = self._get_session()
+        async with session.request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers_map,
+            ssl=sslcontext,
+            params=query_params,
+            timeout=client_timeout,
+        ) as r:
             if r.status >= 200 and r.status < 300:
                 return await r.read(), r
 
@@ -34,6 +34,10 @@ class DaprActorHttpClient(DaprActorClientBase):
         message_serializer: 'Serializer',
         timeout: int = 60,
         headers_callback: Optional[Callable[[], Dict[str, str]]] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
     ):
         """Invokes Dapr Actors over HTTP.
 
@@ -41,8 +45,34 @@ class DaprActorHttpClient(DaprActorClientBase):
             message_serializer (Serializer): Dapr serializer.
             timeout (int, optional): Timeout in seconds, defaults to 60.
             headers_callback (lambda: Dict[str, str]], optional): Generates header for each request.
+            max_connections (int, optional): Maximum number of pooled connections, defaults
+                to settings.DAPR_HTTP_MAX_CONNECTIONS.
+            max_connections_per_host (int, optional): Maximum number of pooled connections to
+                the same endpoint, defaults to settings.DAPR_HTTP_MAX_CONNECTIONS_PER_HOST.
+            keepalive_timeout (float, optional): Seconds an idle connection is kept alive,
+                defaults to settings.DAPR_HTTP_KEEPALIVE_TIMEOUT.
+            dns_cache_ttl (int, optional): Seconds resolved addresses are cached, defaults to
+                settings.DAPR_HTTP_DNS_CACHE_TTL.
         """
-        self._client = DaprHttpClient(message_serializer, timeout, headers_callback)
+        self._client = DaprHttpClient(
+            message_serializer,
+            timeout,
+            headers_callback,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+        )
+
+    async def close(self) -> None:
+        """Closes the pooled HTTP connections."""
+        await self._client.close()
+
+    async def __aenter__(self) -> 'DaprActorHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     async def invoke_method(
         self, actor_type: str, actor_id: str, method: str, data: Optional[bytes] = None
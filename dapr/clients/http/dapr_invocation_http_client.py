@@ -13,11 +13,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
-
 from typing import Callable, Dict, Optional, Union
 from multidict import MultiDict
 
+from dapr.clients.http._event_loop import BackgroundEventLoop
 from dapr.clients.http.client import DaprHttpClient
 from dapr.clients.grpc._helpers import MetadataTuple, GrpcMessage
 from dapr.clients.grpc._response import InvokeMethodResponse
@@ -34,15 +33,49 @@ class DaprInvocationHttpClient:
     """Service Invocation HTTP Client"""
 
     def __init__(
-        self, timeout: int = 60, headers_callback: Optional[Callable[[], Dict[str, str]]] = None
+        self,
+        timeout: int = 60,
+        headers_callback: Optional[Callable[[], Dict[str, str]]] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
     ):
         """Invokes Dapr's API for method invocation over HTTP.
 
         Args:
             timeout (int, optional): Timeout in seconds, defaults to 60.
             headers_callback (lambda: Dict[str, str]], optional): Generates header for each request.
+            max_connections (int, optional): Maximum number of pooled connections, defaults
+                to settings.DAPR_HTTP_MAX_CONNECTIONS.
+            max_connections_per_host (int, optional): Maximum number of pooled connections to
+                the same endpoint, defaults to settings.DAPR_HTTP_MAX_CONNECTIONS_PER_HOST.
+            keepalive_timeout (float, optional): Seconds an idle connection is kept alive,
+                defaults to settings.DAPR_HTTP_KEEPALIVE_TIMEOUT.
+            dns_cache_ttl (int, optional): Seconds resolved addresses are cached, defaults to
+                settings.DAPR_HTTP_DNS_CACHE_TTL.
         """
-        self._client = DaprHttpClient(DefaultJSONSerializer(), timeout, headers_callback)
+        self._client = DaprHttpClient(
+            DefaultJSONSerializer(),
+            timeout,
+            headers_callback,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+        )
+        # Sync invocations all run on this loop so they share one pooled session.
+        self._background_loop = BackgroundEventLoop('dapr-http-invocation')
+
+    async def close(self) -> None:
+        """Closes the pooled HTTP connections."""
+        await self._client.close()
+
+    async def __aenter__(self) -> 'DaprInvocationHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     async def invoke_method_async(
         self,
@@ -132,7 +165,10 @@ class DaprInvocationHttpClient:
         http_querystring: Optional[MetadataTuple] = None,
         timeout: Optional[int] = None,
     ) -> InvokeMethodResponse:
-        """Invoke a service method over HTTP (async).
+        """Invoke a service method over HTTP.
+
+        The request runs on an event loop owned by this client, so it can be called from
+        any thread and connections are reused across calls.
 
         Args:
             app_id (str): Application Id.
@@ -148,13 +184,22 @@ class DaprInvocationHttpClient:
             InvokeMethodResponse: the response from the method invocation.
         """
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        awaitable = self.invoke_method_async(
-            app_id, method_name, data, content_type, metadata, http_verb, http_querystring, timeout
+        return self._background_loop.run(
+            self.invoke_method_async(
+                app_id,
+                method_name,
+                data,
+                content_type,
+                metadata,
+                http_verb,
+                http_querystring,
+                timeout,
+            )
         )
-        return loop.run_until_complete(awaitable)
+
+    def shutdown(self) -> None:
+        """Closes the pooled connections of :meth:`invoke_method` and stops its event loop.
+
+        The client can still be used afterwards; the loop is restarted on the next call.
+        """
+        self._background_loop.stop(cleanup=self._client._close_running_loop_session)
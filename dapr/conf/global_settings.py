@@ -28,5 +28,12 @@ DAPR_API_VERSION = 'v1.0'
 DAPR_HEALTH_TIMEOUT = 60  # seconds
 
 DAPR_API_METHOD_INVOCATION_PROTOCOL = 'http'
+DAPR_ACTOR_CLIENT_PROTOCOL = 'http'  # 'http', 'grpc' or 'grpc-aio'
 
 DAPR_HTTP_TIMEOUT_SECONDS = 60
+
+# Connection pool settings for the HTTP clients (actors and service invocation)
+DAPR_HTTP_MAX_CONNECTIONS = 100
+DAPR_HTTP_MAX_CONNECTIONS_PER_HOST = 0  # 0 means no per-host limit
+DAPR_HTTP_KEEPALIVE_TIMEOUT = 15  # seconds
+DAPR_HTTP_DNS_CACHE_TTL = 10  # seconds
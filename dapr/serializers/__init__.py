@@ -15,5 +15,6 @@ limitations under the License.
 
 from dapr.serializers.base import Serializer
 from dapr.serializers.json import DefaultJSONSerializer
+from dapr.serializers.messagepack import MessagePackSerializer
 
-__all__ = ['Serializer', 'DefaultJSONSerializer']
+__all__ = ['Serializer', 'DefaultJSONSerializer', 'MessagePackSerializer']
@@ -20,6 +20,11 @@ from typing import Any, Callable, Optional, Type
 class Serializer(ABC):
     """Serializer base class."""
 
+    # True if serialize() returns binary data rather than a JSON document. Binary
+    # state values are stored base64 encoded, and the Dapr actor API bodies (timers
+    # and reminders) keep using JSON.
+    binary: bool = False
+
     @abstractmethod
     def serialize(
         self, obj: object, custom_hook: Optional[Callable[[object], bytes]] = None
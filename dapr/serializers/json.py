@@ -18,10 +18,16 @@ import re
 import datetime
 import json
 
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type
 from dateutil import parser
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from dapr.serializers.base import Serializer
+from dapr.serializers.typed import TypeDecoder, compile_decoder
 from dapr.serializers.util import (
     convert_from_dapr_duration,
     convert_to_dapr_duration,
@@ -30,8 +36,33 @@ from dapr.serializers.util import (
 
 
 class DefaultJSONSerializer(Serializer):
-    def __init__(self, ensure_ascii: bool = True) -> None:
+    def __init__(
+        self,
+        ensure_ascii: bool = True,
+        fast_decode: bool = True,
+        decode_dapr_types: bool = True,
+        typed_decode: bool = False,
+    ) -> None:
+        """Creates the JSON serializer.
+
+        Args:
+            ensure_ascii (bool, optional): Escape non-ASCII characters when serializing.
+            fast_decode (bool, optional): Parse with orjson, if installed, or the C scanner of
+                the json module and convert the string values afterwards, instead of the
+                pure-Python :class:`DaprJSONDecoder`. Both produce the same objects.
+            decode_dapr_types (bool, optional): Convert date strings and Dapr duration strings
+                to datetime and timedelta objects when deserializing.
+            typed_decode (bool, optional): Convert the decoded document to ``data_type``
+                (dataclasses, TypedDicts, enums, datetimes, lists, ...) with a decoder
+                compiled once per type, instead of converting every string that looks like
+                a date or a duration. ``data_type`` can also be a compiled
+                :class:`TypeDecoder`.
+        """
         self.ensure_ascii = ensure_ascii
+        self.fast_decode = fast_decode
+        self.decode_dapr_types = decode_dapr_types
+        self.typed_decode = typed_decode
+        self._type_decoders: Dict[Any, TypeDecoder] = {}
 
     def serialize(
         self, obj: object, custom_hook: Optional[Callable[[object], bytes]] = None
@@ -63,10 +94,79 @@ class DefaultJSONSerializer(Serializer):
         if not isinstance(data, (str, bytes)):
             raise ValueError('data must be str or bytes types')
 
-        obj = json.loads(data, cls=DaprJSONDecoder)
+        if isinstance(data_type, TypeDecoder):
+            obj = data_type(_loads(data))
+        elif self.typed_decode and data_type not in (None, object, Any):
+            obj = self._get_type_decoder(data_type)(_loads(data))
+        elif not self.decode_dapr_types:
+            obj = _loads(data)
+        elif self.fast_decode:
+            obj = convert_dapr_types(_loads(data))
+        else:
+            obj = json.loads(data, cls=DaprJSONDecoder)
 
         return custom_hook(obj) if callable(custom_hook) else obj
 
+    def _get_type_decoder(self, data_type: Any) -> TypeDecoder:
+        try:
+            return self._type_decoders[data_type]
+        except KeyError:
+            decoder = self._type_decoders[data_type] = compile_decoder(data_type)
+            return decoder
+        except TypeError:  # unhashable type hint
+            return compile_decoder(data_type)
+
+
+def _loads(data):
+    """Parses JSON with orjson if it is available, otherwise with the C scanner of json.
+
+    Documents orjson rejects but json accepts (NaN, integers beyond 64 bits, non UTF-8
+    encodings) are parsed by json, so the result never depends on the backend.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _convert_str(s: str) -> Any:
+    # Both formats start with a digit; skip the regexes for every other string.
+    if not s or not s[0].isdigit():
+        return s
+    if DaprJSONDecoder.datetime_regex.match(s):
+        return parser.parse(s)
+    duration = DAPR_DURATION_PARSER.match(s)
+    if duration is not None and duration.lastindex is not None:
+        return convert_from_dapr_duration(s)
+    return s
+
+
+def convert_dapr_types(obj: Any) -> Any:
+    """Converts the string values of a decoded JSON document like :class:`DaprJSONDecoder`.
+
+    Date strings become datetime objects and Dapr duration strings become timedelta
+    objects. Object keys are left untouched. Dicts and lists are updated in place.
+    """
+    if isinstance(obj, str):
+        return _convert_str(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, str):
+                if value and value[0].isdigit():
+                    obj[key] = _convert_str(value)
+            elif isinstance(value, (dict, list)):
+                convert_dapr_types(value)
+    elif isinstance(obj, list):
+        for i, value in enumerate(obj):
+            if isinstance(value, str):
+                if value and value[0].isdigit():
+                    obj[i] = _convert_str(value)
+            elif isinstance(value, (dict, list)):
+                convert_dapr_types(value)
+    return obj
+
 
 class DaprJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import datetime
+import struct
+
+from typing import Any, Callable, Optional, Type
+
+from dapr.serializers.base import Serializer
+from dapr.serializers.typed import TypeDecoder
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# MessagePack extension type codes
+EXT_DATETIME = 1  # ISO 8601 string, keeps naive datetimes naive
+EXT_DATE = 2  # ISO 8601 string
+EXT_TIMEDELTA = 3  # days, seconds, microseconds as big-endian int64, int32, int32
+
+_TIMEDELTA = struct.Struct('>qii')
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, datetime.datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode('utf-8'))
+    if isinstance(obj, datetime.date):
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode('utf-8'))
+    if isinstance(obj, datetime.timedelta):
+        return msgpack.ExtType(
+            EXT_TIMEDELTA, _TIMEDELTA.pack(obj.days, obj.seconds, obj.microseconds)
+        )
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not MessagePack serializable')
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode('utf-8'))
+    if code == EXT_DATE:
+        return datetime.date.fromisoformat(data.decode('utf-8'))
+    if code == EXT_TIMEDELTA:
+        days, seconds, microseconds = _TIMEDELTA.unpack(data)
+        return datetime.timedelta(days=days, seconds=seconds, microseconds=microseconds)
+    return msgpack.ExtType(code, data)
+
+
+class MessagePackSerializer(Serializer):
+    """Serializes to MessagePack, a compact binary format.
+
+    bytes are stored natively; datetime, date and timedelta use extension types.
+    Requires the ``msgpack`` package (``pip install dapr[msgpack]``).
+
+    The serializer can be used as ``message_serializer`` and ``state_serializer`` of
+    :meth:`ActorRuntime.register_actor` and :class:`ActorProxyFactory`. Both sides of
+    an actor call must use it.
+    """
+
+    binary = True
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError(
+                'MessagePackSerializer requires the msgpack package: pip install dapr[msgpack]'
+            )
+        self._packer_options = {'default': _default, 'use_bin_type': True}
+
+    def serialize(
+        self, obj: object, custom_hook: Optional[Callable[[object], bytes]] = None
+    ) -> bytes:
+        if callable(custom_hook):
+            obj = custom_hook(obj)
+        return msgpack.packb(obj, **self._packer_options)
+
+    def deserialize(
+        self,
+        data: bytes,
+        data_type: Optional[Type] = object,
+        custom_hook: Optional[Callable[[bytes], object]] = None,
+    ) -> Any:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise ValueError('data must be bytes types')
+
+        obj = msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+        if isinstance(data_type, TypeDecoder):
+            obj = data_type(obj)
+
+        return custom_hook(obj) if callable(custom_hook) else obj
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+import dataclasses
+import datetime
+import enum
+
+from typing import Any, Callable, Dict, List, Optional, Union, get_type_hints
+
+from dateutil import parser
+from typing_extensions import Literal, get_args, get_origin, is_typeddict
+
+from dapr.serializers.util import convert_from_dapr_duration
+
+_NONE_TYPE = type(None)
+
+
+class TypeDecoder:
+    """Converts a decoded JSON document to an instance of ``data_type``.
+
+    Created by :func:`compile_decoder`. The conversion functions for the type and all of
+    its nested types are built once, so decoding only walks the document.
+    """
+
+    __slots__ = ('data_type', '_decode')
+
+    def __init__(self, data_type: Any, decode: Callable[[Any], Any]):
+        self.data_type = data_type
+        self._decode = decode
+
+    def __call__(self, obj: Any) -> Any:
+        return self._decode(obj)
+
+    def __repr__(self) -> str:
+        return f'TypeDecoder({self.data_type!r})'
+
+
+def compile_decoder(data_type: Any) -> TypeDecoder:
+    """Compiles a decoder for values of ``data_type``.
+
+    Supported types are dataclasses, TypedDicts, enums, datetime, date, timedelta (Dapr
+    duration strings), bytes (base64 strings), str, int, float, bool, and Optional, List,
+    Tuple, Set and Dict of supported types. Untyped values (``object``, ``Any`` and other
+    classes) fall back to the string conversion of :class:`DaprJSONDecoder`.
+
+    Args:
+        data_type (type): The expected type of the decoded value.
+
+    Returns:
+        :class:`TypeDecoder`: the compiled decoder.
+    """
+    if isinstance(data_type, TypeDecoder):
+        return data_type
+    return TypeDecoder(data_type, _compile(data_type))
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _untyped(obj: Any) -> Any:
+    # importing this from top scope creates a circular import
+    from dapr.serializers.json import convert_dapr_types
+
+    return convert_dapr_types(obj)
+
+
+def _to_float(obj: Any) -> Any:
+    return float(obj) if isinstance(obj, int) and not isinstance(obj, bool) else obj
+
+
+def _to_datetime(obj: Any) -> Any:
+    if not isinstance(obj, str):
+        return obj
+    try:
+        return parser.isoparse(obj)
+    except ValueError:
+        return parser.parse(obj)
+
+
+def _to_date(obj: Any) -> Any:
+    return datetime.date.fromisoformat(obj) if isinstance(obj, str) else obj
+
+
+def _to_timedelta(obj: Any) -> Any:
+    return convert_from_dapr_duration(obj) if isinstance(obj, str) else obj
+
+
+def _to_bytes(obj: Any) -> Any:
+    return base64.b64decode(obj) if isinstance(obj, str) else obj
+
+
+_SCALAR_DECODERS: Dict[Any, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    bool: _identity,
+    float: _to_float,
+    _NONE_TYPE: _identity,
+    bytes: _to_bytes,
+    datetime.datetime: _to_datetime,
+    datetime.date: _to_date,
+    datetime.timedelta: _to_timedelta,
+}
+
+
+def _compile(data_type: Any) -> Callable[[Any], Any]:
+    if data_type is None or data_type is object or data_type is Any:
+        return _untyped
+
+    scalar = _SCALAR_DECODERS.get(data_type)
+    if scalar is not None:
+        return scalar
+
+    origin = get_origin(data_type)
+    args = get_args(data_type)
+
+    if origin is Union:
+        members = [arg for arg in args if arg is not _NONE_TYPE]
+        if len(members) == 1:
+            return _compile_optional(_compile(members[0]))
+        return _untyped
+    if origin is Literal:
+        return _identity
+    if origin in (list, List) or data_type is list:
+        return _compile_list(_compile(args[0]) if args else _untyped)
+    if origin is set or data_type is set:
+        return _compile_set(_compile(args[0]) if args else _untyped)
+    if origin is tuple or data_type is tuple:
+        return _compile_tuple(args)
+    if origin is dict or data_type is dict:
+        return _compile_dict(_compile(args[1]) if len(args) == 2 else _untyped)
+
+    if isinstance(data_type, type):
+        if issubclass(data_type, enum.Enum):
+            return data_type
+        if dataclasses.is_dataclass(data_type):
+            return _compile_dataclass(data_type)
+        if is_typeddict(data_type):
+            return _compile_typeddict(data_type)
+
+    return _untyped
+
+
+def _compile_optional(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def decode_optional(obj: Any) -> Any:
+        return None if obj is None else decode(obj)
+
+    return decode_optional
+
+
+def _compile_list(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def decode_list(obj: Any) -> Any:
+        return [decode(item) for item in obj] if isinstance(obj, list) else obj
+
+    return decode_list
+
+
+def _compile_set(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def decode_set(obj: Any) -> Any:
+        return {decode(item) for item in obj} if isinstance(obj, list) else obj
+
+    return decode_set
+
+
+def _compile_tuple(args: Any) -> Callable[[Any], Any]:
+    if not args:
+        item_decoders = None
+    elif len(args) == 2 and args[1] is Ellipsis:
+        item_decoders = [_compile(args[0])]
+    else:
+        item_decoders = [_compile(arg) for arg in args]
+
+    def decode_tuple(obj: Any) -> Any:
+        if not isinstance(obj, list):
+            return obj
+        if item_decoders is None:
+            return tuple(_untyped(item) for item in obj)
+        if len(item_decoders) == 1:
+            return tuple(item_decoders[0](item) for item in obj)
+        return tuple(decode(item) for decode, item in zip(item_decoders, obj))
+
+    return decode_tuple
+
+
+def _compile_dict(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def decode_dict(obj: Any) -> Any:
+        return {key: decode(value) for key, value in obj.items()} if isinstance(obj, dict) else obj
+
+    return decode_dict
+
+
+def _compile_fields(cls: Any, names: Optional[List[str]] = None) -> Callable[[], Dict[str, Any]]:
+    # Field decoders are compiled on first use, so self-referencing types do not recurse.
+    decoders: Dict[str, Callable[[Any], Any]] = {}
+
+    def get_decoders() -> Dict[str, Callable[[Any], Any]]:
+        if not decoders:
+            hints = get_type_hints(cls)
+            for name in names if names is not None else hints:
+                decoders[name] = _compile(hints.get(name, Any))
+        return decoders
+
+    return get_decoders
+
+
+def _compile_dataclass(cls: Any) -> Callable[[Any], Any]:
+    init_fields = [field.name for field in dataclasses.fields(cls) if field.init]
+    get_decoders = _compile_fields(cls, init_fields)
+
+    def decode_dataclass(obj: Any) -> Any:
+        if not isinstance(obj, dict):
+            return obj
+        decoders = get_decoders()
+        return cls(
+            **{name: decoders[name](value) for name, value in obj.items() if name in decoders}
+        )
+
+    return decode_dataclass
+
+
+def _compile_typeddict(cls: Any) -> Callable[[Any], Any]:
+    get_decoders = _compile_fields(cls)
+
+    def decode_typeddict(obj: Any) -> Any:
+        if not isinstance(obj, dict):
+            return obj
+        decoders = get_decoders()
+        return {key: decoders.get(key, _untyped)(value) for key, value in obj.items()}
+
+    return decode_typeddict
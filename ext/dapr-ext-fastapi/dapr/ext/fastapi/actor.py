@@ -56,6 +56,7 @@ class DaprActor(object):
         self._dapr_serializer = DefaultJSONSerializer()
         self.init_routes(self._router)
         app.include_router(self._router)
+        app.router.add_event_handler('shutdown', ActorRuntime.shutdown)
 
     def init_routes(self, router: APIRouter):
         @router.get('/healthz', tags=self._router_tags)
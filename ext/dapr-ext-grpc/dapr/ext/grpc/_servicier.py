@@ -147,7 +147,7 @@ class _CallbackServicer(appcallback_service_v1.AppCallbackServicer):
             return common_v1.InvokeResponse()
 
         resp_data = InvokeMethodResponse()
-        if isinstance(resp, (bytes, str)):
+        if isinstance(resp, (bytes, bytearray, memoryview, str)):
             resp_data.set_data(resp)
             resp_data.content_type = DEFAULT_JSON_CONTENT_TYPE
         elif isinstance(resp, GrpcMessage):
@@ -166,7 +166,13 @@ class _CallbackServicer(appcallback_service_v1.AppCallbackServicer):
         if resp_data.content_type:
             content_type = resp_data.content_type
 
-        return common_v1.InvokeResponse(data=resp_data.proto, content_type=content_type)
+        response = common_v1.InvokeResponse(content_type=content_type)
+        # set the data in place, as the response would copy a GrpcAny passed to it
+        if resp_data.is_proto():
+            response.data.CopyFrom(resp_data.proto)
+        else:
+            response.data.value = resp_data.data
+        return response
 
     def ListTopicSubscriptions(self, request, context):
         """Lists all topics subscribed by this app."""
@@ -14,9 +14,11 @@ limitations under the License.
 """
 
 from __future__ import annotations
+import inspect
 from datetime import datetime
 from typing import Any, Optional, TypeVar
 
+import grpc  # type: ignore
 from durabletask import client
 
 from dapr.ext.workflow.workflow_state import WorkflowState
@@ -24,6 +26,8 @@ from dapr.ext.workflow.workflow_context import Workflow
 from dapr.ext.workflow.util import getAddress
 
 from dapr.clients import DaprInternalError
+from dapr.clients.grpc._channels import channel_registry
+from dapr.clients.grpc._helpers import DaprClientInterceptor
 from dapr.clients.http.client import DAPR_API_TOKEN_HEADER
 from dapr.conf import settings
 from dapr.conf.helpers import GrpcEndpoint
@@ -63,14 +67,37 @@ class DaprWorkflowClient:
         if settings.DAPR_API_TOKEN:
             metadata = ((DAPR_API_TOKEN_HEADER, settings.DAPR_API_TOKEN),)
         options = self._logger.get_options()
+        channel_args = {}
+        self._channel_lease = None
+        if _accepts_channel(client.TaskHubGrpcClient):
+            # Workflow clients of the same endpoint share one channel. A channel passed
+            # in is used as is, so the metadata is added by an interceptor.
+            self._channel_lease = channel_registry.acquire(
+                ('workflow', uri.endpoint, uri.tls), lambda: _create_channel(uri)
+            )
+            channel = self._channel_lease.channel
+            if metadata:
+                channel = grpc.intercept_channel(channel, DaprClientInterceptor(list(metadata)))
+            channel_args['channel'] = channel
         self.__obj = client.TaskHubGrpcClient(
             host_address=uri.endpoint,
             metadata=metadata,
             secure_channel=uri.tls,
             log_handler=options.log_handler,
             log_formatter=options.log_formatter,
+            **channel_args,
         )
 
+    def close(self):
+        """Releases the gRPC channel, closing it once no other workflow client uses it."""
+        if getattr(self, '_channel_lease', None) is not None:
+            channel = self._channel_lease.release()
+            if channel is not None:
+                channel.close()
+
+    def __del__(self):
+        self.close()
+
     def schedule_new_workflow(
         self,
         workflow: Workflow,
@@ -246,3 +273,17 @@ class DaprWorkflowClient:
             instance_id: The instance ID of the workflow to resume.
         """
         return self.__obj.resume_orchestration(instance_id)
+
+
+def _accepts_channel(client_type: Any) -> bool:
+    # older durabletask releases always create their own channel
+    try:
+        return 'channel' in inspect.signature(client_type).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _create_channel(uri: GrpcEndpoint) -> grpc.Channel:
+    if uri.tls:
+        return grpc.secure_channel(uri.endpoint, grpc.ssl_channel_credentials())
+    return grpc.insecure_channel(uri.endpoint)
@@ -13,6 +13,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import inspect
 from datetime import datetime
 from typing import Any, Union
 import unittest
@@ -21,6 +22,8 @@ from unittest import mock
 from dapr.ext.workflow.dapr_workflow_client import DaprWorkflowClient
 from durabletask import client
 
+from dapr.clients.grpc._channels import channel_registry
+
 mock_schedule_result = 'workflow001'
 mock_raise_event_result = 'event001'
 mock_terminate_result = 'terminate001'
@@ -119,3 +122,20 @@ class WorkflowClientTest(unittest.TestCase):
 
             actual_resume_result = wfClient.resume_workflow(instance_id=mockInstanceId)
             assert actual_resume_result == mock_resume_result
+
+    @unittest.skipUnless(
+        'channel' in inspect.signature(client.TaskHubGrpcClient).parameters,
+        'durabletask does not accept a channel',
+    )
+    def test_clients_share_channel(self):
+        first = DaprWorkflowClient()
+        second = DaprWorkflowClient()
+        key = first._channel_lease.key
+        self.assertIs(first._channel_lease.channel, second._channel_lease.channel)
+        self.assertEqual(2, channel_registry.refcount(key))
+
+        first.close()
+        first.close()
+        self.assertEqual(1, channel_registry.refcount(key))
+        second.close()
+        self.assertEqual(0, channel_registry.refcount(key))
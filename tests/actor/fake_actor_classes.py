@@ -15,8 +15,9 @@ limitations under the License.
 from dapr.serializers.json import DefaultJSONSerializer
 import asyncio
 
-from datetime import timedelta
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from dapr.actor.runtime.actor import Actor
 from dapr.actor.runtime.remindable import Remindable
@@ -217,3 +218,36 @@ class FakeSlowReentrantActor(Actor, FakeActorCls2Interface, ReentrantActorInterf
 
     async def action(self, data: object) -> str:
         pass
+
+
+@dataclass
+class FakeOrder:
+    order_id: str
+    created_at: datetime
+    lines: List[str]
+
+
+class FakeTypedActorInterface(ActorInterface):
+    @actormethod(name='PlaceOrder')
+    async def place_order(self, order: FakeOrder) -> str:
+        ...
+
+
+class FakeTypedActor(Actor, FakeTypedActorInterface):
+    def __init__(self, ctx, actor_id):
+        super(FakeTypedActor, self).__init__(ctx, actor_id)
+        self.orders: List[FakeOrder] = []
+
+    async def place_order(self, order: FakeOrder) -> str:
+        self.orders.append(order)
+        return order.order_id
+
+
+class FakePrefetchActor(Actor, FakeSimpleActorInterface):
+    prefetch_states = {'order': FakeOrder, 'total': int, 'missing': object}
+
+    def __init__(self, ctx, actor_id):
+        super(FakePrefetchActor, self).__init__(ctx, actor_id)
+
+    async def actor_method(self, arg: int) -> dict:
+        return {'total': await self._state_manager.get_state('total')}
@@ -24,13 +24,16 @@ from dapr.actor.runtime.context import ActorRuntimeContext
 from dapr.actor.runtime.runtime import ActorRuntime
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.conf import settings
-from dapr.serializers import DefaultJSONSerializer
+from dapr.serializers import DefaultJSONSerializer, MessagePackSerializer
+from dapr.serializers import messagepack
 
 from tests.actor.fake_actor_classes import (
     FakeSimpleActor,
     FakeSimpleReminderActor,
     FakeSimpleTimerActor,
     FakeMultiInterfacesActor,
+    FakeOrder,
+    FakePrefetchActor,
 )
 
 from tests.actor.fake_client import FakeDaprActorClient
@@ -96,6 +99,36 @@ class ActorTests(unittest.TestCase):
         config = ActorRuntime.get_actor_config()
         self.assertTrue(FakeSimpleActor.__name__ in config._entities)
 
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.get_state',
+        new=_async_mock(
+            side_effect=lambda t, i, name: {
+                'order': b'{"order_id":"1","created_at":"2024-01-01T00:00:00","lines":["a"]}',
+                'total': b'42',
+            }.get(name, b'')
+        ),
+    )
+    def test_prefetch_states_on_activate(self):
+        test_type_info = ActorTypeInformation.create(FakePrefetchActor)
+        test_client = FakeDaprActorClient
+        serializer = DefaultJSONSerializer(typed_decode=True)
+        ctx = ActorRuntimeContext(test_type_info, serializer, serializer, test_client)
+        test_actor = FakePrefetchActor(ctx, ActorId('test_id'))
+
+        _run(test_actor._on_activate_internal())
+        get_state = test_client.get_state.mock
+        self.assertEqual(
+            ['missing', 'order', 'total'], sorted(call.args[2] for call in get_state.call_args_list)
+        )
+
+        # the first method call is served from memory
+        self.assertEqual({'total': 42}, _run(test_actor.actor_method(0)))
+        order = _run(test_actor._state_manager.get_state('order'))
+        self.assertIsInstance(order, FakeOrder)
+        self.assertEqual(['a'], order.lines)
+        self.assertFalse(_run(test_actor._state_manager.contains_state('missing')))
+        self.assertEqual(3, get_state.call_count)
+
     def test_dispatch(self):
         _run(ActorRuntime.register_actor(FakeMultiInterfacesActor))
 
@@ -154,6 +187,27 @@ class ActorTests(unittest.TestCase):
             'FakeSimpleReminderActor', 'test_id', 'test_reminder'
         )
 
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.register_reminder',
+        new=_async_mock(return_value=b'"ok"'),
+    )
+    @unittest.skipIf(messagepack.msgpack is None, 'msgpack is not installed')
+    def test_register_reminder_with_binary_serializer(self):
+        test_type_info = ActorTypeInformation.create(FakeSimpleReminderActor)
+        serializer = MessagePackSerializer()
+        ctx = ActorRuntimeContext(test_type_info, serializer, serializer, FakeDaprActorClient)
+        test_actor = FakeSimpleReminderActor(ctx, ActorId('test_id'))
+
+        _run(
+            test_actor.register_reminder(
+                'test_reminder', b'reminder_message', timedelta(seconds=1), timedelta(seconds=1)
+            )
+        )
+
+        # Dapr expects a JSON body, whatever the message serializer is.
+        body = FakeDaprActorClient.register_reminder.mock.call_args[0][3]
+        self.assertEqual('cmVtaW5kZXJfbWVzc2FnZQ==', self._serializer.deserialize(body)['data'])
+
     @mock.patch(
         'tests.actor.fake_client.FakeDaprActorClient.register_timer',
         new=_async_mock(return_value=b'"ok"'),
@@ -25,6 +25,8 @@ from dapr.serializers import DefaultJSONSerializer
 
 from tests.actor.fake_actor_classes import (
     FakeMultiInterfacesActor,
+    FakeOrder,
+    FakeTypedActor,
     FakeSimpleActor,
     FakeSimpleReminderActor,
     FakeSimpleTimerActor,
@@ -38,6 +40,32 @@ from tests.actor.utils import (
 )
 
 
+class ActorManagerTypedDecodeTests(unittest.TestCase):
+    def setUp(self):
+        self._serializer = DefaultJSONSerializer(typed_decode=True)
+        self._runtime_ctx = ActorRuntimeContext(
+            ActorTypeInformation.create(FakeTypedActor),
+            self._serializer,
+            self._serializer,
+            FakeDaprActorClient,
+        )
+        self._manager = ActorManager(self._runtime_ctx)
+
+    def test_dispatch_typed_argument(self):
+        test_actor_id = ActorId('typed')
+        request_body = (
+            b'{"order_id":"2020-01-01","created_at":"2020-01-01T01:00:00Z","lines":["a"]}'
+        )
+        response = _run(self._manager.dispatch(test_actor_id, 'PlaceOrder', request_body))
+
+        self.assertEqual(b'"2020-01-01"', response)
+        order = self._manager._active_actors[test_actor_id.id].orders[0]
+        self.assertIsInstance(order, FakeOrder)
+        self.assertEqual('2020-01-01', order.order_id)
+        self.assertEqual(2020, order.created_at.year)
+        self.assertEqual(['a'], order.lines)
+
+
 class ActorManagerTests(unittest.TestCase):
     def setUp(self):
         self._test_type_info = ActorTypeInformation.create(FakeMultiInterfacesActor)
@@ -16,6 +16,7 @@ limitations under the License.
 import unittest
 
 from datetime import timedelta
+from unittest import mock
 
 from dapr.actor.runtime.runtime import ActorRuntime
 from dapr.actor.runtime.config import ActorRuntimeConfig
@@ -28,7 +29,7 @@ from tests.actor.fake_actor_classes import (
     FakeSimpleTimerActor,
 )
 
-from tests.actor.utils import _run
+from tests.actor.utils import _async_mock, _run
 from tests.clients.fake_http_server import FakeHttpServer
 
 
@@ -92,6 +93,30 @@ class ActorRuntimeTests(unittest.TestCase):
         config = ActorRuntime.get_actor_config()
         self.assertTrue(FakeSimpleActor.__name__ in config._entities)
 
+    @mock.patch(
+        'dapr.clients.http.dapr_actor_http_client.DaprActorHttpClient.close',
+        new=_async_mock(),
+    )
+    def test_shutdown_closes_actor_clients(self):
+        from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
+
+        _run(ActorRuntime.shutdown())
+
+        self.assertEqual(3, DaprActorHttpClient.close.mock.call_count)
+        # Actor types stay registered after shutdown
+        self.assertEqual(3, len(ActorRuntime.get_registered_actor_types()))
+
+    @mock.patch(
+        'dapr.clients.http.dapr_actor_http_client.DaprActorHttpClient.close',
+        new=_async_mock(),
+    )
+    def test_register_again_closes_previous_client(self):
+        from dapr.clients.http.dapr_actor_http_client import DaprActorHttpClient
+
+        _run(ActorRuntime.register_actor(FakeSimpleActor))
+
+        DaprActorHttpClient.close.mock.assert_called_once()
+
     def test_dispatch(self):
         _run(ActorRuntime.register_actor(FakeMultiInterfacesActor))
 
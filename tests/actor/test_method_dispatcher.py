@@ -20,7 +20,7 @@ from dapr.actor.runtime.method_dispatcher import ActorMethodDispatcher
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.serializers import DefaultJSONSerializer
 
-from tests.actor.fake_actor_classes import FakeSimpleActor
+from tests.actor.fake_actor_classes import FakeMultiInterfacesActor, FakeSimpleActor
 from tests.actor.fake_client import FakeDaprActorClient
 from tests.actor.utils import _run
 
@@ -54,3 +54,14 @@ class ActorMethodDispatcherTests(unittest.TestCase):
         actorInstance = FakeSimpleActor(self._fake_runtime_ctx, None)
         result = _run(dispatcher.dispatch(actorInstance, 'ActorMethod', 10))
         self.assertEqual({'name': 'actor_method'}, result)
+
+    def test_get_arg_decoder_is_compiled_once(self):
+        dispatcher = ActorMethodDispatcher(self._testActorTypeInfo)
+        decoder = dispatcher.get_arg_decoder('ActorMethod')
+        self.assertIs(int, decoder.data_type)
+        self.assertIs(decoder, dispatcher.get_arg_decoder('ActorMethod'))
+        self.assertEqual(10, decoder(10))
+
+    def test_get_arg_decoder_without_args(self):
+        dispatcher = ActorMethodDispatcher(ActorTypeInformation.create(FakeMultiInterfacesActor))
+        self.assertIsNone(dispatcher.get_arg_decoder('ActionMethodWithoutArg'))
@@ -13,17 +13,22 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import base64
+import datetime
+import json
 import unittest
 
 from unittest import mock
 
 from dapr.actor.id import ActorId
 from dapr.actor.runtime.context import ActorRuntimeContext
+from dapr.actor.runtime.reentrancy_context import reentrancy_ctx
 from dapr.actor.runtime.state_change import StateChangeKind
 from dapr.actor.runtime.state_manager import ActorStateManager
 from dapr.actor.runtime._type_information import ActorTypeInformation
-from dapr.serializers import DefaultJSONSerializer
+from dapr.serializers import DefaultJSONSerializer, MessagePackSerializer
+from dapr.serializers import messagepack
 
 from tests.actor.fake_actor_classes import FakeSimpleActor
 from tests.actor.fake_client import FakeDaprActorClient
@@ -90,6 +95,26 @@ class ActorStateManagerTests(unittest.TestCase):
         self.assertTrue(has_value)
         self.assertEqual('value1', val)
 
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.get_state',
+        new=_async_mock(return_value=b'"2020-01-01"'),
+    )
+    def test_get_state_with_state_type(self):
+        serializer = DefaultJSONSerializer(typed_decode=True)
+        runtime_ctx = ActorRuntimeContext(
+            self._test_type_info, serializer, serializer, self._fake_client
+        )
+        state_manager = ActorStateManager(FakeSimpleActor(runtime_ctx, self._test_actor_id))
+        val = _run(state_manager.get_state('state1', datetime.date))
+        self.assertEqual(datetime.date(2020, 1, 1), val)
+
+        provider = runtime_ctx.state_provider
+        has_value, val = _run(
+            provider.try_load_state(self._test_type_info.type_name, '1', 's', str)
+        )
+        self.assertEqual('2020-01-01', val)
+        self.assertEqual({datetime.date, str}, set(provider._state_decoders))
+
     @mock.patch(
         'tests.actor.fake_client.FakeDaprActorClient.get_state',
         new=_async_mock(return_value=b'"value1"'),
@@ -376,6 +401,120 @@ class ActorStateManagerTests(unittest.TestCase):
         with self.assertRaises(AttributeError):
             _run(state_manager.add_or_update_state('state1', 'value1', None))
 
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.get_state',
+        new=_async_mock(side_effect=lambda t, i, name: b'"value1"' if name == 'state1' else b''),
+    )
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.save_state_transactionally', new=_async_mock()
+    )
+    def test_state_is_fetched_once(self):
+        state_manager = ActorStateManager(self._fake_actor)
+        get_state = self._fake_client.get_state.mock
+
+        # an existing state, whose value is kept from the existence check
+        self.assertTrue(_run(state_manager.contains_state('state1')))
+        self.assertEqual('value1', _run(state_manager.get_state('state1')))
+        self.assertTrue(_run(state_manager.try_remove_state('state1')))
+
+        # a state that does not exist
+        self.assertFalse(_run(state_manager.contains_state('state2')))
+        self.assertEqual((False, None), _run(state_manager.try_get_state('state2')))
+        self.assertFalse(_run(state_manager.try_remove_state('state2')))
+        _run(state_manager.set_state('state2', 'value2'))
+        self.assertEqual(
+            StateChangeKind.add, state_manager._get_contextual_state_tracker()['state2'].change_kind
+        )
+
+        self.assertEqual(['state1', 'state2'], [call.args[2] for call in get_state.call_args_list])
+
+        # a removed state is known not to exist after it is saved
+        _run(state_manager.save_state())
+        self.assertFalse(_run(state_manager.contains_state('state1')))
+        self.assertEqual(2, get_state.call_count)
+
+        # clearing the cache reads the states again
+        _run(state_manager.clear_cache())
+        self.assertFalse(_run(state_manager.contains_state('state2')))
+        self.assertEqual(3, get_state.call_count)
+
+    def test_get_states(self):
+        loading = set()
+        loaded = []
+        max_loading = 0
+
+        async def get_state(actor_type, actor_id, state_name):
+            nonlocal max_loading
+            loading.add(state_name)
+            max_loading = max(max_loading, len(loading))
+            await asyncio.sleep(0.01)
+            loading.remove(state_name)
+            loaded.append(state_name)
+            return b'' if state_name == 'missing' else json.dumps(state_name).encode()
+
+        state_manager = ActorStateManager(self._fake_actor)
+        names = [f'state{i}' for i in range(5)]
+        with mock.patch('tests.actor.fake_client.FakeDaprActorClient.get_state', new=get_state):
+            _run(state_manager.set_state('state0', 'value0'))
+            _run(state_manager.remove_state('state1'))
+            loaded.clear()
+            states = _run(state_manager.try_get_states(names + ['missing'], max_concurrency=2))
+            self.assertEqual(['missing', 'state2', 'state3', 'state4'], sorted(loaded))
+            self.assertEqual(2, max_loading)
+            self.assertEqual(
+                {'state0': 'value0', 'state2': 'state2', 'state3': 'state3', 'state4': 'state4'},
+                states,
+            )
+            self.assertEqual(['state0', 'state2', 'state3', 'state4'], list(states))
+
+            # the states are tracked now
+            loaded.clear()
+            self.assertEqual(
+                {'state2': 'state2', 'state3': 'state3'},
+                _run(state_manager.get_states(['state2', 'state3'])),
+            )
+            with self.assertRaises(KeyError):
+                _run(state_manager.get_states(['state2', 'missing']))
+            self.assertEqual([], loaded)
+
+            with self.assertRaises(ValueError):
+                _run(state_manager.get_states(['state5'], max_concurrency=0))
+
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.get_state',
+        new=_async_mock(side_effect=lambda t, i, name: b'"value1"' if name == 'state1' else b''),
+    )
+    def test_set_states(self):
+        state_manager = ActorStateManager(self._fake_actor)
+        state_change_tracker = state_manager._get_contextual_state_tracker()
+        _run(state_manager.set_state('state3', 'value3'))
+        _run(state_manager.set_states({'state1': 'new1', 'state2': 'new2', 'state3': 'new3'}, 10))
+
+        self.assertEqual(StateChangeKind.update, state_change_tracker['state1'].change_kind)
+        self.assertEqual(StateChangeKind.add, state_change_tracker['state2'].change_kind)
+        self.assertEqual(StateChangeKind.add, state_change_tracker['state3'].change_kind)
+        self.assertEqual('new3', state_change_tracker['state3'].value)
+        self.assertEqual(10, state_change_tracker['state1'].ttl_in_seconds)
+        self.assertEqual(3, self._fake_client.get_state.mock.call_count)
+
+    @mock.patch(
+        'tests.actor.fake_client.FakeDaprActorClient.get_state',
+        new=_async_mock(return_value=b'"value1"'),
+    )
+    def test_get_states_in_reentrant_call(self):
+        state_manager = ActorStateManager(self._fake_actor)
+
+        async def reentrant_call():
+            reentrancy_ctx.set('reentrancy-id')
+            state_manager.set_state_context('context-id')
+            states = await state_manager.get_states(['state1', 'state2'])
+            return states, state_manager._get_contextual_state_tracker()
+
+        states, reentrant_tracker = _run(reentrant_call())
+        self.assertEqual({'state1': 'value1', 'state2': 'value1'}, states)
+        self.assertEqual({'state1', 'state2'}, set(reentrant_tracker))
+        self.assertEqual(0, len(state_manager._get_contextual_state_tracker()))
+
     @mock.patch('tests.actor.fake_client.FakeDaprActorClient.get_state', new=_async_mock())
     def test_get_state_names(self):
         state_manager = ActorStateManager(self._fake_actor)
@@ -445,6 +584,175 @@ class ActorStateManagerTests(unittest.TestCase):
         self._fake_client.save_state_transactionally = mock_save_state
         _run(state_manager.save_state())
 
+    def _fake_store(self, stored):
+        # the transactions written to the stored states
+        transactions = []
+
+        async def save_state(actor_type, actor_id, data):
+            transactions.append(json.loads(data))
+            for op in transactions[-1]:
+                request = op['request']
+                if op['operation'] == 'delete':
+                    stored.pop(request['key'], None)
+                else:
+                    value = json.dumps(request['value'], separators=(',', ':'))
+                    stored[request['key']] = value.encode()
+
+        async def get_state(actor_type, actor_id, name):
+            return stored.get(name, b'')
+
+        patches = (
+            mock.patch.object(FakeDaprActorClient, 'save_state_transactionally', new=save_state),
+            mock.patch.object(FakeDaprActorClient, 'get_state', new=get_state),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        return transactions
+
+    def test_save_state_elides_unchanged_values(self):
+        stored = {'state1': b'{"a":1}', 'state2': b'"value2"'}
+        transactions = self._fake_store(stored)
+        state_manager = ActorStateManager(self._fake_actor)
+
+        # the same value, whether it was read or not
+        self.assertEqual({'a': 1}, _run(state_manager.get_state('state1')))
+        _run(state_manager.set_state('state1', {'a': 1}))
+        _run(state_manager.set_state('state2', 'value2'))
+        _run(state_manager.save_state())
+        self.assertEqual([], transactions)
+
+        # a new time to live is always written
+        _run(state_manager.set_state_ttl('state2', 'value2', 60))
+        _run(state_manager.set_state('state3', 'value3'))
+        _run(state_manager.save_state())
+        self.assertEqual(['state2', 'state3'], [op['request']['key'] for op in transactions[-1]])
+
+        # the value written last is remembered
+        _run(state_manager.set_state('state3', 'value3'))
+        _run(state_manager.set_state('state1', {'a': 2}))
+        _run(state_manager.save_state())
+        self.assertEqual(['state1'], [op['request']['key'] for op in transactions[-1]])
+
+        self.assertEqual(
+            {'elided_writes': 3, 'elided_bytes': 23, 'detected_mutations': 0},
+            state_manager.counters(),
+        )
+
+    def test_save_state_detects_mutations(self):
+        stored = {'state1': b'{"a":[1]}', 'state2': b'{"b":[2]}'}
+        transactions = self._fake_store(stored)
+
+        # mutations are not detected by default
+        state_manager = ActorStateManager(self._fake_actor)
+        _run(state_manager.get_state('state1'))['a'].append(2)
+        _run(state_manager.save_state())
+        self.assertEqual([], transactions)
+
+        self._fake_actor.detect_state_mutations = True
+        state_manager = ActorStateManager(self._fake_actor)
+        _run(state_manager.get_state('state1'))['a'].append(2)
+        _run(state_manager.get_state('state2'))
+        _run(state_manager.save_state())
+        self.assertEqual(
+            [[{'operation': 'upsert', 'request': {'key': 'state1', 'value': {'a': [1, 2]}}}]],
+            transactions,
+        )
+        self.assertEqual(1, state_manager.detected_mutations)
+
+        # the value written is what is compared from now on
+        _run(state_manager.save_state())
+        self.assertEqual(1, len(transactions))
+
+    def test_state_is_deserialized_when_read(self):
+        stored = {'state1': b'{"a":1}', 'state2': b'{"b":2}'}
+        transactions = self._fake_store(stored)
+        self._fake_actor.detect_state_mutations = True
+        state_manager = ActorStateManager(self._fake_actor)
+        state_provider = self._runtime_ctx.state_provider
+        state_change_tracker = state_manager._get_contextual_state_tracker()
+
+        with mock.patch.object(
+            state_provider, 'deserialize_state', wraps=state_provider.deserialize_state
+        ) as deserialize_state, mock.patch.object(
+            state_provider, 'serialize_state', wraps=state_provider.serialize_state
+        ) as serialize_state:
+            _run(state_manager.prefetch_states({'state1': object, 'state2': object}))
+            self.assertTrue(_run(state_manager.contains_state('state1')))
+            self.assertEqual(b'{"b":2}', state_change_tracker['state2'].serialized_value)
+            deserialize_state.assert_not_called()
+
+            self.assertEqual({'a': 1}, _run(state_manager.get_state('state1')))
+            self.assertEqual({'a': 1}, _run(state_manager.get_state('state1')))
+            self.assertEqual(1, deserialize_state.call_count)
+            self.assertIsNone(state_change_tracker['state1'].serialized_value)
+
+            # a value that was not read is not serialized to look for changes
+            _run(state_manager.save_state())
+            self.assertEqual(1, serialize_state.call_count)
+            self.assertEqual([], transactions)
+
+            # and is written back as it is stored
+            state_change_tracker['state2'].change_kind = StateChangeKind.update
+            state_change_tracker['state2'].ttl_in_seconds = 60
+            _run(state_manager.save_state())
+            # only the value that was read is compared
+            self.assertEqual([mock.call({'a': 1})] * 2, serialize_state.call_args_list)
+            self.assertEqual(1, deserialize_state.call_count)
+        self.assertEqual(
+            [
+                {
+                    'operation': 'upsert',
+                    'request': {
+                        'key': 'state2',
+                        'value': {'b': 2},
+                        'metadata': {'ttlInSeconds': '60'},
+                    },
+                }
+            ],  # noqa: E501
+            transactions[-1],
+        )
+
+    @unittest.skipIf(messagepack.msgpack is None, 'msgpack is not installed')
+    def test_save_and_load_binary_state(self):
+        serializer = MessagePackSerializer()
+        runtime_ctx = ActorRuntimeContext(
+            self._test_type_info, serializer, serializer, self._fake_client
+        )
+        state_manager = ActorStateManager(FakeSimpleActor(runtime_ctx, self._test_actor_id))
+        value = {'raw': b'\x00\xff', 'when': datetime.datetime(2020, 1, 1)}
+        saved = {}
+
+        async def save_state(actor_type, actor_id, data):
+            # The transaction body must stay valid JSON.
+            for op in json.loads(data):
+                saved[op['request']['key']] = json.dumps(op['request']['value']).encode()
+
+        async def get_state(actor_type, actor_id, name):
+            return saved.get(name, b'')
+
+        with mock.patch.object(
+            FakeDaprActorClient, 'save_state_transactionally', new=save_state
+        ), mock.patch.object(FakeDaprActorClient, 'get_state', new=get_state):
+            _run(state_manager.set_state_ttl('state1', value, 60))
+            _run(state_manager.save_state())
+
+            has_value, val = _run(
+                runtime_ctx.state_provider.try_load_state(
+                    self._test_type_info.type_name, '1', 'state1'
+                )
+            )
+
+        self.assertTrue(has_value)
+        self.assertEqual(value, val)
+
+        # the base64 form that is stored is what is compared
+        with mock.patch.object(FakeDaprActorClient, 'get_state', new=get_state):
+            state_manager = ActorStateManager(FakeSimpleActor(runtime_ctx, self._test_actor_id))
+            _run(state_manager.set_state('state1', value))
+            _run(state_manager.save_state())
+        self.assertEqual(1, state_manager.elided_writes)
+
 
 if __name__ == '__main__':
     unittest.main()
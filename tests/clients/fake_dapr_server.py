@@ -1,5 +1,6 @@
 import grpc
 import json
+import time
 
 from concurrent import futures
 from google.protobuf.any_pb2 import Any as GrpcAny
@@ -44,12 +45,22 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         self._http_server = FakeHttpServer(self.http_port)  # Needed for the healthcheck endpoint
         api_service_v1.add_DaprServicer_to_server(self, self._grpc_server)
         self.store = {}
+        self.save_state_requests = []
+        self.bulk_publish_requests = []
+        self.delete_bulk_state_requests = []
+        self.get_bulk_state_requests = []
+        self._next_delays = []
+        self._rejected_entries = set()
         self.shutdown_received = False
         self.locks_to_owner = {}  # (store_name, resource_id) -> lock_owner
         self.workflow_status = {}
         self.workflow_options: Dict[str, str] = {}
         self.metadata: Dict[str, str] = {}
         self._next_exception = None
+        self.actor_state: Dict[tuple, bytes] = {}  # (actor_type, actor_id, key) -> value
+        self.actor_reminders: Dict[tuple, object] = {}  # (actor_type, actor_id, name) -> request
+        self.actor_timers: Dict[tuple, object] = {}  # (actor_type, actor_id, name) -> request
+        self.actor_invocations = []
 
     def start(self):
         self._grpc_server.add_insecure_port(f'[::]:{self.grpc_port}')
@@ -85,13 +96,22 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         self._grpc_server.stop(None)
         GrpcCerts.delete_certificates()
 
-    def raise_exception_on_next_call(self, exception):
+    def raise_exception_on_next_call(self, exception, times: int = 1):
         """
         Raise an exception on the next call to the server.
         Useful for testing error handling.
         @param exception:
+        @param times: the number of calls that raise the exception
         """
         self._next_exception = exception
+        self._next_exception_times = times
+
+    def delay_next_calls(self, *seconds: float):
+        """
+        Delay the next calls to GetState, e.g. to test hedged reads.
+        @param seconds: the delay of each call, in the order of the calls
+        """
+        self._next_delays.extend(seconds)
 
     def check_for_exception(self, context):
         """
@@ -101,7 +121,9 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         """
 
         exception = self._next_exception
-        self._next_exception = None
+        self._next_exception_times = getattr(self, '_next_exception_times', 1) - 1
+        if self._next_exception_times <= 0:
+            self._next_exception = None
 
         if exception is None:
             return None
@@ -173,12 +195,32 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         context.set_trailing_metadata(trailers)
         return empty_pb2.Empty()
 
+    def BulkPublishEventAlpha1(self, request, context):
+        self.check_for_exception(context)
+
+        self.bulk_publish_requests.append(request)
+        failed_entries = []
+        for entry in request.entries:
+            reject = entry.metadata['reject']
+            # 'once' rejects the first attempt of an entry, 'always' every attempt
+            if reject == 'always' or (
+                reject == 'once' and entry.entry_id not in self._rejected_entries
+            ):
+                self._rejected_entries.add(entry.entry_id)
+                failed_entries.append(
+                    api_v1.BulkPublishResponseFailedEntry(entry_id=entry.entry_id, error='rejected')
+                )
+        return api_v1.BulkPublishResponse(failedEntries=failed_entries)
+
     def SaveState(self, request, context):
         self.check_for_exception(context)
 
+        self.save_state_requests.append(request)
         headers = ()
         trailers = ()
         for state in request.states:
+            if state.metadata['reject']:
+                raise ValueError('save rejected')
             data = state.value
             if state.metadata['capitalize']:
                 data = to_bytes(data.decode('utf-8').capitalize())
@@ -211,6 +253,8 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
 
     def GetState(self, request, context):
         self.check_for_exception(context)
+        if self._next_delays:
+            time.sleep(self._next_delays.pop(0))
 
         key = request.key
         if key not in self.store:
@@ -223,6 +267,7 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
 
     def GetBulkState(self, request, context):
         self.check_for_exception(context)
+        self.get_bulk_state_requests.append(request)
 
         items = []
         for key in request.keys:
@@ -251,6 +296,17 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         context.set_trailing_metadata(trailers)
         return empty_pb2.Empty()
 
+    def DeleteBulkState(self, request, context):
+        self.check_for_exception(context)
+
+        self.delete_bulk_state_requests.append(request)
+        for state in request.states:
+            if state.key in self.store:
+                del self.store[state.key]
+            elif state.metadata['must_delete']:
+                raise ValueError('delete failed')
+        return empty_pb2.Empty()
+
     def GetSecret(self, request, context) -> api_v1.GetSecretResponse:
         headers = ()
         trailers = ()
@@ -462,3 +518,42 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
     def Shutdown(self, request, context):
         self.shutdown_received = True
         return empty_pb2.Empty()
+
+    def InvokeActor(self, request, context):
+        self.check_for_exception(context)
+
+        self.actor_invocations.append(request)
+        return api_v1.InvokeActorResponse(data=b'"' + to_bytes(request.method) + b'"')
+
+    def GetActorState(self, request, context):
+        self.check_for_exception(context)
+
+        data = self.actor_state.get((request.actor_type, request.actor_id, request.key), b'')
+        return api_v1.GetActorStateResponse(data=data)
+
+    def ExecuteActorStateTransaction(self, request, context):
+        self.check_for_exception(context)
+
+        for op in request.operations:
+            key = (request.actor_type, request.actor_id, op.key)
+            if op.operationType == 'upsert':
+                self.actor_state[key] = op.value.value
+            elif op.operationType == 'delete':
+                self.actor_state.pop(key, None)
+        return empty_pb2.Empty()
+
+    def RegisterActorReminder(self, request, context):
+        self.actor_reminders[(request.actor_type, request.actor_id, request.name)] = request
+        return empty_pb2.Empty()
+
+    def UnregisterActorReminder(self, request, context):
+        self.actor_reminders.pop((request.actor_type, request.actor_id, request.name), None)
+        return empty_pb2.Empty()
+
+    def RegisterActorTimer(self, request, context):
+        self.actor_timers[(request.actor_type, request.actor_id, request.name)] = request
+        return empty_pb2.Empty()
+
+    def UnregisterActorTimer(self, request, context):
+        self.actor_timers.pop((request.actor_type, request.actor_id, request.name), None)
+        return empty_pb2.Empty()
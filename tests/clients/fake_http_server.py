@@ -2,7 +2,7 @@ import time
 from ssl import PROTOCOL_TLS_SERVER, SSLContext
 
 from threading import Thread
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from tests.clients.certs import HttpCerts
 
@@ -10,6 +10,15 @@ from tests.clients.certs import HttpCerts
 class DaprHandler(BaseHTTPRequestHandler):
     protocol_version = 'HTTP/1.1'
 
+    def setup(self):
+        super().setup()
+        self.server.connection_count += 1
+        self.server.open_connection_count += 1
+
+    def finish(self):
+        super().finish()
+        self.server.open_connection_count -= 1
+
     def serve_forever(self):
         while not self.running:
             self.handle_request()
@@ -17,6 +26,7 @@ class DaprHandler(BaseHTTPRequestHandler):
     def do_request(self, verb):
         if self.path == '/v1.0/healthz/outbound':
             self.send_response(200)
+            self.send_header('Content-Length', '0')
             self.end_headers()
             return
 
@@ -59,13 +69,16 @@ class FakeHttpServer(Thread):
         super().__init__()
 
         self.port = port
-        self.server = HTTPServer(('localhost', self.port), DaprHandler)
+        self.server = ThreadingHTTPServer(('localhost', self.port), DaprHandler)
+        self.server.daemon_threads = True
 
         self.server.response_body = b''
         self.server.response_code = 200
         self.server.response_header_list = []
         self.server.request_body = b''
         self.server.sleep_time = None
+        self.server.connection_count = 0
+        self.server.open_connection_count = 0
 
     def get_port(self):
         return self.server.socket.getsockname()[1]
@@ -93,6 +106,12 @@ class FakeHttpServer(Thread):
     def get_request_body(self):
         return self.server.request_body
 
+    def get_connection_count(self):
+        return self.server.connection_count
+
+    def get_open_connection_count(self):
+        return self.server.open_connection_count
+
     def set_server_delay(self, delay_seconds):
         self.server.sleep_time = delay_seconds
 
@@ -115,3 +134,4 @@ class FakeHttpServer(Thread):
         self.server.response_header_list = []
         self.server.request_body = b''
         self.server.sleep_time = None
+        self.server.connection_count = 0
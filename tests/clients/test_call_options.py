@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from grpc import Compression
+
+from dapr.clients.grpc._call_options import CallOptions, to_compression
+
+
+class CallOptionsTests(unittest.TestCase):
+    def test_deadline(self):
+        self.assertIsNone(CallOptions().deadline(None))
+        self.assertEqual(3, CallOptions().deadline(3))
+        self.assertEqual(5, CallOptions(timeout=5).deadline(None))
+        self.assertEqual(1, CallOptions(timeout=5).deadline(1))
+
+    def test_compression_by_name(self):
+        self.assertEqual(Compression.Gzip, CallOptions(compression='gzip').compression)
+        self.assertEqual(Compression.Deflate, to_compression('Deflate'))
+        self.assertEqual(Compression.NoCompression, to_compression('none'))
+        self.assertEqual(Compression.Gzip, to_compression(Compression.Gzip))
+        self.assertIsNone(to_compression(None))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CallOptions(timeout=0)
+        with self.assertRaises(ValueError):
+            CallOptions(compression='brotli')
+
+
+if __name__ == '__main__':
+    unittest.main()
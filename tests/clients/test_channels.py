@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from dapr.clients.grpc._channels import ChannelRegistry
+
+
+class ChannelRegistryTests(unittest.TestCase):
+    def test_acquire_shares_channel(self):
+        registry = ChannelRegistry()
+        created = []
+
+        def create():
+            created.append(object())
+            return created[-1]
+
+        first = registry.acquire('a', create)
+        second = registry.acquire('a', create)
+        other = registry.acquire('b', create)
+
+        self.assertIs(first.channel, second.channel)
+        self.assertIsNot(first.channel, other.channel)
+        self.assertEqual(2, len(created))
+        self.assertEqual(2, registry.refcount('a'))
+        self.assertEqual(2, len(registry))
+
+    def test_release_returns_channel_to_last_user(self):
+        registry = ChannelRegistry()
+        first = registry.acquire('a', object)
+        second = registry.acquire('a', object)
+
+        self.assertIsNone(first.release())
+        # releasing twice does not take the reference of another client
+        self.assertIsNone(first.release())
+        self.assertEqual(1, registry.refcount('a'))
+        self.assertIs(second.channel, second.release())
+        self.assertEqual(0, registry.refcount('a'))
+        self.assertEqual(0, len(registry))
+
+        third = registry.acquire('a', object)
+        self.assertIsNot(second.channel, third.channel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import unittest
+
+from datetime import timedelta
+
+from google.rpc import status_pb2, code_pb2
+
+from dapr.actor.client.proxy import ActorProxyFactory
+from dapr.actor.runtime._reminder_data import ActorReminderData
+from dapr.actor.runtime._state_provider import StateProvider
+from dapr.actor.runtime._timer_data import ActorTimerData
+from dapr.actor.runtime.reentrancy_context import reentrancy_ctx
+from dapr.actor.runtime.state_change import ActorStateChange, StateChangeKind
+from dapr.aio.clients import DaprActorGrpcClientAsync
+from dapr.clients import DaprActorGrpcClient, DaprActorHttpClient, DaprInternalError
+from dapr.clients.exceptions import DaprGrpcError
+from dapr.conf import settings
+from dapr.serializers import DefaultJSONSerializer
+
+from .fake_dapr_server import FakeDaprSidecar
+
+
+class FakeSidecarTestCase(unittest.TestCase):
+    grpc_port = 50001
+    http_port = 3500
+
+    @classmethod
+    def setUpClass(cls):
+        cls._fake_dapr_server = FakeDaprSidecar(grpc_port=cls.grpc_port, http_port=cls.http_port)
+        cls._fake_dapr_server.start()
+
+        settings.DAPR_HTTP_PORT = cls.http_port
+        settings.DAPR_HTTP_ENDPOINT = 'http://127.0.0.1:{}'.format(cls.http_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._fake_dapr_server.stop()
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+
+class DaprActorGrpcClientTests(FakeSidecarTestCase):
+    def setUp(self):
+        self._fake_dapr_server.actor_state.clear()
+        self._fake_dapr_server.actor_invocations.clear()
+        self.client = self._create_client()
+
+    def tearDown(self):
+        self._run(self.client.close())
+
+    def _create_client(self):
+        return DaprActorGrpcClient(f'localhost:{self.grpc_port}')
+
+    def test_invoke_method(self):
+        response = self._run(self.client.invoke_method('FakeActor', '1', 'Ping', b'"data"'))
+
+        self.assertEqual(b'"Ping"', response)
+        request = self._fake_dapr_server.actor_invocations[-1]
+        self.assertEqual('FakeActor', request.actor_type)
+        self.assertEqual('1', request.actor_id)
+        self.assertEqual(b'"data"', request.data)
+        self.assertEqual({}, dict(request.metadata))
+
+    def test_invoke_method_propagates_reentrancy_id(self):
+        async def invoke():
+            reentrancy_ctx.set('reentrancy-id')
+            return await self.client.invoke_method('FakeActor', '1', 'Ping')
+
+        self._run(invoke())
+
+        request = self._fake_dapr_server.actor_invocations[-1]
+        self.assertEqual('reentrancy-id', request.metadata['Dapr-Reentrancy-Id'])
+
+    def test_invoke_method_error(self):
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError) as context:
+            self._run(self.client.invoke_method('FakeActor', '1', 'Ping'))
+        self.assertEqual('my invalid argument message', context.exception.details())
+
+    def test_state_transaction_through_state_provider(self):
+        provider = StateProvider(self.client, DefaultJSONSerializer())
+        changes = [
+            ActorStateChange('state1', {'a': 1, 'b': 'text'}, StateChangeKind.add),
+            ActorStateChange('state2', 'value2', StateChangeKind.update, ttl_in_seconds=3600),
+        ]
+        self._run(provider.save_state('FakeActor', '1', changes))
+
+        self.assertEqual(
+            b'{"a":1,"b":"text"}', self._run(self.client.get_state('FakeActor', '1', 'state1'))
+        )
+        has_value, value = self._run(provider.try_load_state('FakeActor', '1', 'state2'))
+        self.assertTrue(has_value)
+        self.assertEqual('value2', value)
+
+        changes = [ActorStateChange('state1', None, StateChangeKind.remove)]
+        self._run(provider.save_state('FakeActor', '1', changes))
+        self.assertFalse(self._run(provider.contains_state('FakeActor', '1', 'state1')))
+        self.assertTrue(self._run(provider.contains_state('FakeActor', '1', 'state2')))
+
+    def test_get_missing_state(self):
+        self.assertEqual(b'', self._run(self.client.get_state('FakeActor', '1', 'missing')))
+
+    def test_reminder(self):
+        reminder = ActorReminderData(
+            'reminder', b'reminder state', timedelta(seconds=1), timedelta(seconds=2)
+        )
+        data = DefaultJSONSerializer().serialize(reminder.as_dict())
+        self._run(self.client.register_reminder('FakeActor', '1', 'reminder', data))
+
+        request = self._fake_dapr_server.actor_reminders[('FakeActor', '1', 'reminder')]
+        self.assertEqual(b'reminder state', request.data)
+        self.assertEqual('0h0m1s0ms0μs', request.due_time)
+        self.assertEqual('0h0m2s0ms0μs', request.period)
+
+        self._run(self.client.unregister_reminder('FakeActor', '1', 'reminder'))
+        self.assertNotIn(('FakeActor', '1', 'reminder'), self._fake_dapr_server.actor_reminders)
+
+    def test_timer(self):
+        timer = ActorTimerData(
+            'timer', lambda: None, {'x': 1}, timedelta(seconds=1), timedelta(seconds=2)
+        )
+        data = DefaultJSONSerializer().serialize(timer.as_dict())
+        self._run(self.client.register_timer('FakeActor', '1', 'timer', data))
+
+        request = self._fake_dapr_server.actor_timers[('FakeActor', '1', 'timer')]
+        self.assertEqual(timer.callback, request.callback)
+        self.assertEqual(b'{"x": 1}', request.data)
+        self.assertEqual('0h0m2s0ms0μs', request.period)
+
+        self._run(self.client.unregister_timer('FakeActor', '1', 'timer'))
+        self.assertNotIn(('FakeActor', '1', 'timer'), self._fake_dapr_server.actor_timers)
+
+    def test_concurrent_calls(self):
+        async def invoke_many():
+            return await asyncio.gather(
+                *[self.client.invoke_method('FakeActor', str(i), f'M{i}') for i in range(20)]
+            )
+
+        responses = self._run(invoke_many())
+        self.assertEqual([f'"M{i}"'.encode() for i in range(20)], responses)
+
+
+class DaprActorGrpcClientAsyncTests(DaprActorGrpcClientTests):
+    def _create_client(self):
+        return DaprActorGrpcClientAsync(f'localhost:{self.grpc_port}')
+
+    def _run(self, coro):
+        if not hasattr(self, '_loop'):
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def tearDown(self):
+        super().tearDown()
+        self._loop.close()
+
+
+class ActorClientProtocolTests(FakeSidecarTestCase):
+    def test_proxy_factory_protocol(self):
+        factory = ActorProxyFactory(actor_client_protocol='grpc')
+        self.assertIsInstance(factory._dapr_client, DaprActorGrpcClient)
+        self._run(factory.close())
+
+        factory = ActorProxyFactory(actor_client_protocol='grpc-aio')
+        self.assertIsInstance(factory._dapr_client, DaprActorGrpcClientAsync)
+
+        factory = ActorProxyFactory()
+        self.assertIsInstance(factory._dapr_client, DaprActorHttpClient)
+
+    def test_unknown_protocol(self):
+        with self.assertRaises(DaprInternalError):
+            ActorProxyFactory(actor_client_protocol='carrier-pigeon')
+
+
+if __name__ == '__main__':
+    unittest.main()
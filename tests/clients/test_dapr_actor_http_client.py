@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import time
+import unittest
+
+from dapr.actor.client.proxy import ActorProxyFactory
+from dapr.actor.id import ActorId
+from dapr.clients import DaprActorHttpClient
+from dapr.conf import settings
+from dapr.serializers import DefaultJSONSerializer
+
+from .fake_http_server import FakeHttpServer
+
+
+class DaprActorHttpClientTests(unittest.TestCase):
+    server_port = 3500
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeHttpServer(cls.server_port)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown_server()
+
+    def setUp(self):
+        settings.DAPR_API_TOKEN = None
+        settings.DAPR_HTTP_ENDPOINT = 'http://127.0.0.1:{}'.format(self.server_port)
+
+        self.server.reset()
+        self.server.set_response(b'"state value"')
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def _wait_for_open_connections(self, expected, timeout=2.0):
+        deadline = time.time() + timeout
+        while self.server.get_open_connection_count() != expected and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_requests_reuse_connection(self):
+        client = DaprActorHttpClient(DefaultJSONSerializer())
+        connections_before = self.server.get_connection_count()
+
+        async def get_state_twice():
+            async with client:
+                first = await client.get_state('FakeActor', 'id', 'state')
+                second = await client.get_state('FakeActor', 'id', 'state')
+            return first, second
+
+        first, second = self._run(get_state_twice())
+
+        self.assertEqual(b'"state value"', first)
+        self.assertEqual(b'"state value"', second)
+        self.assertEqual('/v1.0/actors/FakeActor/id/state/state', self.server.request_path())
+        self.assertEqual(1, self.server.get_connection_count() - connections_before)
+
+    def test_close_releases_connections(self):
+        client = DaprActorHttpClient(DefaultJSONSerializer())
+        self._wait_for_open_connections(0)
+
+        async def get_state_and_close():
+            await client.get_state('FakeActor', 'id', 'state')
+            self.assertEqual(1, self.server.get_open_connection_count())
+            await client.close()
+
+        self._run(get_state_and_close())
+
+        self._wait_for_open_connections(0)
+        self.assertEqual(0, self.server.get_open_connection_count())
+
+    def test_client_is_usable_after_close(self):
+        client = DaprActorHttpClient(DefaultJSONSerializer())
+
+        async def get_state_around_close():
+            await client.get_state('FakeActor', 'id', 'state')
+            await client.close()
+            value = await client.get_state('FakeActor', 'id', 'state')
+            await client.close()
+            return value
+
+        self.assertEqual(b'"state value"', self._run(get_state_around_close()))
+
+    def test_pool_options_are_applied(self):
+        client = DaprActorHttpClient(
+            DefaultJSONSerializer(), max_connections=1, max_connections_per_host=1
+        )
+        connections_before = self.server.get_connection_count()
+
+        async def get_states_concurrently():
+            async with client:
+                return await asyncio.gather(
+                    *[client.get_state('FakeActor', 'id', f'state{i}') for i in range(5)]
+                )
+
+        values = self._run(get_states_concurrently())
+
+        self.assertEqual([b'"state value"'] * 5, values)
+        self.assertEqual(1, self.server.get_connection_count() - connections_before)
+
+    def test_proxy_factory_context_manager_releases_connections(self):
+        self._wait_for_open_connections(0)
+
+        async def invoke():
+            async with ActorProxyFactory() as factory:
+                proxy = factory.create('FakeActor', ActorId('id'))
+                return await proxy.invoke_method('Method')
+
+        self.assertEqual(b'"state value"', self._run(invoke()))
+        self.assertEqual('/v1.0/actors/FakeActor/id/method/Method', self.server.request_path())
+
+        self._wait_for_open_connections(0)
+        self.assertEqual(0, self.server.get_open_connection_count())
+
+
+if __name__ == '__main__':
+    unittest.main()
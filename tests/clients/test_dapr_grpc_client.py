@@ -18,24 +18,35 @@ import socket
 import unittest
 import uuid
 import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 
 from unittest.mock import patch
 
+from google.protobuf.duration_pb2 import Duration
 from google.rpc import status_pb2, code_pb2
+from grpc import StatusCode
 
-from dapr.clients.exceptions import DaprGrpcError
+from dapr.clients.exceptions import DaprGrpcError, DaprInternalError
 from dapr.clients.grpc.client import DaprGrpcClient
-from dapr.clients import DaprClient
+from dapr.clients import DaprClient, Publisher, StateCache, StateWriteBatching
 from dapr.proto import common_v1
 from .fake_dapr_server import FakeDaprSidecar
+from .test_retry import unavailable_status
 from dapr.conf import settings
+from dapr.clients.grpc._channels import channel_registry
+from dapr.clients.grpc._call_options import CallOptions
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._retry import RetryPolicy
 from dapr.clients.grpc._helpers import to_bytes
-from dapr.clients.grpc._request import TransactionalStateOperation
+from dapr.clients.grpc._request import BulkPublishEntry, TransactionalStateOperation
 from dapr.clients.grpc._state import StateOptions, Consistency, Concurrency, StateItem
 from dapr.clients.grpc._response import (
     ConfigurationItem,
     ConfigurationResponse,
     ConfigurationWatcher,
+    DaprResponse,
     UnlockResponseStatus,
     WorkflowRuntimeStatus,
 )
@@ -99,6 +110,21 @@ class DaprGrpcClientTests(unittest.TestCase):
         self.assertEqual(3, len(resp.headers))
         self.assertEqual(['value1'], resp.headers['hkey1'])
 
+    def test_bytes_like_data(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        resp = dapr.invoke_method(
+            app_id='targetId', method_name='bytes', data=memoryview(b'haha'), http_verb='PUT'
+        )
+        self.assertEqual(b'haha', resp.data)
+        self.assertEqual(b'ah', resp.data_view[1:3])
+        self.assertTrue(resp.data_view.readonly)
+
+        resp = dapr.publish_event(pubsub_name='pubsub', topic_name='example', data=bytearray(b'ev'))
+        self.assertEqual(['ev'], resp.headers['hdata'])
+
+        dapr.save_state(store_name='statestore', key='key', value=memoryview(b'xvaluex')[1:-1])
+        self.assertEqual(b'value', dapr.get_state(store_name='statestore', key='key').data)
+
     def test_invoke_method_no_data(self):
         dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
         resp = dapr.invoke_method(
@@ -260,6 +286,86 @@ class DaprGrpcClientTests(unittest.TestCase):
                 data=111,
             )
 
+    def test_publish_events(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        requests = self._fake_dapr_server.bulk_publish_requests
+        requests.clear()
+        rejected = BulkPublishEntry('rejected', entry_id='a', metadata={'reject': 'always'})
+
+        resp = dapr.publish_events(
+            pubsub_name='pubsub',
+            topic_name='example',
+            data=['text', b'bytes', rejected],
+            data_content_type='application/json',
+        )
+
+        self.assertEqual(['a'], [failed.entry_id for failed in resp.failed_entries])
+        self.assertIs(rejected, resp.failed_entries[0].entry)
+        self.assertEqual('rejected', resp.failed_entries[0].error)
+        entries = requests[0].entries
+        self.assertEqual(['0', '1', 'a'], [entry.entry_id for entry in entries])
+        self.assertEqual([b'text', b'bytes', b'rejected'], [entry.event for entry in entries])
+        self.assertEqual('application/json', entries[0].content_type)
+
+    def test_publish_events_retries_failed_entries(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        requests = self._fake_dapr_server.bulk_publish_requests
+        requests.clear()
+        flaky_id = str(uuid.uuid4())
+
+        resp = dapr.publish_events(
+            pubsub_name='pubsub',
+            topic_name='example',
+            data=['ok', BulkPublishEntry('flaky', entry_id=flaky_id, metadata={'reject': 'once'})],
+            max_retries=2,
+            retry_backoff_seconds=0,
+        )
+
+        self.assertEqual([], list(resp.failed_entries))
+        self.assertEqual(2, len(requests))
+        self.assertEqual([flaky_id], [entry.entry_id for entry in requests[1].entries])
+
+    def test_publish_events_error(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        with self.assertRaises(ValueError):
+            dapr.publish_events(pubsub_name='pubsub', topic_name='example', data=[])
+        with self.assertRaises(ValueError):
+            dapr.publish_events(
+                pubsub_name='pubsub',
+                topic_name='example',
+                data=[BulkPublishEntry('a', entry_id='1'), 'b'],
+            )
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError):
+            dapr.publish_events(pubsub_name='pubsub', topic_name='example', data=['a'])
+
+    def test_publisher(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        requests = self._fake_dapr_server.bulk_publish_requests
+        requests.clear()
+
+        with Publisher(dapr, max_entries=3, linger_seconds=0.05) as publisher:
+            futures = [publisher.publish('pubsub', 'orders', f'{i}') for i in range(4)]
+            futures.append(publisher.publish('pubsub', 'invoices', 'invoice'))
+            futures.append(
+                publisher.publish(
+                    'pubsub', 'orders', 'bad', entry_id='bad', metadata={'reject': 'always'}
+                )
+            )
+
+        with self.assertRaisesRegex(DaprInternalError, 'failed to publish event bad: rejected'):
+            futures[-1].result()
+        for future in futures[:-1]:
+            self.assertIsInstance(future.result(), str)
+        # the first three orders reached max_entries, the rest were sent on close
+        self.assertEqual(
+            [('invoices', 1), ('orders', 2), ('orders', 3)],
+            sorted((request.topic, len(request.entries)) for request in requests),
+        )
+
     @patch.object(settings, 'DAPR_API_TOKEN', 'test-token')
     def test_dapr_api_token_insertion(self):
         dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
@@ -348,6 +454,294 @@ class DaprGrpcClientTests(unittest.TestCase):
         self.assertEqual(resp.data, to_bytes(value))
         self.assertEqual(resp.etag, '')
 
+    def test_get_state_cache(self):
+        cache = StateCache()
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}', state_cache=cache)
+        key = str(uuid.uuid4())
+
+        dapr.save_state(store_name='statestore', key=key, value='v1')
+        self.assertEqual(b'v1', dapr.get_state(store_name='statestore', key=key).data)
+
+        # a write by another process is not seen until the entry is invalidated
+        self._fake_dapr_server.store[key] = (b'v2', 'etag2')
+        resp = dapr.get_state(store_name='statestore', key=key)
+        self.assertEqual(b'v1', resp.data)
+        self.assertEqual('ETAG_WAS_NONE', resp.etag)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+        dapr.save_state(store_name='statestore', key=key, value='v3')
+        self.assertEqual(b'v3', dapr.get_state(store_name='statestore', key=key).data)
+
+        dapr.execute_state_transaction(
+            store_name='statestore', operations=[TransactionalStateOperation(key=key, data='v4')]
+        )
+        self.assertEqual(b'v4', dapr.get_state(store_name='statestore', key=key).data)
+
+        dapr.delete_state(store_name='statestore', key=key)
+        self.assertEqual(b'', dapr.get_state(store_name='statestore', key=key).data)
+        self.assertEqual((1, 4), (cache.hits, cache.misses))
+
+    def test_get_bulk_state_cache(self):
+        cache = StateCache()
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}', state_cache=cache)
+        keys = [str(uuid.uuid4()) for _ in range(3)]
+        dapr.save_bulk_state(
+            store_name='statestore', states=[StateItem(key=key, value=key) for key in keys]
+        )
+
+        dapr.get_state(store_name='statestore', key=keys[1])
+        self._fake_dapr_server.store[keys[1]] = (b'changed', 'etag')
+        resp = dapr.get_bulk_state(store_name='statestore', keys=keys)
+        self.assertEqual(keys, [item.key for item in resp.items])
+        self.assertEqual([to_bytes(key) for key in keys], [item.data for item in resp.items])
+
+        for key in keys:
+            self._fake_dapr_server.store[key] = (b'changed', 'etag')
+        resp = dapr.get_bulk_state(store_name='statestore', keys=keys)
+        self.assertEqual([to_bytes(key) for key in keys], [item.data for item in resp.items])
+        self.assertEqual(4, cache.hits)
+
+    def test_retry_policy(self):
+        policy = RetryPolicy(initial_backoff_seconds=0.01)
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}', retry_policy=policy)
+        dapr.save_state(store_name='statestore', key='retried', value='value')
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            unavailable_status(Duration(nanos=20000000)), times=2
+        )
+        resp = dapr.get_state(store_name='statestore', key='retried')
+        self.assertEqual(b'value', resp.data)
+        self.assertEqual(2, policy.retries)
+
+        # publishing is not idempotent, so it is not retried
+        self._fake_dapr_server.raise_exception_on_next_call(unavailable_status())
+        with self.assertRaises(DaprGrpcError):
+            dapr.publish_event(pubsub_name='pubsub', topic_name='example', data='data')
+        self.assertEqual(2, policy.retries)
+
+        self._fake_dapr_server.raise_exception_on_next_call(unavailable_status(), times=3)
+        with self.assertRaises(DaprGrpcError) as context:
+            dapr.get_state(store_name='statestore', key='retried')
+        self.assertEqual(StatusCode.UNAVAILABLE, context.exception.code())
+        self.assertEqual(1, policy.exhausted)
+        dapr.close()
+
+    def test_hedging_policy(self):
+        policy = HedgingPolicy(delay_seconds=0.05)
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}', hedging_policy=policy)
+        dapr.save_state(store_name='statestore', key='hedged', value='value')
+
+        resp = dapr.get_state(store_name='statestore', key='hedged')
+        self.assertEqual(b'value', resp.data)
+        self.assertEqual(0, policy.hedges)
+
+        # the first call stalls, so the hedge sent after 50ms answers it
+        self._fake_dapr_server.delay_next_calls(3)
+        start = time.monotonic()
+        resp = dapr.get_state(store_name='statestore', key='hedged')
+        self.assertEqual(b'value', resp.data)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(
+            {'calls': 2, 'hedges': 1, 'hedge_wins': 1, 'throttled': 0}, policy.counters()
+        )
+        dapr.close()
+
+    def test_call_options_deadline(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}', call_options=CallOptions(timeout=0.1)
+        )
+        dapr.save_state(store_name='statestore', key='deadline', value='value')
+
+        self._fake_dapr_server.delay_next_calls(0.5)
+        with self.assertRaises(DaprGrpcError) as context:
+            dapr.get_state(store_name='statestore', key='deadline')
+        self.assertEqual(StatusCode.DEADLINE_EXCEEDED, context.exception.code())
+
+        # a call can wait longer than the default
+        self._fake_dapr_server.delay_next_calls(0.3)
+        resp = dapr.get_state(store_name='statestore', key='deadline', timeout=5)
+        self.assertEqual(b'value', resp.data)
+        dapr.close()
+
+    def test_call_options_compression(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            call_options=CallOptions(compression='gzip'),
+        )
+        value = 'compressible ' * 1000
+        dapr.save_state(store_name='statestore', key='gzip', value=value)
+        dapr.save_state(store_name='statestore', key='deflate', value=value, compression='deflate')
+
+        resp = dapr.get_state(store_name='statestore', key='gzip')
+        self.assertEqual(value.encode(), resp.data)
+        resp = dapr.get_state(store_name='statestore', key='deflate')
+        self.assertEqual(value.encode(), resp.data)
+        dapr.close()
+
+    def test_clients_share_channel(self):
+        first = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        second = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        other = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}', max_grpc_message_length=1024
+        )
+        self.assertIs(first._channel, second._channel)
+        self.assertIsNot(first._channel, other._channel)
+        other.close()
+
+        first.close()
+        # the channel stays open for the client that still uses it
+        second.get_state(store_name='statestore', key='key')
+        second.close()
+        self.assertEqual(0, channel_registry.refcount(second._channel_lease.key))
+
+    def test_get_bulk_state_sharded(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}', max_grpc_message_length=2048
+        )
+        requests = self._fake_dapr_server.get_bulk_state_requests
+        requests.clear()
+        keys = [f'{i:03d}-{uuid.uuid4()}' for i in range(100)]
+        for key in keys:
+            self._fake_dapr_server.store[key] = (to_bytes(key), 'etag')
+
+        resp = dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=3)
+        self.assertGreater(len(requests), 1)
+        self.assertEqual(keys, [item.key for item in resp.items])
+        self.assertEqual([to_bytes(key) for key in keys], [item.data for item in resp.items])
+
+        requests.clear()
+        items = dapr.iter_bulk_state(
+            'statestore', keys, parallelism=3, max_concurrency=4, max_keys_per_request=7
+        )
+        self.assertEqual(sorted(keys), sorted(item.key for item in items))
+
+        items = dapr.iter_bulk_state('statestore', keys, max_keys_per_request=7, ordered=True)
+        self.assertEqual(keys, [item.key for item in items])
+        self.assertEqual(30, len(requests))
+        self.assertTrue(all(req.parallelism == 3 for req in requests[:15]))
+
+        with self.assertRaises(ValueError):
+            dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=0)
+        with self.assertRaises(ValueError):
+            dapr.iter_bulk_state('statestore', keys, max_keys_per_request=0)
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError):
+            dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=3)
+        dapr.close()
+
+    def test_save_state_write_batching(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            state_write_batching=StateWriteBatching(linger_seconds=0.5, max_items=4),
+        )
+        keys = [str(uuid.uuid4()) for _ in range(4)]
+        requests = self._fake_dapr_server.save_state_requests
+        requests.clear()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda key: dapr.save_state(store_name='statestore', key=key, value=key),
+                    keys,
+                )
+            )
+
+        self.assertEqual(1, len(requests))
+        self.assertEqual(sorted(keys), sorted(state.key for state in requests[0].states))
+        self.assertTrue(all(isinstance(result, DaprResponse) for result in results))
+        for key in keys:
+            self.assertEqual(to_bytes(key), self._fake_dapr_server.store[key][0])
+
+        # writes with an etag are sent on their own right away
+        dapr.save_state(store_name='statestore', key=keys[0], value='v', etag='etag')
+        self.assertEqual(2, len(requests))
+        dapr.close()
+
+    def test_save_state_write_batching_error_attribution(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            state_write_batching=StateWriteBatching(linger_seconds=5, max_items=2),
+        )
+        good_key = str(uuid.uuid4())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            good = executor.submit(
+                dapr.save_state, store_name='statestore', key=good_key, value='good'
+            )
+            time.sleep(0.1)
+            bad = executor.submit(
+                dapr.save_state,
+                store_name='statestore',
+                key='bad',
+                value='bad',
+                state_metadata={'reject': '1'},
+            )
+
+            self.assertIsInstance(good.result(), DaprResponse)
+            with self.assertRaises(DaprGrpcError) as context:
+                bad.result()
+        self.assertIn('save rejected', str(context.exception))
+        self.assertEqual(b'good', self._fake_dapr_server.store[good_key][0])
+        dapr.close()
+
+    def test_save_state_write_batching_flushes_on_size(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            state_write_batching=StateWriteBatching(linger_seconds=0.2, max_bytes=2048),
+        )
+        requests = self._fake_dapr_server.save_state_requests
+        requests.clear()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in executor.map(
+                lambda key: dapr.save_state(store_name='statestore', key=key, value='x' * 600),
+                [str(uuid.uuid4()) for _ in range(4)],
+            ):
+                pass
+
+        self.assertGreater(len(requests), 1)
+        self.assertTrue(all(request.ByteSize() <= 2048 for request in requests))
+        dapr.close()
+
+    def test_delete_bulk_state(self):
+        dapr = DaprGrpcClient(
+            f'{self.scheme}localhost:{self.grpc_port}', max_grpc_message_length=4096
+        )
+        requests = self._fake_dapr_server.delete_bulk_state_requests
+        requests.clear()
+        keys = [f'{i:04d}-{uuid.uuid4()}' for i in range(200)]
+        for key in keys:
+            self._fake_dapr_server.store[key] = (b'value', 'etag')
+
+        resp = dapr.delete_bulk_state(store_name='statestore', keys=keys, max_concurrency=3)
+
+        self.assertEqual({}, resp.failed_keys)
+        self.assertGreater(len(requests), 1)
+        self.assertTrue(all(request.ByteSize() <= 4096 for request in requests))
+        self.assertEqual(sorted(keys), sorted(s.key for r in requests for s in r.states))
+        self.assertFalse(any(key in self._fake_dapr_server.store for key in keys))
+
+    def test_delete_bulk_state_failed_keys(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+        key = str(uuid.uuid4())
+        self._fake_dapr_server.store[key] = (b'value', 'etag')
+
+        resp = dapr.delete_bulk_state(
+            store_name='statestore',
+            keys=[key, 'missing'],
+            etags={key: 'etag'},
+            states_metadata={'must_delete': '1'},
+        )
+
+        self.assertEqual([key, 'missing'], list(resp.failed_keys))
+        self.assertIn('delete failed', resp.failed_keys['missing'])
+        self.assertEqual({}, dapr.delete_bulk_state(store_name='statestore', keys=[]).failed_keys)
+        with self.assertRaises(ValueError):
+            dapr.delete_bulk_state(store_name='statestore', keys=[key], max_concurrency=0)
+
     def test_transaction_then_get_states(self):
         dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
 
@@ -577,6 +971,30 @@ class DaprGrpcClientTests(unittest.TestCase):
                 query=json.dumps({'filter': {}, 'page': {'limit': 3, 'token': '3'}}),
             )
 
+    def test_iter_query_state(self):
+        dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
+
+        items = dapr.iter_query_state('statestore', json.dumps({'filter': {}}), page_size=3)
+        self.assertEqual([item.key for item in items], [str(key) for key in range(1, 11)])
+
+        items = dapr.iter_query_state(
+            'statestore',
+            json.dumps({'filter': {}, 'page': {'limit': 4}}),
+            prefetch=False,
+            decode=lambda item: item.text(),
+            decode_workers=3,
+        )
+        self.assertEqual(list(items), [f'value of {key}' for key in range(1, 11)])
+
+        with self.assertRaises(ValueError):
+            dapr.iter_query_state('statestore', json.dumps({'filter': {}}), page_size=0)
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError):
+            list(dapr.iter_query_state('statestore', json.dumps({'filter': {}})))
+
     def test_shutdown(self):
         dapr = DaprGrpcClient(f'{self.scheme}localhost:{self.grpc_port}')
         dapr.shutdown()
@@ -13,28 +13,39 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import json
 import socket
+import time
 import unittest
 import uuid
 
 from unittest.mock import patch
 
+from google.protobuf.duration_pb2 import Duration
 from google.rpc import status_pb2, code_pb2
+from grpc import StatusCode
 
 from dapr.aio.clients.grpc.client import DaprGrpcClientAsync
-from dapr.aio.clients import DaprClient
-from dapr.clients.exceptions import DaprGrpcError
+from dapr.aio.clients import DaprClient, Publisher, StateCache, StateWriteBatching
+from dapr.clients.exceptions import DaprGrpcError, DaprInternalError
 from dapr.proto import common_v1
 from .fake_dapr_server import FakeDaprSidecar
+from .test_retry import unavailable_status
 from dapr.conf import settings
+from dapr.clients.grpc._channels import channel_registry
+from dapr.clients.grpc._call_options import CallOptions
+from dapr.clients.grpc._hedging import HedgingPolicy
+from dapr.clients.grpc._retry import RetryPolicy
+from dapr.clients.health import DaprHealth
 from dapr.clients.grpc._helpers import to_bytes
-from dapr.clients.grpc._request import TransactionalStateOperation
+from dapr.clients.grpc._request import BulkPublishEntry, TransactionalStateOperation
 from dapr.clients.grpc._state import StateOptions, Consistency, Concurrency, StateItem
 from dapr.clients.grpc._response import (
     ConfigurationItem,
     ConfigurationWatcher,
     ConfigurationResponse,
+    DaprResponse,
     UnlockResponseStatus,
 )
 
@@ -97,6 +108,25 @@ class DaprGrpcClientAsyncTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(3, len(resp.headers))
         self.assertEqual(['value1'], resp.headers['hkey1'])
 
+    async def test_bytes_like_data(self):
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        resp = await dapr.invoke_method(
+            app_id='targetId', method_name='bytes', data=memoryview(b'haha'), http_verb='PUT'
+        )
+        self.assertEqual(b'haha', resp.data)
+        self.assertEqual(b'ah', resp.data_view[1:3])
+        self.assertTrue(resp.data_view.readonly)
+
+        resp = await dapr.publish_event(
+            pubsub_name='pubsub', topic_name='example', data=bytearray(b'ev')
+        )
+        self.assertEqual(['ev'], resp.headers['hdata'])
+
+        await dapr.save_state(
+            store_name='statestore', key='key', value=memoryview(b'xvaluex')[1:-1]
+        )
+        self.assertEqual(b'value', (await dapr.get_state(store_name='statestore', key='key')).data)
+
     async def test_invoke_method_no_data(self):
         dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
         resp = await dapr.invoke_method(
@@ -260,6 +290,45 @@ class DaprGrpcClientAsyncTests(unittest.IsolatedAsyncioTestCase):
                 data=111,
             )
 
+    async def test_publish_events(self):
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        requests = self._fake_dapr_server.bulk_publish_requests
+        requests.clear()
+        flaky_id = str(uuid.uuid4())
+
+        resp = await dapr.publish_events(
+            pubsub_name='pubsub',
+            topic_name='example',
+            data=[
+                'ok',
+                BulkPublishEntry('flaky', entry_id=flaky_id, metadata={'reject': 'once'}),
+                BulkPublishEntry('rejected', entry_id='a', metadata={'reject': 'always'}),
+            ],
+            max_retries=1,
+            retry_backoff_seconds=0,
+        )
+
+        self.assertEqual(['a'], [failed.entry_id for failed in resp.failed_entries])
+        self.assertEqual([3, 2], [len(request.entries) for request in requests])
+        await dapr.close()
+
+    async def test_publisher(self):
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        requests = self._fake_dapr_server.bulk_publish_requests
+        requests.clear()
+
+        async with Publisher(dapr, linger_seconds=0.01) as publisher:
+            futures = [publisher.publish('pubsub', 'orders', f'{i}') for i in range(5)]
+            futures.append(
+                publisher.publish('pubsub', 'orders', 'bad', metadata={'reject': 'always'})
+            )
+            results = await asyncio.gather(*futures, return_exceptions=True)
+
+        self.assertEqual(1, len(requests))
+        self.assertTrue(all(isinstance(result, str) for result in results[:-1]))
+        self.assertIsInstance(results[-1], DaprInternalError)
+        await dapr.close()
+
     @patch.object(settings, 'DAPR_API_TOKEN', 'test-token')
     async def test_dapr_api_token_insertion(self):
         dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
@@ -350,6 +419,206 @@ class DaprGrpcClientAsyncTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(resp.data, to_bytes(value))
         self.assertEqual(resp.etag, '')
 
+    async def test_get_state_cache(self):
+        cache = StateCache()
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}', state_cache=cache)
+        keys = [str(uuid.uuid4()) for _ in range(2)]
+
+        await dapr.save_state(store_name='statestore', key=keys[0], value='v1')
+        await dapr.save_state(store_name='statestore', key=keys[1], value='v2')
+        self.assertEqual(b'v1', (await dapr.get_state(store_name='statestore', key=keys[0])).data)
+
+        self._fake_dapr_server.store[keys[0]] = (b'v2', 'etag2')
+        resp = await dapr.get_bulk_state(store_name='statestore', keys=keys)
+        self.assertEqual(keys, [item.key for item in resp.items])
+        self.assertEqual(b'v1', resp.items[0].data)
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+        await dapr.delete_state(store_name='statestore', key=keys[0])
+        self.assertEqual(b'', (await dapr.get_state(store_name='statestore', key=keys[0])).data)
+        await dapr.close()
+
+    async def test_retry_policy(self):
+        policy = RetryPolicy(initial_backoff_seconds=0.01)
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}', retry_policy=policy)
+        await dapr.save_state(store_name='statestore', key='retried', value='value')
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            unavailable_status(Duration(nanos=20000000)), times=2
+        )
+        resp = await dapr.get_state(store_name='statestore', key='retried')
+        self.assertEqual(b'value', resp.data)
+        self.assertEqual(2, policy.retries)
+
+        # publishing is not idempotent, so it is not retried
+        self._fake_dapr_server.raise_exception_on_next_call(unavailable_status())
+        with self.assertRaises(DaprGrpcError):
+            await dapr.publish_event(pubsub_name='pubsub', topic_name='example', data='data')
+        self.assertEqual(2, policy.retries)
+
+        self._fake_dapr_server.raise_exception_on_next_call(unavailable_status(), times=3)
+        with self.assertRaises(DaprGrpcError) as context:
+            await dapr.get_state(store_name='statestore', key='retried')
+        self.assertEqual(StatusCode.UNAVAILABLE, context.exception.code())
+        self.assertEqual(1, policy.exhausted)
+        await dapr.close()
+
+    async def test_hedging_policy(self):
+        policy = HedgingPolicy(delay_seconds=0.05)
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}', hedging_policy=policy
+        )
+        await dapr.save_state(store_name='statestore', key='hedged', value='value')
+
+        resp = await dapr.get_state(store_name='statestore', key='hedged')
+        self.assertEqual(b'value', resp.data)
+        self.assertEqual(0, policy.hedges)
+
+        # the first call stalls, so the hedge sent after 50ms answers it
+        self._fake_dapr_server.delay_next_calls(3)
+        start = time.monotonic()
+        resp = await dapr.get_state(store_name='statestore', key='hedged')
+        self.assertEqual(b'value', resp.data)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(
+            {'calls': 2, 'hedges': 1, 'hedge_wins': 1, 'throttled': 0}, policy.counters()
+        )
+        await dapr.close()
+
+    async def test_call_options_deadline(self):
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}', call_options=CallOptions(timeout=0.1)
+        )
+        await dapr.save_state(store_name='statestore', key='deadline', value='value')
+
+        self._fake_dapr_server.delay_next_calls(0.5)
+        with self.assertRaises(DaprGrpcError) as context:
+            await dapr.get_state(store_name='statestore', key='deadline')
+        self.assertEqual(StatusCode.DEADLINE_EXCEEDED, context.exception.code())
+
+        # a call can wait longer than the default
+        self._fake_dapr_server.delay_next_calls(0.3)
+        resp = await dapr.get_state(store_name='statestore', key='deadline', timeout=5)
+        self.assertEqual(b'value', resp.data)
+        await dapr.close()
+
+    async def test_call_options_compression(self):
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            call_options=CallOptions(compression='gzip'),
+        )
+        value = 'compressible ' * 1000
+        await dapr.save_state(store_name='statestore', key='gzip', value=value)
+        await dapr.save_state(
+            store_name='statestore', key='deflate', value=value, compression='deflate'
+        )
+
+        resp = await dapr.get_state(store_name='statestore', key='gzip')
+        self.assertEqual(value.encode(), resp.data)
+        resp = await dapr.get_state(store_name='statestore', key='deflate')
+        self.assertEqual(value.encode(), resp.data)
+        await dapr.close()
+
+    async def test_clients_share_channel(self):
+        first = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        second = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        self.assertIs(first._channel, second._channel)
+
+        await first.close()
+        # the channel stays open for the client that still uses it
+        await second.get_state(store_name='statestore', key='key')
+        await second.close()
+        self.assertEqual(0, channel_registry.refcount(second._channel_lease.key))
+
+    async def test_get_bulk_state_sharded(self):
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}', max_grpc_message_length=2048
+        )
+        requests = self._fake_dapr_server.get_bulk_state_requests
+        requests.clear()
+        keys = [f'{i:03d}-{uuid.uuid4()}' for i in range(100)]
+        for key in keys:
+            self._fake_dapr_server.store[key] = (to_bytes(key), 'etag')
+
+        resp = await dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=3)
+        self.assertGreater(len(requests), 1)
+        self.assertEqual(keys, [item.key for item in resp.items])
+        self.assertEqual([to_bytes(key) for key in keys], [item.data for item in resp.items])
+
+        requests.clear()
+        items = dapr.iter_bulk_state(
+            'statestore', keys, parallelism=3, max_concurrency=4, max_keys_per_request=7
+        )
+        self.assertEqual(sorted(keys), sorted([item.key async for item in items]))
+
+        items = dapr.iter_bulk_state('statestore', keys, max_keys_per_request=7, ordered=True)
+        self.assertEqual(keys, [item.key async for item in items])
+        self.assertEqual(30, len(requests))
+        self.assertTrue(all(req.parallelism == 3 for req in requests[:15]))
+
+        with self.assertRaises(ValueError):
+            await dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=0)
+        with self.assertRaises(ValueError):
+            dapr.iter_bulk_state('statestore', keys, max_keys_per_request=0)
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError):
+            await dapr.get_bulk_state(store_name='statestore', keys=keys, max_concurrency=3)
+        await dapr.close()
+
+    async def test_save_state_write_batching(self):
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}',
+            state_write_batching=StateWriteBatching(linger_seconds=0.05),
+        )
+        keys = [str(uuid.uuid4()) for _ in range(3)]
+        requests = self._fake_dapr_server.save_state_requests
+        requests.clear()
+
+        results = await asyncio.gather(
+            *[dapr.save_state(store_name='statestore', key=key, value=key) for key in keys],
+            dapr.save_state(
+                store_name='statestore', key='bad', value='bad', state_metadata={'reject': '1'}
+            ),
+            return_exceptions=True,
+        )
+
+        # the failed batch is retried one state at a time
+        self.assertEqual(5, len(requests))
+        self.assertEqual(4, len(requests[0].states))
+        self.assertIsInstance(results[-1], DaprInternalError)
+        self.assertIn('save rejected', str(results[-1]))
+        for key, result in zip(keys, results):
+            self.assertIsInstance(result, DaprResponse)
+            self.assertEqual(to_bytes(key), self._fake_dapr_server.store[key][0])
+        await dapr.close()
+
+    async def test_delete_bulk_state(self):
+        dapr = DaprGrpcClientAsync(
+            f'{self.scheme}localhost:{self.grpc_port}', max_grpc_message_length=4096
+        )
+        requests = self._fake_dapr_server.delete_bulk_state_requests
+        requests.clear()
+        keys = [f'{i:04d}-{uuid.uuid4()}' for i in range(200)]
+        for key in keys:
+            self._fake_dapr_server.store[key] = (b'value', 'etag')
+
+        resp = await dapr.delete_bulk_state(
+            store_name='statestore',
+            keys=keys + ['missing'],
+            states_metadata={'must_delete': '1'},
+            max_concurrency=2,
+        )
+
+        self.assertGreater(len(requests), 1)
+        # only the request holding the missing key failed
+        self.assertIn('missing', resp.failed_keys)
+        self.assertLess(len(resp.failed_keys), len(keys))
+        self.assertFalse(any(key in self._fake_dapr_server.store for key in keys))
+        await dapr.close()
+
     async def test_transaction_then_get_states(self):
         dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
 
@@ -579,11 +848,51 @@ class DaprGrpcClientAsyncTests(unittest.IsolatedAsyncioTestCase):
                 query=json.dumps({'filter': {}, 'page': {'limit': 2}}),
             )
 
+    async def test_iter_query_state(self):
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+
+        items = dapr.iter_query_state('statestore', json.dumps({'filter': {}}), page_size=3)
+        self.assertEqual([item.key async for item in items], [str(key) for key in range(1, 11)])
+
+        items = dapr.iter_query_state(
+            'statestore',
+            json.dumps({'filter': {}, 'page': {'limit': 4}}),
+            prefetch=False,
+            decode=lambda item: item.text(),
+            decode_workers=3,
+        )
+        self.assertEqual([value async for value in items], [f'value of {k}' for k in range(1, 11)])
+
+        # stopping early cancels the prefetched page
+        items = dapr.iter_query_state('statestore', json.dumps({'filter': {}}), page_size=2)
+        async for item in items:
+            break
+        await items.aclose()
+        self.assertEqual(item.key, '1')
+
+        self._fake_dapr_server.raise_exception_on_next_call(
+            status_pb2.Status(code=code_pb2.INVALID_ARGUMENT, message='my invalid argument message')
+        )
+        with self.assertRaises(DaprGrpcError):
+            [item async for item in dapr.iter_query_state('statestore', '{"filter": {}}')]
+
     async def test_shutdown(self):
         dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
         await dapr.shutdown()
         self.assertTrue(self._fake_dapr_server.shutdown_received)
 
+    async def test_health_check_does_not_block_event_loop(self):
+        DaprHealth.reset()
+        dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
+        self.assertIsNotNone(dapr._health_check)
+        async with dapr:
+            self.assertTrue(DaprHealth.is_ready())
+
+        # later clients find the sidecar ready
+        self.assertIsNone(
+            DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')._health_check
+        )
+
     async def test_wait_ok(self):
         dapr = DaprGrpcClientAsync(f'{self.scheme}localhost:{self.grpc_port}')
         await dapr.wait(0.1)
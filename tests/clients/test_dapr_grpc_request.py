@@ -28,6 +28,18 @@ class InvokeMethodRequestTests(unittest.TestCase):
         self.assertEqual(b'hello dapr', req.data)
         self.assertEqual('application/json; charset=utf-8', req.content_type)
 
+    def test_bytes_like_data(self):
+        payload = b'hello dapr'
+
+        # a view of a whole bytes object is not copied
+        req = InvokeMethodRequest(data=memoryview(payload))
+        self.assertIs(payload, req.data)
+
+        req = InvokeMethodRequest(data=bytearray(payload))
+        self.assertEqual(payload, req.data)
+        self.assertEqual(payload, req.proto.value)
+        self.assertFalse(req.is_proto())
+
     def test_proto_message_data(self):
         # arrange
         fake_req = common_v1.InvokeRequest(method='test')
@@ -58,6 +70,10 @@ class InvokeBindingRequestDataTests(unittest.TestCase):
         self.assertEqual(b'hello dapr', data.data)
         self.assertEqual({}, data.metadata)
 
+    def test_bytes_like_data(self):
+        data = BindingRequest(data=memoryview(b'hello dapr')[6:])
+        self.assertEqual(b'dapr', data.data)
+
     def test_str_data(self):
         # act
         data = BindingRequest(data='hello dapr')
@@ -23,9 +23,11 @@ from dapr.clients.grpc._response import (
     BindingResponse,
     StateResponse,
     BulkStateItem,
+    BulkStatesResponse,
+    QueryResponse,
 )
 
-from dapr.proto import common_v1
+from dapr.proto import api_v1, common_v1
 
 
 class DaprResponseTests(unittest.TestCase):
@@ -35,6 +37,13 @@ class DaprResponseTests(unittest.TestCase):
         ('key3', 'value3'),
     )
 
+    def test_headers_are_converted_once(self):
+        resp = DaprResponse(self.test_headers)
+        self.assertIs(resp.headers, resp.headers)
+
+        resp.headers = (('key4', 'value4'),)
+        self.assertEqual({'key4': ['value4']}, resp.headers)
+
     def test_convert_metadata(self):
         # act
         resp = DaprResponse(self.test_headers)
@@ -75,6 +84,17 @@ class InvokeMethodResponseTests(unittest.TestCase):
         self.assertEqual('hello dapr', resp.text())
         self.assertEqual('application/json', resp.content_type)
 
+    def test_data_view(self):
+        resp = InvokeMethodResponse(data=GrpcAny(value=b'hello dapr'))
+        view = resp.data_view
+        self.assertTrue(view.readonly)
+        self.assertEqual(b'dapr', view[6:])
+        # the data is copied out of the message only once
+        self.assertIs(resp.data, resp.data)
+
+        resp = InvokeMethodResponse(data=bytearray(b'hello'))
+        self.assertEqual(b'hello', resp.proto.value)
+
     def test_json_data(self):
         resp = InvokeMethodResponse(data=b'{ "status": "ok" }', content_type='application/json')
         self.assertEqual({'status': 'ok'}, resp.json())
@@ -119,6 +139,10 @@ class StateResponseTests(unittest.TestCase):
     def test_json_data(self):
         resp = StateResponse(data=b'{"status": "ok"}')
         self.assertEqual({'status': 'ok'}, resp.json())
+        self.assertIs(resp.json(), resp.json())
+
+        resp.data = b'{"status": "changed"}'
+        self.assertEqual({'status': 'changed'}, resp.json())
 
 
 class BulkStateItemTests(unittest.TestCase):
@@ -126,6 +150,42 @@ class BulkStateItemTests(unittest.TestCase):
         item = BulkStateItem(key='item1', data=b'{ "status": "ok" }')
         self.assertEqual({'status': 'ok'}, item.json())
 
+    def test_from_proto(self):
+        message = api_v1.BulkStateItem(key='item1', data=b'{"status": "ok"}', etag='1')
+        item = BulkStateItem.from_proto(message)
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertEqual('item1', item.key)
+        self.assertEqual(b'{"status": "ok"}', item.data)
+        self.assertEqual('1', item.etag)
+        self.assertEqual('', item.error)
+        self.assertIs(item.json(), item.json())
+
+
+class BulkStatesResponseTests(unittest.TestCase):
+    def test_items_are_created_on_access(self):
+        response = api_v1.GetBulkStateResponse(
+            items=[api_v1.BulkStateItem(key=f'key{i}', data=b'"value"') for i in range(5)]
+        )
+        cached = BulkStateItem(key='cached', data=b'"cached"')
+        resp = BulkStatesResponse(items=list(response.items) + [cached])
+
+        self.assertEqual(6, len(resp.items))
+        self.assertIs(resp.items[1], resp.items[1])
+        self.assertIs(cached, resp.items[-1])
+        self.assertEqual(['key3', 'key4'], [item.key for item in resp.items[3:5]])
+        self.assertEqual([f'key{i}' for i in range(5)] + ['cached'], [i.key for i in resp.items])
+        with self.assertRaises(IndexError):
+            resp.items[6]
+
+    def test_query_results(self):
+        response = api_v1.QueryStateResponse(
+            results=[api_v1.QueryStateItem(key='key', data=b'{"a": 1}')], token='2'
+        )
+        resp = QueryResponse(results=response.results, token=response.token)
+        self.assertEqual('key', resp.results[0].key)
+        self.assertEqual({'a': 1}, resp.results[0].json())
+        self.assertEqual('2', resp.token)
+
 
 if __name__ == '__main__':
     unittest.main()
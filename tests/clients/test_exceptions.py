@@ -1,9 +1,12 @@
 import unittest
 
+from unittest import mock
+
 import grpc
 from google.rpc import error_details_pb2, status_pb2, code_pb2
 from google.protobuf.any_pb2 import Any
 from google.protobuf.duration_pb2 import Duration
+from grpc_status import rpc_status
 
 from dapr.clients import DaprGrpcClient
 from dapr.clients.exceptions import DaprGrpcError
@@ -216,3 +219,21 @@ class DaprExceptionsTestCase(unittest.TestCase):
         dapr_error = context.exception
 
         self.assertEqual(dapr_error.error_code(), 'UNKNOWN')
+
+    def test_details_are_parsed_lazily(self):
+        dapr = DaprGrpcClient(f'localhost:{self._grpc_port}')
+
+        self._fake_dapr_server.raise_exception_on_next_call(self._expected_status)
+        with mock.patch(
+            'dapr.clients.exceptions.rpc_status.from_call', wraps=rpc_status.from_call
+        ) as from_call:
+            with self.assertRaises(DaprGrpcError) as context:
+                dapr.get_metadata()
+            dapr_error = context.exception
+            self.assertEqual(grpc.StatusCode.INTERNAL, dapr_error.code())
+            from_call.assert_not_called()
+
+            self.assertEqual('DAPR_ERROR_CODE', dapr_error.error_code())
+            self.assertEqual('5s', dapr_error.status_details().retry_info['retry_delay'])
+            dapr_error.json()
+            from_call.assert_called_once()
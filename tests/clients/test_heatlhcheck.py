@@ -12,6 +12,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import asyncio
 import time
 import unittest
 from unittest.mock import patch, MagicMock
@@ -22,6 +23,12 @@ from dapr.version import __version__
 
 
 class DaprHealthCheckTests(unittest.TestCase):
+    def setUp(self):
+        DaprHealth.reset()
+
+    def tearDown(self):
+        DaprHealth.reset()
+
     @patch.object(settings, 'DAPR_HTTP_ENDPOINT', 'http://domain.com:3500')
     @patch('urllib.request.urlopen')
     def test_wait_until_ready_success(self, mock_urlopen):
@@ -74,3 +81,67 @@ class DaprHealthCheckTests(unittest.TestCase):
 
         self.assertGreaterEqual(time.time() - start, 2.5)
         self.assertGreater(mock_urlopen.call_count, 1)
+
+    @patch.object(settings, 'DAPR_HTTP_ENDPOINT', 'http://domain.com:3500')
+    @patch('urllib.request.urlopen')
+    def test_wait_until_ready_is_cached(self, mock_urlopen):
+        mock_urlopen.return_value.__enter__.return_value = MagicMock(status=200)
+
+        self.assertFalse(DaprHealth.is_ready())
+        for _ in range(50):
+            DaprHealth.wait_until_ready()
+
+        self.assertTrue(DaprHealth.is_ready())
+        mock_urlopen.assert_called_once()
+
+    @patch.object(settings, 'DAPR_HEALTH_TIMEOUT', '10')
+    @patch('urllib.request.urlopen')
+    def test_wait_until_ready_backs_off(self, mock_urlopen):
+        responses = [MagicMock(status=500)] * 3 + [MagicMock(status=200)]
+        mock_urlopen.return_value.__enter__.side_effect = responses
+
+        start = time.time()
+        DaprHealth.wait_until_ready()
+
+        # 0.05 + 0.1 + 0.2 seconds between the four checks
+        self.assertEqual(4, mock_urlopen.call_count)
+        self.assertGreaterEqual(time.time() - start, 0.35)
+        self.assertLess(time.time() - start, 2)
+
+    @patch.object(settings, 'DAPR_HTTP_ENDPOINT', 'http://domain.com:3500')
+    @patch('urllib.request.urlopen')
+    def test_wait_until_ready_async(self, mock_urlopen):
+        mock_urlopen.return_value.__enter__.side_effect = [
+            MagicMock(status=500),
+            MagicMock(status=200),
+        ]
+
+        async def wait():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.ensure_future(tick())
+            await DaprHealth.wait_until_ready_async()
+            ticker.cancel()
+            return ticks
+
+        # the event loop kept running while the sidecar was checked
+        self.assertGreater(asyncio.run(wait()), 1)
+        self.assertTrue(DaprHealth.is_ready())
+
+        asyncio.run(DaprHealth.wait_until_ready_async())
+        self.assertEqual(2, mock_urlopen.call_count)
+
+    @patch.object(settings, 'DAPR_HEALTH_TIMEOUT', '0.5')
+    @patch('urllib.request.urlopen')
+    def test_wait_until_ready_async_timeout(self, mock_urlopen):
+        mock_urlopen.return_value.__enter__.return_value = MagicMock(status=500)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(DaprHealth.wait_until_ready_async())
+        self.assertFalse(DaprHealth.is_ready())
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import unittest
+
+from concurrent.futures import Future
+
+from grpc import RpcError
+
+from dapr.clients.grpc._hedging import HedgingPolicy, hedged_call
+
+
+class FakeMultiCallable:
+    """Hands out futures, which ``on_send`` completes as the test needs."""
+
+    def __init__(self, on_send):
+        self.futures = []
+        self._on_send = on_send
+
+    def future(self, request, metadata=None, timeout=None):
+        future = Future()
+        self.futures.append(future)
+        self._on_send(self.futures)
+        return future
+
+
+class HedgingPolicyTests(unittest.TestCase):
+    def test_fixed_delay(self):
+        policy = HedgingPolicy(delay_seconds=0.2)
+        for _ in range(50):
+            policy.on_success('GetState', 5.0, False)
+        self.assertEqual(0.2, policy.delay('GetState'))
+
+    def test_adaptive_delay(self):
+        policy = HedgingPolicy(min_samples=20, max_delay_seconds=1.0, min_delay_seconds=0.001)
+        self.assertEqual(1.0, policy.delay('GetState'))
+
+        for i in range(1, 101):
+            policy.on_success('GetState', i / 1000, False)
+        self.assertAlmostEqual(0.095, policy.delay('GetState'))
+        # the delay is kept per method
+        self.assertEqual(1.0, policy.delay('GetSecret'))
+
+    def test_adaptive_delay_is_clamped(self):
+        policy = HedgingPolicy(min_samples=1, min_delay_seconds=0.01, max_delay_seconds=0.5)
+        policy.on_success('GetState', 0.0001, False)
+        self.assertEqual(0.01, policy.delay('GetState'))
+
+    def test_budget(self):
+        policy = HedgingPolicy(max_hedge_ratio=0.5, budget_max_tokens=2)
+        self.assertTrue(policy.try_hedge())
+        self.assertTrue(policy.try_hedge())
+        self.assertFalse(policy.try_hedge())
+
+        policy.on_call()
+        policy.on_call()
+        self.assertTrue(policy.try_hedge())
+        self.assertEqual(
+            {'calls': 2, 'hedges': 3, 'hedge_wins': 0, 'throttled': 1}, policy.counters()
+        )
+
+    def test_applies_to(self):
+        policy = HedgingPolicy()
+        self.assertTrue(policy.applies_to('GetState'))
+        self.assertFalse(policy.applies_to('SaveState'))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            HedgingPolicy(delay_seconds=-1)
+        with self.assertRaises(ValueError):
+            HedgingPolicy(percentile=0)
+        with self.assertRaises(ValueError):
+            HedgingPolicy(max_hedge_ratio=-0.1)
+
+
+class HedgedCallTests(unittest.TestCase):
+    def test_fast_call_is_not_hedged(self):
+        policy = HedgingPolicy(delay_seconds=1)
+        multicallable = FakeMultiCallable(lambda futures: futures[-1].set_result('first'))
+
+        response, call = hedged_call(policy, 'GetState', multicallable, 'request')
+        self.assertEqual('first', response)
+        self.assertEqual(1, len(multicallable.futures))
+        self.assertEqual(0, policy.hedges)
+
+    def test_hedge_wins_and_first_call_is_cancelled(self):
+        def on_send(futures):
+            if len(futures) == 2:
+                futures[1].set_result('hedge')
+
+        policy = HedgingPolicy(delay_seconds=0.01)
+        multicallable = FakeMultiCallable(on_send)
+
+        response, call = hedged_call(policy, 'GetState', multicallable, 'request')
+        self.assertEqual('hedge', response)
+        self.assertTrue(multicallable.futures[0].cancelled())
+        self.assertEqual(1, policy.hedge_wins)
+
+    def test_failed_hedge_leaves_first_call_to_win(self):
+        def on_send(futures):
+            if len(futures) == 2:
+                futures[1].set_exception(RpcError())
+                futures[0].set_result('first')
+
+        policy = HedgingPolicy(delay_seconds=0.01)
+        multicallable = FakeMultiCallable(on_send)
+
+        response, call = hedged_call(policy, 'GetState', multicallable, 'request')
+        self.assertEqual('first', response)
+        self.assertIs(multicallable.futures[0], call)
+        self.assertEqual(0, policy.hedge_wins)
+
+    def test_every_call_failed(self):
+        def on_send(futures):
+            if len(futures) == 2:
+                futures[0].set_exception(RpcError())
+                futures[1].set_exception(RpcError())
+
+        policy = HedgingPolicy(delay_seconds=0.01)
+        multicallable = FakeMultiCallable(on_send)
+
+        with self.assertRaises(RpcError):
+            hedged_call(policy, 'GetState', multicallable, 'request')
+
+    def test_throttled_call_is_not_hedged(self):
+        policy = HedgingPolicy(delay_seconds=0.01, budget_max_tokens=0)
+        multicallable = FakeMultiCallable(lambda futures: None)
+        timer = threading.Timer(0.05, lambda: multicallable.futures[0].set_result('first'))
+        timer.start()
+
+        response, call = hedged_call(policy, 'GetState', multicallable, 'request')
+        timer.join()
+        self.assertEqual('first', response)
+        self.assertEqual(1, len(multicallable.futures))
+        self.assertEqual(1, policy.throttled)
+
+
+if __name__ == '__main__':
+    unittest.main()
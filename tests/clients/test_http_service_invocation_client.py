@@ -13,7 +13,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import json
+import threading
+import time
 import typing
 import unittest
 from asyncio import TimeoutError
@@ -26,6 +29,7 @@ from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapProp
 
 
 from dapr.clients.exceptions import DaprInternalError
+from dapr.clients.http.dapr_invocation_http_client import DaprInvocationHttpClient
 from dapr.conf import settings
 from dapr.proto import common_v1
 
@@ -58,6 +62,9 @@ class DaprInvocationHttpClientTests(unittest.TestCase):
         self.server.reset()
         self.client = DaprClient()
 
+    def tearDown(self):
+        self.client.close()
+
     def test_basic_invoke(self):
         self.server.set_response(b'STRING_BODY')
 
@@ -69,16 +76,173 @@ class DaprInvocationHttpClientTests(unittest.TestCase):
     def test_coroutine_basic_invoke(self):
         self.server.set_response(b'STRING_BODY')
 
-        import asyncio
-
         loop = asyncio.new_event_loop()
         response = loop.run_until_complete(
             self.client.invoke_method_async(self.app_id, self.method_name, '')
         )
+        loop.run_until_complete(self.client.invocation_client.close())
+        loop.close()
 
         self.assertEqual(b'STRING_BODY', response.data)
         self.assertEqual(self.invoke_url, self.server.request_path())
 
+    def test_coroutine_invoke_reuses_connection(self):
+        self.server.set_response(b'STRING_BODY')
+        connections_before = self.server.get_connection_count()
+
+        async def invoke_twice():
+            await self.client.invoke_method_async(self.app_id, self.method_name, '')
+            await self.client.invoke_method_async(self.app_id, self.method_name, '')
+            await self.client.invocation_client.close()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(invoke_twice())
+        loop.close()
+
+        self.assertEqual(1, self.server.get_connection_count() - connections_before)
+
+    def test_coroutine_invoke_reuses_connection_after_error_response(self):
+        connections_before = self.server.get_connection_count()
+
+        async def fail_then_succeed():
+            self.server.set_response(b'{"errorCode":"ERR","message":"error"}', 500)
+            with self.assertRaises(DaprInternalError):
+                await self.client.invoke_method_async(self.app_id, self.method_name, '')
+            self.server.set_response(b'STRING_BODY')
+            response = await self.client.invoke_method_async(self.app_id, self.method_name, '')
+            await self.client.invocation_client.close()
+            return response
+
+        loop = asyncio.new_event_loop()
+        response = loop.run_until_complete(fail_then_succeed())
+        loop.close()
+
+        self.assertEqual(b'STRING_BODY', response.data)
+        self.assertEqual(1, self.server.get_connection_count() - connections_before)
+
+    def test_async_context_manager_releases_connections(self):
+        self.server.set_response(b'STRING_BODY')
+        self._wait_for_open_connections(0)
+        invocation_client = DaprInvocationHttpClient()
+
+        async def invoke():
+            async with invocation_client:
+                await invocation_client.invoke_method_async(self.app_id, self.method_name, '')
+                self.assertEqual(1, self.server.get_open_connection_count())
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(invoke())
+        loop.close()
+
+        self._wait_for_open_connections(0)
+        self.assertEqual(0, self.server.get_open_connection_count())
+
+    def test_coroutine_invoke_on_different_loops_uses_separate_connections(self):
+        self.server.set_response(b'STRING_BODY')
+        connections_before = self.server.get_connection_count()
+        invoke = self.client.invoke_method_async
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(invoke(self.app_id, self.method_name, ''))
+        second = second_loop.run_until_complete(invoke(self.app_id, self.method_name, ''))
+        second_loop.run_until_complete(self.client.invocation_client.close())
+        first_loop.close()
+        second_loop.close()
+
+        self.assertEqual(b'STRING_BODY', first.data)
+        self.assertEqual(b'STRING_BODY', second.data)
+        self.assertEqual(2, self.server.get_connection_count() - connections_before)
+
+    def test_connections_of_closed_loop_are_released(self):
+        self.server.set_response(b'STRING_BODY')
+        self._wait_for_open_connections(0)
+        invoke = self.client.invoke_method_async
+
+        stale_loop = asyncio.new_event_loop()
+        stale_loop.run_until_complete(invoke(self.app_id, self.method_name, ''))
+        stale_loop.close()
+        self.assertEqual(1, self.server.get_open_connection_count())
+
+        loop = asyncio.new_event_loop()
+        response = loop.run_until_complete(invoke(self.app_id, self.method_name, ''))
+        loop.run_until_complete(self.client.invocation_client.close())
+        loop.close()
+
+        self.assertEqual(b'STRING_BODY', response.data)
+        self._wait_for_open_connections(0)
+        self.assertEqual(0, self.server.get_open_connection_count())
+
+    def test_sync_invoke_after_coroutine_invoke(self):
+        self.server.set_response(b'STRING_BODY')
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.client.invoke_method_async(self.app_id, self.method_name, ''))
+
+        response = self.client.invoke_method(self.app_id, self.method_name, '')
+        loop.run_until_complete(self.client.invocation_client.close())
+        loop.close()
+
+        self.assertEqual(b'STRING_BODY', response.data)
+
+    def test_sync_invoke_reuses_connection(self):
+        self.server.set_response(b'STRING_BODY')
+        connections_before = self.server.get_connection_count()
+
+        for _ in range(3):
+            response = self.client.invoke_method(self.app_id, self.method_name, '')
+            self.assertEqual(b'STRING_BODY', response.data)
+
+        self.assertEqual(1, self.server.get_connection_count() - connections_before)
+
+    def test_sync_invoke_from_many_threads(self):
+        self.server.set_response(b'STRING_BODY')
+        connections_before = self.server.get_connection_count()
+        thread_count = 8
+        responses = []
+
+        def invoke():
+            for _ in range(5):
+                responses.append(self.client.invoke_method(self.app_id, self.method_name, ''))
+
+        threads = [threading.Thread(target=invoke) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(thread_count * 5, len(responses))
+        self.assertTrue(all(r.data == b'STRING_BODY' for r in responses))
+        self.assertLessEqual(self.server.get_connection_count() - connections_before, thread_count)
+
+    def test_sync_invoke_inside_running_loop(self):
+        self.server.set_response(b'STRING_BODY')
+
+        async def invoke():
+            return self.client.invoke_method(self.app_id, self.method_name, '')
+
+        loop = asyncio.new_event_loop()
+        response = loop.run_until_complete(invoke())
+        loop.close()
+
+        self.assertEqual(b'STRING_BODY', response.data)
+
+    def test_close_releases_sync_invoke_connections(self):
+        self.server.set_response(b'STRING_BODY')
+        self._wait_for_open_connections(0)
+
+        self.client.invoke_method(self.app_id, self.method_name, '')
+        self.assertEqual(1, self.server.get_open_connection_count())
+        self.client.close()
+
+        self._wait_for_open_connections(0)
+        self.assertEqual(0, self.server.get_open_connection_count())
+        self.assertNotIn('dapr-http-invocation', [thread.name for thread in threading.enumerate()])
+
+        # The invocation client restarts its loop when used again
+        response = self.client.invoke_method(self.app_id, self.method_name, '')
+        self.assertEqual(b'STRING_BODY', response.data)
+
     def test_invoke_PUT_with_body(self):
         self.server.set_response(b'STRING_BODY')
 
@@ -234,6 +398,11 @@ class DaprInvocationHttpClientTests(unittest.TestCase):
             )
         self.assertEqual(expected_msg, str(ctx.exception))
 
+    def _wait_for_open_connections(self, expected, timeout=2.0):
+        deadline = time.time() + timeout
+        while self.server.get_open_connection_count() != expected and time.time() < deadline:
+            time.sleep(0.01)
+
     def test_generic_client_unknown_protocol(self):
         settings.DAPR_API_METHOD_INVOCATION_PROTOCOL = 'unknown'
 
@@ -314,6 +483,7 @@ class DaprInvocationHttpClientTests(unittest.TestCase):
         self.server.set_server_delay(1.5)
         with self.assertRaises(TimeoutError):
             new_client.invoke_method(self.app_id, self.method_name, '')
+        new_client.close()
 
     def test_global_timeout_setting_is_honored(self):
         previous_timeout = settings.DAPR_HTTP_TIMEOUT_SECONDS
@@ -322,5 +492,6 @@ class DaprInvocationHttpClientTests(unittest.TestCase):
         self.server.set_server_delay(1.5)
         with self.assertRaises(TimeoutError):
             new_client.invoke_method(self.app_id, self.method_name, '')
+        new_client.close()
 
         settings.DAPR_HTTP_TIMEOUT_SECONDS = previous_timeout
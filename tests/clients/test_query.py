@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import time
+import unittest
+
+from dapr.clients.grpc._query import (
+    DEFAULT_QUERY_PAGE_SIZE,
+    iter_query,
+    page_query,
+    parse_paged_query,
+    split,
+)
+from dapr.clients.grpc._response import QueryResponse, QueryResponseItem
+
+
+class FakePages:
+    """Serves ``total`` items in pages, recording the queries it receives."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.queries = []
+
+    def __call__(self, query: str) -> QueryResponse:
+        parsed = json.loads(query)
+        self.queries.append(parsed)
+        start = int(parsed['page'].get('token', '0'))
+        end = min(start + parsed['page']['limit'], self.total)
+        return QueryResponse(
+            results=[QueryResponseItem(str(i), b'%d' % i) for i in range(start, end)],
+            token=str(end) if end < self.total else '',
+        )
+
+
+class QueryTests(unittest.TestCase):
+    def test_parse_paged_query(self):
+        self.assertEqual(
+            parse_paged_query('{"filter": {}}')['page'], {'limit': DEFAULT_QUERY_PAGE_SIZE}
+        )
+        self.assertEqual(parse_paged_query('{"page": {"limit": 5}}')['page'], {'limit': 5})
+        self.assertEqual(parse_paged_query('{"page": {"limit": 5}}', 7)['page'], {'limit': 7})
+        with self.assertRaises(ValueError):
+            parse_paged_query('[]')
+        with self.assertRaises(ValueError):
+            parse_paged_query('{}', -1)
+
+    def test_page_query(self):
+        query = parse_paged_query('{"filter": {}}', 2)
+        self.assertEqual(json.loads(page_query(query, 'abc'))['page'], {'limit': 2, 'token': 'abc'})
+        # the parsed query is reused for every page
+        self.assertNotIn('token', query['page'])
+
+    def test_split(self):
+        self.assertEqual(split([1, 2, 3, 4, 5], 2), [[1, 2, 3], [4, 5]])
+        self.assertEqual(split([1], 4), [[1]])
+        self.assertEqual(split([], 4), [])
+
+    def test_iter_query(self):
+        fetch = FakePages(25)
+        items = list(iter_query(fetch, parse_paged_query('{}', 10)))
+
+        self.assertEqual([item.key for item in items], [str(i) for i in range(25)])
+        self.assertEqual([q['page'].get('token') for q in fetch.queries], [None, '10', '20'])
+
+    def test_iter_query_prefetches_one_page(self):
+        fetch = FakePages(100)
+        items = iter_query(fetch, parse_paged_query('{}', 10))
+
+        next(items)
+        for _ in range(100):
+            if len(fetch.queries) == 2:
+                break
+            time.sleep(0.01)
+        # the second page is fetched ahead of time, but no further
+        self.assertEqual(len(fetch.queries), 2)
+        items.close()
+
+    def test_iter_query_decode(self):
+        fetch = FakePages(7)
+        values = iter_query(
+            fetch, parse_paged_query('{}', 3), decode=lambda item: item.json(), decode_workers=2
+        )
+        self.assertEqual(list(values), list(range(7)))
+
+    def test_iter_query_stops_on_repeated_token(self):
+        def fetch(query):
+            return QueryResponse(results=[QueryResponseItem('1', b'')], token='1')
+
+        self.assertEqual(len(list(iter_query(fetch, parse_paged_query('{}'), prefetch=False))), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
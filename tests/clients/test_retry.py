@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from google.protobuf.any_pb2 import Any
+from google.protobuf.duration_pb2 import Duration
+from google.rpc import code_pb2, error_details_pb2, status_pb2
+from grpc import RpcError, StatusCode
+
+from dapr.clients.grpc._retry import RetryPolicy
+
+GET_STATE = '/dapr.proto.runtime.v1.Dapr/GetState'
+PUBLISH_EVENT = '/dapr.proto.runtime.v1.Dapr/PublishEvent'
+
+
+class FakeRpcError(RpcError):
+    def __init__(self, code: StatusCode, retry_delay: Duration = None):
+        self._code = code
+        self._trailing_metadata = ()
+        if retry_delay is not None:
+            detail = Any()
+            detail.Pack(error_details_pb2.RetryInfo(retry_delay=retry_delay))
+            status = status_pb2.Status(code=code.value[0], message='busy', details=[detail])
+            self._trailing_metadata = (('grpc-status-details-bin', status.SerializeToString()),)
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return 'busy'
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+
+def no_jitter(low, high):
+    return (low + high) / 2
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(
+            max_attempts=4, initial_backoff_seconds=0.1, max_backoff_seconds=0.3, jitter=0.5
+        )
+        policy._random_uniform = no_jitter
+        err = FakeRpcError(StatusCode.UNAVAILABLE)
+
+        self.assertAlmostEqual(0.1, policy.on_failure(GET_STATE, err, 1))
+        self.assertAlmostEqual(0.2, policy.on_failure(GET_STATE, err, 2))
+        self.assertAlmostEqual(0.3, policy.on_failure(GET_STATE, err, 3))
+        self.assertIsNone(policy.on_failure(GET_STATE, err, 4))
+        self.assertEqual(
+            {'attempts': 4, 'retries': 3, 'exhausted': 1, 'throttled': 0}, policy.counters()
+        )
+
+    def test_jitter(self):
+        policy = RetryPolicy(initial_backoff_seconds=1.0, jitter=0.2)
+        delays = [policy.on_failure(GET_STATE, FakeRpcError(StatusCode.UNAVAILABLE), 1)]
+        policy = RetryPolicy(initial_backoff_seconds=1.0, jitter=0.2)
+        delays.append(policy.on_failure(GET_STATE, FakeRpcError(StatusCode.UNAVAILABLE), 1))
+        for delay in delays:
+            self.assertGreaterEqual(delay, 0.8)
+            self.assertLessEqual(delay, 1.2)
+
+    def test_server_delay(self):
+        policy = RetryPolicy(initial_backoff_seconds=0.1)
+        err = FakeRpcError(StatusCode.RESOURCE_EXHAUSTED, Duration(seconds=2, nanos=500000000))
+        self.assertEqual(2.5, policy.on_failure(GET_STATE, err, 1))
+
+    def test_deadline(self):
+        policy = RetryPolicy(initial_backoff_seconds=1.0, jitter=0)
+        err = FakeRpcError(StatusCode.UNAVAILABLE)
+        self.assertIsNone(policy.on_failure(GET_STATE, err, 1, remaining=0.5))
+        self.assertEqual(1.0, policy.on_failure(GET_STATE, err, 1, remaining=5))
+
+    def test_not_retried(self):
+        policy = RetryPolicy()
+        self.assertIsNone(policy.on_failure(GET_STATE, FakeRpcError(StatusCode.NOT_FOUND), 1))
+        self.assertIsNone(policy.on_failure(PUBLISH_EVENT, FakeRpcError(StatusCode.UNAVAILABLE), 1))
+        self.assertEqual(0, policy.retries)
+
+        policy = RetryPolicy(retry_non_idempotent=True)
+        self.assertIsNotNone(
+            policy.on_failure(PUBLISH_EVENT.encode(), FakeRpcError(StatusCode.UNAVAILABLE), 1)
+        )
+
+        policy = RetryPolicy(idempotent_methods=['PublishEvent'])
+        self.assertTrue(policy.is_idempotent(PUBLISH_EVENT))
+        self.assertFalse(policy.is_idempotent(GET_STATE))
+
+    def test_budget(self):
+        policy = RetryPolicy(max_attempts=2, budget_max_tokens=4, budget_token_ratio=0.5)
+        err = FakeRpcError(StatusCode.UNAVAILABLE)
+
+        self.assertIsNotNone(policy.on_failure(GET_STATE, err, 1))
+        # the second failure leaves half of the tokens, so retries stop
+        self.assertIsNone(policy.on_failure(GET_STATE, err, 1))
+        self.assertEqual(1, policy.throttled)
+
+        # successful calls refill the budget
+        for _ in range(3):
+            policy.on_success()
+        self.assertIsNotNone(policy.on_failure(GET_STATE, err, 1))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter=2)
+
+
+def unavailable_status(retry_delay: Duration = None) -> status_pb2.Status:
+    details = []
+    if retry_delay is not None:
+        detail = Any()
+        detail.Pack(error_details_pb2.RetryInfo(retry_delay=retry_delay))
+        details.append(detail)
+    return status_pb2.Status(code=code_pb2.UNAVAILABLE, message='unavailable', details=details)
+
+
+if __name__ == '__main__':
+    unittest.main()
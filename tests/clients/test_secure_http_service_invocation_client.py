@@ -34,11 +34,7 @@ from .fake_http_server import FakeHttpServer
 from .test_http_service_invocation_client import DaprInvocationHttpClientTests
 
 
-def replacement_get_client_ssl_context(a):
-    """
-    This method is used (overwritten) from tests
-    to return context for self-signed certificates
-    """
+def _create_client_ssl_context():
     context = ssl.create_default_context()
     context.check_hostname = False
     context.verify_mode = ssl.CERT_NONE
@@ -46,6 +42,18 @@ def replacement_get_client_ssl_context(a):
     return context
 
 
+_client_ssl_context = _create_client_ssl_context()
+
+
+def replacement_get_client_ssl_context(a):
+    """
+    This method is used (overwritten) from tests
+    to return context for self-signed certificates
+    """
+    # Pooled connections are keyed by ssl context, so return the same one for every request.
+    return _client_ssl_context
+
+
 DaprHttpClient.get_ssl_context = replacement_get_client_ssl_context
 DaprGrpcClient.get_credentials = replacement_get_credentials_func
 DaprHealth.get_ssl_context = replacement_get_health_context
@@ -90,6 +98,7 @@ class DaprSecureInvocationHttpClientTests(DaprInvocationHttpClientTests):
         self.server.set_server_delay(1.5)
         with self.assertRaises(TimeoutError):
             new_client.invoke_method(self.app_id, self.method_name, '')
+        new_client.close()
 
         settings.DAPR_HTTP_TIMEOUT_SECONDS = previous_timeout
 
@@ -139,3 +148,4 @@ class DaprSecureInvocationHttpClientTests(DaprInvocationHttpClientTests):
         self.server.set_server_delay(1.5)
         with self.assertRaises(TimeoutError):
             new_client.invoke_method(self.app_id, self.method_name, '')
+        new_client.close()
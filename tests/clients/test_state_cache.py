@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import unittest
+
+from datetime import datetime, timedelta, timezone
+
+from dapr.clients.grpc._response import BulkStateItem
+from dapr.clients.grpc._state_cache import StateCache, merge_bulk_state
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class StateCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = StateCache(max_entries=2, ttl_seconds=10, clock=self.clock)
+
+    def put(self, key, data=b'value', metadata=None, response_metadata=None):
+        self.cache.put(
+            'store', key, metadata, data, 'etag', self.cache.generation, response_metadata
+        )
+
+    def test_hit_and_miss_counters(self):
+        self.assertIsNone(self.cache.get('store', 'key'))
+        self.put('key')
+        self.assertEqual((b'value', 'etag'), self.cache.get('store', 'key'))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_metadata_is_part_of_the_key(self):
+        self.put('key', b'upper', metadata={'upper': '1'})
+        self.assertIsNone(self.cache.get('store', 'key'))
+        self.assertEqual((b'upper', 'etag'), self.cache.get('store', 'key', {'upper': '1'}))
+
+    def test_ttl_expiry(self):
+        self.put('key')
+        self.clock.now += 10
+        self.assertIsNone(self.cache.get('store', 'key'))
+        self.assertEqual(0, len(self.cache))
+
+    def test_lru_eviction(self):
+        self.put('a')
+        self.put('b')
+        self.cache.get('store', 'a')
+        self.put('c')
+        self.assertEqual(1, self.cache.evictions)
+        self.assertIsNone(self.cache.get('store', 'b'))
+        self.assertIsNotNone(self.cache.get('store', 'a'))
+        self.assertIsNotNone(self.cache.get('store', 'c'))
+
+    def test_invalidate_drops_all_variants(self):
+        self.put('key')
+        self.put('key', metadata={'upper': '1'})
+        self.cache.invalidate('store', 'key')
+        self.assertEqual(0, len(self.cache))
+
+    def test_read_started_before_write_is_not_cached(self):
+        generation = self.cache.generation
+        self.cache.invalidate('store', 'key')
+        self.cache.put('store', 'key', None, b'stale', 'etag', generation)
+        self.assertIsNone(self.cache.get('store', 'key'))
+
+        self.put('key', b'fresh')
+        self.assertEqual((b'fresh', 'etag'), self.cache.get('store', 'key'))
+
+    def test_forgotten_writes_still_reject_older_reads(self):
+        generation = self.cache.generation
+        for key in ('a', 'b', 'c'):
+            self.cache.invalidate('store', key)
+        self.cache.put('store', 'a', None, b'stale', 'etag', generation)
+        self.assertIsNone(self.cache.get('store', 'a'))
+
+    def test_honors_ttl_in_seconds_of_own_writes(self):
+        self.cache.invalidate('store', 'key', {'ttlInSeconds': '2'})
+        self.put('key')
+        self.clock.now += 2
+        self.assertIsNone(self.cache.get('store', 'key'))
+
+    def test_honors_ttl_expire_time(self):
+        expire_time = datetime.now(timezone.utc) + timedelta(seconds=3)
+        self.put('key', response_metadata={'ttlExpireTime': expire_time.isoformat()})
+        self.clock.now += 4
+        self.assertIsNone(self.cache.get('store', 'key'))
+
+    def test_state_ttl_ignored_when_disabled(self):
+        cache = StateCache(ttl_seconds=None, honor_state_ttl=False, clock=self.clock)
+        cache.invalidate('store', 'key', {'ttlInSeconds': '2'})
+        cache.put('store', 'key', None, b'value', 'etag', cache.generation)
+        self.clock.now += 1000
+        self.assertIsNotNone(cache.get('store', 'key'))
+
+    def test_clear(self):
+        generation = self.cache.generation
+        self.put('key')
+        self.cache.clear()
+        self.cache.put('store', 'key', None, b'stale', 'etag', generation)
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            StateCache(max_entries=0)
+
+    def test_merge_bulk_state(self):
+        items = merge_bulk_state(
+            ['a', 'b', 'c'],
+            {'b': (b'cached', 'etag')},
+            [BulkStateItem('c', b'c'), BulkStateItem('a', b'a')],
+        )
+        self.assertEqual(['a', 'b', 'c'], [item.key for item in items])
+        self.assertEqual(b'cached', items[1].data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,8 +16,25 @@ limitations under the License.
 import unittest
 import datetime
 
+from unittest import mock
+
 from dapr.serializers.json import DefaultJSONSerializer
 
+# Documents decoded by the fast path and by DaprJSONDecoder in the parity tests
+DECODE_CORPUS = [
+    b'{"propertyDecimal":10,"propertyStr":"StrValue","propertyDateTime":"2020-01-01T01:00:00Z"}',
+    b'{"callback":"timer_callback","data":{"d":"2021-03-04"},"dueTime":"0h0m1s","period":"1h"}',
+    b'{"2020-01-01":"key is not converted","nested":[["1h2m3s", "12ms", "5us", "3\\u03bcs"]]}',
+    b'["", "0", "123", "1x", "2020/01/02", "99999-99", "\\u0661\\u0662", null, true, 1.5e3]',
+    b'{"big":123456789012345678901234567890,"nan":NaN,"inf":-Infinity,"emoji":"\\ud83d\\ude00"}',
+    b'"2021-12-25T10:00:00+09:00"',
+    b'"4h15m50s123ms345\\u03bcs"',
+    b'"plain"',
+    b'42',
+    '{"text":"\u00e9t\u00e9","unicode":"été"}'.encode('utf-16'),
+    '{"str input":"10m"}',
+]
+
 
 class DefaultJSONSerializerTests(unittest.TestCase):
     def test_serialize(self):
@@ -77,6 +94,33 @@ class DefaultJSONSerializerTests(unittest.TestCase):
             ),
         )
 
+    def test_fast_decode_matches_decoder(self):
+        slow = DefaultJSONSerializer(fast_decode=False)
+        fast = DefaultJSONSerializer()
+        for payload in DECODE_CORPUS:
+            with self.subTest(payload=payload):
+                self.assertEqual(repr(slow.deserialize(payload)), repr(fast.deserialize(payload)))
+
+    def test_fast_decode_without_orjson_matches_decoder(self):
+        slow = DefaultJSONSerializer(fast_decode=False)
+        fast = DefaultJSONSerializer()
+        with mock.patch('dapr.serializers.json.orjson', None):
+            for payload in DECODE_CORPUS:
+                with self.subTest(payload=payload):
+                    self.assertEqual(
+                        repr(slow.deserialize(payload)), repr(fast.deserialize(payload))
+                    )
+
+    def test_deserialize_without_dapr_types(self):
+        serializer = DefaultJSONSerializer(decode_dapr_types=False)
+        obj = serializer.deserialize(b'{"date":"2020-01-01T01:00:00Z","duration":"1h"}')
+        self.assertEqual({'date': '2020-01-01T01:00:00Z', 'duration': '1h'}, obj)
+
+    def test_deserialize_invalid_json(self):
+        for serializer in (DefaultJSONSerializer(), DefaultJSONSerializer(fast_decode=False)):
+            with self.assertRaises(ValueError):
+                serializer.deserialize(b'{"unterminated":')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import datetime
+import unittest
+
+from dapr.serializers import DefaultJSONSerializer, MessagePackSerializer
+from dapr.serializers import messagepack
+
+
+@unittest.skipIf(messagepack.msgpack is None, 'msgpack is not installed')
+class MessagePackSerializerTests(unittest.TestCase):
+    def test_round_trip(self):
+        serializer = MessagePackSerializer()
+        obj = {
+            'int': 10,
+            'str': '2020-01-01',
+            'bytes': b'\x00\x01binary',
+            'datetime': datetime.datetime(2020, 1, 1, 1, tzinfo=datetime.timezone.utc),
+            'naive': datetime.datetime(2020, 1, 1, 1, 2, 3, 456789),
+            'date': datetime.date(2021, 5, 6),
+            'duration': datetime.timedelta(days=-1, hours=2, microseconds=7),
+            'list': [1.5, None, True],
+        }
+
+        self.assertEqual(obj, serializer.deserialize(serializer.serialize(obj)))
+
+    def test_smaller_than_json(self):
+        obj = {'payload': b'x' * 300, 'when': datetime.datetime(2020, 1, 1)}
+        packed = MessagePackSerializer().serialize(obj)
+        self.assertLess(len(packed), len(DefaultJSONSerializer().serialize(obj)))
+
+    def test_custom_hook(self):
+        serializer = MessagePackSerializer()
+        data = serializer.serialize(object(), custom_hook=lambda o: {'custom': True})
+        self.assertTrue(serializer.deserialize(data, custom_hook=lambda o: o['custom']))
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            MessagePackSerializer().serialize(object())
+
+    def test_deserialize_requires_bytes(self):
+        with self.assertRaises(ValueError):
+            MessagePackSerializer().deserialize('str')
+
+    def test_is_binary(self):
+        self.assertTrue(MessagePackSerializer.binary)
+        self.assertFalse(DefaultJSONSerializer.binary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2024 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import datetime
+import enum
+import unittest
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from typing_extensions import TypedDict
+
+from dapr.serializers import DefaultJSONSerializer
+from dapr.serializers.typed import TypeDecoder, compile_decoder
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Address(TypedDict):
+    city: str
+    since: datetime.date
+
+
+@dataclass
+class Node:
+    name: str
+    color: Color
+    children: List['Node'] = field(default_factory=list)
+
+
+@dataclass
+class Customer:
+    name: str
+    created_at: datetime.datetime
+    address: Address
+    tags: Tuple[str, ...]
+    retry: Optional[datetime.timedelta] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    score: float = 0.0
+
+
+class CompileDecoderTests(unittest.TestCase):
+    def test_dataclass(self):
+        decoder = compile_decoder(Customer)
+        customer = decoder(
+            {
+                'name': '2020-01-01',
+                'created_at': '2020-01-01T01:00:00Z',
+                'address': {'city': 'Seattle', 'since': '2019-05-06'},
+                'tags': ['a', 'b'],
+                'retry': '1h2m',
+                'extra': {'when': '2021-01-01'},
+                'score': 3,
+                'unknown': 'ignored',
+            }
+        )
+
+        self.assertIsInstance(customer, Customer)
+        # str fields are never sniffed for dates
+        self.assertEqual('2020-01-01', customer.name)
+        self.assertEqual(
+            datetime.datetime(2020, 1, 1, 1, tzinfo=datetime.timezone.utc), customer.created_at
+        )
+        self.assertEqual({'city': 'Seattle', 'since': datetime.date(2019, 5, 6)}, customer.address)
+        self.assertEqual(('a', 'b'), customer.tags)
+        self.assertEqual(datetime.timedelta(hours=1, minutes=2), customer.retry)
+        # untyped values keep the DaprJSONDecoder conversion
+        self.assertIsInstance(customer.extra['when'], datetime.datetime)
+        self.assertIsInstance(customer.score, float)
+
+    def test_optional_none(self):
+        decoder = compile_decoder(Optional[Customer])
+        self.assertIsNone(decoder(None))
+
+    def test_recursive_dataclass(self):
+        decoder = compile_decoder(Node)
+        node = decoder(
+            {'name': 'root', 'color': 'red', 'children': [{'name': 'leaf', 'color': 'blue'}]}
+        )
+        self.assertEqual(Node('root', Color.RED, [Node('leaf', Color.BLUE)]), node)
+
+    def test_list_of_enums(self):
+        self.assertEqual([Color.BLUE, Color.RED], compile_decoder(List[Color])(['blue', 'red']))
+
+    def test_bytes(self):
+        self.assertEqual(b'bytes_data', compile_decoder(bytes)('Ynl0ZXNfZGF0YQ=='))
+
+    def test_invalid_enum_value(self):
+        with self.assertRaises(ValueError):
+            compile_decoder(Color)('green')
+
+    def test_compile_decoder_is_idempotent(self):
+        decoder = compile_decoder(int)
+        self.assertIsInstance(decoder, TypeDecoder)
+        self.assertIs(decoder, compile_decoder(decoder))
+
+
+class TypedDeserializeTests(unittest.TestCase):
+    def test_typed_deserialize(self):
+        serializer = DefaultJSONSerializer(typed_decode=True)
+        payload = b'{"name":"n","color":"blue","children":[]}'
+        self.assertEqual(Node('n', Color.BLUE), serializer.deserialize(payload, Node))
+        self.assertIs(serializer._type_decoders[Node], serializer._get_type_decoder(Node))
+
+    def test_typed_deserialize_object_keeps_conversion(self):
+        serializer = DefaultJSONSerializer(typed_decode=True)
+        obj = serializer.deserialize(b'{"when":"2020-01-01T01:00:00Z"}')
+        self.assertIsInstance(obj['when'], datetime.datetime)
+
+    def test_str_is_not_converted(self):
+        serializer = DefaultJSONSerializer(typed_decode=True)
+        self.assertEqual('1h', serializer.deserialize(b'"1h"', str))
+
+    def test_compiled_decoder_as_data_type(self):
+        serializer = DefaultJSONSerializer()
+        decoder = compile_decoder(List[datetime.date])
+        self.assertEqual(
+            [datetime.date(2020, 1, 2)], serializer.deserialize(b'["2020-01-02"]', decoder)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()